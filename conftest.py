@@ -47,6 +47,8 @@ pytest_plugins = [
     "saleor.graphql.account.tests.fixtures",
     "saleor.payment.tests.fixtures",
     "saleor.webhook.tests.circuit_breaker.fixtures",
+    "saleor.marketplace.tests.fixtures.seller",
+    "saleor.marketplace.tests.fixtures.order",
 ]
 
 
@@ -79,12 +79,15 @@ def _raw_remove_deliveries(deliveries_ids):
         for event_payload in payloads.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
         if event_payload.payload_file
     ]
-    delete_files_from_private_storage_task.delay(files_to_delete)
 
     attempts._raw_delete(attempts.db)
     deliveries._raw_delete(deliveries.db)
     payloads._raw_delete(payloads.db)
 
+    delete_files_from_private_storage_task.delay(
+        EventPayload.objects.get_unreferenced_payload_files(files_to_delete)
+    )
+
 
 @celeryconf.app.task
 @allow_writer()
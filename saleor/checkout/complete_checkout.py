@@ -40,6 +40,7 @@ from ..discount.utils.voucher import (
 from ..graphql.checkout.utils import (
     prepare_insufficient_stock_checkout_validation_error,
 )
+from ..marketplace.services.seller_orders import create_seller_orders
 from ..order import OrderOrigin, OrderStatus
 from ..order.actions import order_created
 from ..order.fetch import OrderInfo, OrderLineInfo
@@ -835,6 +836,7 @@ def _create_order(
 
     OrderLine.objects.bulk_create(order_lines)
     OrderLineDiscount.objects.bulk_create(order_line_discounts)
+    create_seller_orders(order, order_lines)
 
     country_code = checkout_info.get_country()
     additional_warehouse_lookup = (
@@ -1491,6 +1493,7 @@ def _create_order_from_checkout(
         order_pk=order.pk,
         prices_entered_with_tax=prices_entered_with_tax,
     )
+    create_seller_orders(order, [line_info.line for line_info in order_lines_info])
 
     # update undiscounted order total
     undiscounted_total = (
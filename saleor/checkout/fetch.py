@@ -41,6 +41,8 @@ if TYPE_CHECKING:
         Voucher,
         VoucherCode,
     )
+    from ..marketplace.plugins.tax_context import SellerTaxContext
+    from ..marketplace.services.seller_split import SellerSplit
     from ..plugins.manager import PluginsManager
     from ..product.models import (
         Product,
@@ -144,6 +146,18 @@ class CheckoutInfo:
             )
         )
 
+    @cached_property
+    def seller_tax_context(self) -> "SellerTaxContext":
+        from ..marketplace.plugins.tax_context import SellerTaxContext
+
+        return SellerTaxContext.for_checkout_lines(self.lines, self.get_country())
+
+    @cached_property
+    def seller_split(self) -> "SellerSplit":
+        from ..marketplace.services.seller_split import SellerSplit
+
+        return SellerSplit.for_checkout_info(self)
+
     def get_delivery_method_info(self) -> "DeliveryMethodBase":
         delivery_method: ShippingMethodData | Warehouse | None = None
 
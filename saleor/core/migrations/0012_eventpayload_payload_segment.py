@@ -0,0 +1,27 @@
+# Generated by Django 5.2.1 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0011_eventpayload_payload_file"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eventpayload",
+            name="payload_offset",
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="eventpayload",
+            name="payload_size",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="eventpayload",
+            name="payload_hash",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+    ]
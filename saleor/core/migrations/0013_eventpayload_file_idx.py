@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-16 10:00
+
+from django.contrib.postgres.indexes import BTreeIndex
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("core", "0012_eventpayload_payload_segment"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="eventpayload",
+            index=BTreeIndex(fields=["payload_file"], name="eventpayload_file_idx"),
+        ),
+    ]
@@ -1,8 +1,11 @@
 import datetime
+import gzip
+import hashlib
 from collections.abc import Iterable
 from typing import Any, TypeVar
 
-from django.contrib.postgres.indexes import GinIndex, PostgresIndex
+from django.conf import settings
+from django.contrib.postgres.indexes import BTreeIndex, GinIndex, PostgresIndex
 from django.core.files.base import ContentFile
 from django.db import models, transaction
 from django.db.models import F, JSONField, Max, Q
@@ -150,6 +153,50 @@ class Job(models.Model):
         abstract = True
 
 
+PAYLOAD_COMPRESS_LEVEL = 6
+
+
+def _write_payload_segment(segment: bytes, objs: list["EventPayload"]):
+    first_obj = objs[0]
+    prefix = get_random_string(length=12)
+    file_path = safe_join(prefix, f"{first_obj.pk}.json.gz")
+    first_obj.payload_file.save(file_path, ContentFile(segment), save=False)
+    for obj in objs[1:]:
+        obj.payload_file = first_obj.payload_file.name
+
+
+def save_payload_files(objs: Iterable["EventPayload"], payloads: Iterable[str]):
+    """Pack payloads into compressed segment files.
+
+    Each distinct payload is stored once per segment as a separate gzip member,
+    so it can be read back without decompressing the rest of the segment.
+    Payloads with identical content share the member. A new segment is started
+    when the current one reaches `EVENT_PAYLOAD_SEGMENT_SIZE` bytes.
+
+    The instances are not saved.
+    """
+    segment = bytearray()
+    segment_objs: list[EventPayload] = []
+    members: dict[str, tuple[int, int]] = {}
+    for obj, payload_data in zip(objs, payloads, strict=False):
+        payload_bytes = payload_data.encode("utf-8")
+        payload_hash = hashlib.sha256(payload_bytes).hexdigest()
+        if payload_hash not in members:
+            if segment and len(segment) >= settings.EVENT_PAYLOAD_SEGMENT_SIZE:
+                _write_payload_segment(bytes(segment), segment_objs)
+                segment, segment_objs, members = bytearray(), [], {}
+            member = gzip.compress(
+                payload_bytes, compresslevel=PAYLOAD_COMPRESS_LEVEL, mtime=0
+            )
+            members[payload_hash] = (len(segment), len(member))
+            segment += member
+        obj.payload_hash = payload_hash
+        obj.payload_offset, obj.payload_size = members[payload_hash]
+        segment_objs.append(obj)
+    if segment_objs:
+        _write_payload_segment(bytes(segment), segment_objs)
+
+
 class EventPayloadManager(models.Manager["EventPayload"]):
     @transaction.atomic
     def create_with_payload_file(self, payload: str) -> "EventPayload":
@@ -159,42 +206,82 @@ class EventPayloadManager(models.Manager["EventPayload"]):
 
     @transaction.atomic
     def bulk_create_with_payload_files(
-        self, objs: Iterable["EventPayload"], payloads=Iterable[str]
+        self, objs: Iterable["EventPayload"], payloads: Iterable[str]
     ) -> list["EventPayload"]:
         created_objs = self.bulk_create(objs)
-        for obj, payload_data in zip(created_objs, payloads, strict=False):
-            obj.save_payload_file(payload_data, save_instance=False)
-        self.bulk_update(created_objs, ["payload_file"])
+        save_payload_files(created_objs, payloads)
+        self.bulk_update(created_objs, EventPayload.PAYLOAD_FILE_FIELDS)
         return created_objs
 
+    def get_unreferenced_payload_files(self, file_names: Iterable[str]) -> list[str]:
+        """Return payload files that are not used by any payload.
+
+        Segment files are shared by many payloads, so they can be removed from
+        the storage only after all of their payloads are deleted.
+        """
+        file_names = set(file_names)
+        referenced = set(
+            self.filter(payload_file__in=file_names).values_list(
+                "payload_file", flat=True
+            )
+        )
+        return sorted(file_names - referenced)
+
 
 class EventPayload(models.Model):
     PAYLOADS_DIR = "payloads"
+    PAYLOAD_FILE_FIELDS = [
+        "payload_file",
+        "payload_offset",
+        "payload_size",
+        "payload_hash",
+    ]
 
     payload = models.TextField(default="")
     payload_file = models.FileField(
         storage=private_storage, upload_to=PAYLOADS_DIR, null=True
     )
+    # Location of the gzip member within a segment file. Payload files saved
+    # before segments were introduced don't have an offset and hold plain JSON.
+    payload_offset = models.PositiveBigIntegerField(null=True, blank=True)
+    payload_size = models.PositiveIntegerField(null=True, blank=True)
+    payload_hash = models.CharField(max_length=64, blank=True, default="")
     created_at = models.DateTimeField(auto_now_add=True)
 
     objects = EventPayloadManager()
 
+    class Meta:
+        indexes = [
+            BTreeIndex(fields=["payload_file"], name="eventpayload_file_idx"),
+        ]
+
     # TODO (PE-568): change typing of return payload to `bytes` to avoid unnecessary decoding.
     def get_payload(self):
         if self.payload_file:
-            with self.payload_file.open("rb") as f:
-                payload_data = f.read()
-                return payload_data.decode("utf-8")
+            if self.payload_offset is None:
+                with self.payload_file.open("rb") as f:
+                    payload_data = f.read()
+            else:
+                payload_data = gzip.decompress(
+                    self._read_payload_segment(self.payload_offset, self.payload_size)
+                )
+            return payload_data.decode("utf-8")
         return self.payload
 
+    def _read_payload_segment(self, offset: int, size: int | None) -> bytes:
+        # Remote storages download the whole file on open, so read only the range
+        # of this payload when the storage supports it.
+        read_range = getattr(self.payload_file.storage, "read_range", None)
+        if read_range is not None and size is not None:
+            return read_range(self.payload_file.name, offset, size)
+        with self.payload_file.open("rb") as f:
+            f.seek(offset)
+            return f.read(size)
+
     def save_payload_file(self, payload_data: str, save_instance=True):
-        payload_bytes = payload_data.encode("utf-8")
-        prefix = get_random_string(length=12)
-        file_name = f"{self.pk}.json"
-        file_path = safe_join(prefix, file_name)
-        self.payload_file.save(
-            file_path, ContentFile(payload_bytes), save=save_instance
-        )
+        save_payload_files([self], [payload_data])
+        if save_instance:
+            self.save(update_fields=self.PAYLOAD_FILE_FIELDS)
 
     def save_as_file(self):
         payload_data = self.payload
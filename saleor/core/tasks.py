@@ -86,6 +86,9 @@ def delete_event_payloads_task(expiration_date=None):
             ]
             with allow_writer():
                 qs.delete()
+                files_to_delete = EventPayload.objects.get_unreferenced_payload_files(
+                    files_to_delete
+                )
             delete_files_from_private_storage_task.delay(files_to_delete)
             delete_event_payloads_task.delay(expiration_date)
         else:
@@ -13,6 +13,7 @@ GRAPHQL_OPERATION_COST: Final = "graphql.operation.cost"
 GRAPHQL_OPERATION_IDENTIFIER: Final = "graphql.operation.identifier"
 GRAPHQL_PARENT_TYPE: Final = "graphql.parent_type"
 GRAPHQL_RESOLVER_ROW_COUNT: Final = "graphql.resolver.row_count"
+GRAPHQL_RESPONSE_CACHE_RESULT: Final = "graphql.response_cache.result"
 
 # Http
 SALEOR_SOURCE_SERVICE_NAME: Final = "saleor.source.service.name"
@@ -26,6 +27,7 @@ SALEOR_APP_NAME: Final = "saleor.app.name"
 SALEOR_WEBHOOK_EXECUTION_MODE: Final = "saleor.webhook.execution_mode"
 SALEOR_WEBHOOK_EVENT_TYPE: Final = "saleor.webhook.event_type"
 SALEOR_WEBHOOK_PAYLOAD_SIZE: Final = "saleor.webhook.payload.size"
+SALEOR_WEBHOOK_DISPATCH_COALESCED: Final = "saleor.webhook.dispatch.coalesced"
 
 # Circuit Breaker
 SALEOR_CIRCUIT_BREAKER_STATE: Final = "saleor.circuit_breaker.state"
@@ -1,3 +1,6 @@
+import gzip
+from unittest.mock import patch
+
 import pytest
 from django.core.files.base import ContentFile
 from django.utils.crypto import get_random_string
@@ -37,3 +40,118 @@ def test_reading_event_payload_saved_as_string(payload_data):
 
     # then
     assert read_payload == payload_data
+
+
+def test_reading_event_payload_from_segment(payload_data):
+    # given
+    payloads = [payload_data, '{"product": {"name": "Blue"}}']
+    event_payloads = EventPayload.objects.bulk_create_with_payload_files(
+        [EventPayload(), EventPayload()], payloads
+    )
+
+    # when
+    read_payloads = [
+        EventPayload.objects.get(pk=event_payload.pk).get_payload()
+        for event_payload in event_payloads
+    ]
+
+    # then
+    assert read_payloads == payloads
+    assert event_payloads[0].payload_file.name == event_payloads[1].payload_file.name
+    assert event_payloads[1].payload_offset == event_payloads[0].payload_size
+
+
+def test_reading_event_payload_from_segment_with_ranged_read(payload_data):
+    # given
+    payloads = [payload_data, '{"product": {"name": "Blue"}}']
+    event_payloads = EventPayload.objects.bulk_create_with_payload_files(
+        [EventPayload(), EventPayload()], payloads
+    )
+    event_payload = EventPayload.objects.get(pk=event_payloads[1].pk)
+    storage = event_payload.payload_file.storage
+
+    def read_range(name, offset, size):
+        with storage.open(name, "rb") as f:
+            f.seek(offset)
+            return f.read(size)
+
+    # when
+    with patch.object(
+        storage, "read_range", side_effect=read_range, create=True
+    ) as mocked_read_range:
+        read_payload = event_payload.get_payload()
+
+    # then
+    assert read_payload == payloads[1]
+    mocked_read_range.assert_called_once_with(
+        event_payload.payload_file.name,
+        event_payload.payload_offset,
+        event_payload.payload_size,
+    )
+
+
+def test_event_payload_file_is_compressed(payload_data):
+    # given
+    payload = EventPayload.objects.create_with_payload_file(payload_data)
+
+    # when
+    with payload.payload_file.open("rb") as f:
+        payload_file_data = f.read()
+
+    # then
+    assert gzip.decompress(payload_file_data).decode("utf-8") == payload_data
+
+
+def test_identical_payloads_are_stored_once(payload_data):
+    # given
+    payloads = [payload_data, payload_data, payload_data]
+
+    # when
+    event_payloads = EventPayload.objects.bulk_create_with_payload_files(
+        [EventPayload() for _ in payloads], payloads
+    )
+
+    # then
+    assert {event_payload.payload_hash for event_payload in event_payloads} == {
+        event_payloads[0].payload_hash
+    }
+    assert {event_payload.payload_offset for event_payload in event_payloads} == {0}
+    with event_payloads[0].payload_file.open("rb") as f:
+        assert len(f.read()) == event_payloads[0].payload_size
+
+
+def test_payloads_are_split_into_segments_of_max_size(payload_data, settings):
+    # given
+    settings.EVENT_PAYLOAD_SEGMENT_SIZE = 1
+    payloads = [payload_data, '{"product": {"name": "Blue"}}']
+
+    # when
+    event_payloads = EventPayload.objects.bulk_create_with_payload_files(
+        [EventPayload(), EventPayload()], payloads
+    )
+
+    # then
+    assert event_payloads[0].payload_file.name != event_payloads[1].payload_file.name
+    assert [event_payload.get_payload() for event_payload in event_payloads] == (
+        payloads
+    )
+
+
+def test_get_unreferenced_payload_files(payload_data):
+    # given
+    first_payload, second_payload = EventPayload.objects.bulk_create_with_payload_files(
+        [EventPayload(), EventPayload()], [payload_data, "{}"]
+    )
+    single_payload = EventPayload.objects.create_with_payload_file(payload_data)
+    file_names = [
+        first_payload.payload_file.name,
+        single_payload.payload_file.name,
+    ]
+    first_payload.delete()
+    single_payload.delete()
+
+    # when
+    unreferenced_files = EventPayload.objects.get_unreferenced_payload_files(file_names)
+
+    # then
+    assert unreferenced_files == [single_payload.payload_file.name]
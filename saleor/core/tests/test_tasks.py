@@ -65,6 +65,41 @@ def test_delete_event_payloads_task(webhook, settings):
     assert not private_storage.exists(payload_files[before_delete_period])
 
 
+def test_delete_event_payloads_task_keeps_shared_segment(webhook, settings):
+    # given
+    delete_period = settings.EVENT_PAYLOAD_DELETE_PERIOD
+    start_time = timezone.now()
+    expired_payload, valid_payload = (
+        EventPayload.objects.bulk_create_with_payload_files(
+            [EventPayload(), EventPayload()], ["expired", "valid"]
+        )
+    )
+    segment_name = valid_payload.payload_file.name
+    assert expired_payload.payload_file.name == segment_name
+    with freeze_time(start_time - delete_period - datetime.timedelta(seconds=1)):
+        EventDelivery.objects.create(
+            event_type=WebhookEventAsyncType.ANY,
+            payload=expired_payload,
+            webhook=webhook,
+        )
+    with freeze_time(start_time - delete_period + datetime.timedelta(seconds=1)):
+        EventDelivery.objects.create(
+            event_type=WebhookEventAsyncType.ANY,
+            payload=valid_payload,
+            webhook=webhook,
+        )
+
+    # when
+    with freeze_time(start_time):
+        delete_event_payloads_task()
+
+    # then
+    assert list(EventPayload.objects.all()) == [valid_payload]
+    assert private_storage.exists(segment_name)
+    valid_payload.refresh_from_db()
+    assert valid_payload.get_payload() == "valid"
+
+
 def test_delete_files_from_storage_task(
     product_with_image, variant_with_image, media_root
 ):
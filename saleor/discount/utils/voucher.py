@@ -286,18 +286,12 @@ def validate_voucher_for_checkout(
     # consistent with Saleor's single-voucher-per-checkout model and avoids partially
     # applying an order-level voucher across multiple sellers.
     if getattr(voucher, "seller_id", None):
-        sellers_in_checkout = {
-            getattr(line_info.product, "seller", None)
-            for line_info in lines
-            if getattr(line_info, "product", None) is not None
-        }
-        sellers_in_checkout.discard(None)
-        if len(sellers_in_checkout) != 1:
+        seller_ids_in_checkout = checkout_info.seller_split.seller_ids
+        if len(seller_ids_in_checkout) != 1:
             raise NotApplicable(
                 "This voucher can only be used when your cart contains items from a single seller."
             )
-        only_seller = next(iter(sellers_in_checkout))
-        if only_seller.pk != voucher.seller_id:
+        if voucher.seller_id not in seller_ids_in_checkout:
             raise NotApplicable("This voucher is not valid for the selected seller.")
 
     quantity = calculate_checkout_quantity(lines)
@@ -325,7 +319,7 @@ def validate_voucher_in_order(
         return
 
     from ...order.utils import get_total_quantity
-    from ...marketplace.utils import group_lines_by_seller
+    from ...marketplace.services.seller_split import get_order_seller_split
 
     subtotal = order.subtotal
     quantity = get_total_quantity(lines)
@@ -337,13 +331,12 @@ def validate_voucher_in_order(
     # Marketplace: seller-scoped voucher must match order lines seller.
     voucher = order.voucher
     if getattr(voucher, "seller_id", None):
-        sellers_in_order = {s for s in group_lines_by_seller(list(lines)).keys() if s}
-        if len(sellers_in_order) != 1:
+        seller_ids_in_order = get_order_seller_split(order, lines).seller_ids
+        if len(seller_ids_in_order) != 1:
             raise NotApplicable(
                 "This voucher can only be used when the order contains items from a single seller."
             )
-        only_seller = next(iter(sellers_in_order))
-        if only_seller.pk != voucher.seller_id:
+        if voucher.seller_id not in seller_ids_in_order:
             raise NotApplicable("This voucher is not valid for the selected seller.")
 
     validate_voucher(
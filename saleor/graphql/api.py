@@ -76,6 +76,7 @@ try:
         InventorySyncQueries,
         ReturnRequestQueries,
         ReturnPolicyQueries,
+        HelpArticleQueries,
         LoyaltyPointsBalanceQueries,
         LoyaltyPointsTransactionQueries,
         BadgeQueries,
@@ -101,6 +102,7 @@ try:
         InventorySyncQueries = InventorySyncQueries
         ReturnRequestQueries = ReturnRequestQueries
         ReturnPolicyQueries = ReturnPolicyQueries
+        HelpArticleQueries = HelpArticleQueries
         LoyaltyPointsBalanceQueries = LoyaltyPointsBalanceQueries
         LoyaltyPointsTransactionQueries = LoyaltyPointsTransactionQueries
         BadgeQueries = BadgeQueries
@@ -151,8 +153,10 @@ from .meta.schema import MetaMutations
 from .order.schema import OrderMutations, OrderQueries
 from .page.schema import PageMutations, PageQueries
 from .payment.schema import PAYMENT_ADDITIONAL_TYPES, PaymentMutations, PaymentQueries
+from .persisted_queries import PersistedQueryRegistry
 from .plugins.schema import PluginsMutations, PluginsQueries
 from .product.schema import ProductMutations, ProductQueries
+from .query_cost_map import COST_MAP
 from .shipping.schema import ShippingMutations, ShippingQueries
 from .shop.schema import ShopMutations, ShopQueries
 from .tax.schema import TaxMutations, TaxQueries
@@ -191,6 +195,7 @@ class Query(
     SellerShippingMethodQueries,
     InventorySyncQueries,
     ReturnRequestQueries,
+    HelpArticleQueries,
     LoyaltyPointsBalanceQueries,
     LoyaltyPointsTransactionQueries,
     BadgeQueries,
@@ -529,6 +534,14 @@ def _fail(errors, **_kwargs) -> ExecutionResult:
     return ExecutionResult(errors=errors, invalid=True)
 
 
+class SaleorGraphQLDocument(GraphQLDocument):
+    """GraphQL document along with the errors of its eager validation."""
+
+    def __init__(self, *args, validation_errors=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.validation_errors = validation_errors or []
+
+
 class SaleorGraphQLBackend(GraphQLCoreBackend):
     def document_from_string(
         self,
@@ -539,14 +552,15 @@ class SaleorGraphQLBackend(GraphQLCoreBackend):
         document_ast = parse(document_string)
         validation_errors = validate(schema, document_ast)
         if validation_errors:
-            return GraphQLDocument(
+            return SaleorGraphQLDocument(
                 schema=schema,
                 document_string=document_string,
                 document_ast=document_ast,
                 execute=partial(_fail, validation_errors),
+                validation_errors=validation_errors,
             )
 
-        return GraphQLDocument(
+        return SaleorGraphQLDocument(
             schema=schema,
             document_string=document_string,
             document_ast=document_ast,
@@ -555,3 +569,4 @@ class SaleorGraphQLBackend(GraphQLCoreBackend):
 
 
 backend = GraphQLCachedBackend(SaleorGraphQLBackend(), cache_map=CacheDict(1000))
+persisted_queries = PersistedQueryRegistry(schema, backend, COST_MAP)
@@ -147,6 +147,8 @@ class CheckoutLinesAdd(BaseMutation):
 
         lines, _ = fetch_checkout_lines(checkout)
         checkout_info.lines = lines
+        # The seller split memoized for the previous lines is stale now.
+        checkout_info.__dict__.pop("seller_split", None)
         return lines
 
     @classmethod
@@ -2,6 +2,7 @@ from uuid import UUID
 
 from ...checkout import models
 from ...core.exceptions import PermissionDenied
+from ...marketplace.context import get_tenant_scope_from_context
 from ...permission.enums import (
     AccountPermissions,
     CheckoutPermissions,
@@ -29,6 +30,8 @@ def resolve_checkouts(info, channel_slug):
     ).all()
     if channel_slug:
         queryset = queryset.filter(channel__slug=channel_slug)
+    if scope := get_tenant_scope_from_context(info.context):
+        queryset = scope.filter_checkouts(queryset)
     return queryset
 
 
@@ -362,6 +362,43 @@ def create_connection_slice(
     return slice
 
 
+def validate_connection_slice_args(
+    info: "ResolveInfo", args: dict, max_limit: int | None = None
+):
+    """Validate and clamp pagination arguments like `create_connection_slice`."""
+    _validate_slice_args(info, args, max_limit)
+    _validate_connection_args(args)
+
+
+def create_connection_from_first_page(
+    records: list,
+    qs: QuerySet,
+    first: int,
+    sort_by: dict,
+    connection_type,
+    edge_type=None,
+    pageinfo_type=graphene.relay.PageInfo,
+):
+    """Build the first page of a connection from records fetched ahead of time.
+
+    `records` are the first `first + 1` rows of `qs` ordered by `sort_by`; the
+    extra row tells whether there is a next page. Cursors are the same as the ones
+    built by `create_connection_slice`, so following pages can be requested with
+    `after`. Validate the arguments with `validate_connection_slice_args` first.
+    """
+    sorting_fields = _get_sorting_fields(sort_by, qs)
+    edges, page_info = _get_edges_for_connection(
+        edge_type or connection_type.Edge, records, {"first": first}, sorting_fields
+    )
+    if "total_count" in connection_type._meta.fields:
+        return connection_type(
+            edges=edges,
+            page_info=pageinfo_type(**page_info),
+            total_count=qs.count,
+        )
+    return connection_type(edges=edges, page_info=pageinfo_type(**page_info))
+
+
 def _validate_slice_args(
     info: "ResolveInfo",
     args: dict,
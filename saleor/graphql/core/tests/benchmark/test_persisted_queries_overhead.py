@@ -0,0 +1,95 @@
+"""Per-request overhead of preparing a document for execution on a warm worker.
+
+Compares what `GraphQLView` does before execution for a query sent in full (hash
+lookup in the backend, schema check, identifier, fingerprint and cost validation)
+with a persisted query sent by its hash. Run with `pytest -s` to see the p50 and
+p99 overhead of both.
+"""
+
+import statistics
+import time
+
+from django.test import override_settings
+
+from ....api import backend, schema
+from ....persisted_queries import PersistedQueryRegistry
+from ....query_cost_map import COST_MAP
+from ....utils import query_fingerprint, query_identifier
+from ....utils.validators import check_if_query_contains_only_schema
+from ...validators.query_cost import validate_query_cost
+
+REQUESTS_COUNT = 2_000
+MAX_COMPLEXITY = 50_000
+
+QUERY = """
+    query Products($first: Int, $channel: String) {
+        products(first: $first, channel: $channel) {
+            edges {
+                node {
+                    id
+                    name
+                    slug
+                    category { id name slug }
+                    thumbnail { url alt }
+                    pricing {
+                        priceRange {
+                            start { gross { amount currency } }
+                            stop { gross { amount currency } }
+                        }
+                    }
+                    variants {
+                        id
+                        name
+                        sku
+                        quantityAvailable
+                        attributes { attribute { id name } values { id name } }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def _get_percentiles(timings):
+    percentiles = statistics.quantiles(timings, n=100)
+    return percentiles[49] * 1e6, percentiles[98] * 1e6
+
+
+def _measure(prepare, variables):
+    timings = []
+    for _ in range(REQUESTS_COUNT):
+        start = time.perf_counter()
+        prepare(variables)
+        timings.append(time.perf_counter() - start)
+    return _get_percentiles(timings)
+
+
+@override_settings(GRAPHQL_QUERY_MAX_COMPLEXITY=MAX_COMPLEXITY)
+def test_persisted_query_overhead(db):
+    # given
+    variables = {"first": 20, "channel": "default-channel"}
+    registry = PersistedQueryRegistry(schema, backend, COST_MAP)
+    query_hash = registry.register(QUERY).query_hash
+
+    def prepare_query(variables):
+        document = backend.document_from_string(schema, QUERY)
+        check_if_query_contains_only_schema(document)
+        query_identifier(document)
+        query_fingerprint(document)
+        validate_query_cost(schema, document, variables, COST_MAP, MAX_COMPLEXITY)
+
+    def prepare_persisted_query(variables):
+        compiled_query = registry.get(query_hash)
+        compiled_query.cost(variables, MAX_COMPLEXITY)
+
+    # when
+    query_p50, query_p99 = _measure(prepare_query, variables)
+    persisted_p50, persisted_p99 = _measure(prepare_persisted_query, variables)
+
+    # then
+    print(  # noqa: T201
+        f"\nquery: p50 {query_p50:,.1f}us, p99 {query_p99:,.1f}us"
+        f"\npersisted query: p50 {persisted_p50:,.1f}us, p99 {persisted_p99:,.1f}us"
+    )
+    assert persisted_p50 < query_p50
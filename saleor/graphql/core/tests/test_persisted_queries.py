@@ -0,0 +1,189 @@
+import uuid
+from unittest.mock import patch
+
+import graphene
+import pytest
+from django.test import override_settings
+
+from ...api import backend, schema
+from ...persisted_queries import (
+    PersistedQueryRegistry,
+    QueryCost,
+    get_cost_variable_names,
+    get_persisted_query_hash,
+    get_query_hash,
+)
+from ...query_cost_map import COST_MAP
+from ...tests.utils import get_graphql_content
+
+QUERY_CATEGORY = """
+    query GetCategory($id: ID!) {
+        category(id: $id) {
+            name
+        }
+    }
+"""
+
+QUERY_PRODUCTS = """
+    query GetProducts($first: Int, $channel: String) {
+        products(first: $first, channel: $channel) {
+            edges {
+                node {
+                    name
+                }
+            }
+        }
+    }
+"""
+
+
+def _get_persisted_query_data(query_hash, query=None, variables=None):
+    data = {
+        "extensions": {"persistedQuery": {"version": 1, "sha256Hash": query_hash}},
+        "variables": variables or {},
+    }
+    if query:
+        data["query"] = query
+    return data
+
+
+def test_persisted_query_not_found(api_client):
+    # given
+    query = f"# {uuid.uuid4()}\n{{ shop {{ name }} }}"
+    data = _get_persisted_query_data(get_query_hash(query))
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    content = response.json()
+    assert "data" not in content
+    assert content["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_persisted_query_registered_and_executed_by_hash(api_client, category):
+    # given
+    query_hash = get_query_hash(QUERY_CATEGORY)
+    variables = {"id": graphene.Node.to_global_id("Category", category.pk)}
+    response = api_client.post(
+        _get_persisted_query_data(query_hash, QUERY_CATEGORY, variables)
+    )
+    assert get_graphql_content(response)["data"]["category"]["name"] == category.name
+
+    # when
+    response = api_client.post(_get_persisted_query_data(query_hash, None, variables))
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["category"]["name"] == category.name
+
+
+def test_persisted_query_hash_mismatch(api_client):
+    # given
+    query_hash = get_query_hash("{ shop { name } }")
+    data = _get_persisted_query_data(query_hash, QUERY_CATEGORY)
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    content = response.json()
+    assert content["errors"][0]["extensions"]["code"] == (
+        "PERSISTED_QUERY_HASH_MISMATCH"
+    )
+
+
+def test_get_persisted_query_hash_from_json_extensions():
+    # given
+    data = {"extensions": '{"persistedQuery": {"version": 1, "sha256Hash": "abc"}}'}
+
+    # when
+    query_hash = get_persisted_query_hash(data)
+
+    # then
+    assert query_hash == "abc"
+
+
+def test_persisted_query_registry_skips_invalid_queries():
+    # given
+    registry = PersistedQueryRegistry(schema, backend, COST_MAP)
+    query = "{ nonExistingField }"
+
+    # when
+    compiled = registry.register(query)
+
+    # then
+    assert not compiled.is_valid
+    registry._compiled.clear()
+    assert registry.get(compiled.query_hash) is None
+
+
+def test_get_cost_variable_names():
+    # given
+    document = backend.document_from_string(schema, QUERY_PRODUCTS)
+
+    # when
+    names = get_cost_variable_names(document, COST_MAP)
+
+    # then
+    assert names == {"first"}
+
+
+@patch(
+    "saleor.graphql.persisted_queries.validate_query_cost",
+    return_value=(10, None),
+)
+def test_query_cost_is_computed_once_per_cost_variables(mocked_validate_query_cost):
+    # given
+    document = backend.document_from_string(schema, QUERY_PRODUCTS)
+    cost = QueryCost(document, COST_MAP)
+
+    # when
+    cost({"first": 10, "channel": "a"}, 100)
+    cost({"first": 10, "channel": "b"}, 100)
+    cost({"first": 20, "channel": "a"}, 100)
+
+    # then
+    assert mocked_validate_query_cost.call_count == 2
+
+
+@pytest.mark.parametrize(("maximum_cost", "has_errors"), [(5, True), (0, False)])
+@patch(
+    "saleor.graphql.persisted_queries.validate_query_cost",
+    return_value=(10, None),
+)
+def test_query_cost_applies_maximum_cost_to_memoized_cost(
+    mocked_validate_query_cost, maximum_cost, has_errors
+):
+    # given
+    document = backend.document_from_string(schema, QUERY_PRODUCTS)
+    cost = QueryCost(document, COST_MAP)
+    cost({"first": 10}, 100)
+
+    # when
+    query_cost, errors = cost({"first": 10}, maximum_cost)
+
+    # then
+    assert query_cost == 10
+    assert bool(errors) is has_errors
+    mocked_validate_query_cost.assert_called_once()
+
+
+@override_settings(GRAPHQL_QUERY_MAX_COMPLEXITY=1)
+def test_persisted_query_exceeding_cost_limit_fails(api_client, channel_USD):
+    # given
+    query_hash = get_query_hash(QUERY_PRODUCTS)
+    variables = {"first": 10, "channel": channel_USD.slug}
+    api_client.post(_get_persisted_query_data(query_hash, QUERY_PRODUCTS, variables))
+
+    # when
+    response = api_client.post(_get_persisted_query_data(query_hash, None, variables))
+
+    # then
+    content = response.json()
+    assert "data" not in content
+    query_cost = content["extensions"]["cost"]["requestedQueryCost"]
+    assert content["errors"][0]["message"] == (
+        f"The query exceeds the maximum cost of 1. Actual cost is {query_cost}"
+    )
@@ -0,0 +1,177 @@
+from unittest.mock import patch
+
+import pytest
+
+from ....core.telemetry import saleor_attributes
+from ....plugins.manager import get_plugins_manager
+from ....product.models import Product, ProductChannelListing
+from ....product.utils.variant_prices import update_discounted_prices_for_promotion
+from ....tests.utils import get_metric_data
+from ...api import backend, schema
+from ...metrics import METRIC_GRAPHQL_RESPONSE_CACHE_COUNT
+from ...response_cache import (
+    CATEGORY_TAG,
+    COLLECTION_TAG,
+    PRODUCT_TAG,
+    get_response_cache_tags,
+    get_tag_versions,
+)
+from ...tests.utils import get_graphql_content
+
+QUERY_PRODUCTS = """
+    query Products($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    name
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture
+def response_cache_enabled(settings):
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = True
+
+
+def test_anonymous_query_response_is_cached(
+    response_cache_enabled, api_client, product, channel_USD, get_test_metrics_data
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+    get_graphql_content(response)
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["edges"][0]["node"]["name"] == product.name
+    metric_data = get_metric_data(
+        get_test_metrics_data(), METRIC_GRAPHQL_RESPONSE_CACHE_COUNT
+    )
+    results = {
+        data_point.attributes[saleor_attributes.GRAPHQL_RESPONSE_CACHE_RESULT]: (
+            data_point.value
+        )
+        for data_point in metric_data.data.data_points
+    }
+    assert results == {"miss": 1, "hit": 1}
+
+
+def test_response_cache_is_invalidated_by_product_update(
+    response_cache_enabled, settings, api_client, product, channel_USD
+):
+    # given
+    settings.PLUGINS = [
+        "saleor.plugins.graphql_response_cache.plugin.GraphQLResponseCachePlugin"
+    ]
+    variables = {"channel": channel_USD.slug}
+    get_graphql_content(api_client.post_graphql(QUERY_PRODUCTS, variables))
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # when
+    get_plugins_manager(allow_replica=False).product_updated(product)
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["edges"][0]["node"]["name"] == "New name"
+
+
+def test_response_cache_is_invalidated_by_promotion_update(
+    response_cache_enabled, settings, catalogue_promotion
+):
+    # given
+    settings.PLUGINS = [
+        "saleor.plugins.graphql_response_cache.plugin.GraphQLResponseCachePlugin"
+    ]
+    versions = get_tag_versions(frozenset({PRODUCT_TAG}))
+
+    # when
+    get_plugins_manager(allow_replica=False).promotion_updated(catalogue_promotion)
+
+    # then
+    assert get_tag_versions(frozenset({PRODUCT_TAG})) != versions
+
+
+def test_response_cache_is_invalidated_by_discounted_price_recalculation(
+    response_cache_enabled, settings, product, channel_USD
+):
+    # given
+    settings.PLUGINS = [
+        "saleor.plugins.graphql_response_cache.plugin.GraphQLResponseCachePlugin"
+    ]
+    ProductChannelListing.objects.filter(product=product).update(
+        discounted_price_amount=0
+    )
+    versions = get_tag_versions(frozenset({PRODUCT_TAG}))
+
+    # when
+    update_discounted_prices_for_promotion(Product.objects.filter(pk=product.pk))
+
+    # then
+    assert get_tag_versions(frozenset({PRODUCT_TAG})) != versions
+
+
+def test_response_cache_is_not_used_for_authenticated_users(
+    response_cache_enabled, user_api_client, product, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    get_graphql_content(user_api_client.post_graphql(QUERY_PRODUCTS, variables))
+
+    # when
+    with patch("saleor.graphql.views.get_cached_response") as mocked_get:
+        response = user_api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    get_graphql_content(response)
+    mocked_get.assert_not_called()
+
+
+def test_response_cache_is_disabled_by_default(api_client, product, channel_USD):
+    # given
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    with patch("saleor.graphql.views.get_cached_response") as mocked_get:
+        response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    get_graphql_content(response)
+    mocked_get.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("query", "expected_tags"),
+    [
+        (QUERY_PRODUCTS, {PRODUCT_TAG, CATEGORY_TAG, COLLECTION_TAG}),
+        (
+            "{ collections(first: 1) { edges { node { name } } } }",
+            {COLLECTION_TAG, PRODUCT_TAG},
+        ),
+        ("query { shop { name } }", None),
+        ("query { products(first: 1) { totalCount } shop { name } }", None),
+        ("mutation { tokenRefresh { token } }", None),
+        ("{ products(first: 1) { edges { node { isAvailable } } } }", None),
+        (
+            "query { productVariants(first: 1) { edges { node { ...Variant } } } }"
+            " fragment Variant on ProductVariant { quantityAvailable }",
+            None,
+        ),
+    ],
+)
+def test_get_response_cache_tags(query, expected_tags):
+    # given
+    document = backend.document_from_string(schema, query)
+
+    # when
+    tags = get_response_cache_tags(document, None)
+
+    # then
+    assert tags == expected_tags
@@ -236,15 +236,7 @@ class CostValidator(ValidationRule):
         return [m for m in multipliers if m > 0]
 
     def get_cost_exceeded_error(self) -> "QueryCostError":
-        return QueryCostError(
-            cost_analysis_message(self.maximum_cost, self.cost),
-            extensions={
-                "cost": {
-                    "requestedQueryCost": self.cost,
-                    "maximumAvailable": self.maximum_cost,
-                }
-            },
-        )
+        return get_cost_exceeded_error(self.maximum_cost, self.cost)
 
     def enter(
         self,
@@ -310,6 +302,18 @@ class QueryCostError(GraphQLError):
     pass
 
 
+def get_cost_exceeded_error(maximum_cost: int, cost: int) -> QueryCostError:
+    return QueryCostError(
+        cost_analysis_message(maximum_cost, cost),
+        extensions={
+            "cost": {
+                "requestedQueryCost": cost,
+                "maximumAvailable": maximum_cost,
+            }
+        },
+    )
+
+
 def cost_validator(
     maximum_cost: int,
     *,
@@ -1,9 +1,109 @@
 """DataLoaders for marketplace GraphQL."""
 
+from collections import defaultdict
+from uuid import UUID
+
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from saleor.channel.models import Channel
 from saleor.marketplace.dataloaders import (
+    RecentlyViewedProductIdsByUserIdLoader,
+    SellerAnalyticsTotalsLoader,
     SellerByDomainLoader,
     SellerByIdLoader,
     SellerBySlugLoader,
+    SellerDiscountConfigBySellerIdLoader,
+    SellerDomainsBySellerIdLoader,
+    SellerLogisticsConfigBySellerIdLoader,
+    SellerStaffIdsBySellerIdLoader,
+    SellerStorefrontSettingsBySellerIdLoader,
+    SellerTaxRegistrationsBySellerIdLoader,
+    SettlementSummariesBySellerIdLoader,
 )
+from saleor.product.models import Product
+
+from ..core.dataloaders import DataLoader
+from ..utils import get_user_or_app_from_context
+from ..utils.sorting import sort_queryset_by_default
+
+# Seller ID, channel, whether the requestor is the seller's staff and page size.
+SellerProductsPageKey = tuple[UUID, Channel | None, bool, int]
+
+
+def filter_seller_products(qs, requestor, channel: Channel | None, is_seller_staff):
+    """Limit seller products to the ones visible to the requestor.
+
+    Seller owner and staff can see all their products (including pending), others
+    see only storefront-visible products.
+    """
+    if channel is not None:
+        qs = qs.filter(
+            channel_listings__channel_id=channel.pk,
+            channel_listings__is_published=True,
+        )
+    if not is_seller_staff:
+        qs = qs.visible_to_user(
+            requestor, channel, limited_channel_access=channel is not None
+        )
+    return qs
+
+
+class FirstProductsPageBySellerLoader(DataLoader[SellerProductsPageKey, list[Product]]):
+    """Load the first page of products of many sellers with one query per page shape.
+
+    Each page holds one product more than requested, so the caller can tell
+    whether there is a next page.
+    """
+
+    context_key = "first_products_page_by_seller"
+
+    def batch_load(self, keys):
+        requestor = get_user_or_app_from_context(self.context)
+        seller_ids_by_page: dict[tuple, list[UUID]] = defaultdict(list)
+        for seller_id, channel, is_seller_staff, first in keys:
+            seller_ids_by_page[(channel, is_seller_staff, first)].append(seller_id)
+
+        products_by_key: dict[SellerProductsPageKey, list[Product]] = defaultdict(list)
+        for (channel, is_seller_staff, first), seller_ids in seller_ids_by_page.items():
+            qs = filter_seller_products(
+                Product.objects.using(self.database_connection_name).filter(
+                    seller_id__in=seller_ids
+                ),
+                requestor,
+                channel,
+                is_seller_staff,
+            )
+            qs, _ = sort_queryset_by_default(qs, reversed=False)
+            ordering = list(qs.query.order_by)
+            qs = (
+                qs.annotate(
+                    seller_position=Window(
+                        RowNumber(), partition_by=F("seller_id"), order_by=ordering
+                    )
+                )
+                .filter(seller_position__lte=first + 1)
+                .order_by("seller_id", *ordering)
+            )
+            for product in qs:
+                products_by_key[
+                    (product.seller_id, channel, is_seller_staff, first)
+                ].append(product)
+        return [products_by_key.get(key, []) for key in keys]
+
 
-__all__ = ["SellerByIdLoader", "SellerBySlugLoader", "SellerByDomainLoader"]
+__all__ = [
+    "FirstProductsPageBySellerLoader",
+    "RecentlyViewedProductIdsByUserIdLoader",
+    "SellerAnalyticsTotalsLoader",
+    "SellerByIdLoader",
+    "SellerBySlugLoader",
+    "SellerByDomainLoader",
+    "SellerDiscountConfigBySellerIdLoader",
+    "SellerDomainsBySellerIdLoader",
+    "SellerLogisticsConfigBySellerIdLoader",
+    "SellerStaffIdsBySellerIdLoader",
+    "SellerStorefrontSettingsBySellerIdLoader",
+    "SellerTaxRegistrationsBySellerIdLoader",
+    "SettlementSummariesBySellerIdLoader",
+]
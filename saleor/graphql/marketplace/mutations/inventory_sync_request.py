@@ -160,14 +160,16 @@ class InventorySyncRequest(BaseMutation):
                     stock.quantity_allocated for stock in stocks
                 )
 
-        # Create inventory sync record
-        inventory_sync = models.InventorySync.objects.create(
+        # Create or update inventory sync record
+        inventory_sync, _ = models.InventorySync.objects.update_or_create(
             product_variant=variant,
             fulfillment_center=fulfillment_center,
             warehouse=warehouse,
-            quantity_available=quantity_available,
-            quantity_reserved=quantity_reserved,
-            synced_at=timezone.now(),
+            defaults={
+                "quantity_available": quantity_available,
+                "quantity_reserved": quantity_reserved,
+                "synced_at": timezone.now(),
+            },
         )
 
         return cls(inventory_sync=inventory_sync)
@@ -1,12 +1,8 @@
 """GraphQL mutation for tracking product views."""
 
-from typing import TYPE_CHECKING
-from datetime import datetime
-
 from django.core.exceptions import ValidationError
-from django.utils import timezone
 
-from saleor.core.tracing import traced_atomic_transaction
+from saleor.marketplace.services.recently_viewed import record_product_view
 from ...core.context import get_database_connection_name
 from ...core import ResolveInfo
 from ...core.mutations import BaseMutation
@@ -14,12 +10,6 @@ from ...core.types import MarketplaceError
 from ...core.utils import from_global_id_or_error
 from saleor.marketplace import error_codes
 
-if TYPE_CHECKING:
-    from saleor.account.models import User
-
-
-RECENTLY_VIEWED_METADATA_KEY = "recently_viewed_products"
-
 
 class ProductView(BaseMutation):
     """Track a product view for the authenticated user."""
@@ -63,11 +53,11 @@ class ProductView(BaseMutation):
         connection_name = get_database_connection_name(info.context)
         from saleor.product import models as product_models
 
-        try:
-            product = product_models.Product.objects.using(connection_name).get(
-                pk=product_pk
-            )
-        except product_models.Product.DoesNotExist:
+        if (
+            not product_models.Product.objects.using(connection_name)
+            .filter(pk=product_pk)
+            .exists()
+        ):
             raise ValidationError(
                 {
                     "productId": ValidationError(
@@ -77,44 +67,8 @@ class ProductView(BaseMutation):
                 }
             )
 
-        # Get user preferences for limit
-        preferences = user.get_value_from_metadata("preferences", {})
-        limit = preferences.get("recently_viewed_products_limit", 10)
-
-        # Get current recently viewed list
-        recently_viewed = user.get_value_from_metadata(
-            RECENTLY_VIEWED_METADATA_KEY, []
-        )
-        if not isinstance(recently_viewed, list):
-            recently_viewed = []
-
-        # Convert product ID to string for comparison
-        product_id_str = str(product.id)
-
-        # Remove existing entry if present (to move to front)
-        recently_viewed = [
-            item for item in recently_viewed if item.get("product_id") != product_id_str
-        ]
-
-        # Add product to front of list with timestamp
-        recently_viewed.insert(
-            0,
-            {
-                "product_id": product_id_str,
-                "viewed_at": timezone.now().isoformat(),
-            },
-        )
-
-        # Limit to user's preference (default 10)
-        if limit > 0:
-            recently_viewed = recently_viewed[:limit]
-
-        # Save to metadata
-        with traced_atomic_transaction():
-            user.store_value_in_metadata(
-                {RECENTLY_VIEWED_METADATA_KEY: recently_viewed}
-            )
-            user.save(update_fields=["metadata", "updated_at"])
+        # Views are buffered and flushed to the recently viewed products table in
+        # batches, so tracking a view doesn't write to the user's row.
+        record_product_view(user, int(product_pk))
 
         return cls.success_response()
-
@@ -7,26 +7,60 @@ from typing import Optional
 import graphene
 from django.db.models import Q, Sum
 from django.utils import timezone
+from promise import Promise
 
+from ...order import OrderStatus
+from ...permission.utils import has_one_of_permissions
+from ..channel.dataloaders.by_self import ChannelBySlugLoader
+from ..channel.utils import get_default_channel_slug_or_graphql_error
 from ..core import ResolveInfo
-from ..core.context import get_database_connection_name
+from ..core.connection import (
+    connection_from_queryset_slice,
+    create_connection_from_first_page,
+    validate_connection_slice_args,
+)
+from ..core.context import ChannelContext, get_database_connection_name
 from ..core.enums import ReportingPeriod
 from prices import Money
 from ..core.utils import from_global_id_or_error
 from ..utils.filters import reporting_period_to_date
 from saleor.marketplace import models
-from saleor.marketplace.context import get_seller_from_context
-from saleor.marketplace.dataloaders import SellerByDomainLoader, SellerByIdLoader, SellerBySlugLoader
-from saleor.marketplace.utils import (
-    calculate_seller_earnings_total,
-    calculate_seller_revenue,
-    get_seller_order_count,
+from saleor.marketplace.context import get_tenant_scope_from_context
+from saleor.marketplace.dataloaders import (
+    RecentlyViewedProductIdsByUserIdLoader,
+    SellerByDomainLoader,
+    SellerByIdLoader,
+    SellerBySlugLoader,
+)
+from saleor.marketplace.analytics import get_seller_analytics_totals
+from saleor.marketplace.services.featured import (
+    get_featured_collection_ids,
+    get_featured_product_ids,
+)
+from saleor.marketplace.services.help_views import (
+    get_top_help_article_ids,
+    record_help_article_view,
 )
 from ..core.validators import validate_one_of_args_is_in_query
+from ...core.utils import get_client_ip
 from ...product import models as product_models
 from ..product.resolvers import resolve_collections
 from ..utils import get_user_or_app_from_context
-from .types import NewsletterSubscription, Seller, SellerAnalytics, Theme, UserPreferences
+from ..utils.sorting import sort_queryset_by_default
+from .dataloaders import FirstProductsPageBySellerLoader
+from .types import (
+    HelpArticle,
+    NewsletterSubscription,
+    Seller,
+    SellerAnalytics,
+    Theme,
+    UserPreferences,
+)
+
+SELLER_ORDERS_SORT_BY = {
+    "field": ["created_at", "order_id"],
+    "direction": "-",
+}
 
 
 def resolve_seller(info: ResolveInfo, id: str | None, slug: str | None):
@@ -36,9 +70,9 @@ def resolve_seller(info: ResolveInfo, id: str | None, slug: str | None):
     qs = models.Seller.objects.using(get_database_connection_name(info.context)).all()
     
     # Apply tenant filtering
-    current_seller = get_seller_from_context(info.context)
-    if current_seller:
-        qs = qs.filter(id=current_seller.id)
+    scope = get_tenant_scope_from_context(info.context)
+    if scope:
+        qs = scope.filter_sellers(qs)
 
     if id:
         _, db_id = from_global_id_or_error(id, Seller)
@@ -58,11 +92,11 @@ def resolve_sellers(info: ResolveInfo):
     
     # If there's a seller in context (from domain routing), filter to that seller only
     # This enables tenant isolation for seller-specific storefronts
-    context_seller = get_seller_from_context(info.context)
-    if context_seller:
+    scope = get_tenant_scope_from_context(info.context)
+    if scope:
         # For seller-specific storefronts, only show the current seller
-        qs = qs.filter(id=context_seller.id)
-        
+        qs = scope.filter_sellers(qs)
+
     return qs
 
 
@@ -74,9 +108,14 @@ def resolve_seller_analytics(
       if period:
           start_date = reporting_period_to_date(period)
 
-      revenue = calculate_seller_revenue(seller, start_date=start_date)
-      earnings = calculate_seller_earnings_total(seller, start_date=start_date)
-      order_count = get_seller_order_count(seller, start_date=start_date)
+      totals = get_seller_analytics_totals(
+          seller,
+          start_date=start_date,
+          database_connection_name=get_database_connection_name(info.context),
+      )
+      revenue = totals["revenue"]
+      earnings = totals["earnings"]
+      order_count = totals["order_count"]
       # Calculate platform fee total as revenue - earnings
       platform_fee_total = revenue - earnings
 
@@ -159,44 +198,48 @@ def resolve_user_preferences(info: ResolveInfo) -> Optional[UserPreferences]:
     return UserPreferences(**preferences_data)
 
 
+def _get_featured_channel(info: ResolveInfo, channel: Optional[str]):
+    """Return a promise of the channel whose featured content is requested."""
+    if not channel:
+        return Promise.resolve(None)
+    return ChannelBySlugLoader(info.context).load(str(channel))
+
+
 def resolve_featured_collections(
     info: ResolveInfo,
     channel: Optional[str] = None,
     first: Optional[int] = None,
 ):
     """Resolve featured collections for homepage.
-    
-    Collections are marked as featured via metadata key 'is_featured' = True.
+
+    Collections are featured per channel with `FeaturedCollection`; their IDs
+    are read from the featured content cache.
     """
-    from ...product import models as product_models
-    
     connection_name = get_database_connection_name(info.context)
     requestor = get_user_or_app_from_context(info.context)
-    
-    # Get collections marked as featured in metadata
-    collections = product_models.Collection.objects.using(connection_name).filter(
-        metadata__contains={"is_featured": True}
-    )
-    
-    # Filter by channel if provided
-    if channel:
-        # Filter to only published collections in this channel
-        published_collections = product_models.CollectionChannelListing.objects.using(
-            connection_name
-        ).filter(
-            channel__slug=channel,
-            is_published=True,
-        ).values_list("collection_id", flat=True)
-        collections = collections.filter(id__in=published_collections)
-    
-    # Apply visibility filtering (respects published/unpublished)
-    collections = collections.visible_to_user(requestor, channel)
-    
-    # Limit results
-    if first:
-        collections = collections[:first]
-    
-    return list(collections)
+
+    def _resolve_collections(channel_obj):
+        if channel and channel_obj is None:
+            return []
+        collection_ids = get_featured_collection_ids(
+            channel_obj.pk if channel_obj else None, connection_name
+        )
+        if not collection_ids:
+            return []
+        collection_map = (
+            product_models.Collection.objects.using(connection_name)
+            .visible_to_user(requestor, channel)
+            .filter(id__in=collection_ids)
+            .in_bulk()
+        )
+        collections = [
+            collection_map[collection_id]
+            for collection_id in collection_ids
+            if collection_id in collection_map
+        ]
+        return collections[:first] if first else collections
+
+    return _get_featured_channel(info, channel).then(_resolve_collections)
 
 
 def resolve_featured_products(
@@ -205,51 +248,36 @@ def resolve_featured_products(
     first: Optional[int] = None,
 ):
     """Resolve featured products for homepage.
-    
-    Products are marked as featured via metadata key 'is_featured' = True,
-    OR they belong to a featured collection.
+
+    Products are featured per channel with `FeaturedProduct`, followed by
+    products of featured collections; their IDs are read from the featured
+    content cache.
     """
-    from ...product import models as product_models
-    
     connection_name = get_database_connection_name(info.context)
     requestor = get_user_or_app_from_context(info.context)
-    
-    # Get products marked as featured in metadata
-    featured_products = product_models.Product.objects.using(connection_name).filter(
-        metadata__contains={"is_featured": True}
-    )
-    
-    # Also get products from featured collections
-    featured_collection_ids = product_models.Collection.objects.using(connection_name).filter(
-        metadata__contains={"is_featured": True}
-    ).values_list("id", flat=True)
-    
-    if featured_collection_ids:
-        products_from_collections = product_models.Product.objects.using(connection_name).filter(
-            collections__id__in=featured_collection_ids
+
+    def _resolve_products(channel_obj):
+        if channel and channel_obj is None:
+            return []
+        product_ids = get_featured_product_ids(
+            channel_obj.pk if channel_obj else None, connection_name
         )
-        # Combine both querysets
-        featured_products = (featured_products | products_from_collections).distinct()
-    
-    # Filter by channel if provided
-    if channel:
-        # Filter to only published products in this channel
-        published_products = product_models.ProductChannelListing.objects.using(
-            connection_name
-        ).filter(
-            channel__slug=channel,
-            is_published=True,
-        ).values_list("product_id", flat=True)
-        featured_products = featured_products.filter(id__in=published_products)
-    
-    # Apply visibility filtering
-    featured_products = featured_products.visible_to_user(requestor, channel)
-    
-    # Limit results
-    if first:
-        featured_products = featured_products[:first]
-    
-    return list(featured_products)
+        if not product_ids:
+            return []
+        product_map = (
+            product_models.Product.objects.using(connection_name)
+            .visible_to_user(requestor, channel_obj, channel_obj is not None)
+            .filter(id__in=product_ids)
+            .in_bulk()
+        )
+        products = [
+            product_map[product_id]
+            for product_id in product_ids
+            if product_id in product_map
+        ]
+        return products[:first] if first else products
+
+    return _get_featured_channel(info, channel).then(_resolve_products)
 
 
 def resolve_recently_viewed_products(
@@ -258,82 +286,78 @@ def resolve_recently_viewed_products(
     first: Optional[int] = None,
 ):
     """Resolve recently viewed products for the authenticated user."""
-    from ...product import models as product_models
-    from ..utils import get_user_or_app_from_context
-    
     user = info.context.user
     if not user or not user.is_authenticated:
-        return []
-    
+        return Promise.resolve([])
+
     connection_name = get_database_connection_name(info.context)
     requestor = get_user_or_app_from_context(info.context)
-    
-    # Get recently viewed product IDs from metadata
-    recently_viewed = user.get_value_from_metadata("recently_viewed_products", [])
-    if not isinstance(recently_viewed, list) or not recently_viewed:
-        return []
-    
-    # Extract product IDs (handle both UUID strings and dict format)
-    product_ids = []
-    for item in recently_viewed:
-        if isinstance(item, dict):
-            product_id_str = item.get("product_id")
-            if product_id_str:
-                try:
-                    from uuid import UUID
-                    product_ids.append(UUID(product_id_str))
-                except (ValueError, TypeError):
-                    continue
-        elif isinstance(item, str):
-            try:
-                from uuid import UUID
-                product_ids.append(UUID(item))
-            except (ValueError, TypeError):
-                continue
-    
-    if not product_ids:
-        return []
-    
-    # Get products
-    products = product_models.Product.objects.using(connection_name).filter(
-        id__in=product_ids
+    limited_channel_access = channel is not None
+    if channel is None and not has_one_of_permissions(
+        requestor, product_models.ALL_PRODUCTS_PERMISSIONS
+    ):
+        channel = get_default_channel_slug_or_graphql_error(
+            allow_replica=info.context.allow_replica
+        )
+
+    def _resolve_products(product_ids, channel_obj):
+        if not product_ids:
+            return []
+        products = (
+            product_models.Product.objects.using(connection_name)
+            .visible_to_user(requestor, channel_obj, limited_channel_access)
+            .filter(id__in=product_ids)
+        )
+        if channel_obj:
+            products = products.filter(
+                channel_listings__channel_id=channel_obj.pk,
+                channel_listings__is_published=True,
+            )
+        product_map = products.in_bulk()
+        ordered_products = [
+            product_map[product_id]
+            for product_id in product_ids
+            if product_id in product_map
+        ]
+        return ordered_products[:first] if first else ordered_products
+
+    product_ids = RecentlyViewedProductIdsByUserIdLoader(info.context).load(user.pk)
+    if not channel:
+        return product_ids.then(lambda ids: _resolve_products(ids, None))
+    return Promise.all(
+        [product_ids, ChannelBySlugLoader(info.context).load(str(channel))]
+    ).then(lambda data: _resolve_products(*data))
+
+
+def resolve_seller_products_first_page(
+    info: ResolveInfo, seller, qs, channel, is_seller_staff: bool, args
+):
+    """Build the first page of a seller's products connection.
+
+    The page is fetched by `FirstProductsPageBySellerLoader` together with pages
+    of the other sellers in the response; cursors are built the same way as by
+    `create_connection_slice`, so following pages can be requested with `after`.
+    """
+    from ..product.types.products import ProductCountableConnection
+
+    validate_connection_slice_args(info, args)
+    first = args["first"]
+    qs, sort_by = sort_queryset_by_default(qs, reversed=False)
+    channel_slug = channel.slug if channel else None
+
+    def _create_connection(products):
+        connection = create_connection_from_first_page(
+            products, qs, first, sort_by, ProductCountableConnection
+        )
+        for edge in connection.edges:
+            edge.node = ChannelContext(node=edge.node, channel_slug=channel_slug)
+        return connection
+
+    return (
+        FirstProductsPageBySellerLoader(info.context)
+        .load((seller.pk, channel, is_seller_staff, first))
+        .then(_create_connection)
     )
-    
-    # Filter by channel if provided
-    if channel:
-        # Filter to only published products in this channel
-        published_products = product_models.ProductChannelListing.objects.using(
-            connection_name
-        ).filter(
-            channel__slug=channel,
-            is_published=True,
-        ).values_list("product_id", flat=True)
-        products = products.filter(id__in=published_products)
-    
-    # Apply visibility filtering
-    products = products.visible_to_user(requestor, channel)
-    
-    # Maintain order from recently_viewed list
-    product_map = {str(product.id): product for product in products}
-    ordered_products = []
-    for item in recently_viewed:
-        if isinstance(item, dict):
-            product_id_str = item.get("product_id")
-        elif isinstance(item, str):
-            product_id_str = item
-        else:
-            continue
-        
-        if product_id_str in product_map:
-            ordered_products.append(product_map[product_id_str])
-            # Remove from map to avoid duplicates
-            del product_map[product_id_str]
-    
-    # Limit results
-    if first:
-        ordered_products = ordered_products[:first]
-    
-    return ordered_products
 
 
 def resolve_fulfillment_centers(info: ResolveInfo, is_active: Optional[bool] = None):
@@ -529,19 +553,24 @@ def resolve_return_policy(info: ResolveInfo, id: str):
 
 
 def resolve_seller_orders(info: ResolveInfo, seller_id: str):
-    """Resolve orders for a specific seller."""
-    from ..utils import get_user_or_app_from_context
-    from ...order import models as order_models
+    """Resolve seller order projections of a specific seller.
+
+    Return `SellerOrder` rows; paginate them with
+    `create_seller_orders_connection`.
+    """
     from .types import Seller
     
     _, seller_pk = from_global_id_or_error(seller_id, Seller)
     connection_name = get_database_connection_name(info.context)
     requestor = get_user_or_app_from_context(info.context)
     
-    # Get orders that have lines belonging to this seller
-    qs = order_models.Order.objects.using(connection_name).non_draft().filter(
-        lines__seller_id=seller_pk
-    ).distinct()
+    # Orders are listed through the seller order projection, which has at most
+    # one row per seller and order, so no line join or DISTINCT is needed.
+    qs = (
+        models.SellerOrder.objects.using(connection_name)
+        .filter(seller_id=seller_pk)
+        .exclude(status=OrderStatus.DRAFT)
+    )
     
     # Permission check: sellers can only see their own orders, staff/app can see all
     from saleor.permission.auth_filters import is_app, is_staff_user
@@ -551,9 +580,41 @@ def resolve_seller_orders(info: ResolveInfo, seller_id: str):
         seller = models.Seller.objects.using(connection_name).filter(id=seller_pk).first()
         if seller and seller.owner_id != requestor.id:
             # Not the seller owner and not staff/app - return empty queryset
-            return order_models.Order.objects.using(connection_name).none()
+            return qs.none()
     
-    return qs.order_by("-created_at")
+    return qs
+
+
+def create_seller_orders_connection(info: ResolveInfo, seller_orders, args):
+    """Build a connection of orders from a queryset of seller order projections.
+
+    The page is read from the projection with keyset cursors in the order of the
+    `(seller, -created_at, -order)` index, and only orders of the page are loaded.
+    """
+    from ...core.db.connection import allow_writer_in_context
+    from ...order import models as order_models
+    from ..order.types import OrderCountableConnection
+
+    validate_connection_slice_args(info, args)
+    direction = "" if args.get("last") else "-"
+    seller_orders = seller_orders.order_by(
+        f"{direction}created_at", f"{direction}order_id"
+    )
+    args["sort_by"] = SELLER_ORDERS_SORT_BY
+    with allow_writer_in_context(info.context):
+        connection = connection_from_queryset_slice(
+            seller_orders,
+            args,
+            OrderCountableConnection,
+            OrderCountableConnection.Edge,
+            graphene.relay.PageInfo,
+        )
+        orders = order_models.Order.objects.using(seller_orders.db).in_bulk(
+            [edge.node.order_id for edge in connection.edges]
+        )
+    for edge in connection.edges:
+        edge.node = orders[edge.node.order_id]
+    return connection
 
 
 def resolve_seller_settlements(
@@ -584,3 +645,53 @@ def resolve_seller_settlements(
         qs = qs.filter(status=status)
     
     return qs.order_by("-created_at")
+
+
+def resolve_help_article(info: ResolveInfo, id: str | None, slug: str | None):
+    """Resolve an active help article by ID or slug and record its view."""
+    validate_one_of_args_is_in_query("id", id, "slug", slug)
+
+    qs = models.HelpArticle.objects.using(
+        get_database_connection_name(info.context)
+    ).filter(is_active=True)
+    if id:
+        _, db_id = from_global_id_or_error(id, HelpArticle)
+        article = qs.filter(id=db_id).first()
+    else:
+        article = qs.filter(slug=slug).first()
+
+    if article:
+        # Views are buffered and flushed in batches, so serving an article doesn't
+        # write to its row.
+        record_help_article_view(
+            article.pk,
+            user=info.context.user,
+            ip_address=get_client_ip(info.context),
+            user_agent=info.context.META.get("HTTP_USER_AGENT", ""),
+        )
+    return article
+
+
+def resolve_top_help_articles(info: ResolveInfo, category_slug: str | None = None):
+    """Resolve the most viewed active help articles, optionally of a category."""
+    connection_name = get_database_connection_name(info.context)
+    category_id = None
+    if category_slug:
+        category_id = (
+            models.HelpCategory.objects.using(connection_name)
+            .filter(slug=category_slug)
+            .values_list("pk", flat=True)
+            .first()
+        )
+        if category_id is None:
+            return []
+
+    article_ids = get_top_help_article_ids(
+        category_id, database_connection_name=connection_name
+    )
+    articles = (
+        models.HelpArticle.objects.using(connection_name)
+        .filter(is_active=True)
+        .in_bulk(article_ids)
+    )
+    return [articles[pk] for pk in article_ids if pk in articles]
@@ -5,6 +5,7 @@ import graphene
 from ..core.connection import CountableConnection, create_connection_slice
 from ..core.doc_category import DOC_CATEGORY_MARKETPLACE
 from ..core.fields import BaseField, ConnectionField
+from ..core.types import NonNullList
 from .schema_loyalty import (
     BadgeQueries,
     LoyaltyMutations,
@@ -48,6 +49,7 @@ from .resolvers import (
       resolve_featured_products,
       resolve_fulfillment_center,
       resolve_fulfillment_centers,
+      resolve_help_article,
       resolve_newsletter_subscription,
       resolve_newsletter_subscriptions,
       resolve_product_submission,
@@ -61,6 +63,7 @@ from .resolvers import (
       resolve_sellers,
       resolve_theme,
       resolve_themes,
+      resolve_top_help_articles,
       resolve_user_preferences,
   )
 from .resolvers_shipping import (
@@ -83,6 +86,7 @@ from .resolvers_loyalty import (
   )
 from .types import (
     FulfillmentCenter,
+    HelpArticle,
     NewsletterSubscription,
     ProductSubmission,
     ReturnPolicy,
@@ -187,11 +191,10 @@ class SellerQueries(graphene.ObjectType):
 
     @staticmethod
     def resolve_seller_orders(_root, info, seller_id, **kwargs):
-        from .resolvers import resolve_seller_orders
-        from ..order.types import OrderCountableConnection
+        from .resolvers import create_seller_orders_connection, resolve_seller_orders
         
         qs = resolve_seller_orders(info, seller_id)
-        return create_connection_slice(qs, info, kwargs, OrderCountableConnection)
+        return create_seller_orders_connection(info, qs, kwargs)
 
     @staticmethod
     def resolve_seller_settlements(_root, info, seller_id, status=None, **kwargs):
@@ -382,57 +385,57 @@ class HomepageQueries(graphene.ObjectType):
         """Resolve featured collections for homepage."""
         from ...core.context import ChannelContext
         
-        collections = resolve_featured_collections(
+        def _create_connection(collections):
+            # Wrap collections in ChannelContext for proper GraphQL resolution
+            channel_contexts = [
+                ChannelContext(node=collection, channel_slug=channel)
+                for collection in collections
+            ]
+            return create_connection_slice(
+                channel_contexts, info, kwargs, CollectionCountableConnection
+            )
+
+        return resolve_featured_collections(
             info, channel=channel, first=kwargs.get("first")
-        )
-        
-        # Wrap collections in ChannelContext for proper GraphQL resolution
-        channel_contexts = [
-            ChannelContext(node=collection, channel_slug=channel)
-            for collection in collections
-        ]
-        
-        return create_connection_slice(
-            channel_contexts, info, kwargs, CollectionCountableConnection
-        )
+        ).then(_create_connection)
 
     @staticmethod
     def resolve_featured_products(_root, info, channel=None, **kwargs):
         """Resolve featured products for homepage."""
         from ...core.context import ChannelContext
         
-        products = resolve_featured_products(
+        def _create_connection(products):
+            # Wrap products in ChannelContext for proper GraphQL resolution
+            channel_contexts = [
+                ChannelContext(node=product, channel_slug=channel)
+                for product in products
+            ]
+            return create_connection_slice(
+                channel_contexts, info, kwargs, ProductCountableConnection
+            )
+
+        return resolve_featured_products(
             info, channel=channel, first=kwargs.get("first")
-        )
-        
-        # Wrap products in ChannelContext for proper GraphQL resolution
-        channel_contexts = [
-            ChannelContext(node=product, channel_slug=channel)
-            for product in products
-        ]
-        
-        return create_connection_slice(
-            channel_contexts, info, kwargs, ProductCountableConnection
-        )
+        ).then(_create_connection)
 
     @staticmethod
     def resolve_recently_viewed_products(_root, info, channel=None, **kwargs):
         """Resolve recently viewed products for the authenticated user."""
         from ...core.context import ChannelContext
         
-        products = resolve_recently_viewed_products(
+        def _create_connection(products):
+            # Wrap products in ChannelContext for proper GraphQL resolution
+            channel_contexts = [
+                ChannelContext(node=product, channel_slug=channel)
+                for product in products
+            ]
+            return create_connection_slice(
+                channel_contexts, info, kwargs, ProductCountableConnection
+            )
+
+        return resolve_recently_viewed_products(
             info, channel=channel, first=kwargs.get("first")
-        )
-        
-        # Wrap products in ChannelContext for proper GraphQL resolution
-        channel_contexts = [
-            ChannelContext(node=product, channel_slug=channel)
-            for product in products
-        ]
-        
-        return create_connection_slice(
-            channel_contexts, info, kwargs, ProductCountableConnection
-        )
+        ).then(_create_connection)
 
 
 class FulfillmentCenterQueries(graphene.ObjectType):
@@ -646,3 +649,34 @@ class ReturnPolicyQueries(graphene.ObjectType):
             info, seller_id=seller_id, product_id=product_id, is_active=is_active
         )
         return create_connection_slice(qs, info, kwargs, ReturnPolicyCountableConnection)
+
+
+class HelpArticleQueries(graphene.ObjectType):
+    """Queries for help center articles."""
+
+    help_article = BaseField(
+        HelpArticle,
+        id=graphene.Argument(graphene.ID, description="ID of the help article."),
+        slug=graphene.Argument(
+            graphene.String, description="Slug of the help article."
+        ),
+        description="Look up an active help article by ID or slug and count its view.",
+        doc_category=DOC_CATEGORY_MARKETPLACE,
+    )
+    top_help_articles = BaseField(
+        NonNullList(HelpArticle),
+        required=True,
+        category_slug=graphene.Argument(
+            graphene.String, description="Slug of the help category."
+        ),
+        description="Most viewed help articles of the recent days.",
+        doc_category=DOC_CATEGORY_MARKETPLACE,
+    )
+
+    @staticmethod
+    def resolve_help_article(_root, info, id=None, slug=None):
+        return resolve_help_article(info, id, slug)
+
+    @staticmethod
+    def resolve_top_help_articles(_root, info, category_slug=None):
+        return resolve_top_help_articles(info, category_slug=category_slug)
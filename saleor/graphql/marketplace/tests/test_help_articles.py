@@ -0,0 +1,132 @@
+from unittest.mock import patch
+
+import graphene
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from ....marketplace.analytics import get_bucket_date
+from ....marketplace.models_help import (
+    HelpArticle,
+    HelpArticleDailyViews,
+    HelpArticleView,
+    HelpCategory,
+)
+from ....marketplace.services.help_views import HelpArticleViewEvent
+from ...tests.utils import get_graphql_content
+
+HELP_ARTICLE_QUERY = """
+    query HelpArticle($slug: String) {
+        helpArticle(slug: $slug) {
+            id
+            title
+        }
+    }
+"""
+
+TOP_HELP_ARTICLES_QUERY = """
+    query TopHelpArticles($categorySlug: String) {
+        topHelpArticles(categorySlug: $categorySlug) {
+            slug
+        }
+    }
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def help_articles(db):
+    shipping = HelpCategory.objects.create(name="Shipping", slug="shipping")
+    payments = HelpCategory.objects.create(name="Payments", slug="payments")
+    return HelpArticle.objects.bulk_create(
+        [
+            HelpArticle(
+                title=f"Article {i}",
+                slug=f"article-{i}",
+                content="Content",
+                category=category,
+            )
+            for i, category in enumerate([shipping, shipping, payments])
+        ]
+    )
+
+
+@patch("saleor.marketplace.tasks.store_help_article_views_task.delay")
+def test_help_article_query_records_view(
+    mocked_store_views_task, api_client, help_articles, settings
+):
+    # given
+    settings.HELP_ARTICLE_VIEW_BUFFER_BROKER_URL = None
+    article = help_articles[0]
+
+    # when
+    response = api_client.post_graphql(HELP_ARTICLE_QUERY, {"slug": article.slug})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["helpArticle"]["id"] == graphene.Node.to_global_id(
+        "HelpArticle", article.pk
+    )
+    # without the buffer the view is stored by a task, not on the request path
+    assert not HelpArticleView.objects.exists()
+    [views] = mocked_store_views_task.call_args.args
+    assert [HelpArticleViewEvent.decode(view).article_id for view in views] == [
+        article.pk
+    ]
+
+
+def test_help_article_query_inactive_article(api_client, help_articles, settings):
+    # given
+    settings.HELP_ARTICLE_VIEW_BUFFER_BROKER_URL = None
+    article = help_articles[0]
+    article.is_active = False
+    article.save(update_fields=["is_active"])
+
+    # when
+    response = api_client.post_graphql(HELP_ARTICLE_QUERY, {"slug": article.slug})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["helpArticle"] is None
+    assert not HelpArticleView.objects.exists()
+
+
+def test_top_help_articles_query(api_client, help_articles):
+    # given
+    first, second, other = help_articles
+    today = get_bucket_date(timezone.now())
+    HelpArticleDailyViews.objects.bulk_create(
+        [
+            HelpArticleDailyViews(article=article, date=today, views_count=count)
+            for article, count in [(first, 1), (second, 3), (other, 5)]
+        ]
+    )
+
+    # when
+    response = api_client.post_graphql(
+        TOP_HELP_ARTICLES_QUERY, {"categorySlug": "shipping"}
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["topHelpArticles"] == [
+        {"slug": second.slug},
+        {"slug": first.slug},
+    ]
+
+
+def test_top_help_articles_query_unknown_category(api_client, help_articles):
+    # when
+    response = api_client.post_graphql(
+        TOP_HELP_ARTICLES_QUERY, {"categorySlug": "unknown"}
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["topHelpArticles"] == []
@@ -0,0 +1,135 @@
+"""Tests for the products connection of sellers."""
+
+import graphene
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ....account.models import User
+from ....marketplace.models import Seller, SellerStatus
+from ....product.models import Product, ProductChannelListing
+from ...tests.utils import get_graphql_content
+
+SELLERS_PRODUCTS_QUERY = """
+    query SellersProducts($channel: String, $first: Int!, $after: String) {
+        sellers(first: 10) {
+            edges {
+                node {
+                    storeName
+                    channel {
+                        slug
+                    }
+                    products(channel: $channel, first: $first, after: $after) {
+                        edges {
+                            node {
+                                id
+                            }
+                        }
+                        pageInfo {
+                            hasNextPage
+                            endCursor
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture
+def create_seller_with_products(product_type, channel_USD):
+    def create(index, products_count=3):
+        seller = Seller.objects.create(
+            store_name=f"Seller {index}",
+            slug=f"seller-{index}",
+            owner=User.objects.create_user(email=f"seller-{index}@example.com"),
+            channel=channel_USD,
+            status=SellerStatus.ACTIVE,
+        )
+        products = Product.objects.bulk_create(
+            [
+                Product(
+                    name=f"Product {index}-{i}",
+                    slug=f"product-{index}-{i}",
+                    product_type=product_type,
+                    seller=seller,
+                )
+                for i in range(products_count)
+            ]
+        )
+        ProductChannelListing.objects.bulk_create(
+            [
+                ProductChannelListing(
+                    product=product, channel=channel_USD, is_published=True
+                )
+                for product in products
+            ]
+        )
+        return seller, products
+
+    return create
+
+
+def test_seller_products_first_page(
+    staff_api_client,
+    permission_manage_products,
+    channel_USD,
+    create_seller_with_products,
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    _, products = create_seller_with_products(0)
+    variables = {"channel": channel_USD.slug, "first": 2}
+
+    # when
+    response = staff_api_client.post_graphql(SELLERS_PRODUCTS_QUERY, variables)
+
+    # then
+    content = get_graphql_content(response)
+    [seller_data] = content["data"]["sellers"]["edges"]
+    connection_data = seller_data["node"]["products"]
+    assert seller_data["node"]["channel"]["slug"] == channel_USD.slug
+    assert [edge["node"]["id"] for edge in connection_data["edges"]] == [
+        graphene.Node.to_global_id("Product", product.pk) for product in products[:2]
+    ]
+    assert connection_data["pageInfo"]["hasNextPage"] is True
+
+    # when
+    variables["after"] = connection_data["pageInfo"]["endCursor"]
+    response = staff_api_client.post_graphql(SELLERS_PRODUCTS_QUERY, variables)
+
+    # then
+    content = get_graphql_content(response)
+    connection_data = content["data"]["sellers"]["edges"][0]["node"]["products"]
+    assert [edge["node"]["id"] for edge in connection_data["edges"]] == [
+        graphene.Node.to_global_id("Product", products[2].pk)
+    ]
+    assert connection_data["pageInfo"]["hasNextPage"] is False
+
+
+def test_seller_products_query_count_does_not_depend_on_sellers(
+    staff_api_client,
+    permission_manage_products,
+    channel_USD,
+    create_seller_with_products,
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    create_seller_with_products(0)
+    variables = {"channel": channel_USD.slug, "first": 2}
+    with CaptureQueriesContext(connection) as single_seller_queries:
+        get_graphql_content(
+            staff_api_client.post_graphql(SELLERS_PRODUCTS_QUERY, variables)
+        )
+    for index in range(1, 5):
+        create_seller_with_products(index)
+
+    # when
+    with CaptureQueriesContext(connection) as many_sellers_queries:
+        response = staff_api_client.post_graphql(SELLERS_PRODUCTS_QUERY, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert len(content["data"]["sellers"]["edges"]) == 5
+    assert len(many_sellers_queries) == len(single_seller_queries)
@@ -0,0 +1,311 @@
+"""Query-count regression tests for the storefront and dashboard seller queries."""
+
+from datetime import timedelta
+from decimal import Decimal
+
+import graphene
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from ....account.models import User
+from ....marketplace.models import (
+    Seller,
+    SellerDomain,
+    SellerDomainStatus,
+    SellerOrder,
+    SellerSettlement,
+    SellerStatus,
+    SellerStorefrontSettings,
+    SellerTaxRegistration,
+)
+from ....order import OrderStatus
+from ...tests.utils import get_graphql_content
+
+STOREFRONT_SELLERS_QUERY = """
+    query StorefrontSellers {
+        sellers(first: 10) {
+            edges {
+                node {
+                    storeName
+                    channel {
+                        slug
+                    }
+                    domains {
+                        domain
+                        isPrimary
+                    }
+                    storefrontSettings {
+                        primaryColor
+                        seller {
+                            slug
+                        }
+                    }
+                    logisticsConfig {
+                        handlingTimeDays
+                        seller {
+                            slug
+                        }
+                    }
+                    discountConfig {
+                        allowSkuLevelDiscounts
+                    }
+                }
+            }
+        }
+    }
+"""
+
+DASHBOARD_SELLERS_QUERY = """
+    query DashboardSellers {
+        sellers(first: 10) {
+            edges {
+                node {
+                    storeName
+                    taxRegistrations {
+                        registrationNumber
+                        country {
+                            code
+                        }
+                    }
+                    settlementSummaries {
+                        currency
+                        settlementCount
+                        sellerEarnings {
+                            amount
+                        }
+                    }
+                    analytics {
+                        orderCount
+                        revenue {
+                            currency
+                        }
+                    }
+                    logisticsConfig {
+                        handlingTimeDays
+                    }
+                    discountConfig {
+                        maxDiscountPercentage
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture
+def create_seller(channel_USD):
+    def create(index):
+        seller = Seller.objects.create(
+            store_name=f"Seller {index}",
+            slug=f"seller-{index}",
+            owner=User.objects.create_user(email=f"seller-{index}@example.com"),
+            channel=channel_USD,
+            status=SellerStatus.ACTIVE,
+        )
+        # logistics, discount and storefront configs are created with the seller
+        SellerStorefrontSettings.objects.filter(seller=seller).update(
+            primary_color="#000"
+        )
+        SellerDomain.objects.create(
+            seller=seller,
+            domain=f"seller-{index}.example.com",
+            is_primary=True,
+            status=SellerDomainStatus.ACTIVE,
+        )
+        SellerTaxRegistration.objects.create(
+            seller=seller,
+            registration_type="vat",
+            registration_number=f"PL{index:010}",
+            country="PL",
+        )
+        SellerSettlement.objects.bulk_create(
+            [
+                SellerSettlement(
+                    seller=seller,
+                    order_total=Decimal(100),
+                    platform_fee=Decimal(10),
+                    seller_earnings=Decimal(90),
+                    currency=currency,
+                )
+                for currency in ["USD", "USD", "EUR"]
+            ]
+        )
+        return seller
+
+    return create
+
+
+def test_dashboard_sellers_query(staff_api_client, create_seller):
+    # given
+    create_seller(0)
+
+    # when
+    response = staff_api_client.post_graphql(DASHBOARD_SELLERS_QUERY)
+
+    # then
+    content = get_graphql_content(response)
+    [seller_data] = content["data"]["sellers"]["edges"]
+    node = seller_data["node"]
+    assert node["taxRegistrations"] == [
+        {"registrationNumber": "PL0000000000", "country": {"code": "PL"}}
+    ]
+    summaries = {
+        summary["currency"]: summary for summary in node["settlementSummaries"]
+    }
+    assert summaries["USD"]["settlementCount"] == 2
+    assert summaries["USD"]["sellerEarnings"]["amount"] == 180
+    assert summaries["EUR"]["settlementCount"] == 1
+    assert (
+        node["analytics"]["revenue"]["currency"]
+        == (node["settlementSummaries"][0]["currency"])
+    )
+    assert node["logisticsConfig"] is not None
+    assert node["discountConfig"] is not None
+
+
+SELLER_PRIVATE_DATA_QUERY = """
+    query SellerPrivateData {
+        sellers(first: 10) {
+            edges {
+                node {
+                    taxRegistrations {
+                        registrationNumber
+                    }
+                    settlementSummaries {
+                        currency
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_seller_private_data_hidden_from_other_users(user_api_client, create_seller):
+    # given
+    create_seller(0)
+
+    # when
+    response = user_api_client.post_graphql(SELLER_PRIVATE_DATA_QUERY)
+
+    # then
+    content = get_graphql_content(response)
+    [seller_data] = content["data"]["sellers"]["edges"]
+    assert seller_data["node"] == {"taxRegistrations": [], "settlementSummaries": []}
+
+
+def test_seller_private_data_visible_to_seller_owner(user_api_client, create_seller):
+    # given
+    seller = create_seller(0)
+    seller.owner = user_api_client.user
+    seller.save(update_fields=["owner"])
+
+    # when
+    response = user_api_client.post_graphql(SELLER_PRIVATE_DATA_QUERY)
+
+    # then
+    content = get_graphql_content(response)
+    [seller_data] = content["data"]["sellers"]["edges"]
+    node = seller_data["node"]
+    assert node["taxRegistrations"] == [{"registrationNumber": "PL0000000000"}]
+    assert {summary["currency"] for summary in node["settlementSummaries"]} == {
+        "USD",
+        "EUR",
+    }
+
+
+def test_seller_private_data_visible_to_seller_staff(user_api_client, create_seller):
+    # given
+    seller = create_seller(0)
+    seller.staff.add(user_api_client.user)
+
+    # when
+    response = user_api_client.post_graphql(SELLER_PRIVATE_DATA_QUERY)
+
+    # then
+    content = get_graphql_content(response)
+    [seller_data] = content["data"]["sellers"]["edges"]
+    node = seller_data["node"]
+    assert node["taxRegistrations"] == [{"registrationNumber": "PL0000000000"}]
+
+
+@pytest.mark.parametrize("query", [STOREFRONT_SELLERS_QUERY, DASHBOARD_SELLERS_QUERY])
+def test_sellers_query_count_does_not_depend_on_sellers(
+    query, staff_api_client, create_seller
+):
+    # given
+    create_seller(0)
+    with CaptureQueriesContext(connection) as single_seller_queries:
+        get_graphql_content(staff_api_client.post_graphql(query))
+    for index in range(1, 5):
+        create_seller(index)
+
+    # when
+    with CaptureQueriesContext(connection) as many_sellers_queries:
+        response = staff_api_client.post_graphql(query)
+
+    # then
+    content = get_graphql_content(response)
+    assert len(content["data"]["sellers"]["edges"]) == 5
+    assert len(many_sellers_queries) == len(single_seller_queries)
+
+
+SELLER_ORDERS_QUERY = """
+    query SellerOrders($sellerId: ID!, $after: String) {
+        sellerOrders(sellerId: $sellerId, first: 2, after: $after) {
+            totalCount
+            edges {
+                node {
+                    id
+                }
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    }
+"""
+
+
+def test_seller_orders_query_paginates_newest_first(
+    staff_api_client, create_seller, order_list
+):
+    # given
+    seller = create_seller(0)
+    now = timezone.now()
+    SellerOrder.objects.bulk_create(
+        [
+            SellerOrder(
+                seller=seller,
+                order=order,
+                created_at=now - timedelta(days=index),
+                status=OrderStatus.UNFULFILLED,
+                currency="USD",
+            )
+            for index, order in enumerate(order_list)
+        ]
+    )
+    variables = {"sellerId": graphene.Node.to_global_id("Seller", seller.pk)}
+
+    # when
+    first_page = get_graphql_content(
+        staff_api_client.post_graphql(SELLER_ORDERS_QUERY, variables)
+    )["data"]["sellerOrders"]
+    second_page = get_graphql_content(
+        staff_api_client.post_graphql(
+            SELLER_ORDERS_QUERY,
+            {**variables, "after": first_page["pageInfo"]["endCursor"]},
+        )
+    )["data"]["sellerOrders"]
+
+    # then
+    assert first_page["totalCount"] == len(order_list)
+    assert first_page["pageInfo"]["hasNextPage"] is True
+    assert second_page["pageInfo"]["hasNextPage"] is False
+    assert [
+        edge["node"]["id"] for edge in first_page["edges"] + second_page["edges"]
+    ] == [graphene.Node.to_global_id("Order", order.pk) for order in order_list]
@@ -8,7 +8,18 @@ from ..core.connection import CountableConnection
 from ..core.doc_category import DOC_CATEGORY_MARKETPLACE
 from ..core.fields import BaseField, ConnectionField, JSONString
 from ..core.scalars import DateTime, Decimal
-from ..core.types import CountryDisplay, Image, ModelObjectType, Money
+from ..core.types import CountryDisplay, Image, ModelObjectType, Money, NonNullList
+from .dataloaders import (
+    SellerAnalyticsTotalsLoader,
+    SellerByIdLoader,
+    SellerDiscountConfigBySellerIdLoader,
+    SellerDomainsBySellerIdLoader,
+    SellerLogisticsConfigBySellerIdLoader,
+    SellerStaffIdsBySellerIdLoader,
+    SellerStorefrontSettingsBySellerIdLoader,
+    SellerTaxRegistrationsBySellerIdLoader,
+    SettlementSummariesBySellerIdLoader,
+)
 from .enums import (
     DistributorCategoryEnum,
     FulfillmentMethodEnum,
@@ -19,9 +30,29 @@ from .enums import (
     SellerTypeEnum,
     SettlementStatusEnum,
     PricingTypeEnum,
+    TaxRegistrationTypeEnum,
 )
 
 
+def _load_if_seller_staff(root: models.Seller, info, loader_class):
+    """Load private data of a seller for staff and the seller's owner or staff.
+
+    Other requestors get an empty list.
+    """
+    user = info.context.user
+    if not user or not user.is_authenticated:
+        return []
+    if user.is_staff or root.owner_id == user.pk:
+        return loader_class(info.context).load(root.pk)
+
+    def _load(staff_ids):
+        if user.pk not in staff_ids:
+            return []
+        return loader_class(info.context).load(root.pk)
+
+    return SellerStaffIdsBySellerIdLoader(info.context).load(root.pk).then(_load)
+
+
 class Seller(ModelObjectType[models.Seller]):
     """Represents a seller/vendor in the marketplace."""
 
@@ -52,6 +83,31 @@ class Seller(ModelObjectType[models.Seller]):
         "saleor.graphql.marketplace.types.SellerDiscountConfig",
         description="Seller-specific discount configuration (marketplace).",
     )
+    storefront_settings = graphene.Field(
+        "saleor.graphql.marketplace.types.SellerStorefrontSettings",
+        description="Storefront settings and branding of the seller.",
+    )
+    domains = NonNullList(
+        "saleor.graphql.marketplace.types.SellerDomain",
+        required=True,
+        description="Domains of the seller's storefront.",
+    )
+    tax_registrations = NonNullList(
+        "saleor.graphql.marketplace.types.SellerTaxRegistration",
+        required=True,
+        description=(
+            "Tax registrations of the seller. Empty unless requested by staff or "
+            "by the seller's owner or staff."
+        ),
+    )
+    settlement_summaries = NonNullList(
+        "saleor.graphql.marketplace.types.SellerSettlementSummary",
+        required=True,
+        description=(
+            "Settlement totals of the seller per currency, latest settlement first. "
+            "Empty unless requested by staff or by the seller's owner or staff."
+        ),
+    )
     created_at = DateTime(required=True)
     updated_at = DateTime(required=True)
 
@@ -83,82 +139,89 @@ class Seller(ModelObjectType[models.Seller]):
 
     @staticmethod
     def resolve_channel(root: models.Seller, info):
-        return root.channel
+        from ..channel.dataloaders.by_self import ChannelByIdLoader
+
+        if not root.channel_id:
+            return None
+        return ChannelByIdLoader(info.context).load(root.channel_id)
 
     @staticmethod
     def resolve_products(root: models.Seller, info, channel=None, **kwargs):
-        """Resolve products for this seller."""
+        """Resolve products for this seller.
+
+        Products are paginated at the database with keyset cursors and only the
+        returned page is wrapped in `ChannelContext`. The first page is loaded for
+        all sellers of a list at once.
+        """
+        from promise import Promise
+
         from ...product import models as product_models
+        from ..channel.dataloaders.by_self import ChannelBySlugLoader
         from ..core.connection import create_connection_slice
-        from ...core.context import ChannelContext
-        from ..core.context import get_database_connection_name
+        from ..core.context import ChannelQsContext, get_database_connection_name
         from ..product.types.products import ProductCountableConnection
-        
-        connection_name = get_database_connection_name(info.context)
-        qs = product_models.Product.objects.using(connection_name).filter(seller=root)
-        
-        channel_obj = None
-        # Apply channel filtering if provided
-        if channel:
-            from ...channel.models import Channel as ChannelModel
-            try:
-                channel_obj = ChannelModel.objects.using(connection_name).get(slug=channel)
-                # Filter by channel listing
-                published_products = product_models.ProductChannelListing.objects.using(
-                    connection_name
-                ).filter(
-                    channel=channel_obj,
-                    is_published=True,
-                ).values_list("product_id", flat=True)
-                qs = qs.filter(id__in=published_products)
-            except ChannelModel.DoesNotExist:
-                qs = product_models.Product.objects.none()
-        
-        # Apply visibility filtering:
-        # - seller owner/staff can see all their products (including pending)
-        # - others see only storefront-visible products
         from ..utils import get_user_or_app_from_context
+        from .dataloaders import SellerStaffIdsBySellerIdLoader, filter_seller_products
+        from .resolvers import resolve_seller_products_first_page
+
         requestor = get_user_or_app_from_context(info.context)
-        if requestor and hasattr(requestor, "pk"):
-            is_seller_staff = (
-                root.owner_id == requestor.pk
-                or root.staff.filter(pk=requestor.pk).exists()
+        user = info.context.user
+        is_authenticated = bool(user and user.is_authenticated)
+
+        def _resolve_products(channel_obj, staff_ids):
+            if channel and channel_obj is None:
+                return create_connection_slice(
+                    product_models.Product.objects.none(),
+                    info,
+                    kwargs,
+                    ProductCountableConnection,
+                )
+            is_seller_staff = is_authenticated and (
+                root.owner_id == user.pk or user.pk in staff_ids
             )
-        else:
-            is_seller_staff = False
-        if not is_seller_staff:
-            # visible_to_user expects a Channel object (or None), not a slug string.
-            qs = qs.visible_to_user(
+            qs = filter_seller_products(
+                product_models.Product.objects.using(
+                    get_database_connection_name(info.context)
+                ).filter(seller_id=root.pk),
                 requestor,
                 channel_obj,
-                limited_channel_access=bool(channel),
+                is_seller_staff,
             )
-        
-        # Wrap in ChannelContext
-        channel_contexts = [
-            ChannelContext(node=product, channel_slug=channel)
-            for product in qs
-        ]
-        
-        return create_connection_slice(
-            channel_contexts, info, kwargs, ProductCountableConnection
+            if kwargs.get("first") and not any(
+                kwargs.get(arg) for arg in ("last", "after", "before")
+            ):
+                return resolve_seller_products_first_page(
+                    info, root, qs, channel_obj, is_seller_staff, kwargs
+                )
+            return create_connection_slice(
+                ChannelQsContext(qs=qs, channel_slug=channel),
+                info,
+                kwargs,
+                ProductCountableConnection,
+            )
+
+        channel_obj = (
+            ChannelBySlugLoader(info.context).load(str(channel)) if channel else None
+        )
+        staff_ids = (
+            SellerStaffIdsBySellerIdLoader(info.context).load(root.pk)
+            if is_authenticated
+            else set()
+        )
+        return Promise.all([channel_obj, staff_ids]).then(
+            lambda data: _resolve_products(*data)
         )
 
     @staticmethod
     def resolve_orders(root: models.Seller, info, **kwargs):
         """Resolve orders for this seller."""
-        from ...order import models as order_models
-        from ..core.connection import create_connection_slice
         from ..core.context import get_database_connection_name
-        from ..order.types import OrderCountableConnection
+        from .resolvers import create_seller_orders_connection
         
         connection_name = get_database_connection_name(info.context)
-        # Filter orders that have at least one order line belonging to this seller
-        qs = order_models.Order.objects.using(connection_name).filter(
-            lines__seller=root
-        ).distinct()
+        qs = models.SellerOrder.objects.using(connection_name).filter(seller_id=root.pk)
         
-        return create_connection_slice(qs, info, kwargs, OrderCountableConnection)
+        return create_seller_orders_connection(info, qs, kwargs)
 
     @staticmethod
     def resolve_settlements(root: models.Seller, info, **kwargs):
@@ -182,68 +245,95 @@ class Seller(ModelObjectType[models.Seller]):
     @staticmethod
     def resolve_logistics_config(root: models.Seller, info):
         """Resolve logistics configuration for this seller."""
-        try:
-            return root.logistics_config
-        except models.SellerLogisticsConfig.DoesNotExist:
-            return None
+        return SellerLogisticsConfigBySellerIdLoader(info.context).load(root.pk)
 
     @staticmethod
     def resolve_discount_config(root: models.Seller, info):
         """Resolve discount configuration for this seller."""
-        try:
-            return root.discount_config
-        except Exception:
-            return None
+        return SellerDiscountConfigBySellerIdLoader(info.context).load(root.pk)
 
     @staticmethod
-    def resolve_analytics(root: models.Seller, info, period=None, seller_type=None):
-        from saleor.marketplace.utils import (
-            calculate_seller_earnings_total,
-            calculate_seller_revenue,
-            get_seller_order_count,
+    def resolve_storefront_settings(root: models.Seller, info):
+        return SellerStorefrontSettingsBySellerIdLoader(info.context).load(root.pk)
+
+    @staticmethod
+    def resolve_domains(root: models.Seller, info):
+        return SellerDomainsBySellerIdLoader(info.context).load(root.pk)
+
+    @staticmethod
+    def resolve_tax_registrations(root: models.Seller, info):
+        return _load_if_seller_staff(
+            root, info, SellerTaxRegistrationsBySellerIdLoader
         )
-        from ..utils.filters import reporting_period_to_date
-        from ...core.prices import Money
+
+    @staticmethod
+    def resolve_settlement_summaries(root: models.Seller, info):
+        return _load_if_seller_staff(root, info, SettlementSummariesBySellerIdLoader)
+
+    @staticmethod
+    def resolve_analytics(root: models.Seller, info, period=None, seller_type=None):
         from decimal import Decimal
 
+        from promise import Promise
+
+        from ...core.prices import Money
+        from ..channel.dataloaders.by_self import ChannelByIdLoader
+        from ..utils.filters import reporting_period_to_date
+
+        channel = (
+            ChannelByIdLoader(info.context).load(root.channel_id)
+            if root.channel_id
+            else None
+        )
+
         # If seller_type filter is provided, filter analytics by seller type
         # This allows separating B2B vs B2C analytics
         if seller_type:
             seller_type_value = seller_type.value if hasattr(seller_type, 'value') else seller_type
             # If seller_type doesn't match, return zero analytics
             if root.seller_type != seller_type_value:
-                currency = root.channel.currency_code if root.channel else "USD"
-                return SellerAnalytics(
-                    revenue=Money(Decimal("0"), currency),
-                    earnings=Money(Decimal("0"), currency),
-                    order_count=0,
-                    platform_fee_total=Money(Decimal("0"), currency),
-                )
+
+                def _empty_analytics(channel):
+                    currency = channel.currency_code if channel else "USD"
+                    return SellerAnalytics(
+                        revenue=Money(Decimal("0"), currency),
+                        earnings=Money(Decimal("0"), currency),
+                        order_count=0,
+                        platform_fee_total=Money(Decimal("0"), currency),
+                    )
+
+                return Promise.resolve(channel).then(_empty_analytics)
 
         start_date = None
         if period:
             start_date = reporting_period_to_date(period)
 
-        revenue = calculate_seller_revenue(root, start_date=start_date)
-        earnings = calculate_seller_earnings_total(root, start_date=start_date)
-        order_count = get_seller_order_count(root, start_date=start_date)
-
-        # Calculate platform fee total
-        platform_fee_total = revenue - earnings
-
-        # Get default currency from seller's first settlement or channel
-        currency = "USD"  # Default
-        if hasattr(root, "settlements") and root.settlements.exists():
-            currency = root.settlements.first().currency
-        elif root.channel and hasattr(root.channel, "currency_code"):
-            currency = root.channel.currency_code
-
-        return SellerAnalytics(
-            revenue=Money(revenue, currency),
-            earnings=Money(earnings, currency),
-            order_count=order_count,
-            platform_fee_total=Money(platform_fee_total, currency),
-        )
+        def _resolve_analytics(data):
+            totals, summaries, channel = data
+            revenue = totals["revenue"]
+            earnings = totals["earnings"]
+
+            # Currency of the seller's latest settlement, then of the channel
+            currency = "USD"  # Default
+            if summaries:
+                currency = summaries[0].currency
+            elif channel:
+                currency = channel.currency_code
+
+            return SellerAnalytics(
+                revenue=Money(revenue, currency),
+                earnings=Money(earnings, currency),
+                order_count=totals["order_count"],
+                platform_fee_total=Money(revenue - earnings, currency),
+            )
+
+        return Promise.all(
+            [
+                SellerAnalyticsTotalsLoader(info.context).load((root.pk, start_date)),
+                SettlementSummariesBySellerIdLoader(info.context).load(root.pk),
+                channel,
+            ]
+        ).then(_resolve_analytics)
 
 
 class SellerDiscountConfig(ModelObjectType[models.SellerDiscountConfig]):
@@ -325,6 +415,55 @@ class SellerSettlement(ModelObjectType[models.SellerSettlement]):
 
         return Money(root.seller_earnings, root.currency)
 
+    @staticmethod
+    def resolve_seller(root: models.SellerSettlement, info):
+        return SellerByIdLoader(info.context).load(root.seller_id)
+
+    @staticmethod
+    def resolve_order(root: models.SellerSettlement, info):
+        from ..order.dataloaders import OrderByIdLoader
+
+        if not root.order_id:
+            return None
+        return OrderByIdLoader(info.context).load(root.order_id)
+
+
+class SellerSettlementSummary(graphene.ObjectType):
+    """Settlement totals of a seller in one currency."""
+
+    class Meta:
+        description = "Settlement totals of a seller in one currency."
+        doc_category = DOC_CATEGORY_MARKETPLACE
+
+    currency = graphene.String(required=True)
+    settlement_count = graphene.Int(
+        required=True, description="Number of settlements in the currency."
+    )
+    order_total = graphene.Field(Money, required=True)
+    platform_fee = graphene.Field(Money, required=True)
+    seller_earnings = graphene.Field(Money, required=True)
+    last_settlement_at = DateTime(
+        required=True, description="Creation date of the latest settlement."
+    )
+
+    @staticmethod
+    def resolve_order_total(root, info):
+        from ...core.prices import Money
+
+        return Money(root.order_total, root.currency)
+
+    @staticmethod
+    def resolve_platform_fee(root, info):
+        from ...core.prices import Money
+
+        return Money(root.platform_fee, root.currency)
+
+    @staticmethod
+    def resolve_seller_earnings(root, info):
+        from ...core.prices import Money
+
+        return Money(root.seller_earnings, root.currency)
+
 
 class SellerSettlementCountableConnection(CountableConnection):
     """Connection type for SellerSettlement list queries."""
@@ -353,6 +492,30 @@ class SellerDomain(ModelObjectType[models.SellerDomain]):
     updated_at = DateTime(required=True)
 
 
+class SellerTaxRegistration(ModelObjectType[models.SellerTaxRegistration]):
+    """Tax registration of a seller in a country or region."""
+
+    class Meta:
+        description = "Tax registration of a seller in a country or region."
+        model = models.SellerTaxRegistration
+        interfaces = [relay.Node]
+        doc_category = DOC_CATEGORY_MARKETPLACE
+
+    id = graphene.GlobalID(required=True)
+    registration_type = TaxRegistrationTypeEnum(required=True)
+    registration_number = graphene.String(required=True)
+    country = graphene.Field(CountryDisplay, required=True)
+    region = graphene.String(required=True)
+    is_active = graphene.Boolean(required=True)
+    expires_at = DateTime()
+    created_at = DateTime(required=True)
+    updated_at = DateTime(required=True)
+
+    @staticmethod
+    def resolve_country(root: models.SellerTaxRegistration, info):
+        return CountryDisplay(code=root.country.code, country=root.country.name)
+
+
 class Theme(ModelObjectType[models.Theme]):
     """Theme template definition for storefront customization."""
 
@@ -425,6 +588,10 @@ class SellerStorefrontSettings(ModelObjectType[models.SellerStorefrontSettings])
     created_at = DateTime(required=True)
     updated_at = DateTime(required=True)
 
+    @staticmethod
+    def resolve_seller(root: models.SellerStorefrontSettings, info):
+        return SellerByIdLoader(info.context).load(root.seller_id)
+
 
 class NewsletterSubscription(ModelObjectType[models.NewsletterSubscription]):
     """Newsletter subscription for customers."""
@@ -483,6 +650,10 @@ class SellerLogisticsConfig(ModelObjectType[models.SellerLogisticsConfig]):
     custom_shipping_methods = JSONString()
     logistics_partner_integration = JSONString()
 
+    @staticmethod
+    def resolve_seller(root: models.SellerLogisticsConfig, info):
+        return SellerByIdLoader(info.context).load(root.seller_id)
+
 
 class SellerShippingMethod(ModelObjectType[models.SellerShippingMethod]):
     """Seller-specific shipping method."""
@@ -504,6 +675,10 @@ class SellerShippingMethod(ModelObjectType[models.SellerShippingMethod]):
     destination_city = graphene.String()
     tiered_pricing = JSONString()
 
+    @staticmethod
+    def resolve_seller(root: models.SellerShippingMethod, info):
+        return SellerByIdLoader(info.context).load(root.seller_id)
+
 
 class ProductSubmission(ModelObjectType[models.ProductSubmission]):
     """Product submission for admin approval."""
@@ -523,6 +698,10 @@ class ProductSubmission(ModelObjectType[models.ProductSubmission]):
     reviewed_by = graphene.Field("saleor.graphql.account.types.User")
     reviewed_at = DateTime()
 
+    @staticmethod
+    def resolve_seller(root: models.ProductSubmission, info):
+        return SellerByIdLoader(info.context).load(root.seller_id)
+
 
 class ReturnPolicy(ModelObjectType[models.ReturnPolicy]):
     """Return policy for sellers or products."""
@@ -541,6 +720,12 @@ class ReturnPolicy(ModelObjectType[models.ReturnPolicy]):
     return_shipping_cost = graphene.String(required=True)
     is_active = graphene.Boolean(required=True)
 
+    @staticmethod
+    def resolve_seller(root: models.ReturnPolicy, info):
+        if not root.seller_id:
+            return None
+        return SellerByIdLoader(info.context).load(root.seller_id)
+
 
 class ReturnRequest(ModelObjectType[models.ReturnRequest]):
     """Return request from a customer."""
@@ -574,6 +759,32 @@ class ReturnRequest(ModelObjectType[models.ReturnRequest]):
         """Alias for requested_at."""
         return root.requested_at
 
+    @staticmethod
+    def resolve_order(root: models.ReturnRequest, info):
+        from ..order.dataloaders import OrderByIdLoader
+
+        return OrderByIdLoader(info.context).load(root.order_id)
+
+    @staticmethod
+    def resolve_order_line(root: models.ReturnRequest, info):
+        from ..order.dataloaders import OrderLineByIdLoader
+
+        return OrderLineByIdLoader(info.context).load(root.order_line_id)
+
+    @staticmethod
+    def resolve_user(root: models.ReturnRequest, info):
+        from ..account.dataloaders import UserByUserIdLoader
+
+        return UserByUserIdLoader(info.context).load(root.user_id)
+
+    @staticmethod
+    def resolve_processed_by(root: models.ReturnRequest, info):
+        from ..account.dataloaders import UserByUserIdLoader
+
+        if not root.processed_by_id:
+            return None
+        return UserByUserIdLoader(info.context).load(root.processed_by_id)
+
     @staticmethod
     def resolve_order_id(root: models.ReturnRequest, info):
         """Return the order ID as a GlobalID."""
@@ -643,6 +854,12 @@ class PricingRule(ModelObjectType[models.PricingRule]):
     country = graphene.Field(CountryDisplay)
     is_active = graphene.Boolean(required=True)
 
+    @staticmethod
+    def resolve_seller(root: models.PricingRule, info):
+        if not root.seller_id:
+            return None
+        return SellerByIdLoader(info.context).load(root.seller_id)
+
 
 class PaymentGatewayConfig(ModelObjectType[models.PaymentGatewayConfig]):
     """Payment gateway configuration."""
@@ -662,6 +879,12 @@ class PaymentGatewayConfig(ModelObjectType[models.PaymentGatewayConfig]):
     compliance_requirements = JSONString()
     is_active = graphene.Boolean(required=True)
 
+    @staticmethod
+    def resolve_seller(root: models.PaymentGatewayConfig, info):
+        if not root.seller_id:
+            return None
+        return SellerByIdLoader(info.context).load(root.seller_id)
+
 
 class UserPreferences(graphene.ObjectType):
     """User preferences stored in user metadata."""
@@ -683,3 +906,25 @@ class UserPreferences(graphene.ObjectType):
     recently_viewed_products_limit = graphene.Int(
         description="Maximum number of recently viewed products to keep (defaults to 10)."
     )
+
+
+class HelpArticle(ModelObjectType[models.HelpArticle]):
+    """Represents a help center article."""
+
+    class Meta:
+        description = "Represents a help center article."
+        model = models.HelpArticle
+        interfaces = [relay.Node]
+        doc_category = DOC_CATEGORY_MARKETPLACE
+
+    id = graphene.GlobalID(required=True)
+    title = graphene.String(required=True)
+    slug = graphene.String(required=True)
+    excerpt = graphene.String(required=True)
+    content = graphene.String(required=True)
+    is_featured = graphene.Boolean(required=True)
+    views_count = graphene.Int(
+        required=True,
+        description="Number of views of the article, updated in batches.",
+    )
+    published_at = DateTime()
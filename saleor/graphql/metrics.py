@@ -70,6 +70,14 @@ METRIC_GRAPHQL_QUERY_COST = meter.create_metric(
     bucket_boundaries=QUERY_COST_BUCKETS,
 )
 
+METRIC_GRAPHQL_RESPONSE_CACHE_COUNT = meter.create_metric(
+    "saleor.graphql.response_cache.count",
+    scope=Scope.SERVICE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description="Number of GraphQL queries looked up in the response cache.",
+)
+
 METRIC_REQUEST_COUNT = meter.create_metric(
     "saleor.request.count",
     scope=Scope.SERVICE,
@@ -142,6 +150,15 @@ def record_graphql_query_cost(
     meter.record(METRIC_GRAPHQL_QUERY_COST, cost, Unit.COST, attributes=attributes)
 
 
+def record_graphql_response_cache_count(*, hit: bool) -> None:
+    attributes = {
+        saleor_attributes.GRAPHQL_RESPONSE_CACHE_RESULT: "hit" if hit else "miss"
+    }
+    meter.record(
+        METRIC_GRAPHQL_RESPONSE_CACHE_COUNT, 1, Unit.REQUEST, attributes=attributes
+    )
+
+
 def record_request_count(
     amount: int = 1,
     error_type: str | None = None,
@@ -35,6 +35,7 @@ from ....discount.models import (
 from ....discount.utils.manual_discount import apply_discount_to_value
 from ....giftcard.models import GiftCard
 from ....invoice.models import Invoice
+from ....marketplace.services.seller_orders import refresh_seller_orders
 from ....order import (
     FulfillmentStatus,
     OrderEvents,
@@ -782,7 +783,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             Q(pk__in=identifiers.variant_ids.keys)
             | Q(sku__in=identifiers.variant_skus.keys)
             | Q(external_reference__in=identifiers.variant_external_references.keys)
-        )
+        ).select_related("product__seller")
         channels = Channel.objects.filter(slug__in=identifiers.channel_slugs.keys)
         tax_configurations = TaxConfiguration.objects.filter(
             channel_id__in=channels.values("id")
@@ -1769,10 +1770,12 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
                 )
             )
         product_type_id = None
+        seller = None
         if variant:
             product_type_id = object_storage.get(
                 "product_id_to_product_type_id_map"
             ).get(variant.product_id)
+            seller = variant.product.seller
         order_line = OrderLine(
             order=order_data.order,
             variant=variant,
@@ -1808,6 +1811,8 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             tax_rate=line_amounts.tax_rate,
             tax_class=line_tax_class,
             tax_class_name=order_line_input.get("tax_class_name"),
+            seller=seller,
+            seller_name=getattr(seller, "store_name", "") or "",
         )
         line_discount = None
         if line_amounts.unit_discount_amount > 0:
@@ -2371,6 +2376,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             [],
         )
         OrderLine.objects.bulk_create(order_lines)
+        refresh_seller_orders(order.pk for order in orders)
 
         order_line_discounts: list[OrderLineDiscount] = sum(
             [
@@ -4,6 +4,7 @@ from django.db.models import Q
 
 from ...channel.models import Channel
 from ...core.exceptions import PermissionDenied
+from ...marketplace.context import get_tenant_scope_from_context
 from ...order import OrderStatus, models
 from ...order.events import OrderEvents
 from ...order.utils import sum_order_totals
@@ -24,6 +25,8 @@ def resolve_orders(
     qs = models.Order.objects.using(database_connection_name).non_draft()
     if channel_slug:
         qs = qs.filter(channel__slug=str(channel_slug))
+    if scope := get_tenant_scope_from_context(info.context):
+        qs = scope.filter_orders(qs)
 
     if requesting_user and not requestor_has_access_to_all:
         return qs.filter(user_id=requesting_user.id)
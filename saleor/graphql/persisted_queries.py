@@ -0,0 +1,278 @@
+"""Persisted queries and automatic persisted queries (APQ).
+
+Documents are identified by the sha256 of their text. A compiled document keeps
+everything that doesn't depend on the request: the parsed and validated document,
+its identifier and fingerprint, and a cost function whose only input are the
+variables. Compiled documents are kept in a bounded per-process map; the texts of
+persisted documents are additionally stored in the shared cache (Redis in
+production), so a document registered by one worker can be served by the others
+given its hash alone.
+
+APQ follows the Apollo protocol: the client sends
+`extensions.persistedQuery.sha256Hash` without the query, and resends the query
+along with the hash if the server responds with `PersistedQueryNotFound`.
+"""
+
+import hashlib
+import json
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql import GraphQLBackend, GraphQLDocument, GraphQLSchema
+from graphql.error import GraphQLError
+from graphql.language.ast import (
+    Field,
+    FragmentDefinition,
+    ListValue,
+    Node,
+    ObjectValue,
+    OperationDefinition,
+    Variable,
+)
+
+from .. import __version__ as saleor_version
+from ..core.utils.cache import CacheDict
+from .core.validators.query_cost import get_cost_exceeded_error, validate_query_cost
+from .utils import query_fingerprint, query_identifier
+from .utils.validators import check_if_query_contains_only_schema
+
+PERSISTED_QUERY_CACHE_KEY = "graphql:persisted_query:{version}:{query_hash}"
+PERSISTED_QUERY_VERSION = 1
+# Number of compiled documents kept by each worker.
+COMPILED_QUERIES_CAPACITY = 1000
+# Number of distinct cost-relevant variable values remembered per document.
+QUERY_COST_CACHE_CAPACITY = 100
+
+
+class PersistedQueryNotFound(GraphQLError):
+    def __init__(self):
+        super().__init__(
+            "PersistedQueryNotFound",
+            extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+        )
+
+
+class PersistedQueryHashMismatch(GraphQLError):
+    def __init__(self):
+        super().__init__(
+            "Provided sha256Hash does not match the query.",
+            extensions={"code": "PERSISTED_QUERY_HASH_MISMATCH"},
+        )
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def get_persisted_query_hash(data: dict) -> str | None:
+    """Return the document hash sent in the APQ request extension, if any."""
+    extensions = data.get("extensions")
+    if isinstance(extensions, str):
+        try:
+            extensions = json.loads(extensions)
+        except ValueError:
+            return None
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query = extensions.get("persistedQuery")
+    if not isinstance(persisted_query, dict):
+        return None
+    if persisted_query.get("version", PERSISTED_QUERY_VERSION) != (
+        PERSISTED_QUERY_VERSION
+    ):
+        raise GraphQLError("Unsupported persisted query version.")
+    query_hash = persisted_query.get("sha256Hash")
+    return query_hash if isinstance(query_hash, str) else None
+
+
+def _get_variable_names(node: Any) -> Iterator[str]:
+    if isinstance(node, Variable):
+        yield node.name.value
+    elif isinstance(node, ListValue):
+        for value in node.values:
+            yield from _get_variable_names(value)
+    elif isinstance(node, ObjectValue):
+        for field in node.fields:
+            yield from _get_variable_names(field.value)
+
+
+def _get_fields(node: Node) -> Iterator[Field]:
+    selection_set = getattr(node, "selection_set", None)
+    if not selection_set:
+        return
+    for selection in selection_set.selections:
+        if isinstance(selection, Field):
+            yield selection
+        yield from _get_fields(selection)
+
+
+def get_cost_variable_names(
+    document: GraphQLDocument, cost_map: dict[str, dict[str, Any]]
+) -> frozenset[str]:
+    """Return names of variables that can change the cost of a document.
+
+    Only arguments of fields with cost multipliers affect the cost, so variables
+    used anywhere else are ignored.
+    """
+    multiplied_fields = {
+        field_name
+        for fields in cost_map.values()
+        for field_name, cost in fields.items()
+        if cost.get("multipliers")
+    }
+    names: set[str] = set()
+    for definition in document.document_ast.definitions:
+        if not isinstance(definition, OperationDefinition | FragmentDefinition):
+            continue
+        for field in _get_fields(definition):
+            if field.name.value not in multiplied_fields:
+                continue
+            for argument in field.arguments:
+                names.update(_get_variable_names(argument.value))
+    return frozenset(names)
+
+
+class QueryCost:
+    """Cost of a document as a function of its variables.
+
+    The cost is computed once for every distinct value of the variables it
+    depends on. Results with errors are never remembered.
+    """
+
+    def __init__(self, document: GraphQLDocument, cost_map: dict[str, dict[str, Any]]):
+        self.document = document
+        self.cost_map = cost_map
+        self.variable_names = tuple(sorted(get_cost_variable_names(document, cost_map)))
+        self._costs: CacheDict = CacheDict(QUERY_COST_CACHE_CAPACITY)
+
+    def _get_key(self, variables: dict | None) -> str | None:
+        if not self.variable_names:
+            return ""
+        if not isinstance(variables, dict):
+            variables = {}
+        try:
+            return json.dumps(
+                [variables.get(name) for name in self.variable_names],
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            return None
+
+    def __call__(
+        self, variables: dict | None, maximum_cost: int
+    ) -> tuple[int, list[GraphQLError] | None]:
+        key = self._get_key(variables)
+        cost = self._costs.get(key) if key is not None else None
+        if cost is None:
+            cost, errors = validate_query_cost(
+                self.document.schema,
+                self.document,
+                variables,
+                self.cost_map,
+                sys.maxsize,
+            )
+            if errors:
+                return cost, errors
+            if key is not None:
+                self._costs[key] = cost
+        if maximum_cost and cost > maximum_cost:
+            return cost, [get_cost_exceeded_error(maximum_cost, cost)]
+        return cost, None
+
+
+@dataclass
+class CompiledQuery:
+    """A document with everything that doesn't depend on the request."""
+
+    query_hash: str
+    document: GraphQLDocument
+    is_valid: bool
+    contains_only_schema: bool
+    # Message of the error raised when introspection is mixed with other queries
+    schema_error: str | None
+    identifier: str
+    fingerprint: str
+    cost: QueryCost
+
+
+class PersistedQueryRegistry:
+    """Compiled documents by hash, with persisted texts shared across workers."""
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        backend: GraphQLBackend,
+        cost_map: dict[str, dict[str, Any]],
+        capacity: int = COMPILED_QUERIES_CAPACITY,
+    ):
+        self.schema = schema
+        self.backend = backend
+        self.cost_map = cost_map
+        self._compiled: CacheDict = CacheDict(capacity)
+
+    def get_cache_key(self, query_hash: str) -> str:
+        version = saleor_version
+        if settings.GRAPHQL_CACHE_SUFFIX:
+            version = f"{version}-{settings.GRAPHQL_CACHE_SUFFIX}"
+        return PERSISTED_QUERY_CACHE_KEY.format(version=version, query_hash=query_hash)
+
+    def compile(self, query: str, query_hash: str | None = None) -> CompiledQuery:
+        """Return the compiled document of a query text.
+
+        Raises `GraphQLSyntaxError` if the query can't be parsed.
+        """
+        query_hash = query_hash or get_query_hash(query)
+        compiled = self._compiled.get(query_hash)
+        if compiled is not None:
+            return compiled
+
+        document = self.backend.document_from_string(self.schema, query)
+        schema_error = None
+        try:
+            contains_only_schema = check_if_query_contains_only_schema(document)
+        except GraphQLError as e:
+            contains_only_schema = False
+            schema_error = str(e)
+        compiled = CompiledQuery(
+            query_hash=query_hash,
+            document=document,
+            is_valid=not getattr(document, "validation_errors", None),
+            contains_only_schema=contains_only_schema,
+            schema_error=schema_error,
+            identifier=query_identifier(document),
+            fingerprint=query_fingerprint(document),
+            cost=QueryCost(document, self.cost_map),
+        )
+        self._compiled[query_hash] = compiled
+        return compiled
+
+    def get(self, query_hash: str) -> CompiledQuery | None:
+        """Return the compiled persisted document, or None if it's unknown."""
+        compiled = self._compiled.get(query_hash)
+        if compiled is not None:
+            return compiled
+        query = cache.get(self.get_cache_key(query_hash))
+        if query is None:
+            return None
+        return self.compile(query, query_hash)
+
+    def register(self, query: str, query_hash: str | None = None) -> CompiledQuery:
+        """Compile a query and persist it if it's valid.
+
+        Raises `PersistedQueryHashMismatch` if the given hash doesn't match.
+        """
+        actual_hash = get_query_hash(query)
+        if query_hash and query_hash != actual_hash:
+            raise PersistedQueryHashMismatch()
+        compiled = self.compile(query, actual_hash)
+        if compiled.is_valid and not compiled.schema_error:
+            cache.set(
+                self.get_cache_key(actual_hash),
+                query,
+                settings.GRAPHQL_PERSISTED_QUERY_TIMEOUT,
+            )
+        return compiled
@@ -2,6 +2,7 @@ from django.db.models import Exists, OuterRef, Sum
 
 from ...attribute import models as attribute_models
 from ...channel.models import Channel
+from ...marketplace.context import get_tenant_scope_from_context
 from ...order import OrderStatus
 from ...order.models import Order
 from ...permission.enums import ProductPermissions
@@ -113,6 +114,8 @@ def resolve_product(
     qs = models.Product.objects.using(database_connection_name).visible_to_user(
         requestor, channel, limited_channel_access
     )
+    if scope := get_tenant_scope_from_context(info.context):
+        qs = scope.filter_products(qs)
     if id:
         _type, id = from_global_id_or_error(id, "Product")
         return qs.filter(id=id).first()
@@ -137,6 +140,8 @@ def resolve_products(
     qs = models.Product.objects.using(connection_name).visible_to_user(
         requestor, channel, limited_channel_access
     )
+    if scope := get_tenant_scope_from_context(info.context):
+        qs = scope.filter_products(qs)
     if not has_one_of_permissions(requestor, ALL_PRODUCTS_PERMISSIONS):
         if channel:
             product_channel_listings = (
@@ -212,6 +217,8 @@ def resolve_product_variants(
     qs = models.ProductVariant.objects.using(connection_name).visible_to_user(
         requestor, channel, limited_channel_access
     )
+    if scope := get_tenant_scope_from_context(info.context):
+        qs = scope.filter_variants(qs)
 
     if ids:
         db_ids = [
@@ -0,0 +1,212 @@
+"""Response cache of anonymous storefront queries.
+
+Only queries of anonymous clients whose root fields all belong to
+`ROOT_FIELD_TAGS` are cached. A response is keyed by the document, the variables,
+the operation name, the active language and the seller tenant of the request;
+channel is a part of the key through the variables or the document itself.
+
+Every cached response is tagged with the kinds of objects it may contain. Each
+tag has a version counter kept in the shared cache and the versions of the
+response tags are part of its key, so bumping a tag version by
+`invalidate_response_cache` makes all responses with that tag unreachable;
+they're removed from the cache when they expire.
+
+Stock availability changes with every allocation, e.g. on checkout completion,
+without an event the cache could be invalidated with, so queries selecting any of
+`UNCACHEABLE_FIELDS` aren't cached.
+
+The cache is opt-in and disabled unless `GRAPHQL_RESPONSE_CACHE_ENABLED` is set.
+"""
+
+import hashlib
+import json
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpRequest
+from django.utils import translation
+from graphql import GraphQLDocument
+from graphql.execution import ExecutionResult
+from graphql.language.ast import (
+    Field,
+    FragmentDefinition,
+    FragmentSpread,
+    InlineFragment,
+    OperationDefinition,
+    SelectionSet,
+)
+
+from .. import __version__ as saleor_version
+from ..core.auth import get_token_from_request
+from ..marketplace.middleware import get_request_tenant_scope
+
+RESPONSE_CACHE_KEY = "graphql:response:{version}:{key}"
+RESPONSE_CACHE_TAG_VERSION_KEY = "graphql:response:tag:{tag}"
+
+COLLECTION_TAG = "collection"
+CATEGORY_TAG = "category"
+MENU_TAG = "menu"
+PAGE_TAG = "page"
+PRODUCT_TAG = "product"
+
+# Tags of objects that may be returned under the given root query field.
+ROOT_FIELD_TAGS: dict[str, frozenset[str]] = {
+    "__typename": frozenset(),
+    "product": frozenset({PRODUCT_TAG, CATEGORY_TAG, COLLECTION_TAG}),
+    "products": frozenset({PRODUCT_TAG, CATEGORY_TAG, COLLECTION_TAG}),
+    "productVariant": frozenset({PRODUCT_TAG}),
+    "productVariants": frozenset({PRODUCT_TAG}),
+    "category": frozenset({CATEGORY_TAG, PRODUCT_TAG}),
+    "categories": frozenset({CATEGORY_TAG, PRODUCT_TAG}),
+    "collection": frozenset({COLLECTION_TAG, PRODUCT_TAG}),
+    "collections": frozenset({COLLECTION_TAG, PRODUCT_TAG}),
+    "menu": frozenset({MENU_TAG, CATEGORY_TAG, COLLECTION_TAG, PAGE_TAG}),
+    "menus": frozenset({MENU_TAG, CATEGORY_TAG, COLLECTION_TAG, PAGE_TAG}),
+    "page": frozenset({PAGE_TAG}),
+    "pages": frozenset({PAGE_TAG}),
+}
+
+
+# Fields resolved from allocated stock quantities.
+UNCACHEABLE_FIELDS = frozenset({"isAvailable", "quantityAvailable", "stocks"})
+
+
+def _get_operation(
+    document: GraphQLDocument, operation_name: str | None
+) -> OperationDefinition | None:
+    operations = [
+        definition
+        for definition in document.document_ast.definitions
+        if isinstance(definition, OperationDefinition)
+    ]
+    if not operation_name:
+        return operations[0] if len(operations) == 1 else None
+    for operation in operations:
+        if operation.name and operation.name.value == operation_name:
+            return operation
+    return None
+
+
+def get_response_cache_tags(
+    document: GraphQLDocument, operation_name: str | None
+) -> frozenset[str] | None:
+    """Return tags of a cacheable query or None if the query can't be cached."""
+    operation = _get_operation(document, operation_name)
+    if not operation or operation.operation != "query":
+        return None
+    tags: set[str] = set()
+    for selection in operation.selection_set.selections:
+        if not isinstance(selection, Field):
+            return None
+        field_tags = ROOT_FIELD_TAGS.get(selection.name.value)
+        if field_tags is None:
+            return None
+        tags.update(field_tags)
+    fragments = {
+        definition.name.value: definition
+        for definition in document.document_ast.definitions
+        if isinstance(definition, FragmentDefinition)
+    }
+    if _selects_uncacheable_fields(operation.selection_set, fragments, set()):
+        return None
+    return frozenset(tags) if tags else None
+
+
+def _selects_uncacheable_fields(
+    selection_set: SelectionSet,
+    fragments: dict[str, FragmentDefinition],
+    visited_fragments: set[str],
+) -> bool:
+    for selection in selection_set.selections:
+        nested = None
+        if isinstance(selection, Field):
+            if selection.name.value in UNCACHEABLE_FIELDS:
+                return True
+            nested = selection.selection_set
+        elif isinstance(selection, InlineFragment):
+            nested = selection.selection_set
+        elif isinstance(selection, FragmentSpread):
+            name = selection.name.value
+            if name in visited_fragments or name not in fragments:
+                continue
+            visited_fragments.add(name)
+            nested = fragments[name].selection_set
+        if nested and _selects_uncacheable_fields(nested, fragments, visited_fragments):
+            return True
+    return False
+
+
+def get_tag_versions(tags: frozenset[str]) -> dict[str, int]:
+    keys = {RESPONSE_CACHE_TAG_VERSION_KEY.format(tag=tag): tag for tag in tags}
+    versions = cache.get_many(list(keys))
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+    return {keys[key]: version for key, version in versions.items()}
+
+
+def invalidate_response_cache(*tags: str) -> None:
+    """Make all cached responses with any of the tags stale."""
+    if not settings.GRAPHQL_RESPONSE_CACHE_ENABLED:
+        return
+    for tag in tags:
+        key = RESPONSE_CACHE_TAG_VERSION_KEY.format(tag=tag)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # The version expired or was evicted; any new version makes old
+            # responses stale.
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def get_response_cache_key(
+    request: HttpRequest,
+    document: GraphQLDocument,
+    variables: Any,
+    operation_name: str | None,
+) -> str | None:
+    """Return the cache key of an anonymous query or None if it can't be cached."""
+    if not settings.GRAPHQL_RESPONSE_CACHE_ENABLED:
+        return None
+    if get_token_from_request(request):
+        return None
+    tags = get_response_cache_tags(document, operation_name)
+    if not tags:
+        return None
+    scope = get_request_tenant_scope(request)
+    try:
+        key_data = json.dumps(
+            [
+                document.document_string,
+                variables or {},
+                operation_name,
+                translation.get_language(),
+                scope.seller_id if scope else None,
+                sorted(get_tag_versions(tags).items()),
+            ],
+            sort_keys=True,
+            cls=DjangoJSONEncoder,
+        )
+    except (TypeError, ValueError):
+        return None
+    version = saleor_version
+    if settings.GRAPHQL_CACHE_SUFFIX:
+        version = f"{version}-{settings.GRAPHQL_CACHE_SUFFIX}"
+    return RESPONSE_CACHE_KEY.format(
+        version=version, key=hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+    )
+
+
+def get_cached_response(key: str) -> ExecutionResult | None:
+    return cache.get(key)
+
+
+def cache_response(key: str, response: ExecutionResult) -> None:
+    """Cache a response unless it has errors."""
+    if response.errors or response.invalid:
+        return
+    cache.set(key, response, settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT)
@@ -1,5 +1,6 @@
 from prices import MoneyRange
 
+from ...marketplace.context import get_tenant_scope_from_context
 from ...shipping import models
 from ...shipping.interface import ShippingMethodData
 from ..core import ResolveInfo
@@ -16,6 +17,8 @@ def resolve_shipping_zones(info, channel_slug):
         instances = models.ShippingZone.objects.using(
             get_database_connection_name(info.context)
         ).all()
+    if scope := get_tenant_scope_from_context(info.context):
+        instances = scope.filter_shipping_zones(instances)
     return ChannelQsContext(qs=instances, channel_slug=channel_slug)
 
 
@@ -2,7 +2,7 @@ import hashlib
 import importlib
 import json
 from inspect import isclass
-from typing import Any
+from typing import Any, cast
 from urllib.parse import urljoin
 
 from django.conf import settings
@@ -39,10 +39,22 @@ from .metrics import (
     record_graphql_query_cost,
     record_graphql_query_count,
     record_graphql_query_duration,
+    record_graphql_response_cache_count,
     record_request_count,
     record_request_duration,
 )
+from .persisted_queries import (
+    CompiledQuery,
+    PersistedQueryNotFound,
+    PersistedQueryRegistry,
+    get_persisted_query_hash,
+)
 from .query_cost_map import COST_MAP, QUERY_COST_FAILED_OPERATION
+from .response_cache import (
+    cache_response,
+    get_cached_response,
+    get_response_cache_key,
+)
 from .utils import (
     format_error,
     get_source_service_name_value,
@@ -67,6 +79,7 @@ class GraphQLView(View):
     middleware = None
     root_value = None
     backend: GraphQLBackend = None  # type: ignore[assignment]
+    persisted_queries: PersistedQueryRegistry | None = None
     _query: str | None = None
 
     HANDLED_EXCEPTIONS = (
@@ -83,6 +96,7 @@ class GraphQLView(View):
         executor=None,
         middleware: list[str] | None = None,
         root_value=None,
+        persisted_queries: PersistedQueryRegistry | None = None,
     ):
         super().__init__()
         if middleware is None:
@@ -98,6 +112,7 @@ class GraphQLView(View):
         self.executor = executor
         self.root_value = root_value
         self.backend = backend
+        self.persisted_queries = persisted_queries
 
     @staticmethod
     def import_middleware(middleware_name):
@@ -267,6 +282,33 @@ class GraphQLView(View):
         except (ValueError, GraphQLSyntaxError) as e:
             return None, ExecutionResult(errors=[e], invalid=True)
 
+    def get_compiled_query(
+        self, query: str | None, data: dict
+    ) -> tuple[CompiledQuery | None, ExecutionResult | None]:
+        """Return the compiled document of a query or of a persisted query hash.
+
+        A query sent along with its hash is persisted for subsequent requests
+        that send the hash alone.
+        """
+        registry = cast(PersistedQueryRegistry, self.persisted_queries)
+        try:
+            query_hash = get_persisted_query_hash(data)
+            if query_hash and not query:
+                compiled_query = registry.get(query_hash)
+                if compiled_query is None:
+                    raise PersistedQueryNotFound()
+                return compiled_query, None
+            if not query or not isinstance(query, str):
+                return None, ExecutionResult(
+                    errors=[GraphQLError("Must provide a query string.")],
+                    invalid=True,
+                )
+            if query_hash:
+                return registry.register(query, query_hash), None
+            return registry.compile(query), None
+        except (ValueError, GraphQLError) as e:
+            return None, ExecutionResult(errors=[e], invalid=True)
+
     def execute_graphql_request(self, request: HttpRequest, data: dict):
         with (
             tracer.start_as_current_span(
@@ -278,7 +320,12 @@ class GraphQLView(View):
             span.set_attribute(saleor_attributes.COMPONENT, "graphql")
 
             query, variables, operation_name = self.get_graphql_params(request, data)
-            document, error = self.parse_query(query)
+            compiled_query = None
+            if self.persisted_queries:
+                compiled_query, error = self.get_compiled_query(query, data)
+                document = compiled_query.document if compiled_query else None
+            else:
+                document, error = self.parse_query(query)
 
             with observability.report_gql_operation() as operation:
                 operation.query = document
@@ -302,7 +349,14 @@ class GraphQLView(View):
                 return error
 
             try:
-                query_contains_schema = check_if_query_contains_only_schema(document)
+                if compiled_query:
+                    if compiled_query.schema_error:
+                        raise GraphQLError(compiled_query.schema_error)
+                    query_contains_schema = compiled_query.contains_only_schema
+                else:
+                    query_contains_schema = check_if_query_contains_only_schema(
+                        document
+                    )
             except GraphQLError as e:
                 span.set_status(status=StatusCode.ERROR, description=str(e))
                 error_type = e.__class__.__name__
@@ -315,8 +369,12 @@ class GraphQLView(View):
 
             # Query identifier and fingerprint cannot be calculated earlier, as they
             # require a parsed and valid GraphQL document.
-            operation_identifier = query_identifier(document)
-            operation_fingerprint = query_fingerprint(document)
+            if compiled_query:
+                operation_identifier = compiled_query.identifier
+                operation_fingerprint = compiled_query.fingerprint
+            else:
+                operation_identifier = query_identifier(document)
+                operation_fingerprint = query_fingerprint(document)
             operation_type = document.get_operation_type(operation_name)
 
             self._query = operation_identifier
@@ -354,13 +412,18 @@ class GraphQLView(View):
                     saleor_attributes.SALEOR_SOURCE_SERVICE_NAME, source_service_name
                 )
 
-            query_cost, cost_errors = validate_query_cost(
-                schema,
-                document,
-                variables,
-                COST_MAP,
-                settings.GRAPHQL_QUERY_MAX_COMPLEXITY,
-            )
+            if compiled_query:
+                query_cost, cost_errors = compiled_query.cost(
+                    variables, settings.GRAPHQL_QUERY_MAX_COMPLEXITY
+                )
+            else:
+                query_cost, cost_errors = validate_query_cost(
+                    schema,
+                    document,
+                    variables,
+                    COST_MAP,
+                    settings.GRAPHQL_QUERY_MAX_COMPLEXITY,
+                )
             span.set_attribute(saleor_attributes.GRAPHQL_OPERATION_COST, query_cost)
 
             if settings.GRAPHQL_QUERY_MAX_COMPLEXITY and cost_errors:
@@ -397,9 +460,17 @@ class GraphQLView(View):
                 should_use_cache_for_scheme = query_contains_schema & (
                     not settings.DEBUG
                 )
+                response_cache_key = None
                 if should_use_cache_for_scheme:
                     key = generate_cache_key(raw_query_string)
                     response = cache.get(key)
+                else:
+                    response_cache_key = get_response_cache_key(
+                        request, document, variables, operation_name
+                    )
+                if response_cache_key:
+                    response = get_cached_response(response_cache_key)
+                    record_graphql_response_cache_count(hit=bool(response))
 
                 if not response:
                     response = document.execute(
@@ -419,6 +490,8 @@ class GraphQLView(View):
 
                     if should_use_cache_for_scheme:
                         cache.set(key, response)
+                    elif response_cache_key:
+                        cache_response(response_cache_key, response)
 
                 record_graphql_query_count(
                     operation_type=operation_type,
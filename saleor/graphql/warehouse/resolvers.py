@@ -1,3 +1,4 @@
+from ...marketplace.context import get_tenant_scope_from_context
 from ...warehouse import models
 from ..core.context import get_database_connection_name
 
@@ -15,6 +16,9 @@ def resolve_stocks(info):
 
 
 def resolve_warehouses(info):
-    return models.Warehouse.objects.using(
+    qs = models.Warehouse.objects.using(
         get_database_connection_name(info.context)
     ).all()
+    if scope := get_tenant_scope_from_context(info.context):
+        qs = scope.filter_warehouses(qs)
+    return qs
@@ -8,8 +8,11 @@ from .models import (
     ContactSupportTicket,
     ContactSupportTicketMessage,
     FandomCharacter,
+    FeaturedCollection,
+    FeaturedProduct,
     FulfillmentCenter,
     HelpArticle,
+    HelpArticleDailyViews,
     HelpArticleView,
     HelpCategory,
     InventorySync,
@@ -17,7 +20,11 @@ from .models import (
     OrderRoutingRule,
     PaymentGatewayConfig,
     PricingRule,
+    ProductCharacter,
     ProductSubmission,
+    Quiz,
+    QuizStats,
+    QuizSubmission,
     ReturnPolicy,
     ReturnRequest,
     Reward,
@@ -404,6 +411,16 @@ class HelpArticleViewAdmin(admin.ModelAdmin):
     autocomplete_fields = ["article", "user"]
 
 
+@admin.register(HelpArticleDailyViews)
+class HelpArticleDailyViewsAdmin(admin.ModelAdmin):
+    """Admin interface for HelpArticleDailyViews model."""
+
+    list_display = ["article", "date", "views_count"]
+    list_filter = ["date"]
+    search_fields = ["article__title"]
+    readonly_fields = ["article", "date", "views_count"]
+
+
 @admin.register(FandomCharacter)
 class FandomCharacterAdmin(admin.ModelAdmin):
     """Admin interface for FandomCharacter model."""
@@ -499,6 +516,21 @@ class QuizSubmissionAdmin(admin.ModelAdmin):
     autocomplete_fields = ["quiz", "user"]
 
 
+@admin.register(QuizStats)
+class QuizStatsAdmin(admin.ModelAdmin):
+    """Admin interface for QuizStats model."""
+
+    list_display = ["quiz", "submission_count", "passed_count", "updated_at"]
+    search_fields = ["quiz__title"]
+    readonly_fields = [
+        "quiz",
+        "submission_count",
+        "passed_count",
+        "score_sum",
+        "updated_at",
+    ]
+
+
 @admin.register(FulfillmentCenter)
 class FulfillmentCenterAdmin(admin.ModelAdmin):
     """Admin interface for FulfillmentCenter model."""
@@ -806,6 +838,29 @@ class InventorySyncAdmin(admin.ModelAdmin):
     autocomplete_fields = ["product_variant", "fulfillment_center", "warehouse"]
 
 
+@admin.register(FeaturedProduct)
+class FeaturedProductAdmin(admin.ModelAdmin):
+    """Admin interface for FeaturedProduct model."""
+
+    list_display = ["product", "channel", "sort_order", "created_at"]
+    list_filter = ["channel"]
+    list_editable = ["sort_order"]
+    search_fields = ["product__name"]
+    ordering = ["channel", "sort_order"]
+    autocomplete_fields = ["product"]
+
+
+@admin.register(FeaturedCollection)
+class FeaturedCollectionAdmin(admin.ModelAdmin):
+    """Admin interface for FeaturedCollection model."""
+
+    list_display = ["collection", "channel", "sort_order", "created_at"]
+    list_filter = ["channel"]
+    list_editable = ["sort_order"]
+    search_fields = ["collection__name"]
+    ordering = ["channel", "sort_order"]
+
+
 @admin.register(PricingRule)
 class PricingRuleAdmin(admin.ModelAdmin):
     """Admin interface for PricingRule model."""
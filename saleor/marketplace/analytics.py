@@ -0,0 +1,194 @@
+"""Materialized per-seller analytics rollups.
+
+`SellerAnalyticsDaily` keeps one row per seller and day. Reporting periods are
+aligned to day boundaries, so any period is answered by summing whole buckets.
+"""
+
+import datetime
+from collections import defaultdict
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from ..order import OrderStatus
+from .models import SellerAnalyticsDaily, SellerSettlement, SettlementStatus
+
+if TYPE_CHECKING:
+    from .models import Seller
+
+ANALYTICS_SETTLEMENT_STATUSES = [SettlementStatus.PENDING, SettlementStatus.PAID]
+ANALYTICS_EXCLUDED_ORDER_STATUSES = [
+    OrderStatus.DRAFT,
+    OrderStatus.CANCELED,
+    OrderStatus.EXPIRED,
+]
+ANALYTICS_BULK_BATCH_SIZE = 1000
+
+SellerDay = tuple[UUID, datetime.date]
+
+
+def get_bucket_date(value: datetime.datetime) -> datetime.date:
+    return timezone.localdate(value)
+
+
+def _day_range(day: datetime.date) -> tuple[datetime.datetime, datetime.datetime]:
+    start = datetime.datetime.combine(
+        day, datetime.time.min, tzinfo=timezone.get_current_timezone()
+    )
+    return start, start + datetime.timedelta(days=1)
+
+
+def _settlement_totals_by_day(
+    seller_ids: Iterable[UUID],
+    start: datetime.datetime | None = None,
+    end: datetime.datetime | None = None,
+) -> dict[SellerDay, tuple[Decimal, Decimal]]:
+    settlements = SellerSettlement.objects.filter(
+        seller_id__in=seller_ids, status__in=ANALYTICS_SETTLEMENT_STATUSES
+    )
+    if start:
+        settlements = settlements.filter(created_at__gte=start)
+    if end:
+        settlements = settlements.filter(created_at__lt=end)
+    rows = (
+        settlements.annotate(day=TruncDate("created_at"))
+        .order_by()
+        .values("seller_id", "day")
+        .annotate(revenue=Sum("order_total"), earnings=Sum("seller_earnings"))
+    )
+    return {
+        (row["seller_id"], row["day"]): (row["revenue"], row["earnings"])
+        for row in rows
+    }
+
+
+def _order_counts_by_day(
+    seller_ids: Iterable[UUID],
+    start: datetime.datetime | None = None,
+    end: datetime.datetime | None = None,
+) -> dict[SellerDay, int]:
+    from ..order.models import OrderLine
+
+    lines = OrderLine.objects.filter(seller_id__in=seller_ids).exclude(
+        order__status__in=ANALYTICS_EXCLUDED_ORDER_STATUSES
+    )
+    if start:
+        lines = lines.filter(order__created_at__gte=start)
+    if end:
+        lines = lines.filter(order__created_at__lt=end)
+    rows = (
+        lines.annotate(day=TruncDate("order__created_at"))
+        .order_by()
+        .values("seller_id", "day")
+        .annotate(order_count=Count("order_id", distinct=True))
+    )
+    return {(row["seller_id"], row["day"]): row["order_count"] for row in rows}
+
+
+def _write_buckets(
+    buckets: Iterable[SellerDay],
+    settlement_totals: dict[SellerDay, tuple[Decimal, Decimal]],
+    order_counts: dict[SellerDay, int],
+):
+    zero = Decimal("0.00")
+    rows = []
+    for seller_id, day in buckets:
+        revenue, earnings = settlement_totals.get((seller_id, day), (zero, zero))
+        rows.append(
+            SellerAnalyticsDaily(
+                seller_id=seller_id,
+                date=day,
+                revenue=revenue or zero,
+                earnings=earnings or zero,
+                order_count=order_counts.get((seller_id, day), 0),
+                updated_at=timezone.now(),
+            )
+        )
+    SellerAnalyticsDaily.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["seller", "date"],
+        update_fields=["revenue", "earnings", "order_count", "updated_at"],
+        batch_size=ANALYTICS_BULK_BATCH_SIZE,
+    )
+
+
+def refresh_seller_analytics(buckets: Iterable[SellerDay]):
+    """Recompute the given (seller ID, day) buckets from settlements and orders.
+
+    Each day is recomputed in full rather than adjusted by deltas, so refreshing
+    a bucket is idempotent and safe to repeat after any change.
+    """
+    seller_ids_by_day: dict[datetime.date, set[UUID]] = defaultdict(set)
+    for seller_id, day in buckets:
+        seller_ids_by_day[day].add(seller_id)
+
+    for day, seller_ids in seller_ids_by_day.items():
+        start, end = _day_range(day)
+        _write_buckets(
+            [(seller_id, day) for seller_id in seller_ids],
+            _settlement_totals_by_day(seller_ids, start, end),
+            _order_counts_by_day(seller_ids, start, end),
+        )
+
+
+def backfill_seller_analytics(seller_ids: Iterable[UUID]):
+    """Rebuild all daily buckets of the given sellers from their full history."""
+    seller_ids = list(seller_ids)
+    settlement_totals = _settlement_totals_by_day(seller_ids)
+    order_counts = _order_counts_by_day(seller_ids)
+    buckets = sorted(set(settlement_totals) | set(order_counts))
+    with transaction.atomic():
+        SellerAnalyticsDaily.objects.filter(seller_id__in=seller_ids).delete()
+        _write_buckets(buckets, settlement_totals, order_counts)
+
+
+def get_seller_analytics_totals(
+    seller: "Seller",
+    start_date: datetime.datetime | None = None,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> dict[str, Decimal | int]:
+    """Return revenue, earnings and order count of a seller since `start_date`."""
+    return get_sellers_analytics_totals(
+        [seller.pk], start_date, database_connection_name
+    )[seller.pk]
+
+
+def get_sellers_analytics_totals(
+    seller_ids: Iterable[UUID],
+    start_date: datetime.datetime | None = None,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> dict[UUID, dict[str, Decimal | int]]:
+    """Return analytics totals of many sellers since `start_date` with one query."""
+    seller_ids = list(seller_ids)
+    buckets = SellerAnalyticsDaily.objects.using(database_connection_name).filter(
+        seller_id__in=seller_ids
+    )
+    if start_date:
+        buckets = buckets.filter(date__gte=get_bucket_date(start_date))
+    rows = (
+        buckets.values("seller_id")
+        .annotate(
+            revenue=Sum("revenue"),
+            earnings=Sum("earnings"),
+            order_count=Sum("order_count"),
+        )
+        .order_by()
+    )
+    totals_by_seller = {row["seller_id"]: row for row in rows}
+    totals = {}
+    for seller_id in seller_ids:
+        seller_totals = totals_by_seller.get(seller_id, {})
+        totals[seller_id] = {
+            "revenue": seller_totals.get("revenue") or Decimal("0.00"),
+            "earnings": seller_totals.get("earnings") or Decimal("0.00"),
+            "order_count": seller_totals.get("order_count") or 0,
+        }
+    return totals
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from ..graphql.core.context import SaleorContext
     from ..marketplace.models import Seller
+    from .tenant import TenantScope
 
 
 def get_seller_from_context(context: "SaleorContext") -> Optional["Seller"]:
@@ -12,20 +13,21 @@ def get_seller_from_context(context: "SaleorContext") -> Optional["Seller"]:
 
     The seller is set by SellerTenantMiddleware from the request domain.
     """
-    if hasattr(context, "request"):
-        from .middleware import get_request_seller
+    from .middleware import get_request_seller
 
-        return get_request_seller(context.request)
-    return None
+    # The GraphQL context is the request itself.
+    return get_request_seller(getattr(context, "request", context))
 
 
-def set_seller_in_context(context: "SaleorContext", seller: Optional["Seller"]) -> None:
-    """Set seller in GraphQL context."""
-    if hasattr(context, "request"):
-        from .middleware import set_request_seller
-
-        set_request_seller(context.request, seller)
+def get_tenant_scope_from_context(context: "SaleorContext") -> Optional["TenantScope"]:
+    """Get the request-scoped tenant scope from GraphQL context."""
+    from .middleware import get_request_tenant_scope
 
+    return get_request_tenant_scope(getattr(context, "request", context))
 
 
+def set_seller_in_context(context: "SaleorContext", seller: Optional["Seller"]) -> None:
+    """Set seller in GraphQL context."""
+    from .middleware import set_request_seller
 
+    set_request_seller(getattr(context, "request", context), seller)
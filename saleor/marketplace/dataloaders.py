@@ -1,9 +1,35 @@
 """DataLoaders for marketplace models."""
 
+import datetime
+from dataclasses import dataclass
+from decimal import Decimal
 from uuid import UUID
 
+from django.db.models import Count, Max, Sum
+
 from ..graphql.core.dataloaders import DataLoader
-from .models import Seller
+from .analytics import get_sellers_analytics_totals
+from .models import (
+    Seller,
+    SellerDiscountConfig,
+    SellerDomain,
+    SellerLogisticsConfig,
+    SellerSettlement,
+    SellerStorefrontSettings,
+    SellerTaxRegistration,
+)
+
+
+@dataclass(frozen=True)
+class SettlementSummary:
+    """Totals of the settlements of a seller in one currency."""
+
+    currency: str
+    settlement_count: int
+    order_total: Decimal
+    platform_fee: Decimal
+    seller_earnings: Decimal
+    last_settlement_at: datetime.datetime
 
 
 class SellerByIdLoader(DataLoader[UUID, Seller]):
@@ -47,3 +73,149 @@ class SellerByDomainLoader(DataLoader[str, Seller]):
         )
         domain_map = {domain.domain.lower(): domain.seller for domain in domains}
         return [domain_map.get(domain.lower()) for domain in keys]
+
+
+class SellerStaffIdsBySellerIdLoader(DataLoader[UUID, set[int]]):
+    """DataLoader for loading IDs of the staff users of a seller."""
+
+    context_key = "seller_staff_ids_by_seller_id"
+
+    def batch_load(self, keys):
+        memberships = (
+            Seller.staff.through.objects.using(self.database_connection_name)
+            .filter(seller_id__in=keys)
+            .values_list("seller_id", "user_id")
+        )
+        staff_ids_by_seller: dict[UUID, set[int]] = {}
+        for seller_id, user_id in memberships:
+            staff_ids_by_seller.setdefault(seller_id, set()).add(user_id)
+        return [staff_ids_by_seller.get(seller_id, set()) for seller_id in keys]
+
+
+class RecentlyViewedProductIdsByUserIdLoader(DataLoader[int, list[int]]):
+    """DataLoader for loading IDs of products recently viewed by a user, latest first."""
+
+    context_key = "recently_viewed_product_ids_by_user_id"
+
+    def batch_load(self, keys):
+        from .models import RecentlyViewedProduct
+
+        views = (
+            RecentlyViewedProduct.objects.using(self.database_connection_name)
+            .filter(user_id__in=keys)
+            .order_by("user_id", "-viewed_at")
+            .values_list("user_id", "product_id")
+        )
+        product_ids_by_user: dict[int, list[int]] = {}
+        for user_id, product_id in views:
+            product_ids_by_user.setdefault(user_id, []).append(product_id)
+        return [product_ids_by_user.get(user_id, []) for user_id in keys]
+
+
+class BaseSellerOneToOneLoader(DataLoader[UUID, object]):
+    """Base loader for models with a one-to-one relation to the seller."""
+
+    model: type
+
+    def batch_load(self, keys):
+        instances = self.model.objects.using(self.database_connection_name).filter(
+            seller_id__in=keys
+        )
+        instance_map = {instance.seller_id: instance for instance in instances}
+        return [instance_map.get(seller_id) for seller_id in keys]
+
+
+class SellerLogisticsConfigBySellerIdLoader(BaseSellerOneToOneLoader):
+    context_key = "seller_logistics_config_by_seller_id"
+    model = SellerLogisticsConfig
+
+
+class SellerDiscountConfigBySellerIdLoader(BaseSellerOneToOneLoader):
+    context_key = "seller_discount_config_by_seller_id"
+    model = SellerDiscountConfig
+
+
+class SellerStorefrontSettingsBySellerIdLoader(BaseSellerOneToOneLoader):
+    context_key = "seller_storefront_settings_by_seller_id"
+    model = SellerStorefrontSettings
+
+
+class BaseSellerRelatedListLoader(DataLoader[UUID, list]):
+    """Base loader for lists of models with a foreign key to the seller."""
+
+    model: type
+
+    def batch_load(self, keys):
+        instances = self.model.objects.using(self.database_connection_name).filter(
+            seller_id__in=keys
+        )
+        instances_by_seller: dict[UUID, list] = {}
+        for instance in instances:
+            instances_by_seller.setdefault(instance.seller_id, []).append(instance)
+        return [instances_by_seller.get(seller_id, []) for seller_id in keys]
+
+
+class SellerDomainsBySellerIdLoader(BaseSellerRelatedListLoader):
+    context_key = "seller_domains_by_seller_id"
+    model = SellerDomain
+
+
+class SellerTaxRegistrationsBySellerIdLoader(BaseSellerRelatedListLoader):
+    context_key = "seller_tax_registrations_by_seller_id"
+    model = SellerTaxRegistration
+
+
+class SettlementSummariesBySellerIdLoader(DataLoader[UUID, list[SettlementSummary]]):
+    """DataLoader for loading per-currency settlement totals of a seller.
+
+    Summaries are ordered by the latest settlement first.
+    """
+
+    context_key = "settlement_summaries_by_seller_id"
+
+    def batch_load(self, keys):
+        rows = (
+            SellerSettlement.objects.using(self.database_connection_name)
+            .filter(seller_id__in=keys)
+            .values("seller_id", "currency")
+            .annotate(
+                settlement_count=Count("id"),
+                order_total=Sum("order_total"),
+                platform_fee=Sum("platform_fee"),
+                seller_earnings=Sum("seller_earnings"),
+                last_settlement_at=Max("created_at"),
+            )
+            .order_by("seller_id", "-last_settlement_at", "currency")
+        )
+        summaries_by_seller: dict[UUID, list[SettlementSummary]] = {}
+        for row in rows:
+            seller_id = row.pop("seller_id")
+            summaries_by_seller.setdefault(seller_id, []).append(
+                SettlementSummary(**row)
+            )
+        return [summaries_by_seller.get(seller_id, []) for seller_id in keys]
+
+
+# Seller ID and the start date of the reporting period.
+SellerAnalyticsKey = tuple[UUID, datetime.datetime | None]
+
+
+class SellerAnalyticsTotalsLoader(
+    DataLoader[SellerAnalyticsKey, dict[str, Decimal | int]]
+):
+    """DataLoader for loading analytics totals of a seller since a start date."""
+
+    context_key = "seller_analytics_totals"
+
+    def batch_load(self, keys):
+        seller_ids_by_start_date: dict[datetime.datetime | None, list[UUID]] = {}
+        for seller_id, start_date in keys:
+            seller_ids_by_start_date.setdefault(start_date, []).append(seller_id)
+        totals = {
+            (seller_id, start_date): seller_totals
+            for start_date, seller_ids in seller_ids_by_start_date.items()
+            for seller_id, seller_totals in get_sellers_analytics_totals(
+                seller_ids, start_date, self.database_connection_name
+            ).items()
+        }
+        return [totals[key] for key in keys]
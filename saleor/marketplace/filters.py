@@ -33,11 +33,7 @@ def filter_products_by_context_seller(
     This enables tenant isolation - when accessing a seller-specific storefront,
     only that seller's products are returned.
     """
-    from .context import get_seller_from_context
-
-    seller = get_seller_from_context(context)
-    return filter_products_by_seller(queryset, seller)
-
-
-
+    from .context import get_tenant_scope_from_context
 
+    scope = get_tenant_scope_from_context(context)
+    return scope.filter_products(queryset) if scope else queryset
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from ...utils_loyalty import BADGE_BACKFILL_BATCH_SIZE, backfill_badges
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute loyalty badge counters of all users from their fulfilled orders "
+        "and award every badge whose threshold is met."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BADGE_BACKFILL_BATCH_SIZE,
+            help="Number of users processed in a single batch.",
+        )
+
+    def handle(self, *args, **options):
+        start_user_id = 0
+        awarded_total = 0
+        while True:
+            last_user_id, awarded = backfill_badges(
+                start_user_id, batch_size=options["batch_size"]
+            )
+            if last_user_id is None:
+                break
+            start_user_id = last_user_id
+            awarded_total += awarded
+            self.stdout.write(
+                f"Processed users up to ID {last_user_id}, "
+                f"awarded {awarded_total} badges so far."
+            )
+        self.stdout.write(f"Done. Awarded {awarded_total} badges.")
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+
+from ...analytics import backfill_seller_analytics
+from ...models import Seller
+
+SELLERS_BATCH_SIZE = 50
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the daily seller analytics rollups from settlements and orders. "
+        "Existing buckets of the processed sellers are replaced."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seller",
+            action="append",
+            dest="seller_slugs",
+            default=[],
+            help="Slug of a seller to backfill. Can be passed multiple times. "
+            "Defaults to all sellers.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=SELLERS_BATCH_SIZE,
+            help="Number of sellers processed in a single batch.",
+        )
+
+    def handle(self, *args, **options):
+        sellers = Seller.objects.order_by("pk")
+        if options["seller_slugs"]:
+            sellers = sellers.filter(slug__in=options["seller_slugs"])
+
+        batch_size = options["batch_size"]
+        last_pk = None
+        processed = 0
+        while True:
+            batch = sellers.filter(pk__gt=last_pk) if last_pk else sellers
+            seller_ids = list(batch.values_list("pk", flat=True)[:batch_size])
+            if not seller_ids:
+                break
+            backfill_seller_analytics(seller_ids)
+            processed += len(seller_ids)
+            last_pk = seller_ids[-1]
+            self.stdout.write(f"Backfilled analytics for {processed} sellers.")
+        self.stdout.write("Done.")
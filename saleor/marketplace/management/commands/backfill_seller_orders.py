@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from ....order.models import Order, OrderLine
+from ...services.seller_orders import refresh_seller_orders
+
+ORDERS_BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the seller order projection from order lines with a seller. "
+        "Existing projections of the processed orders are replaced."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=ORDERS_BATCH_SIZE,
+            help="Number of orders processed in a single batch.",
+        )
+
+    def handle(self, *args, **options):
+        orders = Order.objects.filter(
+            pk__in=OrderLine.objects.filter(seller__isnull=False).values("order_id")
+        ).order_by("number")
+
+        batch_size = options["batch_size"]
+        last_number = None
+        processed = 0
+        while True:
+            batch = orders.filter(number__gt=last_number) if last_number else orders
+            rows = list(batch.values_list("number", "pk")[:batch_size])
+            if not rows:
+                break
+            refresh_seller_orders([pk for _, pk in rows])
+            processed += len(rows)
+            last_number = rows[-1][0]
+            self.stdout.write(f"Backfilled seller orders of {processed} orders.")
+        self.stdout.write("Done.")
@@ -0,0 +1,78 @@
+from django.core.management.base import BaseCommand
+
+from ...tasks import (
+    SETTLEMENTS_ORDER_BATCH_SIZE,
+    create_settlements_for_orders_batch,
+    create_settlements_for_orders_task,
+    get_settlements_checkpoint,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create missing seller settlements for orders, streaming over order "
+        "numbers in batches. Progress is checkpointed after every batch, "
+        "so an interrupted run can be continued with --resume."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--from-number",
+            type=int,
+            default=0,
+            help="Process orders with a number greater than this value.",
+        )
+        parser.add_argument(
+            "--to-number",
+            type=int,
+            default=None,
+            help="Process orders with a number lower than or equal to this value.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=SETTLEMENTS_ORDER_BATCH_SIZE,
+            help="Number of orders processed in a single batch.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Start after the last order processed by a previous run.",
+        )
+        parser.add_argument(
+            "--async",
+            action="store_true",
+            dest="run_async",
+            help="Schedule a Celery task instead of processing in this process.",
+        )
+
+    def handle(self, *args, **options):
+        start_number = options["from_number"]
+        end_number = options["to_number"]
+        batch_size = options["batch_size"]
+        if options["resume"]:
+            start_number = get_settlements_checkpoint() or start_number
+
+        if options["run_async"]:
+            create_settlements_for_orders_task.delay(
+                start_number, end_number, batch_size
+            )
+            self.stdout.write(
+                f"Scheduled settlement creation for orders after {start_number}."
+            )
+            return
+
+        total_created = 0
+        while True:
+            last_number, created_count = create_settlements_for_orders_batch(
+                start_number, end_number, batch_size
+            )
+            if last_number is None:
+                break
+            total_created += created_count
+            self.stdout.write(
+                f"Processed orders up to number {last_number}, "
+                f"created {created_count} settlements."
+            )
+            start_number = last_number
+        self.stdout.write(f"Done. Created {total_created} settlements.")
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+
+from ...models_fandom import Quiz
+from ...services.quizzes import (
+    QUIZ_REBUILD_BATCH_SIZE,
+    rebuild_quiz_stats,
+    rescore_quiz_submissions,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute quiz totals from stored submissions, optionally scoring the "
+        "submissions again with the current answer keys."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--quiz",
+            action="append",
+            dest="quiz_slugs",
+            help="Slug of a quiz to rebuild; can be repeated. Defaults to all.",
+        )
+        parser.add_argument(
+            "--rescore",
+            action="store_true",
+            help="Score stored submissions again before computing totals.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=QUIZ_REBUILD_BATCH_SIZE,
+            help="Number of submissions rescored in a single batch.",
+        )
+
+    def handle(self, *args, **options):
+        quizzes = Quiz.objects.all()
+        if options["quiz_slugs"]:
+            quizzes = quizzes.filter(slug__in=options["quiz_slugs"])
+        quiz_ids = list(quizzes.values_list("pk", flat=True))
+        if options["rescore"]:
+            for quiz_id in quiz_ids:
+                changed = rescore_quiz_submissions(
+                    quiz_id, batch_size=options["batch_size"]
+                )
+                self.stdout.write(f"Quiz {quiz_id}: changed {changed} scores.")
+        rebuilt = rebuild_quiz_stats(quiz_ids)
+        self.stdout.write(f"Done. Rebuilt totals of {rebuilt} quizzes.")
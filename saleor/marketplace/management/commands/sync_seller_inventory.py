@@ -0,0 +1,70 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import FulfillmentCenter, Seller
+from ...services.inventory_sync import (
+    INVENTORY_SYNC_BATCH_SIZE,
+    sync_all_inventory_for_seller,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Sync inventory of all seller products to a fulfillment center "
+        "and report the throughput in rows per second."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seller",
+            action="append",
+            dest="seller_slugs",
+            default=[],
+            help="Slug of a seller to sync. Can be passed multiple times. "
+            "Defaults to all sellers.",
+        )
+        parser.add_argument(
+            "--fulfillment-center",
+            dest="fulfillment_center_id",
+            default=None,
+            help="ID of the fulfillment center to sync to. Defaults to the "
+            "primary fulfillment center of each seller.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=INVENTORY_SYNC_BATCH_SIZE,
+            help="Number of variants synced in a single batch.",
+        )
+
+    def handle(self, *args, **options):
+        fulfillment_center = None
+        if options["fulfillment_center_id"]:
+            fulfillment_center = FulfillmentCenter.objects.filter(
+                pk=options["fulfillment_center_id"]
+            ).first()
+            if not fulfillment_center:
+                raise CommandError("Fulfillment center does not exist.")
+
+        sellers = Seller.objects.order_by("slug")
+        if options["seller_slugs"]:
+            sellers = sellers.filter(slug__in=options["seller_slugs"])
+
+        total_rows = 0
+        total_duration = 0.0
+        for seller in sellers.iterator():
+            result = sync_all_inventory_for_seller(
+                seller,
+                fulfillment_center=fulfillment_center,
+                batch_size=options["batch_size"],
+            )
+            total_rows += result.rows
+            total_duration += result.duration
+            self.stdout.write(
+                f"{seller.slug}: synced {result.rows} rows in "
+                f"{result.duration:.2f}s ({result.rows_per_second:.0f} rows/s)."
+            )
+        rows_per_second = total_rows / total_duration if total_duration else 0.0
+        self.stdout.write(
+            f"Done. Synced {total_rows} rows in {total_duration:.2f}s "
+            f"({rows_per_second:.0f} rows/s)."
+        )
@@ -0,0 +1,36 @@
+from ..core.telemetry import (
+    DEFAULT_DURATION_BUCKETS,
+    MetricType,
+    Scope,
+    Unit,
+    meter,
+)
+
+# Initialize metrics
+QUEUE_DEPTH_BUCKETS = [0, 10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000]
+METRIC_INVENTORY_SYNC_QUEUE_DEPTH = meter.create_metric(
+    "saleor.marketplace.inventory_sync.queue.depth",
+    scope=Scope.SERVICE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.ITEM,
+    description="Number of stocks waiting for an inventory sync when a flush starts.",
+    bucket_boundaries=QUEUE_DEPTH_BUCKETS,
+)
+
+METRIC_INVENTORY_SYNC_FLUSH_LATENCY = meter.create_metric(
+    "saleor.marketplace.inventory_sync.flush.latency",
+    scope=Scope.SERVICE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Time from a stock change to its inventory sync.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+
+
+# Helper functions
+def record_inventory_sync_queue_depth(depth: int) -> None:
+    meter.record(METRIC_INVENTORY_SYNC_QUEUE_DEPTH, depth, Unit.ITEM)
+
+
+def record_inventory_sync_flush_latency(latency: float) -> None:
+    meter.record(METRIC_INVENTORY_SYNC_FLUSH_LATENCY, latency, Unit.SECOND)
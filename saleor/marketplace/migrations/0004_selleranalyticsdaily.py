@@ -0,0 +1,69 @@
+# Generated by Django 5.2.8 on 2026-10-16 09:12
+
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "marketplace",
+            "0003_fulfillmentcenter_inventorysync_orderroutingrule_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SellerAnalyticsDaily",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                (
+                    "revenue",
+                    models.DecimalField(
+                        decimal_places=3,
+                        default=Decimal("0.00"),
+                        help_text="Sum of pending and paid settlement order totals",
+                        max_digits=20,
+                    ),
+                ),
+                (
+                    "earnings",
+                    models.DecimalField(
+                        decimal_places=3,
+                        default=Decimal("0.00"),
+                        help_text="Sum of pending and paid settlement seller earnings",
+                        max_digits=20,
+                    ),
+                ),
+                ("order_count", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "seller",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="analytics_daily",
+                        to="marketplace.seller",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("seller", "date"),
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("seller", "date"), name="unique_seller_analytics_daily"
+                    )
+                ],
+            },
+        ),
+    ]
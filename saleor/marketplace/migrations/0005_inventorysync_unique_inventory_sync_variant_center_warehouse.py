@@ -0,0 +1,39 @@
+# Generated by Django 5.2.8 on 2026-10-16 11:40
+
+from django.db import migrations, models
+
+
+def remove_duplicated_inventory_syncs(apps, schema_editor):
+    InventorySync = apps.get_model("marketplace", "InventorySync")
+    seen = set()
+    duplicate_ids = []
+    syncs = InventorySync.objects.order_by(
+        "product_variant_id", "fulfillment_center_id", "warehouse_id", "-synced_at"
+    ).values_list("pk", "product_variant_id", "fulfillment_center_id", "warehouse_id")
+    for pk, *key in syncs.iterator():
+        key = tuple(key)
+        if key in seen:
+            duplicate_ids.append(pk)
+        else:
+            seen.add(key)
+    if duplicate_ids:
+        InventorySync.objects.filter(pk__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("marketplace", "0004_selleranalyticsdaily"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicated_inventory_syncs, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="inventorysync",
+            constraint=models.UniqueConstraint(
+                fields=("product_variant", "fulfillment_center", "warehouse"),
+                name="unique_inventory_sync_variant_center_warehouse",
+            ),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.8 on 2026-10-16 13:05
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "marketplace",
+            "0005_inventorysync_unique_inventory_sync_variant_center_warehouse",
+        ),
+        ("product", "0204_product_approval_status_product_compliance_data_and_more"),
+        ("warehouse", "0035_alter_warehouse_metadata_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingInventorySync",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "enqueued_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="When the stock first changed",
+                    ),
+                ),
+                (
+                    "product_variant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="product.productvariant",
+                    ),
+                ),
+                (
+                    "warehouse",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="warehouse.warehouse",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("enqueued_at",),
+                "indexes": [
+                    django.contrib.postgres.indexes.BTreeIndex(
+                        fields=["enqueued_at"], name="pending_inv_sync_enqueued_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("product_variant", "warehouse"),
+                        name="unique_pending_inventory_sync",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-16 14:10
+
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("marketplace", "0006_pendinginventorysync"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="loyaltypointsbalance",
+            name="order_count",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Number of fulfilled orders (for badge criteria)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="loyaltypointsbalance",
+            name="total_spent",
+            field=models.DecimalField(
+                decimal_places=3,
+                default=Decimal("0.0"),
+                help_text="Total gross amount of fulfilled orders (for badge criteria)",
+                max_digits=20,
+            ),
+        ),
+    ]
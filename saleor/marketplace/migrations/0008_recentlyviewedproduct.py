@@ -0,0 +1,114 @@
+# Generated by Django 5.2.8 on 2026-10-16 14:40
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.utils.dateparse import parse_datetime
+
+RECENTLY_VIEWED_METADATA_KEY = "recently_viewed_products"
+BATCH_SIZE = 1000
+
+
+def copy_recently_viewed_products_from_metadata(apps, schema_editor):
+    User = apps.get_model("account", "User")
+    Product = apps.get_model("product", "Product")
+    RecentlyViewedProduct = apps.get_model("marketplace", "RecentlyViewedProduct")
+
+    users = User.objects.filter(
+        metadata__has_key=RECENTLY_VIEWED_METADATA_KEY
+    ).values_list("pk", "metadata")
+    views = []
+    for user_id, metadata in users.iterator(chunk_size=BATCH_SIZE):
+        items = metadata.get(RECENTLY_VIEWED_METADATA_KEY)
+        if not isinstance(items, list):
+            continue
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            product_id = str(item.get("product_id") or "")
+            viewed_at = parse_datetime(item.get("viewed_at") or "")
+            if product_id.isdigit() and viewed_at:
+                views.append((user_id, int(product_id), viewed_at))
+
+    existing_product_ids = set(
+        Product.objects.filter(
+            pk__in={product_id for _, product_id, _ in views}
+        ).values_list("pk", flat=True)
+    )
+    RecentlyViewedProduct.objects.bulk_create(
+        [
+            RecentlyViewedProduct(
+                user_id=user_id, product_id=product_id, viewed_at=viewed_at
+            )
+            for user_id, product_id, viewed_at in views
+            if product_id in existing_product_ids
+        ],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("marketplace", "0007_loyaltypointsbalance_order_count_and_more"),
+        ("product", "0204_product_approval_status_product_compliance_data_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RecentlyViewedProduct",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "viewed_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="When the product was last viewed",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="product.product",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("-viewed_at",),
+                "indexes": [
+                    models.Index(
+                        fields=["user", "-viewed_at"], name="recently_viewed_user_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "product"),
+                        name="unique_recently_viewed_product",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            copy_recently_viewed_products_from_metadata, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,172 @@
+# Generated by Django 5.2.8 on 2026-10-16 15:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+FEATURED_METADATA_KEY = "is_featured"
+BATCH_SIZE = 1000
+
+
+def copy_featured_content_from_metadata(apps, schema_editor):
+    Product = apps.get_model("product", "Product")
+    ProductChannelListing = apps.get_model("product", "ProductChannelListing")
+    Collection = apps.get_model("product", "Collection")
+    CollectionChannelListing = apps.get_model("product", "CollectionChannelListing")
+    FeaturedProduct = apps.get_model("marketplace", "FeaturedProduct")
+    FeaturedCollection = apps.get_model("marketplace", "FeaturedCollection")
+
+    # Items were featured in every channel they are listed in, ordered by ID.
+    product_ids = Product.objects.filter(
+        metadata__contains={FEATURED_METADATA_KEY: True}
+    ).values_list("pk", flat=True)
+    product_listings = (
+        ProductChannelListing.objects.filter(product_id__in=product_ids)
+        .order_by("channel_id", "product_id")
+        .values_list("channel_id", "product_id")
+    )
+    FeaturedProduct.objects.bulk_create(
+        [
+            FeaturedProduct(channel_id=channel_id, product_id=product_id, sort_order=i)
+            for i, (channel_id, product_id) in enumerate(product_listings)
+        ],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+    collection_ids = Collection.objects.filter(
+        metadata__contains={FEATURED_METADATA_KEY: True}
+    ).values_list("pk", flat=True)
+    collection_listings = (
+        CollectionChannelListing.objects.filter(collection_id__in=collection_ids)
+        .order_by("channel_id", "collection_id")
+        .values_list("channel_id", "collection_id")
+    )
+    FeaturedCollection.objects.bulk_create(
+        [
+            FeaturedCollection(
+                channel_id=channel_id, collection_id=collection_id, sort_order=i
+            )
+            for i, (channel_id, collection_id) in enumerate(collection_listings)
+        ],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("channel", "0027_channel_allow_legacy_gift_card_use"),
+        ("marketplace", "0008_recentlyviewedproduct"),
+        ("product", "0204_product_approval_status_product_compliance_data_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FeaturedProduct",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "sort_order",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Position of the product in the featured set",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="channel.channel",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="product.product",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("sort_order", "pk"),
+                "indexes": [
+                    models.Index(
+                        fields=["channel", "sort_order"],
+                        name="featured_product_channel_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("channel", "product"), name="unique_featured_product"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="FeaturedCollection",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "sort_order",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Position of the collection in the featured set",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="channel.channel",
+                    ),
+                ),
+                (
+                    "collection",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="product.collection",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("sort_order", "pk"),
+                "indexes": [
+                    models.Index(
+                        fields=["channel", "sort_order"],
+                        name="featured_collection_chan_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("channel", "collection"),
+                        name="unique_featured_collection",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            copy_featured_content_from_metadata, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.8 on 2026-10-16 16:05
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("marketplace", "0009_featuredproduct_featuredcollection"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="loyaltypointstransaction",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                condition=models.Q(
+                    ("expires_at__isnull", False), ("transaction_type", "earned")
+                ),
+                fields=["expires_at", "id"],
+                name="loyalty_tx_expires_idx",
+            ),
+        ),
+    ]
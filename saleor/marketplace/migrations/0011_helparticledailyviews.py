@@ -0,0 +1,64 @@
+# Generated by Django 5.2.8 on 2026-10-16 16:40
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("marketplace", "0010_loyaltypointstransaction_loyalty_tx_expires_idx"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="helparticleview",
+            name="viewed_at",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now
+            ),
+        ),
+        migrations.CreateModel(
+            name="HelpArticleDailyViews",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(help_text="Day of the views")),
+                (
+                    "views_count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Number of views of the article on the day"
+                    ),
+                ),
+                (
+                    "article",
+                    models.ForeignKey(
+                        help_text="Article that was viewed",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_views",
+                        to="marketplace.helparticle",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Help article daily views",
+                "ordering": ("-date",),
+                "indexes": [
+                    models.Index(fields=["date"], name="help_article_daily_date_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("article", "date"),
+                        name="unique_help_article_daily_views",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.8 on 2026-10-16 17:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("marketplace", "0011_helparticledailyviews"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QuizStats",
+            fields=[
+                (
+                    "quiz",
+                    models.OneToOneField(
+                        help_text="Quiz the totals belong to",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="marketplace.quiz",
+                    ),
+                ),
+                (
+                    "submission_count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Number of users who submitted the quiz"
+                    ),
+                ),
+                (
+                    "passed_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of users whose latest score passed the quiz",
+                    ),
+                ),
+                (
+                    "score_sum",
+                    models.PositiveBigIntegerField(
+                        default=0, help_text="Sum of the latest scores of all users"
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name_plural": "Quiz stats",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="quizsubmission",
+            index=models.Index(
+                fields=["quiz", "-score", "completed_at"],
+                name="quiz_submission_leader_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 5.2.8 on 2026-10-16 17:55
+
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("marketplace", "0012_quizstats_quiz_submission_leader_idx"),
+        ("order", "0220_orderline_seller"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SellerOrder",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(help_text="Creation date of the order"),
+                ),
+                (
+                    "status",
+                    models.CharField(help_text="Status of the order", max_length=32),
+                ),
+                ("currency", models.CharField(max_length=3)),
+                (
+                    "subtotal_net_amount",
+                    models.DecimalField(
+                        decimal_places=3,
+                        default=Decimal("0.00"),
+                        help_text="Net total of the seller's lines",
+                        max_digits=20,
+                    ),
+                ),
+                (
+                    "subtotal_gross_amount",
+                    models.DecimalField(
+                        decimal_places=3,
+                        default=Decimal("0.00"),
+                        help_text="Gross total of the seller's lines",
+                        max_digits=20,
+                    ),
+                ),
+                (
+                    "quantity",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of items of the seller in the order",
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "order",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="seller_orders",
+                        to="order.order",
+                    ),
+                ),
+                (
+                    "seller",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="seller_orders",
+                        to="marketplace.seller",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("seller", "-created_at", "-order"),
+                "indexes": [
+                    models.Index(
+                        fields=["seller", "-created_at", "-order"],
+                        name="seller_order_created_idx",
+                    ),
+                    models.Index(fields=["order"], name="seller_order_order_idx"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("seller", "order"), name="unique_seller_order"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -15,6 +15,7 @@ from .models_fandom import (  # noqa: F401
     FandomCharacter,
     ProductCharacter,
     Quiz,
+    QuizStats,
     QuizSubmission,
 )
 
@@ -23,6 +24,7 @@ from .models_help import (  # noqa: F401
     ContactSupportTicket,
     ContactSupportTicketMessage,
     HelpArticle,
+    HelpArticleDailyViews,
     HelpArticleView,
     HelpCategory,
 )
@@ -37,6 +39,7 @@ from django.conf import settings
 from django.contrib.postgres.indexes import BTreeIndex, GinIndex
 from django.core.validators import MinValueValidator, RegexValidator
 from django.db import models
+from django.utils import timezone
 from django_countries.fields import CountryField
 
 from ..account.models import Address, User
@@ -1005,11 +1008,169 @@ class InventorySync(ModelWithMetadata):
             ),
             BTreeIndex(fields=["synced_at"], name="inventory_sync_date_idx"),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product_variant", "fulfillment_center", "warehouse"],
+                name="unique_inventory_sync_variant_center_warehouse",
+            ),
+        ]
 
     def __str__(self):
         return f"Sync: {self.product_variant.sku} @ {self.fulfillment_center.name}"
 
 
+class PendingInventorySync(models.Model):
+    """A stock that changed since its inventory was last synced.
+
+    Rows are deduplicated per (variant, warehouse) and drained in batches by
+    the inventory sync flush task.
+    """
+
+    product_variant = models.ForeignKey(
+        "product.ProductVariant",
+        related_name="+",
+        on_delete=models.CASCADE,
+    )
+    warehouse = models.ForeignKey(
+        Warehouse,
+        related_name="+",
+        on_delete=models.CASCADE,
+    )
+    enqueued_at = models.DateTimeField(
+        default=timezone.now, help_text="When the stock first changed"
+    )
+
+    class Meta:
+        app_label = "marketplace"
+        ordering = ("enqueued_at",)
+        indexes = [
+            BTreeIndex(fields=["enqueued_at"], name="pending_inv_sync_enqueued_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product_variant", "warehouse"],
+                name="unique_pending_inventory_sync",
+            ),
+        ]
+
+
+class RecentlyViewedProduct(models.Model):
+    """A product recently viewed by a customer.
+
+    Views are buffered and flushed in batches; each customer keeps only the
+    number of latest products set in their preferences.
+    """
+
+    user = models.ForeignKey(
+        User,
+        related_name="+",
+        on_delete=models.CASCADE,
+    )
+    product = models.ForeignKey(
+        "product.Product",
+        related_name="+",
+        on_delete=models.CASCADE,
+    )
+    viewed_at = models.DateTimeField(
+        default=timezone.now, help_text="When the product was last viewed"
+    )
+
+    class Meta:
+        app_label = "marketplace"
+        ordering = ("-viewed_at",)
+        indexes = [
+            models.Index(
+                fields=["user", "-viewed_at"], name="recently_viewed_user_idx"
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "product"],
+                name="unique_recently_viewed_product",
+            ),
+        ]
+
+
+class FeaturedProduct(models.Model):
+    """A product curated for the homepage of a channel."""
+
+    channel = models.ForeignKey(
+        Channel,
+        related_name="+",
+        on_delete=models.CASCADE,
+    )
+    product = models.ForeignKey(
+        "product.Product",
+        related_name="+",
+        on_delete=models.CASCADE,
+    )
+    sort_order = models.IntegerField(
+        default=0, help_text="Position of the product in the featured set"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "marketplace"
+        ordering = ("sort_order", "pk")
+        indexes = [
+            models.Index(
+                fields=["channel", "sort_order"], name="featured_product_channel_idx"
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["channel", "product"],
+                name="unique_featured_product",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Featured product {self.product_id} in channel {self.channel_id}"
+
+
+class FeaturedCollection(models.Model):
+    """A collection curated for the homepage of a channel.
+
+    Products of featured collections are featured after the curated products.
+    """
+
+    channel = models.ForeignKey(
+        Channel,
+        related_name="+",
+        on_delete=models.CASCADE,
+    )
+    collection = models.ForeignKey(
+        "product.Collection",
+        related_name="+",
+        on_delete=models.CASCADE,
+    )
+    sort_order = models.IntegerField(
+        default=0, help_text="Position of the collection in the featured set"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "marketplace"
+        ordering = ("sort_order", "pk")
+        indexes = [
+            models.Index(
+                fields=["channel", "sort_order"],
+                name="featured_collection_chan_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["channel", "collection"],
+                name="unique_featured_collection",
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"Featured collection {self.collection_id} in channel {self.channel_id}"
+        )
+
+
 class PricingType(models.TextChoices):
     """Pricing rule type choices."""
 
@@ -1312,3 +1473,99 @@ class SellerSettlement(ModelWithMetadata):
     @property
     def is_paid(self):
         return self.status == SettlementStatus.PAID
+
+
+class SellerAnalyticsDaily(models.Model):
+    """Pre-aggregated per-seller analytics for a single day.
+
+    Buckets are recomputed whenever settlements or orders of the seller change,
+    so dashboard analytics are answered without scanning raw settlements or
+    order lines.
+    """
+
+    seller = models.ForeignKey(
+        Seller,
+        related_name="analytics_daily",
+        on_delete=models.CASCADE,
+    )
+    date = models.DateField()
+    revenue = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=Decimal("0.00"),
+        help_text="Sum of pending and paid settlement order totals",
+    )
+    earnings = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=Decimal("0.00"),
+        help_text="Sum of pending and paid settlement seller earnings",
+    )
+    order_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "marketplace"
+        ordering = ("seller", "date")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["seller", "date"],
+                name="unique_seller_analytics_daily",
+            )
+        ]
+
+
+class SellerOrder(models.Model):
+    """Projection of an order onto one of the sellers whose lines it contains.
+
+    Rows are written when orders are placed and refreshed when their lines or
+    status change, so seller order listings don't join and deduplicate order
+    lines.
+    """
+
+    seller = models.ForeignKey(
+        Seller,
+        related_name="seller_orders",
+        on_delete=models.CASCADE,
+    )
+    order = models.ForeignKey(
+        "order.Order",
+        related_name="seller_orders",
+        on_delete=models.CASCADE,
+    )
+    created_at = models.DateTimeField(help_text="Creation date of the order")
+    status = models.CharField(max_length=32, help_text="Status of the order")
+    currency = models.CharField(max_length=settings.DEFAULT_CURRENCY_CODE_LENGTH)
+    subtotal_net_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=Decimal("0.00"),
+        help_text="Net total of the seller's lines",
+    )
+    subtotal_gross_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=Decimal("0.00"),
+        help_text="Gross total of the seller's lines",
+    )
+    quantity = models.PositiveIntegerField(
+        default=0, help_text="Number of items of the seller in the order"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "marketplace"
+        ordering = ("seller", "-created_at", "-order")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["seller", "order"],
+                name="unique_seller_order",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["seller", "-created_at", "-order"],
+                name="seller_order_created_idx",
+            ),
+            models.Index(fields=["order"], name="seller_order_order_idx"),
+        ]
@@ -186,6 +186,10 @@ class QuizSubmission(models.Model):
             models.Index(fields=["user"], name="quiz_submission_user_idx"),
             models.Index(fields=["quiz"], name="quiz_submission_quiz_idx"),
             models.Index(fields=["completed_at"], name="quiz_submission_completed_idx"),
+            models.Index(
+                fields=["quiz", "-score", "completed_at"],
+                name="quiz_submission_leader_idx",
+            ),
         ]
         unique_together = [("user", "quiz")]
 
@@ -193,5 +197,36 @@ class QuizSubmission(models.Model):
         return f"{self.user.email} - {self.quiz.title} - {self.score}%"
 
 
+class QuizStats(models.Model):
+    """Running totals of a quiz's submissions, updated as they are scored."""
 
+    quiz = models.OneToOneField(
+        Quiz,
+        related_name="stats",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        help_text="Quiz the totals belong to",
+    )
+    submission_count = models.PositiveIntegerField(
+        default=0, help_text="Number of users who submitted the quiz"
+    )
+    passed_count = models.PositiveIntegerField(
+        default=0, help_text="Number of users whose latest score passed the quiz"
+    )
+    score_sum = models.PositiveBigIntegerField(
+        default=0, help_text="Sum of the latest scores of all users"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "marketplace"
+        verbose_name_plural = "Quiz stats"
+
+    def __str__(self):
+        return f"{self.quiz.title} - {self.submission_count} submissions"
 
+    @property
+    def average_score(self) -> float | None:
+        if not self.submission_count:
+            return None
+        return self.score_sum / self.submission_count
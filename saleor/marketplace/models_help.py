@@ -127,17 +127,12 @@ class HelpArticle(models.Model):
     def __str__(self):
         return self.title
 
-    def increment_views(self):
-        """Increment the view count."""
-        self.views_count = models.F("views_count") + 1
-        self.save(update_fields=["views_count"])
-
 
 class HelpArticleView(models.Model):
     """Track views of help articles (for analytics)."""
 
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
-    viewed_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    viewed_at = models.DateTimeField(default=timezone.now, db_index=True)
 
     article = models.ForeignKey(
         HelpArticle,
@@ -172,6 +167,37 @@ class HelpArticleView(models.Model):
         return f"{self.article.title} - {self.viewed_at}"
 
 
+class HelpArticleDailyViews(models.Model):
+    """Number of views of a help article on a given day."""
+
+    article = models.ForeignKey(
+        HelpArticle,
+        related_name="daily_views",
+        on_delete=models.CASCADE,
+        help_text="Article that was viewed",
+    )
+    date = models.DateField(help_text="Day of the views")
+    views_count = models.PositiveIntegerField(
+        default=0, help_text="Number of views of the article on the day"
+    )
+
+    class Meta:
+        app_label = "marketplace"
+        ordering = ("-date",)
+        verbose_name_plural = "Help article daily views"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["article", "date"], name="unique_help_article_daily_views"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["date"], name="help_article_daily_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.article.title} - {self.date}: {self.views_count}"
+
+
 class ContactSupportTicket(models.Model):
     """Support ticket/contact form submission."""
 
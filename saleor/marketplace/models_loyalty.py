@@ -15,7 +15,16 @@ from ..product.models import Product
 
 
 class LoyaltyPointsTransaction(models.Model):
-    """Record of a loyalty points transaction (earned or spent)."""
+    """Record of a loyalty points transaction (earned or spent).
+
+    Transactions form an append-only ledger; rows are never updated.
+    """
+
+    class TransactionType(models.TextChoices):
+        EARNED = "earned", "Earned"
+        SPENT = "spent", "Spent"
+        EXPIRED = "expired", "Expired"
+        ADJUSTED = "adjusted", "Adjusted"
 
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
@@ -34,12 +43,7 @@ class LoyaltyPointsTransaction(models.Model):
     )
     transaction_type = models.CharField(
         max_length=32,
-        choices=[
-            ("earned", "Earned"),
-            ("spent", "Spent"),
-            ("expired", "Expired"),
-            ("adjusted", "Adjusted"),
-        ],
+        choices=TransactionType.choices,
         help_text="Type of transaction",
     )
     description = models.TextField(
@@ -67,6 +71,11 @@ class LoyaltyPointsTransaction(models.Model):
             BTreeIndex(fields=["user"], name="loyalty_tx_user_idx"),
             BTreeIndex(fields=["created_at"], name="loyalty_tx_created_idx"),
             BTreeIndex(fields=["transaction_type"], name="loyalty_tx_type_idx"),
+            BTreeIndex(
+                fields=["expires_at", "id"],
+                name="loyalty_tx_expires_idx",
+                condition=models.Q(expires_at__isnull=False, transaction_type="earned"),
+            ),
         ]
 
     def __str__(self):
@@ -101,6 +110,16 @@ class LoyaltyPointsBalance(ModelWithMetadata):
         validators=[MinValueValidator(0)],
         help_text="Total points ever spent (for tracking)",
     )
+    order_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of fulfilled orders (for badge criteria)",
+    )
+    total_spent = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=Decimal("0.0"),
+        help_text="Total gross amount of fulfilled orders (for badge criteria)",
+    )
 
     class Meta:
         app_label = "marketplace"
@@ -116,41 +135,35 @@ class LoyaltyPointsBalance(ModelWithMetadata):
         """Add points to the balance and create a transaction record."""
         if points <= 0:
             raise ValueError("Points must be positive")
-        
-        from .utils_loyalty import create_points_transaction
-        
-        self.balance += points
-        self.lifetime_earned += points
-        self.save(update_fields=["balance", "lifetime_earned", "updated_at"])
-        
-        create_points_transaction(
-            user=self.user,
-            points=points,
-            transaction_type="earned",
+
+        from .services.loyalty_ledger import post_points
+
+        post_points(
+            {self.user_id: points},
+            LoyaltyPointsTransaction.TransactionType.EARNED,
             description=description,
             order=order,
             expires_at=expires_at,
         )
+        self.refresh_from_db(
+            fields=["balance", "lifetime_earned", "lifetime_spent", "updated_at"]
+        )
 
     def spend_points(self, points: int, description: str = ""):
         """Spend points from the balance and create a transaction record."""
         if points <= 0:
             raise ValueError("Points must be positive")
-        if self.balance < points:
-            raise ValueError("Insufficient points balance")
-        
-        from .utils_loyalty import create_points_transaction
-        
-        self.balance -= points
-        self.lifetime_spent += points
-        self.save(update_fields=["balance", "lifetime_spent", "updated_at"])
-        
-        create_points_transaction(
-            user=self.user,
-            points=-points,
-            transaction_type="spent",
+
+        from .services.loyalty_ledger import post_points
+
+        post_points(
+            {self.user_id: -points},
+            LoyaltyPointsTransaction.TransactionType.SPENT,
             description=description,
         )
+        self.refresh_from_db(
+            fields=["balance", "lifetime_earned", "lifetime_spent", "updated_at"]
+        )
 
 
 class Badge(models.Model):
@@ -0,0 +1,189 @@
+"""Batched lookups of seller tax data for a single checkout or order."""
+
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.db.models import Q
+
+if TYPE_CHECKING:
+    from ...checkout.fetch import CheckoutLineInfo
+    from ...order.models import Order
+    from ..models import Seller
+
+
+class SellerTaxContext:
+    """Seller tax data of a checkout or order, fetched in bulk and memoized.
+
+    Sellers, their active tax registrations and the tax class country rates are
+    loaded with one query each for all lines at once. Sellers, countries and tax
+    classes that show up later are loaded lazily and remembered as well.
+    """
+
+    def __init__(
+        self,
+        seller_ids: Iterable[UUID],
+        tax_class_ids: Iterable[int],
+        country_codes: Iterable[str] = (),
+        database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+    ):
+        self.database_connection_name = database_connection_name
+        self._sellers: dict[UUID, Seller | None] = {}
+        self._registrations: set[tuple[UUID, str, str]] = set()
+        self._tax_class_ids: set[int] = set(tax_class_ids)
+        self._loaded_countries: set[str] = set()
+        self._rates: dict[tuple[int | None, str], Decimal] = {}
+
+        self._load_sellers(set(seller_ids))
+        country_codes = set(country_codes)
+        country_codes.update(
+            code for code in map(self._get_origin_country, self._sellers) if code
+        )
+        self._load_rates(country_codes)
+
+    @classmethod
+    def for_checkout_lines(
+        cls,
+        lines: Iterable["CheckoutLineInfo"],
+        country_code: str | None = None,
+    ) -> "SellerTaxContext":
+        lines = list(lines)
+        return cls(
+            seller_ids={
+                line.product.seller_id for line in lines if line.product.seller_id
+            },
+            tax_class_ids={
+                tax_class_id
+                for line in lines
+                if (tax_class_id := get_checkout_line_tax_class_id(line))
+            },
+            country_codes=[country_code] if country_code else [],
+        )
+
+    @classmethod
+    def for_order(cls, order: "Order") -> "SellerTaxContext":
+        from ...order.models import OrderLine
+
+        lines = OrderLine.objects.using(
+            settings.DATABASE_CONNECTION_DEFAULT_NAME
+        ).filter(order_id=order.pk)
+        seller_ids: set[UUID] = set()
+        tax_class_ids: set[int] = set()
+        for (
+            seller_id,
+            product_seller_id,
+            tax_class_id,
+            product_tax_class_id,
+        ) in lines.values_list(
+            "seller_id",
+            "variant__product__seller_id",
+            "tax_class_id",
+            "variant__product__tax_class_id",
+        ):
+            if seller_id or product_seller_id:
+                seller_ids.add(seller_id or product_seller_id)
+            if tax_class_id or product_tax_class_id:
+                tax_class_ids.add(tax_class_id or product_tax_class_id)
+        shipping_address = order.shipping_address
+        country_code = (
+            shipping_address.country.code
+            if shipping_address and shipping_address.country
+            else None
+        )
+        return cls(seller_ids, tax_class_ids, [country_code] if country_code else [])
+
+    def _load_sellers(self, seller_ids: set[UUID]):
+        from ..models import Seller, SellerTaxRegistration
+
+        seller_ids -= self._sellers.keys()
+        if not seller_ids:
+            return
+        sellers = (
+            Seller.objects.using(self.database_connection_name)
+            .filter(pk__in=seller_ids)
+            .select_related("tax_origin_address")
+        )
+        self._sellers.update(dict.fromkeys(seller_ids))
+        self._sellers.update({seller.pk: seller for seller in sellers})
+        registrations = (
+            SellerTaxRegistration.objects.using(self.database_connection_name)
+            .filter(seller_id__in=seller_ids, is_active=True)
+            .values_list("seller_id", "country", "registration_type")
+        )
+        self._registrations.update(
+            (seller_id, str(country), registration_type)
+            for seller_id, country, registration_type in registrations
+        )
+
+    def _load_rates(self, country_codes: set[str]):
+        from ...tax.models import TaxClassCountryRate
+
+        country_codes -= self._loaded_countries
+        if not country_codes:
+            return
+        rates = (
+            TaxClassCountryRate.objects.using(self.database_connection_name)
+            .filter(country__in=country_codes)
+            .filter(Q(tax_class_id__in=self._tax_class_ids) | Q(tax_class__isnull=True))
+            .values_list("tax_class_id", "country", "rate")
+        )
+        for tax_class_id, country, rate in rates:
+            self._rates.setdefault((tax_class_id, str(country)), rate)
+        self._loaded_countries.update(country_codes)
+
+    def _get_origin_country(self, seller_id: UUID) -> str | None:
+        seller = self._sellers.get(seller_id)
+        if seller and seller.tax_origin_address and seller.tax_origin_address.country:
+            return seller.tax_origin_address.country.code
+        return None
+
+    def get_seller(self, seller_id: UUID | None) -> Optional["Seller"]:
+        if not seller_id:
+            return None
+        self._load_sellers({seller_id})
+        return self._sellers[seller_id]
+
+    def get_tax_country(
+        self, seller_id: UUID, destination_country_code: str | None
+    ) -> str | None:
+        """Return the seller's tax origin country, or the destination country."""
+        return self._get_origin_country(seller_id) or destination_country_code
+
+    def has_tax_registration(
+        self, seller_id: UUID, country_code: str, tax_type: str = "vat"
+    ) -> bool:
+        self._load_sellers({seller_id})
+        return (seller_id, country_code, tax_type.lower()) in self._registrations
+
+    def get_tax_rate(
+        self, tax_class_id: int | None, country_code: str
+    ) -> Decimal | None:
+        """Return the rate of a tax class in a country, or the country default."""
+        if tax_class_id and tax_class_id not in self._tax_class_ids:
+            # Rates of a new tax class have to be fetched for every loaded country.
+            self._tax_class_ids.add(tax_class_id)
+            countries = self._loaded_countries
+            self._loaded_countries = set()
+            self._load_rates(countries | {country_code})
+        else:
+            self._load_rates({country_code})
+        if tax_class_id:
+            rate = self._rates.get((tax_class_id, country_code))
+            if rate is not None:
+                return rate
+        return self._rates.get((None, country_code))
+
+
+def get_checkout_line_tax_class_id(line_info: "CheckoutLineInfo") -> int | None:
+    return line_info.product.tax_class_id or line_info.product_type.tax_class_id
+
+
+def get_order_tax_context(order: "Order") -> SellerTaxContext:
+    """Return the tax context memoized on the order instance."""
+    context = getattr(order, "_seller_tax_context", None)
+    if context is None:
+        context = SellerTaxContext.for_order(order)
+        order._seller_tax_context = context  # type: ignore[attr-defined]
+    return context
@@ -0,0 +1,147 @@
+"""Featured homepage content of channels.
+
+Staff curate an ordered set of featured products and collections per channel.
+The published part of the set is precomputed into a list of IDs kept in the
+shared cache, so rendering the homepage only fetches the listed rows by primary
+key. The lists are dropped whenever featuring or channel listings change.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+
+FEATURED_CONTENT_VERSION_CACHE_KEY = "marketplace:featured_content:version"
+FEATURED_PRODUCT_IDS_CACHE_KEY = "marketplace:featured_products:{version}:{channel_id}"
+FEATURED_COLLECTION_IDS_CACHE_KEY = (
+    "marketplace:featured_collections:{version}:{channel_id}"
+)
+FEATURED_CONTENT_CACHE_TIMEOUT = 60 * 60  # 1 hour
+# Upper bound of products in a featured set, including products of featured
+# collections.
+MAX_FEATURED_PRODUCTS = 100
+
+
+def get_featured_content_version() -> int:
+    return cache.get_or_set(
+        FEATURED_CONTENT_VERSION_CACHE_KEY, int(time.time()), timeout=None
+    )
+
+
+def invalidate_featured_content() -> None:
+    """Drop all cached featured product and collection lists."""
+    try:
+        cache.incr(FEATURED_CONTENT_VERSION_CACHE_KEY)
+    except ValueError:
+        # The key expired or was evicted; any new version makes old keys stale.
+        cache.set(FEATURED_CONTENT_VERSION_CACHE_KEY, int(time.time()), timeout=None)
+
+
+def compute_featured_collection_ids(
+    channel_id: int | None,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> list[int]:
+    """Return IDs of collections featured in the channel, in featured order.
+
+    Without a channel, collections featured in any channel are returned.
+    """
+    from ..models import FeaturedCollection
+
+    featured = FeaturedCollection.objects.using(database_connection_name)
+    if channel_id is not None:
+        featured = featured.filter(
+            channel_id=channel_id,
+            collection__channel_listings__channel_id=channel_id,
+            collection__channel_listings__is_published=True,
+        )
+    collection_ids = featured.order_by("sort_order", "pk").values_list(
+        "collection_id", flat=True
+    )
+    return list(dict.fromkeys(collection_ids))
+
+
+def compute_featured_product_ids(
+    channel_id: int | None,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> list[int]:
+    """Return IDs of products featured in the channel, in featured order.
+
+    Curated products come first, followed by products of featured collections.
+    Without a channel, products featured in any channel are returned.
+    """
+    from ...product.models import CollectionProduct
+    from ..models import FeaturedProduct
+
+    featured = FeaturedProduct.objects.using(database_connection_name)
+    collection_ids = compute_featured_collection_ids(
+        channel_id, database_connection_name
+    )
+    collection_products = CollectionProduct.objects.using(
+        database_connection_name
+    ).filter(collection_id__in=collection_ids)
+    if channel_id is not None:
+        featured = featured.filter(
+            channel_id=channel_id,
+            product__channel_listings__channel_id=channel_id,
+            product__channel_listings__is_published=True,
+        )
+        collection_products = collection_products.filter(
+            product__channel_listings__channel_id=channel_id,
+            product__channel_listings__is_published=True,
+        )
+
+    product_ids = dict.fromkeys(
+        featured.order_by("sort_order", "pk").values_list("product_id", flat=True)[
+            :MAX_FEATURED_PRODUCTS
+        ]
+    )
+    if collection_ids and len(product_ids) < MAX_FEATURED_PRODUCTS:
+        product_ids_by_collection: dict[int, list[int]] = {}
+        for collection_id, product_id in collection_products.order_by(
+            F("sort_order").asc(nulls_last=True), "pk"
+        ).values_list("collection_id", "product_id"):
+            product_ids_by_collection.setdefault(collection_id, []).append(product_id)
+        for collection_id in collection_ids:
+            product_ids.update(
+                dict.fromkeys(product_ids_by_collection.get(collection_id, []))
+            )
+    return list(product_ids)[:MAX_FEATURED_PRODUCTS]
+
+
+def _get_cached_ids(cache_key: str, compute, channel_id, database_connection_name):
+    key = cache_key.format(
+        version=get_featured_content_version(),
+        channel_id=channel_id if channel_id is not None else "all",
+    )
+    ids = cache.get(key)
+    if ids is None:
+        ids = compute(channel_id, database_connection_name)
+        cache.set(key, ids, timeout=FEATURED_CONTENT_CACHE_TIMEOUT)
+    return ids
+
+
+def get_featured_product_ids(
+    channel_id: int | None,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> list[int]:
+    """Return cached IDs of products featured in the channel."""
+    return _get_cached_ids(
+        FEATURED_PRODUCT_IDS_CACHE_KEY,
+        compute_featured_product_ids,
+        channel_id,
+        database_connection_name,
+    )
+
+
+def get_featured_collection_ids(
+    channel_id: int | None,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> list[int]:
+    """Return cached IDs of collections featured in the channel."""
+    return _get_cached_ids(
+        FEATURED_COLLECTION_IDS_CACHE_KEY,
+        compute_featured_collection_ids,
+        channel_id,
+        database_connection_name,
+    )
@@ -0,0 +1,299 @@
+"""Views of help center articles.
+
+Article views are appended to a Redis list and flushed in batches, so serving
+a help page never writes to the database; without the buffer each view is
+stored by a background task. Each flush stores the raw views, adds
+them to the daily per-article rollup and to the articles' view counters, and
+drops cached top article lists of affected categories. Raw views are kept for
+`HELP_ARTICLE_VIEW_RETENTION`; popularity is read from the rollup.
+"""
+
+import datetime
+import json
+import logging
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Sum, Value, When
+from django.utils import timezone
+from redis import RedisError
+
+from ...webhook.observability.buffers import RedisBuffer
+from ..analytics import get_bucket_date
+
+logger = logging.getLogger(__name__)
+
+HELP_ARTICLE_VIEW_BUFFER_KEY = "marketplace_help_article_views"
+TOP_HELP_ARTICLES_CACHE_KEY = "marketplace:help_top_articles:{category_id}"
+TOP_HELP_ARTICLES_CACHE_TIMEOUT = 60 * 15  # 15 minutes
+TOP_HELP_ARTICLES_LIMIT = 10
+TOP_HELP_ARTICLES_DAYS = 30
+MAX_USER_AGENT_LENGTH = 512
+# Upper bound of batches drained by a single flush, so one run can't starve
+# the worker when views keep coming in.
+MAX_FLUSH_BATCHES = 50
+
+
+@dataclass(frozen=True)
+class HelpArticleViewEvent:
+    article_id: UUID
+    viewed_at: datetime.datetime
+    user_id: int | None = None
+    ip_address: str | None = None
+    user_agent: str = ""
+
+    def encode(self) -> bytes:
+        return json.dumps(
+            [
+                str(self.article_id),
+                self.viewed_at.isoformat(),
+                self.user_id,
+                self.ip_address,
+                self.user_agent,
+            ]
+        ).encode()
+
+    @classmethod
+    def decode(cls, value: bytes | str) -> "HelpArticleViewEvent":
+        article_id, viewed_at, user_id, ip_address, user_agent = json.loads(value)
+        return cls(
+            UUID(article_id),
+            datetime.datetime.fromisoformat(viewed_at),
+            user_id,
+            ip_address,
+            user_agent,
+        )
+
+
+def get_help_article_view_buffer() -> RedisBuffer | None:
+    if not settings.HELP_ARTICLE_VIEW_BUFFER_BROKER_URL:
+        return None
+    return RedisBuffer(
+        settings.HELP_ARTICLE_VIEW_BUFFER_BROKER_URL,
+        HELP_ARTICLE_VIEW_BUFFER_KEY,
+        max_size=settings.HELP_ARTICLE_VIEW_BUFFER_SIZE_LIMIT,
+        batch_size=settings.HELP_ARTICLE_VIEW_FLUSH_BATCH_SIZE,
+        timeout=int(settings.HELP_ARTICLE_VIEW_BUFFER_TIMEOUT.total_seconds()),
+    )
+
+
+def record_help_article_view(
+    article_id: UUID,
+    user=None,
+    ip_address: str | None = None,
+    user_agent: str = "",
+):
+    """Record a view of a help article."""
+    view = HelpArticleViewEvent(
+        article_id=article_id,
+        viewed_at=timezone.now(),
+        user_id=user.pk if user and user.is_authenticated else None,
+        ip_address=ip_address,
+        user_agent=(user_agent or "")[:MAX_USER_AGENT_LENGTH],
+    )
+    buffer = get_help_article_view_buffer()
+    if buffer is not None:
+        try:
+            buffer.put_event(view.encode())
+            return
+        except RedisError:
+            logger.warning(
+                "Help article view buffer unavailable, storing in a background task."
+            )
+    # Never write to the database on the request path.
+    from ..tasks import store_help_article_views_task
+
+    store_help_article_views_task.delay([view.encode().decode()])
+
+
+def _increment_counters(model, counts: Mapping, field_name: str):
+    """Atomically add counts to a counter field of rows given by primary key.
+
+    Rows are locked in primary key order first, so concurrent flushes don't
+    deadlock.
+    """
+    pks = list(
+        model.objects.select_for_update()
+        .filter(pk__in=counts.keys())
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    if not pks:
+        return
+    increment = Case(
+        *[When(pk=pk, then=Value(counts[pk])) for pk in pks],
+        output_field=IntegerField(),
+    )
+    model.objects.filter(pk__in=pks).update(**{field_name: F(field_name) + increment})
+
+
+def store_help_article_views(views: Iterable[HelpArticleViewEvent]) -> int:
+    """Store raw views and add them to the rollup and article counters.
+
+    Returns the number of stored views.
+    """
+    from ..models_help import HelpArticle, HelpArticleDailyViews, HelpArticleView
+
+    views = list(views)
+    if not views:
+        return 0
+    # Views of deleted articles are dropped instead of failing the whole batch.
+    category_ids = dict(
+        HelpArticle.objects.filter(
+            pk__in={view.article_id for view in views}
+        ).values_list("pk", "category_id")
+    )
+    views = [view for view in views if view.article_id in category_ids]
+    if not views:
+        return 0
+
+    daily_counts = Counter(
+        (view.article_id, get_bucket_date(view.viewed_at)) for view in views
+    )
+    with transaction.atomic():
+        HelpArticleView.objects.bulk_create(
+            [
+                HelpArticleView(
+                    article_id=view.article_id,
+                    user_id=view.user_id,
+                    ip_address=view.ip_address,
+                    user_agent=view.user_agent,
+                    viewed_at=view.viewed_at,
+                )
+                for view in views
+            ]
+        )
+        HelpArticleDailyViews.objects.bulk_create(
+            [
+                HelpArticleDailyViews(article_id=article_id, date=date)
+                for article_id, date in daily_counts
+            ],
+            ignore_conflicts=True,
+        )
+        rollup_pks = {
+            (article_id, date): pk
+            for pk, article_id, date in HelpArticleDailyViews.objects.filter(
+                article_id__in={article_id for article_id, _ in daily_counts},
+                date__in={date for _, date in daily_counts},
+            ).values_list("pk", "article_id", "date")
+        }
+        _increment_counters(
+            HelpArticleDailyViews,
+            {rollup_pks[key]: count for key, count in daily_counts.items()},
+            "views_count",
+        )
+        _increment_counters(
+            HelpArticle,
+            Counter(view.article_id for view in views),
+            "views_count",
+        )
+
+    affected_categories = {category_ids[view.article_id] for view in views}
+    cache.delete_many(
+        [
+            _get_top_articles_cache_key(category_id)
+            for category_id in {None, *affected_categories}
+        ]
+    )
+    return len(views)
+
+
+def flush_help_article_views(buffer: RedisBuffer | None = None) -> tuple[int, int]:
+    """Move buffered help article views to the database.
+
+    Returns the number of stored views and of views left in the buffer.
+    """
+    if buffer is None:
+        buffer = get_help_article_view_buffer()
+    if buffer is None:
+        return 0, 0
+
+    stored, remaining = 0, 0
+    for _ in range(MAX_FLUSH_BATCHES):
+        events, remaining = buffer.pop_events_get_size()
+        views = []
+        for event in events:
+            try:
+                views.append(HelpArticleViewEvent.decode(event))
+            except (TypeError, ValueError):
+                logger.warning("Skipping malformed help article view event.")
+        stored += store_help_article_views(views)
+        if not remaining:
+            break
+    return stored, remaining
+
+
+def _get_top_articles_cache_key(category_id: UUID | None) -> str:
+    return TOP_HELP_ARTICLES_CACHE_KEY.format(
+        category_id=category_id if category_id is not None else "all"
+    )
+
+
+def compute_top_help_article_ids(
+    category_id: UUID | None,
+    today: datetime.date | None = None,
+    database_connection_name: str = settings.DATABASE_CONNECTION_REPLICA_NAME,
+) -> list[UUID]:
+    """Return IDs of the most viewed active articles of the recent days.
+
+    Without a category, articles of all categories are ranked.
+    """
+    from ..models_help import HelpArticleDailyViews
+
+    today = today or get_bucket_date(timezone.now())
+    rollups = HelpArticleDailyViews.objects.using(database_connection_name).filter(
+        date__gt=today - datetime.timedelta(days=TOP_HELP_ARTICLES_DAYS),
+        article__is_active=True,
+    )
+    if category_id is not None:
+        rollups = rollups.filter(article__category_id=category_id)
+    top = (
+        rollups.values("article_id")
+        .annotate(total=Sum("views_count"))
+        .order_by("-total", "article_id")
+        .values_list("article_id", flat=True)[:TOP_HELP_ARTICLES_LIMIT]
+    )
+    return list(top)
+
+
+def get_top_help_article_ids(
+    category_id: UUID | None,
+    database_connection_name: str = settings.DATABASE_CONNECTION_REPLICA_NAME,
+) -> list[UUID]:
+    """Return cached IDs of the most viewed articles of the category."""
+    key = _get_top_articles_cache_key(category_id)
+    article_ids = cache.get(key)
+    if article_ids is None:
+        article_ids = compute_top_help_article_ids(
+            category_id, database_connection_name=database_connection_name
+        )
+        cache.set(key, article_ids, timeout=TOP_HELP_ARTICLES_CACHE_TIMEOUT)
+    return article_ids
+
+
+def delete_old_help_article_views(
+    now: datetime.datetime | None = None, batch_size: int = 1000
+) -> int:
+    """Delete raw help article views older than the retention period.
+
+    Returns the number of deleted views.
+    """
+    from ..models_help import HelpArticleView
+
+    now = now or timezone.now()
+    cutoff = now - settings.HELP_ARTICLE_VIEW_RETENTION
+    deleted = 0
+    while True:
+        pks = list(
+            HelpArticleView.objects.filter(viewed_at__lt=cutoff)
+            .order_by()
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not pks:
+            return deleted
+        deleted += HelpArticleView.objects.filter(pk__in=pks).delete()[0]
@@ -1,8 +1,16 @@
 """Real-time inventory synchronization service."""
 
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
+from uuid import UUID
 
 from django.db import transaction
+from django.db.models import Q, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 if TYPE_CHECKING:
@@ -10,6 +18,10 @@ if TYPE_CHECKING:
     from ...warehouse.models import Warehouse
     from ..models import FulfillmentCenter, InventorySync
 
+logger = logging.getLogger(__name__)
+
+INVENTORY_SYNC_BATCH_SIZE = 1000
+
 
 def sync_inventory_for_variant(
     variant: "ProductVariant",
@@ -81,17 +93,170 @@ def sync_inventory_for_variant(
     return sync
 
 
-def sync_all_inventory_for_seller(seller, fulfillment_center=None):
+@dataclass
+class BulkInventorySyncResult:
+    """Summary of a bulk inventory sync run."""
+
+    rows: int = 0
+    duration: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.duration if self.duration else 0.0
+
+
+def get_stock_quantities(
+    variant_ids: Iterable[int], warehouse_ids: Iterable[UUID]
+) -> dict[tuple[int, UUID], tuple[int, int]]:
+    """Return on-hand and active-reserved quantities per (variant, warehouse).
+
+    The quantities of all given variants are computed in a single grouped query.
+    """
+    from ...warehouse.models import Stock
+
+    stocks = (
+        Stock.objects.filter(
+            product_variant_id__in=variant_ids, warehouse_id__in=warehouse_ids
+        )
+        .order_by()
+        .annotate(
+            active_reserved=Coalesce(
+                Sum(
+                    "reservations__quantity_reserved",
+                    filter=Q(reservations__reserved_until__gt=timezone.now()),
+                ),
+                0,
+            )
+        )
+        .values_list("product_variant_id", "warehouse_id", "quantity", "active_reserved")
+    )
+    return {
+        (variant_id, warehouse_id): (quantity or 0, reserved)
+        for variant_id, warehouse_id, quantity, reserved in stocks
+    }
+
+
+def _upsert_inventory_syncs(
+    keys: Iterable[tuple[int, UUID, UUID]],
+    quantities: dict[tuple[int, UUID], tuple[int, int]],
+    sync_method: str,
+) -> int:
+    """Write inventory sync records for (variant, fulfillment center, warehouse) keys.
+
+    Returns the number of written rows.
+    """
+    from ..models import InventorySync
+
+    now = timezone.now()
+    syncs = []
+    for variant_id, fulfillment_center_id, warehouse_id in keys:
+        quantity_available, quantity_reserved = quantities.get(
+            (variant_id, warehouse_id), (0, 0)
+        )
+        syncs.append(
+            InventorySync(
+                product_variant_id=variant_id,
+                fulfillment_center_id=fulfillment_center_id,
+                warehouse_id=warehouse_id,
+                quantity_available=quantity_available,
+                quantity_reserved=quantity_reserved,
+                synced_at=now,
+                sync_method=sync_method,
+            )
+        )
+    InventorySync.objects.bulk_create(
+        syncs,
+        update_conflicts=True,
+        unique_fields=["product_variant", "fulfillment_center", "warehouse"],
+        update_fields=[
+            "quantity_available",
+            "quantity_reserved",
+            "synced_at",
+            "sync_method",
+            "updated_at",
+        ],
+    )
+    return len(syncs)
+
+
+def bulk_sync_inventory(
+    variant_ids: list[int],
+    fulfillment_center: "FulfillmentCenter",
+    warehouse_ids: list[UUID],
+    sync_method: str = "polling",
+) -> int:
+    """Upsert inventory sync records of the given variants in all given warehouses.
+
+    Returns the number of written rows.
+    """
+    quantities = get_stock_quantities(variant_ids, warehouse_ids)
+    keys = (
+        (variant_id, fulfillment_center.pk, warehouse_id)
+        for variant_id in variant_ids
+        for warehouse_id in warehouse_ids
+    )
+    return _upsert_inventory_syncs(keys, quantities, sync_method)
+
+
+def sync_inventory_for_stocks(
+    stock_keys: Iterable[tuple[int, UUID]], sync_method: str = "webhook"
+) -> int:
+    """Sync (variant, warehouse) pairs to every fulfillment center of the warehouse.
+
+    Pairs of warehouses that do not belong to any fulfillment center are skipped.
+    Returns the number of written rows.
+    """
+    from ..models import FulfillmentCenter
+
+    stock_keys = set(stock_keys)
+    if not stock_keys:
+        return 0
+    warehouse_ids = {warehouse_id for _, warehouse_id in stock_keys}
+    center_ids_by_warehouse: dict[UUID, list[UUID]] = defaultdict(list)
+    memberships = FulfillmentCenter.warehouses.through.objects.filter(
+        warehouse_id__in=warehouse_ids
+    ).values_list("warehouse_id", "fulfillmentcenter_id")
+    for warehouse_id, fulfillment_center_id in memberships:
+        center_ids_by_warehouse[warehouse_id].append(fulfillment_center_id)
+
+    stock_keys = {key for key in stock_keys if key[1] in center_ids_by_warehouse}
+    if not stock_keys:
+        return 0
+    quantities = get_stock_quantities(
+        {variant_id for variant_id, _ in stock_keys}, warehouse_ids
+    )
+    keys = (
+        (variant_id, fulfillment_center_id, warehouse_id)
+        for variant_id, warehouse_id in stock_keys
+        for fulfillment_center_id in center_ids_by_warehouse[warehouse_id]
+    )
+    return _upsert_inventory_syncs(keys, quantities, sync_method)
+
+
+def sync_all_inventory_for_seller(
+    seller,
+    fulfillment_center=None,
+    sync_method: str = "polling",
+    batch_size: int = INVENTORY_SYNC_BATCH_SIZE,
+) -> BulkInventorySyncResult:
     """Sync all inventory for a seller's products.
 
+    Variants are processed in chunks; each chunk costs one grouped stock query
+    and one upsert, regardless of the number of variants in it.
+
     Args:
         seller: Seller instance
         fulfillment_center: Fulfillment center to sync to (optional)
+        sync_method: Method used for sync (webhook, polling, manual)
+        batch_size: Number of variants synced in a single chunk
+
+    Returns:
+        BulkInventorySyncResult with the number of written rows and the duration
     """
+    from ...product.models import ProductVariant
     from ..models import FulfillmentCenter
 
-    # Get seller's products
-    products = seller.products.all()
+    result = BulkInventorySyncResult()
 
     # Get fulfillment center if not provided
     if not fulfillment_center:
@@ -102,14 +267,35 @@ def sync_all_inventory_for_seller(seller, fulfillment_center=None):
             fulfillment_center = FulfillmentCenter.objects.filter(is_active=True).first()
 
     if not fulfillment_center:
-        return
+        return result
 
-    # Sync inventory for all variants of seller's products
-    for product in products:
-        for variant in product.variants.all():
-            sync_inventory_for_variant(
-                variant, fulfillment_center=fulfillment_center, sync_method="polling"
-            )
+    warehouse_ids = list(fulfillment_center.warehouses.values_list("pk", flat=True))
+    if not warehouse_ids:
+        return result
+
+    start = time.monotonic()
+    variants = ProductVariant.objects.filter(product__seller=seller).order_by("pk")
+    last_pk = 0
+    while True:
+        variant_ids = list(
+            variants.filter(pk__gt=last_pk).values_list("pk", flat=True)[:batch_size]
+        )
+        if not variant_ids:
+            break
+        result.rows += bulk_sync_inventory(
+            variant_ids, fulfillment_center, warehouse_ids, sync_method=sync_method
+        )
+        last_pk = variant_ids[-1]
+    result.duration = time.monotonic() - start
+
+    logger.info(
+        "Synced %s inventory rows for seller %s in %.2fs (%.0f rows/s).",
+        result.rows,
+        seller.pk,
+        result.duration,
+        result.rows_per_second,
+    )
+    return result
 
 
 def get_aggregated_inventory_for_variant(
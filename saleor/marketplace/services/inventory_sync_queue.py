@@ -0,0 +1,152 @@
+"""Coalescing queue of stocks waiting for an inventory sync.
+
+Stock writes only record the changed (variant, warehouse) pair. Pairs changed in
+one transaction are written to the queue with a single insert once it commits,
+and repeated changes of the same stock collapse into one queued row. The flush
+task drains the queue in batches after the debounce window has passed.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from datetime import timedelta
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from ..metrics import (
+    record_inventory_sync_flush_latency,
+    record_inventory_sync_queue_depth,
+)
+from ..models import PendingInventorySync
+from .inventory_sync import sync_inventory_for_stocks
+
+logger = logging.getLogger(__name__)
+
+INVENTORY_SYNC_FLUSH_SCHEDULED_CACHE_KEY = "marketplace:inventory_sync:flush_scheduled"
+
+StockKey = tuple[int, UUID]
+
+_pending = threading.local()
+
+
+def _get_pending_stock_keys() -> set[StockKey]:
+    if not hasattr(_pending, "stock_keys"):
+        _pending.stock_keys = set()
+    return _pending.stock_keys
+
+
+def mark_stock_for_inventory_sync(variant_id: int, warehouse_id: UUID):
+    """Queue an inventory sync of the stock once the current transaction commits.
+
+    Callbacks of rolled back transactions are discarded by Django, while their
+    stock keys stay buffered and are queued with the next commit. Keys of stocks
+    that no longer exist are dropped then, and syncing an unchanged stock again
+    is harmless.
+    """
+    _get_pending_stock_keys().add((variant_id, warehouse_id))
+    transaction.on_commit(enqueue_pending_stock_keys, robust=True)
+
+
+def enqueue_pending_stock_keys():
+    stock_keys = _get_pending_stock_keys()
+    if not stock_keys:
+        return
+    pending = list(stock_keys)
+    stock_keys.clear()
+    enqueue_inventory_sync(pending)
+
+
+def enqueue_inventory_sync(stock_keys: Iterable[StockKey]):
+    """Add (variant ID, warehouse ID) pairs to the queue and schedule a flush."""
+    from ...warehouse.models import Stock
+
+    stock_keys = set(stock_keys)
+    existing_stocks = Stock.objects.filter(
+        product_variant_id__in={variant_id for variant_id, _ in stock_keys},
+        warehouse_id__in={warehouse_id for _, warehouse_id in stock_keys},
+    ).values_list("product_variant_id", "warehouse_id")
+    stock_keys &= set(existing_stocks)
+    if not stock_keys:
+        return
+
+    now = timezone.now()
+    PendingInventorySync.objects.bulk_create(
+        [
+            PendingInventorySync(
+                product_variant_id=variant_id,
+                warehouse_id=warehouse_id,
+                enqueued_at=now,
+            )
+            for variant_id, warehouse_id in stock_keys
+        ],
+        ignore_conflicts=True,
+    )
+    schedule_inventory_sync_flush()
+
+
+def schedule_inventory_sync_flush():
+    """Schedule the flush task unless one is already waiting for its countdown."""
+    from ..tasks import flush_inventory_sync_queue_task
+
+    debounce = settings.INVENTORY_SYNC_DEBOUNCE
+    # The marker outlives the countdown, so a lost task only delays the next flush
+    if cache.add(INVENTORY_SYNC_FLUSH_SCHEDULED_CACHE_KEY, True, timeout=debounce * 3):
+        flush_inventory_sync_queue_task.apply_async(countdown=debounce)
+
+
+def _flush_batch(cutoff, batch_size: int) -> int:
+    with transaction.atomic():
+        batch = list(
+            PendingInventorySync.objects.select_for_update(skip_locked=True)
+            .filter(enqueued_at__lte=cutoff)
+            .order_by("enqueued_at")
+            .values_list("pk", "product_variant_id", "warehouse_id", "enqueued_at")[
+                :batch_size
+            ]
+        )
+        if not batch:
+            return 0
+        # Rows are deleted before the stocks are read. Changes queued before the
+        # delete were committed earlier and are included in the sync, while a
+        # change queued after it inserts a new row, as the conflicting row is
+        # gone once the delete commits.
+        PendingInventorySync.objects.filter(pk__in=[row[0] for row in batch]).delete()
+        sync_inventory_for_stocks(
+            (variant_id, warehouse_id) for _, variant_id, warehouse_id, _ in batch
+        )
+
+    record_inventory_sync_flush_latency((timezone.now() - batch[0][3]).total_seconds())
+    return len(batch)
+
+
+def flush_inventory_sync_queue(
+    batch_size: int | None = None, debounce: int | None = None
+) -> tuple[int, int]:
+    """Sync queued stocks that have been waiting longer than the debounce window.
+
+    Returns the number of flushed stocks and the number of stocks still queued.
+    """
+    batch_size = batch_size or settings.INVENTORY_SYNC_FLUSH_BATCH_SIZE
+    if debounce is None:
+        debounce = settings.INVENTORY_SYNC_DEBOUNCE
+    record_inventory_sync_queue_depth(PendingInventorySync.objects.count())
+
+    start = time.monotonic()
+    cutoff = timezone.now() - timedelta(seconds=debounce)
+    flushed = 0
+    while flushed_in_batch := _flush_batch(cutoff, batch_size):
+        flushed += flushed_in_batch
+
+    remaining = PendingInventorySync.objects.count()
+    logger.debug(
+        "Flushed %s queued inventory syncs in %.2fs, %s left in the queue.",
+        flushed,
+        time.monotonic() - start,
+        remaining,
+    )
+    return flushed, remaining
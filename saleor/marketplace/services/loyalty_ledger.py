@@ -0,0 +1,243 @@
+"""Append-only ledger of loyalty points.
+
+Every change of a points balance is a `LoyaltyPointsTransaction` row written in
+the same database transaction as an atomic `F()` update of the balance. Balance
+rows are locked in a stable order first, so concurrent postings neither lose
+updates nor deadlock, and many users are credited with a constant number of
+queries per chunk.
+
+Points are consumed in order of expiry: spending uses the points that expire
+first, and expiry removes whatever is left of the expired credits.
+"""
+
+import datetime
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Q, Value, When
+from django.utils import timezone
+
+LOYALTY_EXPIRY_CURSOR_CACHE_KEY = "marketplace:loyalty_points:expiry_cursor"
+
+
+def _get_delta_expression(changes: Mapping[int, int]):
+    values = set(changes.values())
+    if len(values) == 1:
+        return Value(values.pop())
+    return Case(
+        *[
+            When(user_id=user_id, then=Value(points))
+            for user_id, points in changes.items()
+        ],
+        output_field=IntegerField(),
+    )
+
+
+def _lock_balances(user_ids: Iterable[int]) -> dict[int, int]:
+    """Lock balance rows of the users in a stable order and return the balances."""
+    from ..models_loyalty import LoyaltyPointsBalance
+
+    return dict(
+        LoyaltyPointsBalance.objects.select_for_update(of=("self",))
+        .filter(user_id__in=list(user_ids))
+        .order_by("user_id")
+        .values_list("user_id", "balance")
+    )
+
+
+def post_points(
+    changes: Mapping[int, int],
+    transaction_type: str,
+    description: str = "",
+    order=None,
+    expires_at: datetime.datetime | None = None,
+    allow_partial: bool = False,
+) -> list:
+    """Apply per-user point changes and record them in the ledger.
+
+    Negative changes larger than the balance raise `ValueError`, unless
+    `allow_partial` is set, in which case they are capped at the balance.
+    Returns the created ledger entries.
+    """
+    from ..models_loyalty import LoyaltyPointsBalance, LoyaltyPointsTransaction
+
+    changes = {user_id: points for user_id, points in changes.items() if points}
+    if not changes:
+        return []
+    with transaction.atomic():
+        LoyaltyPointsBalance.objects.bulk_create(
+            [LoyaltyPointsBalance(user_id=user_id) for user_id in changes],
+            ignore_conflicts=True,
+        )
+        balances = _lock_balances(changes.keys())
+        for user_id, points in list(changes.items()):
+            if balances[user_id] + points >= 0:
+                continue
+            if not allow_partial:
+                raise ValueError("Insufficient points balance")
+            changes[user_id] = -balances[user_id]
+        changes = {user_id: points for user_id, points in changes.items() if points}
+        if not changes:
+            return []
+
+        delta = _get_delta_expression(changes)
+        updates = {"balance": F("balance") + delta, "updated_at": timezone.now()}
+        if transaction_type == LoyaltyPointsTransaction.TransactionType.EARNED:
+            updates["lifetime_earned"] = F("lifetime_earned") + delta
+        elif transaction_type == LoyaltyPointsTransaction.TransactionType.SPENT:
+            updates["lifetime_spent"] = F("lifetime_spent") - delta
+        LoyaltyPointsBalance.objects.filter(user_id__in=changes.keys()).update(
+            **updates
+        )
+        return LoyaltyPointsTransaction.objects.bulk_create(
+            [
+                LoyaltyPointsTransaction(
+                    user_id=user_id,
+                    points=points,
+                    balance_after=balances[user_id] + points,
+                    transaction_type=transaction_type,
+                    description=description,
+                    order=order,
+                    expires_at=expires_at,
+                )
+                for user_id, points in changes.items()
+            ]
+        )
+
+
+def credit_points(
+    user_ids: Iterable[int],
+    points: int,
+    description: str = "",
+    expires_at: datetime.datetime | None = None,
+    batch_size: int | None = None,
+) -> int:
+    """Credit the same number of points to many users, in chunks.
+
+    Returns the number of credited users.
+    """
+    from ..models_loyalty import LoyaltyPointsTransaction
+
+    if points <= 0:
+        raise ValueError("Points must be positive")
+    batch_size = batch_size or settings.LOYALTY_POINTS_BATCH_SIZE
+    user_ids = list(dict.fromkeys(user_ids))
+    for start in range(0, len(user_ids), batch_size):
+        post_points(
+            dict.fromkeys(user_ids[start : start + batch_size], points),
+            LoyaltyPointsTransaction.TransactionType.EARNED,
+            description=description,
+            expires_at=expires_at,
+        )
+    return len(user_ids)
+
+
+@dataclass
+class _Credit:
+    expires_at: datetime.datetime | None
+    remaining: int
+
+
+@dataclass
+class _PointsLots:
+    """Credits of a user with the points left in each, soonest expiry first."""
+
+    credits: list[_Credit] = field(default_factory=list)
+
+    def add(self, points: int, expires_at: datetime.datetime | None):
+        self.credits.append(_Credit(expires_at, points))
+
+    def consume(self, points: int):
+        never = datetime.datetime.max.replace(tzinfo=datetime.UTC)
+        for credit in sorted(self.credits, key=lambda c: c.expires_at or never):
+            if points <= 0:
+                break
+            used = min(credit.remaining, points)
+            credit.remaining -= used
+            points -= used
+
+    def expired(self, now: datetime.datetime) -> int:
+        return sum(
+            credit.remaining
+            for credit in self.credits
+            if credit.expires_at and credit.expires_at <= now
+        )
+
+
+def get_expired_points(
+    user_ids: Iterable[int], now: datetime.datetime | None = None
+) -> dict[int, int]:
+    """Return points of the users that expired and were not spent yet.
+
+    Ledger entries are replayed in order; debits consume credits that expire
+    first, so the result doesn't change after the expiry is recorded.
+    """
+    from ..models_loyalty import LoyaltyPointsTransaction
+
+    now = now or timezone.now()
+    lots: dict[int, _PointsLots] = {}
+    entries = (
+        LoyaltyPointsTransaction.objects.filter(user_id__in=list(user_ids))
+        .order_by("user_id", "created_at", "id")
+        .values_list("user_id", "points", "expires_at")
+    )
+    for user_id, points, expires_at in entries.iterator(chunk_size=2000):
+        user_lots = lots.setdefault(user_id, _PointsLots())
+        if points > 0:
+            user_lots.add(points, expires_at)
+        else:
+            user_lots.consume(-points)
+    expired = {user_id: user_lots.expired(now) for user_id, user_lots in lots.items()}
+    return {user_id: points for user_id, points in expired.items() if points > 0}
+
+
+def expire_points(
+    now: datetime.datetime | None = None, batch_size: int | None = None
+) -> tuple[int, bool]:
+    """Expire points of users with credits that expired since the last run.
+
+    Credits are walked in `expires_at` order with a cursor kept in the cache,
+    one chunk per call. Returns the number of users whose points expired and
+    whether more expired credits are left.
+    """
+    from ..models_loyalty import LoyaltyPointsTransaction
+
+    now = now or timezone.now()
+    batch_size = batch_size or settings.LOYALTY_POINTS_BATCH_SIZE
+    credits = LoyaltyPointsTransaction.objects.filter(
+        transaction_type=LoyaltyPointsTransaction.TransactionType.EARNED,
+        expires_at__lte=now,
+    )
+    cursor = cache.get(LOYALTY_EXPIRY_CURSOR_CACHE_KEY)
+    if cursor:
+        cursor_expires_at, cursor_id = cursor
+        credits = credits.filter(
+            Q(expires_at__gt=cursor_expires_at)
+            | Q(expires_at=cursor_expires_at, id__gt=cursor_id)
+        )
+    batch = list(
+        credits.order_by("expires_at", "id").values_list("expires_at", "id", "user_id")[
+            :batch_size
+        ]
+    )
+    if not batch:
+        return 0, False
+
+    user_ids = {user_id for _, _, user_id in batch}
+    with transaction.atomic():
+        # Replay the ledger under the balance locks, so points spent or expired
+        # concurrently are not expired again.
+        _lock_balances(user_ids)
+        expired = get_expired_points(user_ids, now)
+        post_points(
+            {user_id: -points for user_id, points in expired.items()},
+            LoyaltyPointsTransaction.TransactionType.EXPIRED,
+            description="Points expired",
+            allow_partial=True,
+        )
+    last_expires_at, last_id, _ = batch[-1]
+    cache.set(LOYALTY_EXPIRY_CURSOR_CACHE_KEY, (last_expires_at, last_id), None)
+    return len(expired), len(batch) == batch_size
@@ -1,11 +1,302 @@
-"""Automatic order routing to fulfillment centers."""
+"""Automatic order routing to fulfillment centers.
 
+Active `OrderRoutingRule` rows are compiled once per process into a
+`RoutingTable` indexed by delivery country. The table is rebuilt when the shared
+routing version is bumped by a change of a rule, a fulfillment center or a
+seller's logistics configuration, so routing an order does not query the rules
+at all. Rules with the `require_inventory` condition are checked against the
+stock of the fulfillment center's warehouses with one query per order.
+"""
+
+import heapq
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
+from uuid import UUID
+
+from django.core.cache import cache
 
 if TYPE_CHECKING:
-    from ...order.models import Order
+    from ...order.models import Order, OrderLine
     from ..models import FulfillmentCenter, Seller
 
+ROUTING_TABLE_VERSION_CACHE_KEY = "marketplace:order_routing:version"
+
+# Candidates of rules without the `countries` condition are stored under this key.
+ANY_COUNTRY = ""
+
+
+@dataclass(frozen=True)
+class CompiledRoutingRule:
+    priority: int
+    position: int
+    fulfillment_center_id: UUID
+    countries: frozenset[str] | None
+    seller_ids: frozenset[str] | None
+    require_inventory: bool
+
+    def matches_seller(self, seller_id: UUID | None) -> bool:
+        # Seller preference is only checked when routing for a specific seller.
+        return (
+            seller_id is None
+            or self.seller_ids is None
+            or str(seller_id) in self.seller_ids
+        )
+
+
+def compile_routing_rule(rule, position: int) -> CompiledRoutingRule:
+    conditions = rule.conditions or {}
+    countries = conditions.get("countries")
+    seller_ids = conditions.get("seller_ids")
+    return CompiledRoutingRule(
+        priority=rule.priority,
+        position=position,
+        fulfillment_center_id=rule.fulfillment_center_id,
+        countries=frozenset(countries) if countries is not None else None,
+        seller_ids=(
+            frozenset(str(seller_id) for seller_id in seller_ids)
+            if seller_ids is not None
+            else None
+        ),
+        require_inventory=bool(conditions.get("require_inventory")),
+    )
+
+
+class InventoryIndex:
+    """Available stock quantities of order variants per fulfillment center."""
+
+    def __init__(self, quantities: dict[tuple[int, UUID], int], table: "RoutingTable"):
+        self.quantities = quantities
+        self.table = table
+
+    @classmethod
+    def load(
+        cls, lines: Iterable["OrderLine"], table: "RoutingTable"
+    ) -> "InventoryIndex":
+        from ...warehouse.models import Stock
+
+        variant_ids = {line.variant_id for line in lines if line.variant_id}
+        warehouse_ids = table.inventory_warehouse_ids
+        quantities: dict[tuple[int, UUID], int] = {}
+        if variant_ids and warehouse_ids:
+            stocks = Stock.objects.filter(
+                product_variant_id__in=variant_ids, warehouse_id__in=warehouse_ids
+            ).values_list(
+                "product_variant_id", "warehouse_id", "quantity", "quantity_allocated"
+            )
+            for variant_id, warehouse_id, quantity, quantity_allocated in stocks:
+                quantities[(variant_id, warehouse_id)] = max(
+                    quantity - quantity_allocated, 0
+                )
+        return cls(quantities, table)
+
+    def can_fulfill(
+        self, fulfillment_center_id: UUID, lines: Iterable["OrderLine"]
+    ) -> bool:
+        warehouse_ids = self.table.warehouse_ids_by_center.get(
+            fulfillment_center_id, ()
+        )
+        required: dict[int, int] = defaultdict(int)
+        for line in lines:
+            if line.variant_id:
+                required[line.variant_id] += line.quantity
+        return all(
+            sum(
+                self.quantities.get((variant_id, warehouse_id), 0)
+                for warehouse_id in warehouse_ids
+            )
+            >= quantity
+            for variant_id, quantity in required.items()
+        )
+
+
+class RoutingTable:
+    """Immutable snapshot of the routing configuration."""
+
+    def __init__(
+        self,
+        rules: list[CompiledRoutingRule],
+        fulfillment_centers: dict[UUID, "FulfillmentCenter"],
+        warehouse_ids_by_center: dict[UUID, tuple[UUID, ...]],
+        primary_center_by_seller: dict[UUID, UUID],
+        default_center: Optional["FulfillmentCenter"],
+    ):
+        self.fulfillment_centers = fulfillment_centers
+        self.warehouse_ids_by_center = warehouse_ids_by_center
+        self.primary_center_by_seller = primary_center_by_seller
+        self.default_center = default_center
+        self.rules_by_country: dict[str, list[CompiledRoutingRule]] = defaultdict(
+            list
+        )
+        for rule in rules:
+            countries = rule.countries if rule.countries is not None else [ANY_COUNTRY]
+            for country in countries:
+                self.rules_by_country[country].append(rule)
+        self.inventory_warehouse_ids = {
+            warehouse_id
+            for rule in rules
+            if rule.require_inventory
+            for warehouse_id in warehouse_ids_by_center.get(
+                rule.fulfillment_center_id, ()
+            )
+        }
+        self._candidates: dict[str, list[CompiledRoutingRule]] = {}
+
+    @classmethod
+    def load(cls) -> "RoutingTable":
+        from ..models import (
+            FulfillmentCenter,
+            OrderRoutingRule,
+            SellerLogisticsConfig,
+        )
+
+        rules = [
+            compile_routing_rule(rule, position)
+            for position, rule in enumerate(
+                OrderRoutingRule.objects.filter(is_active=True).order_by("priority")
+            )
+        ]
+        fulfillment_centers = {
+            center.pk: center for center in FulfillmentCenter.objects.all()
+        }
+        warehouse_ids_by_center: dict[UUID, list[UUID]] = defaultdict(list)
+        memberships = FulfillmentCenter.warehouses.through.objects.values_list(
+            "fulfillmentcenter_id", "warehouse_id"
+        )
+        for fulfillment_center_id, warehouse_id in memberships:
+            warehouse_ids_by_center[fulfillment_center_id].append(warehouse_id)
+        primary_center_by_seller = dict(
+            SellerLogisticsConfig.objects.filter(
+                primary_fulfillment_center__isnull=False
+            ).values_list("seller_id", "primary_fulfillment_center_id")
+        )
+        # FulfillmentCenter ordering is ("priority", "name")
+        default_center = next(
+            (center for center in fulfillment_centers.values() if center.is_active),
+            None,
+        )
+        return cls(
+            rules,
+            fulfillment_centers,
+            {key: tuple(value) for key, value in warehouse_ids_by_center.items()},
+            primary_center_by_seller,
+            default_center,
+        )
+
+    def get_candidates(self, country_code: str) -> list[CompiledRoutingRule]:
+        """Return rules applicable to a delivery country in priority order."""
+        candidates = self._candidates.get(country_code)
+        if candidates is None:
+            candidates = list(
+                heapq.merge(
+                    self.rules_by_country.get(country_code, []),
+                    self.rules_by_country.get(ANY_COUNTRY, []),
+                    key=lambda rule: rule.position,
+                )
+            )
+            self._candidates[country_code] = candidates
+        return candidates
+
+    def needs_inventory(self, country_code: str) -> bool:
+        return any(
+            rule.require_inventory for rule in self.get_candidates(country_code)
+        )
+
+    def route(
+        self,
+        country_code: str,
+        seller_id: UUID | None = None,
+        lines: Iterable["OrderLine"] = (),
+        inventory: InventoryIndex | None = None,
+    ) -> Optional["FulfillmentCenter"]:
+        for rule in self.get_candidates(country_code):
+            if not rule.matches_seller(seller_id):
+                continue
+            if rule.require_inventory and (
+                inventory is None
+                or not inventory.can_fulfill(rule.fulfillment_center_id, lines)
+            ):
+                continue
+            return self.fulfillment_centers.get(rule.fulfillment_center_id)
+
+        if seller_id:
+            primary_center_id = self.primary_center_by_seller.get(seller_id)
+            if primary_center_id:
+                return self.fulfillment_centers.get(primary_center_id)
+
+        return self.default_center
+
+
+_table_lock = threading.Lock()
+_table: tuple[int, RoutingTable] | None = None
+
+
+def get_routing_table_version() -> int:
+    return cache.get_or_set(
+        ROUTING_TABLE_VERSION_CACHE_KEY, int(time.time()), timeout=None
+    )
+
+
+def invalidate_routing_table() -> None:
+    """Make every process rebuild its routing table on the next use."""
+    global _table
+
+    _table = None
+    try:
+        cache.incr(ROUTING_TABLE_VERSION_CACHE_KEY)
+    except ValueError:
+        # The key expired or was evicted; any new version makes old tables stale.
+        cache.set(ROUTING_TABLE_VERSION_CACHE_KEY, int(time.time()), timeout=None)
+
+
+def get_routing_table() -> RoutingTable:
+    global _table
+
+    version = get_routing_table_version()
+    current = _table
+    if current is not None and current[0] == version:
+        return current[1]
+    with _table_lock:
+        if _table is None or _table[0] != version:
+            _table = (version, RoutingTable.load())
+        return _table[1]
+
+
+def _get_delivery_country_code(order: "Order") -> str | None:
+    if not order.shipping_address:
+        return None
+    return order.shipping_address.country.code
+
+
+def route_order_lines(
+    order: "Order", lines: Iterable["OrderLine"] | None = None
+) -> dict[UUID | None, Optional["FulfillmentCenter"]]:
+    """Route every seller of an order in a single pass.
+
+    Returns a mapping of seller ID to the fulfillment center its lines ship from.
+    Lines without a seller are routed under the `None` key.
+    """
+    country_code = _get_delivery_country_code(order)
+    if country_code is None:
+        return {}
+    lines = list(order.lines.all() if lines is None else lines)
+    table = get_routing_table()
+    inventory = (
+        InventoryIndex.load(lines, table)
+        if table.needs_inventory(country_code)
+        else None
+    )
+    lines_by_seller: dict[UUID | None, list[OrderLine]] = defaultdict(list)
+    for line in lines:
+        lines_by_seller[line.seller_id].append(line)
+    return {
+        seller_id: table.route(country_code, seller_id, seller_lines, inventory)
+        for seller_id, seller_lines in lines_by_seller.items()
+    }
+
 
 def route_order_to_fulfillment_center(
     order: "Order",
@@ -20,51 +311,22 @@ def route_order_to_fulfillment_center(
     Returns:
         FulfillmentCenter instance or None
     """
-    from ..models import FulfillmentCenter, OrderRoutingRule
-
-    if not order.shipping_address:
+    country_code = _get_delivery_country_code(order)
+    if country_code is None:
         return None
 
-    delivery_country = order.shipping_address.country
-
-    # Get active routing rules, ordered by priority
-    routing_rules = OrderRoutingRule.objects.filter(is_active=True).order_by("priority")
-
-    # Check each rule's conditions
-    for rule in routing_rules:
-        conditions = rule.conditions or {}
-
-        # Check country match
-        if "countries" in conditions:
-            if delivery_country.code not in conditions["countries"]:
-                continue
-
-        # Check inventory availability (if specified)
-        if "require_inventory" in conditions and conditions["require_inventory"]:
-            # Check if fulfillment center has inventory for order lines
-            # This would require checking warehouse stock
-            # For now, skip this check
-            pass
-
-        # Check seller preference (if specified)
-        if seller and "seller_ids" in conditions:
-            if str(seller.id) not in conditions["seller_ids"]:
-                continue
-
-        # Rule matches, return this fulfillment center
-        return rule.fulfillment_center
-
-    # If seller has primary fulfillment center, use that
-    if seller:
-        try:
-            logistics_config = seller.logistics_config
-            if logistics_config.primary_fulfillment_center:
-                return logistics_config.primary_fulfillment_center
-        except AttributeError:
-            pass
-
-    # Default: return first active fulfillment center
-    return FulfillmentCenter.objects.filter(is_active=True).first()
+    table = get_routing_table()
+    seller_id = seller.pk if seller else None
+    lines: list[OrderLine] = []
+    inventory = None
+    if table.needs_inventory(country_code):
+        lines = [
+            line
+            for line in order.lines.all()
+            if seller_id is None or line.seller_id == seller_id
+        ]
+        inventory = InventoryIndex.load(lines, table)
+    return table.route(country_code, seller_id, lines, inventory)
 
 
 def split_order_by_fulfillment_center(order: "Order") -> dict:
@@ -76,23 +338,13 @@ def split_order_by_fulfillment_center(order: "Order") -> dict:
     Returns:
         Dictionary mapping fulfillment center to list of order lines
     """
-    from collections import defaultdict
-
-    from ..models import FulfillmentCenter
+    lines = [line for line in order.lines.all() if line.seller_id]
+    center_by_seller = route_order_lines(order, lines)
 
     lines_by_center = defaultdict(list)
-
-    for line in order.lines.all():
-        # Get seller for this line
-        seller = getattr(line, "seller", None)
-        if not seller:
-            # No seller, skip routing
-            continue
-
-        # Route to fulfillment center
-        center = route_order_to_fulfillment_center(order, seller=seller)
+    for line in lines:
+        center = center_by_seller.get(line.seller_id)
         if center:
             lines_by_center[center].append(line)
 
     return dict(lines_by_center)
-
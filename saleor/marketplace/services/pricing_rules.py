@@ -0,0 +1,227 @@
+"""Evaluation of HoS pricing rules.
+
+Active pricing rules are compiled per product and per seller, keeping the
+country and validity window of every rule, so the discounted price of many
+variant listings is evaluated in memory. Resulting prices are materialized on
+variant channel listings by `update_discounted_prices_for_promotion`, together
+with the promotion discounts; listings are marked as dirty whenever a rule
+changes or one of its validity boundaries passes.
+"""
+
+import datetime
+from collections.abc import Iterable
+from dataclasses import dataclass
+from decimal import Decimal
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+from prices import Money
+
+from ...core.prices import quantize_price
+
+PRICING_RULES_LAST_CHECK_CACHE_KEY = "marketplace:pricing_rules:last_boundary_check"
+HUNDRED = Decimal(100)
+
+
+@dataclass(frozen=True)
+class CompiledPricingRule:
+    pricing_type: str
+    discount_percentage: Decimal | None
+    fixed_price: Decimal | None
+    country: str | None
+    valid_from: datetime.datetime | None
+    valid_until: datetime.datetime | None
+
+    @classmethod
+    def compile(cls, rule) -> "CompiledPricingRule":
+        return cls(
+            pricing_type=rule.pricing_type,
+            discount_percentage=rule.discount_percentage,
+            fixed_price=rule.fixed_price,
+            country=rule.country.code if rule.country else None,
+            valid_from=rule.valid_from,
+            valid_until=rule.valid_until,
+        )
+
+    def applies_to(self, country_code: str | None, now: datetime.datetime) -> bool:
+        if self.country and self.country != country_code:
+            return False
+        if self.valid_from and self.valid_from > now:
+            return False
+        return not (self.valid_until and self.valid_until <= now)
+
+    def get_price(self, price: Money, cost_price: Money | None) -> Money | None:
+        """Return the price set by the rule or None if the rule gives no price."""
+        from ..models import PricingType
+
+        currency = price.currency
+        if self.pricing_type == PricingType.RRP:
+            # The recommended retail price is a ceiling for the seller's price.
+            if self.fixed_price is None:
+                return None
+            return min(price, Money(self.fixed_price, currency))
+        if self.pricing_type == PricingType.COST_PLUS:
+            if cost_price is None:
+                return None
+            if self.fixed_price is not None:
+                return cost_price + Money(self.fixed_price, currency)
+            if self.discount_percentage is not None:
+                markup = cost_price.amount * self.discount_percentage / HUNDRED
+                return cost_price + Money(markup, currency)
+            return None
+        # Promotional and seasonal rules override or discount the price.
+        if self.fixed_price is not None:
+            return Money(self.fixed_price, currency)
+        if self.discount_percentage is not None:
+            discount = price.amount * self.discount_percentage / HUNDRED
+            return price - Money(discount, currency)
+        return None
+
+
+class PricingRuleSet:
+    """Pricing rules of a batch of products, compiled for in-memory evaluation.
+
+    Product rules take precedence over seller-wide rules; when several rules of
+    the same level apply, the lowest price wins.
+    """
+
+    def __init__(
+        self,
+        seller_ids_by_product: dict[int, UUID | None],
+        rules_by_product: dict[int, list[CompiledPricingRule]],
+        rules_by_seller: dict[UUID, list[CompiledPricingRule]],
+        now: datetime.datetime,
+    ):
+        self.seller_ids_by_product = seller_ids_by_product
+        self.rules_by_product = rules_by_product
+        self.rules_by_seller = rules_by_seller
+        self.now = now
+
+    @classmethod
+    def load(
+        cls,
+        products,
+        now: datetime.datetime | None = None,
+        database_connection_name: str = settings.DATABASE_CONNECTION_REPLICA_NAME,
+    ) -> "PricingRuleSet":
+        from ..models import PricingRule
+
+        now = now or timezone.now()
+        seller_ids_by_product = dict(products.values_list("id", "seller_id"))
+        seller_ids = {
+            seller_id for seller_id in seller_ids_by_product.values() if seller_id
+        }
+        rules = (
+            PricingRule.objects.using(database_connection_name)
+            .filter(is_active=True)
+            .filter(
+                Q(product_id__in=seller_ids_by_product.keys())
+                | Q(product__isnull=True, seller_id__in=seller_ids)
+            )
+            .filter(Q(valid_until__isnull=True) | Q(valid_until__gt=now))
+        )
+        rules_by_product: dict[int, list[CompiledPricingRule]] = {}
+        rules_by_seller: dict[UUID, list[CompiledPricingRule]] = {}
+        for rule in rules:
+            compiled = CompiledPricingRule.compile(rule)
+            if rule.product_id:
+                rules_by_product.setdefault(rule.product_id, []).append(compiled)
+            else:
+                rules_by_seller.setdefault(rule.seller_id, []).append(compiled)
+        return cls(seller_ids_by_product, rules_by_product, rules_by_seller, now)
+
+    def __bool__(self):
+        return bool(self.rules_by_product or self.rules_by_seller)
+
+    def get_rules(
+        self, product_id: int, country_code: str | None
+    ) -> list[CompiledPricingRule]:
+        product_rules = [
+            rule
+            for rule in self.rules_by_product.get(product_id, [])
+            if rule.applies_to(country_code, self.now)
+        ]
+        if product_rules:
+            return product_rules
+        seller_id = self.seller_ids_by_product.get(product_id)
+        return [
+            rule
+            for rule in self.rules_by_seller.get(seller_id, [])  # type: ignore[arg-type]
+            if rule.applies_to(country_code, self.now)
+        ]
+
+    def get_price(
+        self,
+        product_id: int,
+        country_code: str | None,
+        price: Money,
+        cost_price: Money | None = None,
+    ) -> Money | None:
+        """Return the price set by pricing rules or None if no rule applies."""
+        prices = [
+            rule_price
+            for rule in self.get_rules(product_id, country_code)
+            if (rule_price := rule.get_price(price, cost_price)) is not None
+        ]
+        if not prices:
+            return None
+        lowest = min(prices)
+        return quantize_price(max(lowest, Money(0, lowest.currency)), price.currency)
+
+
+def get_pricing_rule_product_filter(
+    product_ids: Iterable[int], seller_ids: Iterable[UUID]
+) -> Q:
+    """Return a product listing filter matching products affected by rules."""
+    return Q(product_id__in=list(product_ids)) | Q(
+        product__seller_id__in=list(seller_ids)
+    )
+
+
+def mark_pricing_rule_products_dirty(rules: Iterable) -> int:
+    """Mark listings of products affected by the given rules for recalculation."""
+    from ...product.models import ProductChannelListing
+
+    product_ids, seller_ids = set(), set()
+    for rule in rules:
+        if rule.product_id:
+            product_ids.add(rule.product_id)
+        elif rule.seller_id:
+            seller_ids.add(rule.seller_id)
+    if not product_ids and not seller_ids:
+        return 0
+    return ProductChannelListing.objects.filter(
+        get_pricing_rule_product_filter(product_ids, seller_ids),
+        discounted_price_dirty=False,
+    ).update(discounted_price_dirty=True)
+
+
+def mark_products_with_passed_rule_boundaries_dirty(
+    now: datetime.datetime | None = None,
+) -> int:
+    """Mark products whose pricing rules started or ended since the last check.
+
+    Returns the number of marked product listings.
+    """
+    from ..models import PricingRule
+
+    now = now or timezone.now()
+    last_check = cache.get(PRICING_RULES_LAST_CHECK_CACHE_KEY)
+    if last_check is None:
+        # Look back twice the check period, so a lost key doesn't skip boundaries.
+        last_check = now - 2 * settings.PRICING_RULE_BOUNDARY_CHECK_PERIOD
+    rules = (
+        PricingRule.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(is_active=True)
+        .filter(
+            Q(valid_from__gt=last_check, valid_from__lte=now)
+            | Q(valid_until__gt=last_check, valid_until__lte=now)
+        )
+        .only("product_id", "seller_id")
+    )
+    marked = mark_pricing_rule_products_dirty(rules)
+    cache.set(PRICING_RULES_LAST_CHECK_CACHE_KEY, now, timeout=None)
+    return marked
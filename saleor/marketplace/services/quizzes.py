@@ -0,0 +1,393 @@
+"""Scoring and leaderboards of fandom quizzes.
+
+Each quiz's answer key is compiled once from its `questions` and kept in the
+cache until the quiz changes. Submissions are scored in batches: a batch is
+upserted with one query, `QuizStats` totals of all affected quizzes are updated
+atomically, and loyalty points are posted once per quiz. Leaderboards are read
+from the `(quiz, -score, completed_at)` index and cached briefly.
+
+`Quiz.questions` holds a list of questions, optionally under a "questions" key:
+
+    [
+        {"id": "q1", "correct_answer": "b"},
+        {"id": "q2", "correct_answers": ["a", "c"]},
+    ]
+
+Submitted answers map question IDs to the chosen answer or list of answers; an
+answer is correct when it matches the whole set of correct answers. Questions
+without an ID are identified by their position.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import BigIntegerField, Case, Count, F, Q, Sum, Value, When
+from django.utils import timezone
+
+PASSING_SCORE = 50
+QUIZ_ANSWER_KEY_CACHE_KEY = "marketplace:quiz_answer_key:{quiz_id}"
+QUIZ_ANSWER_KEY_CACHE_TIMEOUT = 60 * 60 * 24  # 1 day
+QUIZ_LEADERBOARD_CACHE_KEY = "marketplace:quiz_leaderboard:{quiz_id}:{limit}"
+QUIZ_LEADERBOARD_CACHE_TIMEOUT = 30
+QUIZ_REBUILD_BATCH_SIZE = 1000
+
+
+def _normalize_answer(value) -> frozenset[str]:
+    values = value if isinstance(value, list | tuple | set) else [value]
+    return frozenset(
+        str(value).strip().lower()
+        for value in values
+        if value is not None and str(value).strip()
+    )
+
+
+@dataclass(frozen=True)
+class QuizAnswerKey:
+    quiz_id: UUID
+    title: str
+    points_reward: int
+    answers: dict[str, frozenset[str]] = field(default_factory=dict)
+
+    @classmethod
+    def compile(cls, quiz) -> "QuizAnswerKey":
+        questions = quiz.questions
+        if isinstance(questions, dict):
+            questions = questions.get("questions", [])
+        if not isinstance(questions, list):
+            questions = []
+        answers = {}
+        for position, question in enumerate(questions):
+            if not isinstance(question, dict):
+                continue
+            correct = _normalize_answer(
+                question.get("correct_answers", question.get("correct_answer"))
+            )
+            if correct:
+                answers[str(question.get("id", position))] = correct
+        return cls(quiz.pk, quiz.title, quiz.points_reward, answers)
+
+    def score(self, answers: Any) -> int:
+        """Return the percentage of correctly answered questions."""
+        if not self.answers or not isinstance(answers, dict) or not answers:
+            return 0
+        correct = sum(
+            1
+            for question_id, key in self.answers.items()
+            if question_id in answers and _normalize_answer(answers[question_id]) == key
+        )
+        return round(100 * correct / len(self.answers))
+
+
+@dataclass(frozen=True)
+class QuizAttempt:
+    user_id: int
+    quiz_id: UUID
+    answers: dict
+
+
+def _get_answer_key_cache_key(quiz_id: UUID) -> str:
+    return QUIZ_ANSWER_KEY_CACHE_KEY.format(quiz_id=quiz_id)
+
+
+def get_quiz_answer_keys(quiz_ids: Iterable[UUID]) -> dict[UUID, QuizAnswerKey]:
+    """Return compiled answer keys of the quizzes, compiling the missing ones."""
+    from ..models_fandom import Quiz
+
+    cache_keys = {_get_answer_key_cache_key(quiz_id): quiz_id for quiz_id in quiz_ids}
+    answer_keys = {
+        cache_keys[key]: answer_key
+        for key, answer_key in cache.get_many(cache_keys.keys()).items()
+    }
+    missing = [quiz_id for quiz_id in cache_keys.values() if quiz_id not in answer_keys]
+    if missing:
+        compiled = {
+            quiz.pk: QuizAnswerKey.compile(quiz)
+            for quiz in Quiz.objects.filter(pk__in=missing).only(
+                "title", "points_reward", "questions"
+            )
+        }
+        cache.set_many(
+            {
+                _get_answer_key_cache_key(quiz_id): answer_key
+                for quiz_id, answer_key in compiled.items()
+            },
+            timeout=QUIZ_ANSWER_KEY_CACHE_TIMEOUT,
+        )
+        answer_keys.update(compiled)
+    return answer_keys
+
+
+def invalidate_quiz_answer_key(quiz_id: UUID):
+    cache.delete(_get_answer_key_cache_key(quiz_id))
+
+
+def _update_quiz_stats(deltas: Mapping[UUID, Sequence[int]]):
+    """Add submission, pass and score deltas to quiz totals.
+
+    Rows are locked in primary key order first, so concurrent batches don't
+    deadlock.
+    """
+    from ..models_fandom import QuizStats
+
+    deltas = {quiz_id: delta for quiz_id, delta in deltas.items() if any(delta)}
+    if not deltas:
+        return
+    QuizStats.objects.bulk_create(
+        [QuizStats(quiz_id=quiz_id) for quiz_id in deltas], ignore_conflicts=True
+    )
+    list(
+        QuizStats.objects.select_for_update()
+        .filter(pk__in=deltas.keys())
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+
+    def increment(position):
+        return Case(
+            *[
+                When(pk=quiz_id, then=Value(delta[position]))
+                for quiz_id, delta in deltas.items()
+            ],
+            output_field=BigIntegerField(),
+        )
+
+    QuizStats.objects.filter(pk__in=deltas.keys()).update(
+        submission_count=F("submission_count") + increment(0),
+        passed_count=F("passed_count") + increment(1),
+        score_sum=F("score_sum") + increment(2),
+        updated_at=timezone.now(),
+    )
+
+
+def score_quiz_submissions(attempts: Iterable[QuizAttempt]) -> list:
+    """Score quiz attempts and store them as the users' submissions.
+
+    A user keeps one submission per quiz; a later attempt replaces the earlier
+    one. Loyalty points are awarded the first time a user passes a quiz.
+    Attempts of unknown quizzes are skipped. Returns the stored submissions.
+    """
+    from ..models_fandom import QuizSubmission
+    from ..models_loyalty import LoyaltyPointsTransaction
+    from .loyalty_ledger import post_points
+
+    # The last attempt of a user wins within the batch.
+    attempts_by_key = {
+        (attempt.user_id, attempt.quiz_id): attempt for attempt in attempts
+    }
+    answer_keys = get_quiz_answer_keys({quiz_id for _, quiz_id in attempts_by_key})
+    attempts_by_key = {
+        key: attempt
+        for key, attempt in attempts_by_key.items()
+        if attempt.quiz_id in answer_keys
+    }
+    if not attempts_by_key:
+        return []
+
+    with transaction.atomic():
+        # Insert empty submissions first, so there's a row to lock even for first
+        # submissions; a concurrent first submission of the same quiz waits for
+        # the insert and then reads the submission stored here.
+        QuizSubmission.objects.bulk_create(
+            [
+                QuizSubmission(user_id=user_id, quiz_id=quiz_id)
+                for user_id, quiz_id in attempts_by_key
+            ],
+            ignore_conflicts=True,
+        )
+        previous = {
+            (user_id, quiz_id): (score, points_awarded)
+            for user_id, quiz_id, score, points_awarded in (
+                QuizSubmission.objects.select_for_update()
+                .filter(
+                    user_id__in={user_id for user_id, _ in attempts_by_key},
+                    quiz_id__in={quiz_id for _, quiz_id in attempts_by_key},
+                )
+                .order_by("pk")
+                .values_list("user_id", "quiz_id", "score", "points_awarded")
+            )
+        }
+        submissions = []
+        stats: dict[UUID, list[int]] = {}
+        awarded_user_ids: dict[UUID, list[int]] = {}
+        for key, attempt in attempts_by_key.items():
+            answer_key = answer_keys[attempt.quiz_id]
+            score = answer_key.score(attempt.answers)
+            passed = score >= PASSING_SCORE
+            previous_score, points_awarded = previous.get(key, (None, 0))
+            if passed and answer_key.points_reward > 0 and not points_awarded:
+                points_awarded = answer_key.points_reward
+                awarded_user_ids.setdefault(attempt.quiz_id, []).append(attempt.user_id)
+            delta = stats.setdefault(attempt.quiz_id, [0, 0, 0])
+            if previous_score is None:
+                delta[0] += 1
+                delta[1] += passed
+                delta[2] += score
+            else:
+                delta[1] += passed - (previous_score >= PASSING_SCORE)
+                delta[2] += score - previous_score
+            submissions.append(
+                QuizSubmission(
+                    user_id=attempt.user_id,
+                    quiz_id=attempt.quiz_id,
+                    answers=attempt.answers,
+                    score=score,
+                    points_awarded=points_awarded,
+                )
+            )
+
+        QuizSubmission.objects.bulk_create(
+            submissions,
+            update_conflicts=True,
+            unique_fields=["user", "quiz"],
+            update_fields=["answers", "score", "points_awarded", "completed_at"],
+        )
+        # The upsert keeps primary keys generated for the new instances, so the
+        # stored rows are selected again.
+        stored = {
+            (submission.user_id, submission.quiz_id): submission
+            for submission in QuizSubmission.objects.filter(
+                user_id__in={user_id for user_id, _ in attempts_by_key},
+                quiz_id__in={quiz_id for _, quiz_id in attempts_by_key},
+            )
+        }
+        submissions = [stored[key] for key in attempts_by_key]
+        _update_quiz_stats(stats)
+        for quiz_id, user_ids in awarded_user_ids.items():
+            answer_key = answer_keys[quiz_id]
+            post_points(
+                dict.fromkeys(user_ids, answer_key.points_reward),
+                LoyaltyPointsTransaction.TransactionType.EARNED,
+                description=f"Points for completing quiz: {answer_key.title}",
+            )
+    return submissions
+
+
+def get_quiz_leaderboard(
+    quiz_id: UUID,
+    limit: int = 10,
+    database_connection_name: str = settings.DATABASE_CONNECTION_REPLICA_NAME,
+) -> list[tuple[int, int]]:
+    """Return (user ID, score) pairs of the best submissions of the quiz.
+
+    Ties are ranked by who completed the quiz first.
+    """
+    from ..models_fandom import QuizSubmission
+
+    key = QUIZ_LEADERBOARD_CACHE_KEY.format(quiz_id=quiz_id, limit=limit)
+    leaderboard = cache.get(key)
+    if leaderboard is None:
+        leaderboard = list(
+            QuizSubmission.objects.using(database_connection_name)
+            .filter(quiz_id=quiz_id, score__isnull=False)
+            .order_by("-score", "completed_at")
+            .values_list("user_id", "score")[:limit]
+        )
+        cache.set(key, leaderboard, timeout=QUIZ_LEADERBOARD_CACHE_TIMEOUT)
+    return leaderboard
+
+
+def get_character_quiz_stats(
+    character_ids: Iterable[UUID],
+    database_connection_name: str = settings.DATABASE_CONNECTION_REPLICA_NAME,
+) -> dict[UUID, dict[str, int]]:
+    """Return quiz totals summed over the quizzes of each character."""
+    from ..models_fandom import QuizStats
+
+    rows = (
+        QuizStats.objects.using(database_connection_name)
+        .filter(quiz__character_id__in=list(character_ids))
+        .values("quiz__character_id")
+        .annotate(
+            submissions=Sum("submission_count"),
+            passed=Sum("passed_count"),
+            score_sum=Sum("score_sum"),
+        )
+        .order_by()
+    )
+    return {
+        row["quiz__character_id"]: {
+            "submission_count": row["submissions"],
+            "passed_count": row["passed"],
+            "score_sum": row["score_sum"],
+        }
+        for row in rows
+    }
+
+
+def rescore_quiz_submissions(
+    quiz_id: UUID, batch_size: int = QUIZ_REBUILD_BATCH_SIZE
+) -> int:
+    """Score stored submissions of the quiz again with its current answer key.
+
+    Loyalty points are not awarded again. Returns the number of changed scores.
+    """
+    from ..models_fandom import QuizSubmission
+
+    invalidate_quiz_answer_key(quiz_id)
+    answer_key = get_quiz_answer_keys([quiz_id]).get(quiz_id)
+    if answer_key is None:
+        return 0
+    changed = 0
+    last_pk = None
+    while True:
+        submissions = QuizSubmission.objects.filter(quiz_id=quiz_id).order_by("pk")
+        if last_pk is not None:
+            submissions = submissions.filter(pk__gt=last_pk)
+        batch = list(submissions.only("pk", "answers", "score")[:batch_size])
+        if not batch:
+            return changed
+        last_pk = batch[-1].pk
+        to_update = []
+        for submission in batch:
+            score = answer_key.score(submission.answers)
+            if score != submission.score:
+                submission.score = score
+                to_update.append(submission)
+        QuizSubmission.objects.bulk_update(to_update, ["score"])
+        changed += len(to_update)
+
+
+def rebuild_quiz_stats(quiz_ids: Iterable[UUID] | None = None) -> int:
+    """Recompute quiz totals from stored submissions.
+
+    Returns the number of quizzes with submissions.
+    """
+    from ..models_fandom import Quiz, QuizStats, QuizSubmission
+
+    submissions = QuizSubmission.objects.all()
+    quizzes = Quiz.objects.all()
+    if quiz_ids is not None:
+        quiz_ids = list(quiz_ids)
+        submissions = submissions.filter(quiz_id__in=quiz_ids)
+        quizzes = quizzes.filter(pk__in=quiz_ids)
+    rows = (
+        submissions.values("quiz_id")
+        .annotate(
+            submission_count=Count("pk"),
+            passed_count=Count("pk", filter=Q(score__gte=PASSING_SCORE)),
+            score_sum=Sum("score", default=0),
+        )
+        .order_by()
+    )
+    stats = [QuizStats(quiz_id=row.pop("quiz_id"), **row) for row in rows]
+    with transaction.atomic():
+        QuizStats.objects.filter(quiz__in=quizzes).exclude(
+            pk__in=[quiz_stats.pk for quiz_stats in stats]
+        ).delete()
+        QuizStats.objects.bulk_create(
+            stats,
+            update_conflicts=True,
+            unique_fields=["quiz"],
+            update_fields=[
+                "submission_count",
+                "passed_count",
+                "score_sum",
+                "updated_at",
+            ],
+        )
+    return len(stats)
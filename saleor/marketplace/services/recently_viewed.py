@@ -0,0 +1,187 @@
+"""Recently viewed products of customers.
+
+Product views are appended to a Redis list and flushed to the
+`RecentlyViewedProduct` table in batches, so browsing never writes to the
+customer's row. Each flush upserts the latest view per customer and product and
+trims every affected customer's list to the limit from their preferences with
+one query per distinct limit.
+"""
+
+import datetime
+import json
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+from redis import RedisError
+
+from ...webhook.observability.buffers import RedisBuffer
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_VIEW_BUFFER_KEY = "marketplace_product_views"
+RECENTLY_VIEWED_LIMIT_PREFERENCE = "recently_viewed_products_limit"
+DEFAULT_RECENTLY_VIEWED_LIMIT = 10
+# Upper bound of batches drained by a single flush, so one run can't starve
+# the worker when views keep coming in.
+MAX_FLUSH_BATCHES = 50
+
+
+@dataclass(frozen=True)
+class ProductView:
+    user_id: int
+    product_id: int
+    viewed_at: datetime.datetime
+    # Number of products kept for the customer; non-positive values mean no limit.
+    limit: int = DEFAULT_RECENTLY_VIEWED_LIMIT
+
+    def encode(self) -> bytes:
+        return json.dumps(
+            [self.user_id, self.product_id, self.viewed_at.isoformat(), self.limit]
+        ).encode()
+
+    @classmethod
+    def decode(cls, value: bytes) -> "ProductView":
+        user_id, product_id, viewed_at, limit = json.loads(value)
+        return cls(
+            user_id, product_id, datetime.datetime.fromisoformat(viewed_at), limit
+        )
+
+
+def get_recently_viewed_limit(user) -> int:
+    preferences = user.get_value_from_metadata("preferences", {})
+    if not isinstance(preferences, dict):
+        return DEFAULT_RECENTLY_VIEWED_LIMIT
+    try:
+        return int(
+            preferences.get(
+                RECENTLY_VIEWED_LIMIT_PREFERENCE, DEFAULT_RECENTLY_VIEWED_LIMIT
+            )
+        )
+    except (TypeError, ValueError):
+        return DEFAULT_RECENTLY_VIEWED_LIMIT
+
+
+def get_product_view_buffer() -> RedisBuffer | None:
+    if not settings.PRODUCT_VIEW_BUFFER_BROKER_URL:
+        return None
+    return RedisBuffer(
+        settings.PRODUCT_VIEW_BUFFER_BROKER_URL,
+        PRODUCT_VIEW_BUFFER_KEY,
+        max_size=settings.PRODUCT_VIEW_BUFFER_SIZE_LIMIT,
+        batch_size=settings.PRODUCT_VIEW_FLUSH_BATCH_SIZE,
+        timeout=int(settings.PRODUCT_VIEW_BUFFER_TIMEOUT.total_seconds()),
+    )
+
+
+def record_product_view(user, product_id: int):
+    """Add a product to the customer's recently viewed products."""
+    view = ProductView(
+        user_id=user.pk,
+        product_id=product_id,
+        viewed_at=timezone.now(),
+        limit=get_recently_viewed_limit(user),
+    )
+    buffer = get_product_view_buffer()
+    if buffer is not None:
+        try:
+            buffer.put_event(view.encode())
+            return
+        except RedisError:
+            logger.warning("Product view buffer unavailable, storing view directly.")
+    store_product_views([view])
+
+
+def store_product_views(views: Iterable[ProductView]) -> int:
+    """Upsert product views and trim recently viewed lists of their customers.
+
+    Returns the number of upserted (customer, product) pairs.
+    """
+    from ...product.models import Product
+    from ..models import RecentlyViewedProduct
+
+    latest: dict[tuple[int, int], ProductView] = {}
+    for view in views:
+        key = (view.user_id, view.product_id)
+        if key not in latest or latest[key].viewed_at < view.viewed_at:
+            latest[key] = view
+    if not latest:
+        return 0
+
+    # Views of deleted products are dropped instead of failing the whole batch.
+    product_ids = set(
+        Product.objects.filter(
+            pk__in={product_id for _, product_id in latest}
+        ).values_list("pk", flat=True)
+    )
+    rows = [
+        RecentlyViewedProduct(
+            user_id=view.user_id, product_id=view.product_id, viewed_at=view.viewed_at
+        )
+        for view in latest.values()
+        if view.product_id in product_ids
+    ]
+    RecentlyViewedProduct.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["user", "product"],
+        update_fields=["viewed_at"],
+    )
+
+    user_ids_by_limit: dict[int, set[int]] = {}
+    for view in latest.values():
+        if view.limit > 0:
+            user_ids_by_limit.setdefault(view.limit, set()).add(view.user_id)
+    for limit, user_ids in user_ids_by_limit.items():
+        trim_recently_viewed_products(user_ids, limit)
+    return len(rows)
+
+
+def trim_recently_viewed_products(user_ids: Iterable[int], limit: int):
+    """Delete all but the `limit` latest products viewed by the given customers."""
+    from ..models import RecentlyViewedProduct
+
+    overflow = (
+        RecentlyViewedProduct.objects.filter(user_id__in=user_ids)
+        .annotate(
+            position=Window(
+                RowNumber(),
+                partition_by=F("user_id"),
+                order_by=F("viewed_at").desc(),
+            )
+        )
+        .filter(position__gt=limit)
+        .values_list("pk", flat=True)
+    )
+    pks = list(overflow)
+    if pks:
+        RecentlyViewedProduct.objects.filter(pk__in=pks).delete()
+
+
+def flush_product_views(buffer: RedisBuffer | None = None) -> tuple[int, int]:
+    """Move buffered product views to the database.
+
+    Returns the number of stored views and of views left in the buffer.
+    """
+    if buffer is None:
+        buffer = get_product_view_buffer()
+    if buffer is None:
+        return 0, 0
+
+    stored, remaining = 0, 0
+    for _ in range(MAX_FLUSH_BATCHES):
+        events, remaining = buffer.pop_events_get_size()
+        views = []
+        for event in events:
+            try:
+                views.append(ProductView.decode(event))
+            except (TypeError, ValueError):
+                logger.warning("Skipping malformed product view event.")
+        stored += store_product_views(views)
+        if not remaining:
+            break
+    return stored, remaining
@@ -0,0 +1,132 @@
+"""Projection of orders onto sellers.
+
+Every order gets one `SellerOrder` row per seller with lines in it, holding the
+seller's subtotal and the order status. Rows are written when a checkout is
+completed, from lines that already carry the denormalized seller, and refreshed
+when lines are added or removed later, so seller order listings read a single
+indexed table instead of joining order lines with DISTINCT. Paths that write
+lines or statuses in bulk, bypassing model signals, refresh the projections
+explicitly.
+"""
+
+from collections.abc import Iterable
+from decimal import Decimal
+from uuid import UUID
+
+from django.db.models import Sum
+
+SELLER_ORDER_UPDATE_FIELDS = [
+    "created_at",
+    "status",
+    "currency",
+    "subtotal_net_amount",
+    "subtotal_gross_amount",
+    "quantity",
+    "updated_at",
+]
+
+
+def create_seller_orders(order, lines: Iterable) -> list:
+    """Store projections of a new order from its in-memory lines."""
+    from ..models import SellerOrder
+
+    seller_orders: dict[UUID, SellerOrder] = {}
+    for line in lines:
+        if not line.seller_id:
+            continue
+        seller_order = seller_orders.setdefault(
+            line.seller_id,
+            SellerOrder(
+                seller_id=line.seller_id,
+                order_id=order.pk,
+                created_at=order.created_at,
+                status=order.status,
+                currency=order.currency,
+            ),
+        )
+        seller_order.subtotal_net_amount += line.total_price_net_amount or 0
+        seller_order.subtotal_gross_amount += line.total_price_gross_amount or 0
+        seller_order.quantity += line.quantity
+    if not seller_orders:
+        return []
+    return SellerOrder.objects.bulk_create(
+        seller_orders.values(),
+        update_conflicts=True,
+        unique_fields=["seller", "order"],
+        update_fields=SELLER_ORDER_UPDATE_FIELDS,
+    )
+
+
+def refresh_seller_orders(order_ids: Iterable[UUID]) -> int:
+    """Recompute projections of the orders from their stored lines.
+
+    Returns the number of stored projections.
+    """
+    from ...order.models import Order, OrderLine
+    from ..models import SellerOrder
+
+    order_ids = list(order_ids)
+    if not order_ids:
+        return 0
+    orders = {
+        order_id: (created_at, status, currency)
+        for order_id, created_at, status, currency in Order.objects.filter(
+            pk__in=order_ids
+        ).values_list("pk", "created_at", "status", "currency")
+    }
+    rows = (
+        OrderLine.objects.filter(order_id__in=orders.keys(), seller__isnull=False)
+        .values("order_id", "seller_id")
+        .annotate(
+            net=Sum("total_price_net_amount"),
+            gross=Sum("total_price_gross_amount"),
+            items=Sum("quantity"),
+        )
+        .order_by()
+    )
+    seller_orders = []
+    for row in rows:
+        created_at, status, currency = orders[row["order_id"]]
+        seller_orders.append(
+            SellerOrder(
+                seller_id=row["seller_id"],
+                order_id=row["order_id"],
+                created_at=created_at,
+                status=status,
+                currency=currency,
+                subtotal_net_amount=row["net"] or Decimal(0),
+                subtotal_gross_amount=row["gross"] or Decimal(0),
+                quantity=row["items"] or 0,
+            )
+        )
+    current = {
+        (seller_order.order_id, seller_order.seller_id)
+        for seller_order in seller_orders
+    }
+    stale_pks = [
+        pk
+        for pk, order_id, seller_id in SellerOrder.objects.filter(
+            order_id__in=order_ids
+        ).values_list("pk", "order_id", "seller_id")
+        if (order_id, seller_id) not in current
+    ]
+    if stale_pks:
+        SellerOrder.objects.filter(pk__in=stale_pks).delete()
+    SellerOrder.objects.bulk_create(
+        seller_orders,
+        update_conflicts=True,
+        unique_fields=["seller", "order"],
+        update_fields=SELLER_ORDER_UPDATE_FIELDS,
+    )
+    return len(seller_orders)
+
+
+def update_seller_orders_status(order_ids: Iterable[UUID], status: str) -> int:
+    """Copy a changed status of the orders to their projections."""
+    from ..models import SellerOrder
+
+    return (
+        SellerOrder.objects.filter(order_id__in=list(order_ids))
+        .exclude(status=status)
+        .update(status=status)
+    )
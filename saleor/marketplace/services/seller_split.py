@@ -0,0 +1,261 @@
+"""Lines of a checkout or an order split by seller.
+
+`SellerSplit` walks the lines once, grouping them by seller and summing each
+seller's subtotal, weight and quantity on the way. Shipping and discount
+allocations are computed from those sums and distributed exactly: shares are
+rounded to the currency precision and the remaining cents go to the sellers
+with the largest rounding remainders, so allocations always add up to the
+allocated amount.
+
+A split is memoized on `CheckoutInfo.seller_split` and, for orders, on the order
+instance by `get_order_seller_split`, keyed by the split lines, so tax, voucher,
+shipping and settlement code share one computation.
+"""
+
+from collections.abc import Callable, Iterable
+from decimal import ROUND_DOWN, Decimal
+from typing import TYPE_CHECKING, Any, Optional
+from uuid import UUID
+
+from babel.numbers import get_currency_precision
+
+if TYPE_CHECKING:
+    from ...checkout.fetch import CheckoutInfo
+    from ...order.models import Order
+    from ..models import Seller
+
+DEFAULT_PRECISION = 2
+
+
+def get_line_seller(line: Any) -> Optional["Seller"]:
+    """Return the seller of an order or checkout line, preferring the product's."""
+    seller = getattr(line, "seller", None)
+    if getattr(line, "product", None):
+        seller = getattr(line.product, "seller", seller)
+    return seller
+
+
+def get_line_amount(line: Any) -> Decimal:
+    """Return the gross total of an order or checkout line."""
+    if hasattr(line, "total_price"):
+        return line.total_price.gross.amount
+    return line.get_total().gross.amount
+
+
+def get_line_weight(line: Any) -> Decimal:
+    """Return the total weight of a line in kilograms."""
+    variant = getattr(line, "variant", None)
+    if not variant or not variant.weight:
+        return Decimal(0)
+    return Decimal(str(variant.weight.kg)) * line.quantity
+
+
+def distribute(
+    amount: Decimal, weights: dict, precision: int = DEFAULT_PRECISION
+) -> dict:
+    """Split the amount proportionally to weights without losing a cent.
+
+    Every share is rounded down to the precision and the remaining units go one
+    by one to the keys with the largest remainders; ties keep the keys' order.
+    With no positive weights the amount is split equally.
+    """
+    if not weights:
+        return {}
+    if amount < 0:
+        return {
+            key: -share
+            for key, share in distribute(-amount, weights, precision).items()
+        }
+    unit = Decimal(10) ** -precision
+    total_units = int((amount / unit).to_integral_value(rounding=ROUND_DOWN))
+    weights = {key: max(weight, Decimal(0)) for key, weight in weights.items()}
+    total_weight = sum(weights.values(), Decimal(0))
+    if total_weight == 0:
+        weights = dict.fromkeys(weights, Decimal(1))
+        total_weight = Decimal(len(weights))
+
+    shares = {}
+    remainders = []
+    for index, (key, weight) in enumerate(weights.items()):
+        share, remainder = divmod(total_units * weight, total_weight)
+        shares[key] = int(share)
+        remainders.append((-remainder, index, key))
+    leftover = total_units - sum(shares.values())
+    for _, _, key in sorted(remainders)[:leftover]:
+        shares[key] += 1
+    # Anything below the precision, e.g. 10.005 split to cents, stays with the
+    # first key so the shares still add up to the amount.
+    rest = amount - total_units * unit
+    first_key = next(iter(shares))
+    return {
+        key: units * unit + (rest if key == first_key else 0)
+        for key, units in shares.items()
+    }
+
+
+class SellerSplit:
+    """Lines split by seller with per-seller subtotals, weights and quantities."""
+
+    def __init__(
+        self,
+        lines: Iterable[Any],
+        get_seller: Callable[[Any], Optional["Seller"]] = get_line_seller,
+        get_amount: Callable[[Any], Decimal] = get_line_amount,
+        get_weight: Callable[[Any], Decimal] = get_line_weight,
+        currency: str | None = None,
+    ):
+        self.precision = (
+            get_currency_precision(currency) if currency else DEFAULT_PRECISION
+        )
+        self.lines_by_seller: dict[Seller | None, list] = {}
+        self.subtotals: dict[Seller | None, Decimal] = {}
+        self.weights: dict[Seller | None, Decimal] = {}
+        self.quantities: dict[Seller | None, int] = {}
+        for line in lines:
+            seller = get_seller(line)
+            if seller not in self.lines_by_seller:
+                self.lines_by_seller[seller] = []
+                self.subtotals[seller] = Decimal(0)
+                self.weights[seller] = Decimal(0)
+                self.quantities[seller] = 0
+            self.lines_by_seller[seller].append(line)
+            self.subtotals[seller] += get_amount(line)
+            self.weights[seller] += get_weight(line)
+            self.quantities[seller] += line.quantity
+        self._allocations: dict[tuple[str, str, Decimal], dict] = {}
+
+    @classmethod
+    def for_checkout_info(cls, checkout_info: "CheckoutInfo") -> "SellerSplit":
+        """Split checkout lines by the sellers of their products.
+
+        Sellers come from the checkout's seller tax context, so they are fetched
+        with one query shared with the tax calculations.
+        """
+        tax_context = checkout_info.seller_tax_context
+        return cls(
+            checkout_info.lines,
+            get_seller=lambda line_info: tax_context.get_seller(
+                line_info.product.seller_id
+            ),
+            get_amount=lambda line_info: (
+                line_info.variant_discounted_price.amount * line_info.line.quantity
+            ),
+            currency=checkout_info.checkout.currency,
+        )
+
+    @classmethod
+    def from_lines_by_seller(cls, lines_by_seller: dict, **kwargs) -> "SellerSplit":
+        """Build a split of lines that are already grouped by seller."""
+        seller_by_line = {
+            id(line): seller
+            for seller, lines in lines_by_seller.items()
+            for line in lines
+        }
+        return cls(
+            (line for lines in lines_by_seller.values() for line in lines),
+            get_seller=lambda line: seller_by_line[id(line)],
+            **kwargs,
+        )
+
+    @property
+    def sellers(self) -> list["Seller"]:
+        return [seller for seller in self.lines_by_seller if seller]
+
+    @property
+    def seller_ids(self) -> set[UUID]:
+        return {seller.pk for seller in self.sellers}
+
+    def get_subtotal(self, seller: Optional["Seller"]) -> Decimal:
+        return self.subtotals.get(seller, Decimal(0))
+
+    def allocate(self, amount: Decimal, allocation_method: str = "proportional"):
+        """Allocate an amount across sellers, memoized per method and amount.
+
+        Methods:
+            - "proportional": by subtotal
+            - "weight": by total weight
+            - "equal": the same share for every seller
+
+        """
+        key = ("amount", allocation_method, amount)
+        if key not in self._allocations:
+            if allocation_method == "proportional":
+                weights = self.subtotals
+            elif allocation_method == "weight":
+                weights = self.weights
+            elif allocation_method == "equal":
+                weights = dict.fromkeys(self.lines_by_seller, Decimal(1))
+            else:
+                raise ValueError(f"Unknown allocation method: {allocation_method}")
+            self._allocations[key] = distribute(amount, weights, self.precision)
+        return self._allocations[key]
+
+    def allocate_discount(
+        self, total_discount: Decimal, allocation_method: str = "proportional"
+    ) -> dict:
+        if allocation_method not in ("proportional", "equal"):
+            raise ValueError(f"Unknown allocation method: {allocation_method}")
+        return self.allocate(total_discount, allocation_method)
+
+    def allocate_shipping(
+        self, total_shipping_cost: Decimal, allocation_method: str = "proportional"
+    ) -> dict:
+        """Allocate shipping cost with B2B sellers' bulk shipping discounts applied.
+
+        B2B wholesale sellers may configure `b2b_discount_factor` in their
+        logistics custom shipping methods, e.g. 0.9 for a 10% discount of their
+        share.
+        """
+        key = ("shipping", allocation_method, total_shipping_cost)
+        if key not in self._allocations:
+            shares = self.allocate(total_shipping_cost, allocation_method)
+            unit = Decimal(10) ** -self.precision
+            allocation = {}
+            for seller, share in shares.items():
+                factor = get_shipping_discount_factor(seller)
+                allocation[seller] = (
+                    share if factor == 1 else (share * factor).quantize(unit)
+                )
+            self._allocations[key] = allocation
+        return self._allocations[key]
+
+
+def get_shipping_discount_factor(seller: Optional["Seller"]) -> Decimal:
+    if not seller or seller.seller_type != "b2b_wholesale":
+        return Decimal(1)
+    try:
+        custom_methods = seller.logistics_config.custom_shipping_methods or {}
+    except AttributeError:
+        return Decimal(1)
+    if not isinstance(custom_methods, dict):
+        return Decimal(1)
+    return Decimal(str(custom_methods.get("b2b_discount_factor", 1)))
+
+
+def get_order_seller_split(
+    order: "Order", lines: Iterable[Any] | None = None
+) -> SellerSplit:
+    """Return the seller split memoized on the order instance.
+
+    Lines are grouped by their denormalized seller; when they are not given, they
+    are fetched with their sellers in one query. Splits of given lines are
+    memoized by the line IDs, so a subset of lines never reuses the split of
+    another one.
+    """
+    key: tuple | None = None
+    if lines is not None:
+        lines = list(lines)
+        key = tuple(line.pk for line in lines)
+    splits = getattr(order, "_seller_splits", None)
+    if splits is None:
+        splits = {}
+        order._seller_splits = splits  # type: ignore[attr-defined]
+    split = splits.get(key)
+    if split is None:
+        if lines is None:
+            lines = order.lines.select_related("seller", "variant")
+        split = SellerSplit(
+            lines, get_seller=lambda line: line.seller, currency=order.currency
+        )
+        splits[key] = split
+    return split
@@ -0,0 +1,340 @@
+"""Seller shipping quotes computed from compiled, cached shipping profiles.
+
+A `SellerShippingProfile` holds everything needed to price a seller's shipping:
+the logistics configuration, the shipping zones and the active seller shipping
+methods with their tier tables compiled into sorted arrays. Profiles are loaded
+for all sellers of a checkout at once and kept in the shared cache until the
+seller's shipping configuration changes.
+
+Quotes are cached per seller, country and city, with the weight and subtotal
+reduced to buckets. Bucket boundaries are the tier thresholds of the seller's
+methods, so every weight and subtotal within one bucket has exactly the same
+price.
+"""
+
+import time
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Any
+from uuid import UUID
+
+from django.core.cache import cache
+
+SHIPPING_QUOTES_VERSION_CACHE_KEY = "marketplace:shipping_quotes:version"
+SHIPPING_PROFILE_CACHE_KEY = "marketplace:shipping_profile:{version}:{seller_id}"
+SHIPPING_QUOTE_CACHE_KEY = (
+    "marketplace:shipping_quote:{version}:{seller_id}:{country}:{city}"
+    ":{weight_bucket}:{subtotal_bucket}"
+)
+SHIPPING_CACHE_TIMEOUT = 60 * 60  # 1 hour
+
+ZERO = Decimal(0)
+
+
+def to_decimal(value: Any, default: Decimal = ZERO) -> Decimal:
+    if value is None:
+        return default
+    if isinstance(value, Decimal):
+        return value
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        return default
+
+
+@dataclass(frozen=True)
+class TierTable:
+    """Tier prices keyed by ascending minimum thresholds."""
+
+    thresholds: tuple[Decimal, ...] = ()
+    prices: tuple[Decimal, ...] = ()
+
+    @classmethod
+    def compile(
+        cls, tiers: Iterable[dict], min_key: str, default_price: Decimal
+    ) -> "TierTable":
+        prices_by_threshold: dict[Decimal, Decimal] = {}
+        for tier in tiers or []:
+            threshold = to_decimal(tier.get(min_key))
+            # The first tier defined for a threshold wins.
+            prices_by_threshold.setdefault(
+                threshold, to_decimal(tier.get("price"), default=default_price)
+            )
+        thresholds = tuple(sorted(prices_by_threshold))
+        return cls(
+            thresholds, tuple(prices_by_threshold[value] for value in thresholds)
+        )
+
+    def lookup(self, value: Decimal) -> Decimal | None:
+        """Return the price of the highest tier whose threshold is <= `value`."""
+        index = bisect_right(self.thresholds, value)
+        return self.prices[index - 1] if index else None
+
+
+@dataclass(frozen=True)
+class CompiledSellerMethod:
+    id: UUID
+    name: str
+    base_price: Decimal
+    estimated_days: int | None
+    destination_country: str | None
+    destination_city: str | None
+    weight_tiers: TierTable
+    price_tiers: TierTable
+
+    @classmethod
+    def compile(cls, method) -> "CompiledSellerMethod":
+        base_price = to_decimal(method.price)
+        tiers = method.tiered_pricing or {}
+        return cls(
+            id=method.pk,
+            name=method.name,
+            base_price=base_price,
+            estimated_days=method.estimated_days,
+            destination_country=(
+                str(method.destination_country) if method.destination_country else None
+            ),
+            destination_city=(method.destination_city or "").strip().lower() or None,
+            weight_tiers=TierTable.compile(
+                tiers.get("weight_tiers"), "min_weight", base_price
+            ),
+            price_tiers=TierTable.compile(
+                tiers.get("price_tiers"), "min_price", base_price
+            ),
+        )
+
+    def applies_to(self, country_code: str, city: str | None) -> bool:
+        if self.destination_country and self.destination_country != country_code:
+            return False
+        if self.destination_city:
+            return self.destination_city == city
+        return True
+
+
+@dataclass(frozen=True)
+class ShippingQuote:
+    method_id: UUID
+    name: str
+    price: Decimal
+    estimated_days: int | None
+
+
+@dataclass(frozen=True)
+class SellerShippingProfile:
+    seller_id: UUID
+    has_logistics_config: bool = False
+    free_shipping_threshold: Decimal | None = None
+    b2b_discount_factor: Decimal | None = None
+    shipping_zone_ids: tuple[int, ...] = ()
+    methods: tuple[CompiledSellerMethod, ...] = ()
+
+    @property
+    def weight_thresholds(self) -> tuple[Decimal, ...]:
+        return tuple(
+            sorted({value for m in self.methods for value in m.weight_tiers.thresholds})
+        )
+
+    @property
+    def subtotal_thresholds(self) -> tuple[Decimal, ...]:
+        values = {value for m in self.methods for value in m.price_tiers.thresholds}
+        if self.free_shipping_threshold:
+            values.add(self.free_shipping_threshold)
+        return tuple(sorted(values))
+
+    def get_buckets(self, weight: Decimal | None, subtotal: Decimal) -> tuple[int, int]:
+        # Quotes without weight skip the weight tiers, so they get their own bucket.
+        weight_bucket = (
+            -1 if weight is None else bisect_right(self.weight_thresholds, weight)
+        )
+        return weight_bucket, bisect_right(self.subtotal_thresholds, subtotal)
+
+    def is_free_shipping(self, subtotal: Decimal) -> bool:
+        return bool(
+            self.free_shipping_threshold and subtotal >= self.free_shipping_threshold
+        )
+
+    def get_price(
+        self,
+        method: CompiledSellerMethod,
+        weight: Decimal | None,
+        subtotal: Decimal,
+    ) -> Decimal:
+        if self.is_free_shipping(subtotal):
+            price = ZERO
+        else:
+            # Weight tiers take precedence if the weight is known.
+            tier_price = None
+            if weight is not None:
+                tier_price = method.weight_tiers.lookup(weight)
+            if tier_price is None:
+                tier_price = method.price_tiers.lookup(subtotal)
+            price = method.base_price if tier_price is None else tier_price
+        if self.b2b_discount_factor is not None:
+            price = (price * self.b2b_discount_factor).quantize(Decimal("0.01"))
+        return price
+
+    def get_quotes(
+        self,
+        country_code: str,
+        city: str | None,
+        weight: Decimal | None,
+        subtotal: Decimal,
+    ) -> list[ShippingQuote]:
+        return [
+            ShippingQuote(
+                method.id,
+                method.name,
+                self.get_price(method, weight, subtotal),
+                method.estimated_days,
+            )
+            for method in self.methods
+            if method.applies_to(country_code, city)
+        ]
+
+
+def get_shipping_quotes_version() -> int:
+    return cache.get_or_set(
+        SHIPPING_QUOTES_VERSION_CACHE_KEY, int(time.time()), timeout=None
+    )
+
+
+def invalidate_shipping_quotes() -> None:
+    """Drop all cached shipping profiles and quotes."""
+    try:
+        cache.incr(SHIPPING_QUOTES_VERSION_CACHE_KEY)
+    except ValueError:
+        # The key expired or was evicted; any new version makes old keys stale.
+        cache.set(SHIPPING_QUOTES_VERSION_CACHE_KEY, int(time.time()), timeout=None)
+
+
+def load_seller_shipping_profiles(
+    seller_ids: Iterable[UUID],
+) -> dict[UUID, SellerShippingProfile]:
+    """Build shipping profiles of the given sellers with one query per model."""
+    from ..models import Seller, SellerLogisticsConfig, SellerShippingMethod
+
+    seller_ids = set(seller_ids)
+    if not seller_ids:
+        return {}
+    sellers = Seller.objects.filter(pk__in=seller_ids).values_list(
+        "pk",
+        "seller_type",
+        "logistics_config__id",
+        "logistics_config__free_shipping_threshold",
+        "logistics_config__custom_shipping_methods",
+    )
+    zone_ids_by_seller: dict[UUID, list[int]] = {}
+    zones = SellerLogisticsConfig.shipping_zones.through.objects.filter(
+        sellerlogisticsconfig__seller_id__in=seller_ids
+    ).values_list("sellerlogisticsconfig__seller_id", "shippingzone_id")
+    for seller_id, zone_id in zones:
+        zone_ids_by_seller.setdefault(seller_id, []).append(zone_id)
+    methods_by_seller: dict[UUID, list[CompiledSellerMethod]] = {}
+    methods = SellerShippingMethod.objects.filter(
+        seller_id__in=seller_ids, is_active=True
+    ).order_by("seller_id", "name")
+    for method in methods:
+        methods_by_seller.setdefault(method.seller_id, []).append(
+            CompiledSellerMethod.compile(method)
+        )
+
+    profiles = {}
+    for seller_id, seller_type, config_id, threshold, custom_methods in sellers:
+        b2b_discount_factor = None
+        if seller_type == "b2b_wholesale":
+            factor = (custom_methods or {}).get("b2b_discount_factor")
+            if factor is not None:
+                b2b_discount_factor = to_decimal(factor, default=Decimal(1))
+        profiles[seller_id] = SellerShippingProfile(
+            seller_id=seller_id,
+            has_logistics_config=config_id is not None,
+            free_shipping_threshold=threshold,
+            b2b_discount_factor=b2b_discount_factor,
+            shipping_zone_ids=tuple(zone_ids_by_seller.get(seller_id, ())),
+            methods=tuple(methods_by_seller.get(seller_id, ())),
+        )
+    return profiles
+
+
+class ShippingQuoteService:
+    """Shipping profiles and quotes of a set of sellers, e.g. of one checkout.
+
+    Profiles are read from the shared cache with one round trip, and the missing
+    ones are built from the database with one query per model.
+    """
+
+    def __init__(self, seller_ids: Iterable[UUID]):
+        self.version = get_shipping_quotes_version()
+        self.profiles: dict[UUID, SellerShippingProfile] = {}
+        self._load_profiles(set(seller_ids))
+
+    def _profile_key(self, seller_id: UUID) -> str:
+        return SHIPPING_PROFILE_CACHE_KEY.format(
+            version=self.version, seller_id=seller_id
+        )
+
+    def _load_profiles(self, seller_ids: set[UUID]):
+        seller_ids -= self.profiles.keys()
+        if not seller_ids:
+            return
+        keys = {self._profile_key(seller_id): seller_id for seller_id in seller_ids}
+        cached = cache.get_many(keys.keys())
+        self.profiles.update({keys[key]: profile for key, profile in cached.items()})
+        missing = {seller_id for key, seller_id in keys.items() if key not in cached}
+        if missing:
+            loaded = load_seller_shipping_profiles(missing)
+            cache.set_many(
+                {
+                    self._profile_key(seller_id): profile
+                    for seller_id, profile in loaded.items()
+                },
+                timeout=SHIPPING_CACHE_TIMEOUT,
+            )
+            self.profiles.update(loaded)
+
+    def get_profile(self, seller_id: UUID) -> SellerShippingProfile | None:
+        self._load_profiles({seller_id})
+        return self.profiles.get(seller_id)
+
+    def get_quotes(
+        self,
+        requests: dict[UUID, tuple[Decimal | None, Decimal]],
+        country_code: str,
+        city: str | None = None,
+    ) -> dict[UUID, list[ShippingQuote]]:
+        """Return quotes of all applicable seller methods for a destination.
+
+        `requests` maps seller IDs to the weight and subtotal of their items.
+        """
+        self._load_profiles(set(requests))
+        city = (city or "").strip().lower() or None
+        keys: dict[str, UUID] = {}
+        for seller_id, (weight, subtotal) in requests.items():
+            profile = self.profiles.get(seller_id)
+            if profile is None:
+                continue
+            weight_bucket, subtotal_bucket = profile.get_buckets(weight, subtotal)
+            key = SHIPPING_QUOTE_CACHE_KEY.format(
+                version=self.version,
+                seller_id=seller_id,
+                country=country_code,
+                city=city or "",
+                weight_bucket=weight_bucket,
+                subtotal_bucket=subtotal_bucket,
+            )
+            keys[key] = seller_id
+
+        quotes = {keys[key]: value for key, value in cache.get_many(keys).items()}
+        computed = {}
+        for key, seller_id in keys.items():
+            if seller_id in quotes:
+                continue
+            weight, subtotal = requests[seller_id]
+            quotes[seller_id] = computed[key] = self.profiles[seller_id].get_quotes(
+                country_code, city, weight, subtotal
+            )
+        if computed:
+            cache.set_many(computed, timeout=SHIPPING_CACHE_TIMEOUT)
+        return quotes
@@ -3,20 +3,21 @@
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from django.db.models import Q
+from .services.order_routing import route_order_to_fulfillment_center  # noqa: F401
+from .services.shipping_quotes import ShippingQuoteService
 
 if TYPE_CHECKING:
     from ..account.models import Address
     from ..checkout.models import Checkout
-    from ..order.models import Order
     from ..shipping.models import ShippingMethod, ShippingZone
-    from .models import FulfillmentCenter, Seller, SellerLogisticsConfig, SellerShippingMethod
+    from .models import Seller, SellerLogisticsConfig, SellerShippingMethod
 
 
 def get_applicable_shipping_methods_for_seller(
     seller: "Seller",
     shipping_address: Optional["Address"] = None,
     order_total: Optional[Decimal] = None,
+    quote_service: Optional[ShippingQuoteService] = None,
 ) -> list["ShippingMethod"]:
     """Get applicable shipping methods based on seller type and configuration.
 
@@ -24,41 +25,32 @@ def get_applicable_shipping_methods_for_seller(
         seller: The seller instance
         shipping_address: Customer shipping address (optional)
         order_total: Total order value (optional, for free shipping threshold)
+        quote_service: Shipping quote service shared by all sellers of a checkout
+            (optional)
 
     Returns:
         List of applicable shipping methods
     """
     from ..shipping.models import ShippingMethod
 
-    # Get seller's logistics configuration
-    try:
-        logistics_config = seller.logistics_config
-    except AttributeError:
-        # No logistics config, return empty list
-        return []
+    quote_service = quote_service or ShippingQuoteService([seller.pk])
+    profile = quote_service.get_profile(seller.pk)
 
-    # Get shipping zones for this seller
-    shipping_zones = logistics_config.shipping_zones.all()
-    if not shipping_zones.exists():
-        # No shipping zones configured, return empty list
+    # No logistics config or shipping zones configured, return empty list
+    if not profile or not profile.shipping_zone_ids:
         return []
 
     # Filter shipping methods by zones
-    methods = ShippingMethod.objects.filter(shipping_zone__in=shipping_zones)
+    methods = ShippingMethod.objects.filter(
+        shipping_zone_id__in=profile.shipping_zone_ids
+    )
 
-    # Apply seller-type-specific filtering
-    if seller.seller_type == "b2b_wholesale":
-        # B2B sellers may have negotiated rates or bulk shipping discounts.
-        # SellerShippingMethod is handled in MarketplaceShippingPlugin (external methods).
-        # Keep standard methods unchanged here.
-        pass
+    # B2B sellers may have negotiated rates or bulk shipping discounts.
+    # SellerShippingMethod is handled in MarketplaceShippingPlugin (external methods).
+    # Keep standard methods unchanged here.
 
     # Check free shipping threshold
-    if (
-        logistics_config.free_shipping_threshold
-        and order_total
-        and order_total >= logistics_config.free_shipping_threshold
-    ):
+    if order_total and profile.is_free_shipping(order_total):
         # Filter to include free shipping methods
         methods = methods.filter(price_amount=0)
 
@@ -70,6 +62,7 @@ def calculate_shipping_cost_for_seller(
     shipping_method: "ShippingMethod",
     weight: Optional[Decimal] = None,
     order_total: Optional[Decimal] = None,
+    quote_service: Optional[ShippingQuoteService] = None,
 ) -> Decimal:
     """Calculate shipping cost for a seller based on seller type and configuration.
 
@@ -78,113 +71,32 @@ def calculate_shipping_cost_for_seller(
         shipping_method: The shipping method to calculate cost for
         weight: Total weight of items (optional, for weight-based calculation)
         order_total: Total order value (optional, for free shipping threshold)
+        quote_service: Shipping quote service shared by all sellers of a checkout
+            (optional)
 
     Returns:
         Shipping cost as Decimal
     """
-    from ..shipping.models import ShippingMethod
+    standard_price = Decimal(str(shipping_method.price_amount or 0))
 
-    # Get seller's logistics configuration
-    try:
-        logistics_config = seller.logistics_config
-    except AttributeError:
+    quote_service = quote_service or ShippingQuoteService([seller.pk])
+    profile = quote_service.get_profile(seller.pk)
+    if not profile or not profile.has_logistics_config:
         # No logistics config, use standard shipping method price
-        return Decimal(str(shipping_method.price_amount or 0))
+        return standard_price
 
-    # Check free shipping threshold
-    if (
-        logistics_config.free_shipping_threshold
-        and order_total
-        and order_total >= logistics_config.free_shipping_threshold
-    ):
+    subtotal = order_total or Decimal("0.00")
+    if profile.is_free_shipping(subtotal):
         return Decimal("0.00")
 
-    # Check for seller-specific shipping method
-    from .models import SellerShippingMethod
-    seller_method = SellerShippingMethod.objects.filter(
-        seller=seller,
-        is_active=True,
-        # Match by name or other criteria
-    ).first()
-
+    # Use seller-specific pricing of the method with the same name, or of the
+    # seller's first active method
+    seller_method = next(
+        (m for m in profile.methods if m.name == shipping_method.name),
+        profile.methods[0] if profile.methods else None,
+    )
     if seller_method:
-        # Use seller-specific pricing
-        base_price = seller_method.price
-
-        # Apply tiered pricing if available
-        if seller_method.tiered_pricing and weight:
-            # Calculate based on weight tiers
-            for tier in seller_method.tiered_pricing.get("weight_tiers", []):
-                if weight >= tier.get("min_weight", 0):
-                    return Decimal(str(tier.get("price", base_price)))
-        elif seller_method.tiered_pricing and order_total:
-            # Calculate based on price tiers
-            for tier in seller_method.tiered_pricing.get("price_tiers", []):
-                if order_total >= Decimal(str(tier.get("min_price", 0))):
-                    return Decimal(str(tier.get("price", base_price)))
-
-        return base_price
+        return profile.get_price(seller_method, weight, subtotal)
 
     # Use standard shipping method price
-    return Decimal(str(shipping_method.price_amount or 0))
-
-
-def route_order_to_fulfillment_center(
-    order: "Order",
-    seller: Optional["Seller"] = None,
-) -> Optional["FulfillmentCenter"]:
-    """Route order to nearest fulfillment center based on inventory and delivery location.
-
-    Args:
-        order: The order to route
-        seller: The seller (optional, if routing for specific seller)
-
-    Returns:
-        FulfillmentCenter instance or None
-    """
-    from .models import FulfillmentCenter, OrderRoutingRule
-
-    if not order.shipping_address:
-        return None
-
-    delivery_country = order.shipping_address.country
-
-    # Get active routing rules, ordered by priority
-    routing_rules = OrderRoutingRule.objects.filter(is_active=True).order_by("priority")
-
-    # Check each rule's conditions
-    for rule in routing_rules:
-        conditions = rule.conditions or {}
-
-        # Check country match
-        if "countries" in conditions:
-            if delivery_country.code not in conditions["countries"]:
-                continue
-
-        # Check inventory availability (if specified)
-        if "require_inventory" in conditions and conditions["require_inventory"]:
-            # Check if fulfillment center has inventory for order lines
-            # This would require checking warehouse stock
-            # For now, skip this check
-            pass
-
-        # Check seller preference (if specified)
-        if seller and "seller_ids" in conditions:
-            if str(seller.id) not in conditions["seller_ids"]:
-                continue
-
-        # Rule matches, return this fulfillment center
-        return rule.fulfillment_center
-
-    # If seller has primary fulfillment center, use that
-    if seller:
-        try:
-            logistics_config = seller.logistics_config
-            if logistics_config.primary_fulfillment_center:
-                return logistics_config.primary_fulfillment_center
-        except AttributeError:
-            pass
-
-    # Default: return first active fulfillment center
-    return FulfillmentCenter.objects.filter(is_active=True).first()
-
+    return standard_price
@@ -2,19 +2,33 @@
 
 import logging
 
-from django.db.models.signals import post_save, pre_save, post_delete
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_save, pre_save, post_delete
 from django.dispatch import receiver
 
+from ..product.models import (
+    Collection,
+    CollectionChannelListing,
+    CollectionProduct,
+    ProductChannelListing,
+)
 from .models import (
+    FeaturedCollection,
+    FeaturedProduct,
     FulfillmentCenter,
     InventorySync,
     OrderRoutingRule,
+    PricingRule,
     ProductSubmission,
+    Quiz,
     ReturnRequest,
     Seller,
     SellerDomain,
     SellerLogisticsConfig,
+    SellerSettlement,
+    SellerShippingMethod,
     SellerStorefrontSettings,
+    SellerWarehouse,
 )
 
 logger = logging.getLogger(__name__)
@@ -168,6 +182,103 @@ def handle_domain_verification(sender, instance: SellerDomain, created: bool, **
         # TODO: Integrate with SSL certificate management (Let's Encrypt, etc.)
 
 
+@receiver(pre_save, sender=Seller)
+def remember_seller_tenant_snapshot(
+    sender, instance: Seller, update_fields=None, **kwargs
+):
+    """Keep the stored snapshot of a seller, so no-op saves keep the tenant cache."""
+    from .tenant import (
+        SNAPSHOT_IGNORED_FIELDS,
+        get_stored_seller_snapshot,
+        take_seller_snapshot,
+    )
+
+    if update_fields is not None and set(update_fields) <= SNAPSHOT_IGNORED_FIELDS:
+        # Nothing a cached resolution holds is written.
+        instance._previous_tenant_snapshot = take_seller_snapshot(instance)
+    else:
+        instance._previous_tenant_snapshot = get_stored_seller_snapshot(instance.pk)
+
+
+@receiver(post_save, sender=Seller)
+def invalidate_seller_tenant_cache(sender, instance: Seller, **kwargs):
+    """Drop cached host resolutions for a changed seller."""
+    from .tenant import seller_snapshot_changed, tenant_resolver
+
+    previous = getattr(instance, "_previous_tenant_snapshot", None)
+    if not seller_snapshot_changed(previous, instance):
+        return
+    seller_id = instance.pk
+    transaction.on_commit(lambda: tenant_resolver.invalidate(seller_id=seller_id))
+
+
+@receiver(post_delete, sender=Seller)
+def invalidate_deleted_seller_tenant_cache(sender, instance: Seller, **kwargs):
+    """Drop cached host resolutions for a deleted seller."""
+    from .tenant import tenant_resolver
+
+    seller_id = instance.pk
+    transaction.on_commit(lambda: tenant_resolver.invalidate(seller_id=seller_id))
+
+
+@receiver(post_save, sender=SellerDomain)
+@receiver(post_delete, sender=SellerDomain)
+def invalidate_seller_domain_tenant_cache(sender, instance: SellerDomain, **kwargs):
+    """Drop cached host resolutions for a changed seller domain."""
+    from .tenant import tenant_resolver
+
+    seller_id, domain = instance.seller_id, instance.domain
+    transaction.on_commit(
+        lambda: tenant_resolver.invalidate(seller_id=seller_id, hosts=(domain,))
+    )
+
+
+@receiver(post_save, sender=SellerWarehouse)
+@receiver(post_delete, sender=SellerWarehouse)
+def invalidate_seller_warehouse_tenant_scope(
+    sender, instance: SellerWarehouse, **kwargs
+):
+    """Drop cached tenant scope IDs once a seller's warehouses change."""
+    from .tenant import tenant_resolver
+
+    seller_id = instance.seller_id
+    transaction.on_commit(lambda: tenant_resolver.invalidate(seller_id=seller_id))
+
+
+@receiver(m2m_changed, sender=SellerLogisticsConfig.shipping_zones.through)
+def invalidate_seller_shipping_zones_tenant_scope(
+    sender, instance, action: str, reverse: bool, pk_set, **kwargs
+):
+    """Drop cached tenant scope IDs once a seller's shipping zones change."""
+    from .tenant import tenant_resolver
+
+    # When a shipping zone is (un)assigned from its side, `pk_set` holds the
+    # configs, except when clearing, where the configs are only known before the
+    # clear. Seller IDs are collected now, as the callback runs after the change.
+    if not reverse:
+        if not action.startswith("post_"):
+            return
+        seller_ids = [instance.seller_id]
+    elif action == "pre_clear":
+        seller_ids = list(
+            instance.seller_logistics_configs.values_list("seller_id", flat=True)
+        )
+    elif action in ("post_add", "post_remove"):
+        seller_ids = list(
+            SellerLogisticsConfig.objects.filter(pk__in=pk_set).values_list(
+                "seller_id", flat=True
+            )
+        )
+    else:
+        return
+
+    def invalidate_tenant_scopes():
+        for seller_id in seller_ids:
+            tenant_resolver.invalidate(seller_id=seller_id)
+
+    transaction.on_commit(invalidate_tenant_scopes)
+
+
 @receiver(post_save, sender="product.Product")
 def handle_product_assignment(sender, instance, created: bool, **kwargs):
     """Handle product assignment to seller and validate seller status."""
@@ -385,28 +496,21 @@ def handle_order_line_denormalization(sender, instance, created: bool, **kwargs)
 
 @receiver(post_save, sender="warehouse.Stock")
 def handle_inventory_change(sender, instance, **kwargs):
-    """Trigger real-time inventory sync when stock changes."""
-    from .services.inventory_sync import sync_inventory_for_variant
+    """Queue an inventory sync of the changed stock.
 
-    variant = instance.product_variant
-    if variant:
-        # Sync inventory for this variant
-        try:
-            sync_inventory_for_variant(
-                variant,
-                warehouse=instance.warehouse,
-                sync_method="webhook",
-            )
-            logger.debug(f"Synced inventory for variant {variant.sku}")
-        except Exception as e:
-            logger.error(f"Error syncing inventory for variant {variant.sku}: {e}")
+    The sync itself runs in the flush task, so stock writes only pay for buffering
+    the changed (variant, warehouse) pair.
+    """
+    from .services.inventory_sync_queue import mark_stock_for_inventory_sync
+
+    mark_stock_for_inventory_sync(instance.product_variant_id, instance.warehouse_id)
 
 
 @receiver(post_save, sender="order.Order")
 def handle_order_creation(sender, instance, created: bool, **kwargs):
     """Apply automatic routing to nearest fulfillment center when order is created."""
     if created and instance.shipping_address:
-        from .shipping import route_order_to_fulfillment_center
+        from .services.order_routing import route_order_to_fulfillment_center
 
         # Route order to fulfillment center
         fulfillment_center = route_order_to_fulfillment_center(instance)
@@ -418,3 +522,165 @@ def handle_order_creation(sender, instance, created: bool, **kwargs):
             logger.info(
                 f"Order {instance.number} routed to fulfillment center {fulfillment_center.name}"
             )
+
+
+@receiver(post_save, sender=SellerSettlement)
+@receiver(post_delete, sender=SellerSettlement)
+def handle_settlement_change(sender, instance: SellerSettlement, **kwargs):
+    """Refresh the seller analytics bucket of a changed settlement."""
+    from .analytics import get_bucket_date
+    from .tasks import schedule_seller_analytics_refresh
+
+    schedule_seller_analytics_refresh(
+        [(instance.seller_id, get_bucket_date(instance.created_at))]
+    )
+
+
+@receiver(post_save, sender="order.Order")
+def handle_order_status_change(sender, instance, created: bool, **kwargs):
+    """Refresh seller analytics buckets when an order is created or its status changes."""
+    update_fields = kwargs.get("update_fields")
+    if not created and update_fields is not None and "status" not in update_fields:
+        return
+
+    from .tasks import refresh_seller_analytics_for_order_task
+
+    order_id = str(instance.pk)
+    transaction.on_commit(
+        lambda: refresh_seller_analytics_for_order_task.delay(order_id)
+    )
+
+
+@receiver(post_save, sender="order.Order")
+def handle_order_fulfillment_for_badges(sender, instance, created: bool, **kwargs):
+    """Refresh the customer's badge counters when an order is fulfilled or returned."""
+    from .utils_loyalty import BADGE_COUNTER_STATUSES
+
+    update_fields = kwargs.get("update_fields")
+    if created or not instance.user_id:
+        return
+    if update_fields is not None and "status" not in update_fields:
+        return
+    if instance.status not in BADGE_COUNTER_STATUSES:
+        return
+
+    from .tasks import update_badge_counters_task
+
+    user_id, order_id = instance.user_id, str(instance.pk)
+    transaction.on_commit(
+        lambda: update_badge_counters_task.delay(user_id, order_id)
+    )
+
+
+@receiver(post_save, sender=OrderRoutingRule)
+@receiver(post_delete, sender=OrderRoutingRule)
+@receiver(post_save, sender=FulfillmentCenter)
+@receiver(post_delete, sender=FulfillmentCenter)
+@receiver(m2m_changed, sender=FulfillmentCenter.warehouses.through)
+@receiver(post_save, sender=SellerLogisticsConfig)
+@receiver(post_delete, sender=SellerLogisticsConfig)
+def invalidate_order_routing_table(sender, **kwargs):
+    """Rebuild compiled routing tables once the routing configuration changes."""
+    from .services.order_routing import invalidate_routing_table
+
+    transaction.on_commit(invalidate_routing_table)
+
+
+@receiver(post_save, sender=SellerShippingMethod)
+@receiver(post_delete, sender=SellerShippingMethod)
+@receiver(post_save, sender=SellerLogisticsConfig)
+@receiver(post_delete, sender=SellerLogisticsConfig)
+@receiver(m2m_changed, sender=SellerLogisticsConfig.shipping_zones.through)
+@receiver(post_save, sender=Seller)
+def invalidate_seller_shipping_quotes(sender, **kwargs):
+    """Drop cached shipping profiles and quotes once seller shipping changes."""
+    from .services.shipping_quotes import invalidate_shipping_quotes
+
+    transaction.on_commit(invalidate_shipping_quotes)
+
+
+@receiver(post_save, sender=FeaturedProduct)
+@receiver(post_delete, sender=FeaturedProduct)
+@receiver(post_save, sender=FeaturedCollection)
+@receiver(post_delete, sender=FeaturedCollection)
+@receiver(post_save, sender=ProductChannelListing)
+@receiver(post_delete, sender=ProductChannelListing)
+@receiver(post_save, sender=CollectionChannelListing)
+@receiver(post_delete, sender=CollectionChannelListing)
+@receiver(post_save, sender=CollectionProduct)
+@receiver(post_delete, sender=CollectionProduct)
+@receiver(m2m_changed, sender=Collection.products.through)
+def invalidate_featured_content_cache(sender, **kwargs):
+    """Drop cached featured content once featuring or listings change."""
+    from .services.featured import invalidate_featured_content
+
+    transaction.on_commit(invalidate_featured_content)
+
+
+@receiver(pre_save, sender=PricingRule)
+def remember_pricing_rule_targets(sender, instance: PricingRule, **kwargs):
+    """Keep the previous target of an edited rule, so its prices get updated too."""
+    instance._previous_targets = list(
+        PricingRule.objects.filter(pk=instance.pk).only("product_id", "seller_id")
+    )
+
+
+@receiver(post_save, sender=PricingRule)
+@receiver(post_delete, sender=PricingRule)
+def recalculate_pricing_rule_prices(sender, instance: PricingRule, **kwargs):
+    """Mark prices of products affected by a pricing rule for recalculation."""
+    from .services.pricing_rules import mark_pricing_rule_products_dirty
+
+    rules = [instance, *getattr(instance, "_previous_targets", [])]
+    transaction.on_commit(lambda: mark_pricing_rule_products_dirty(rules))
+
+
+@receiver(post_save, sender=Quiz)
+@receiver(post_delete, sender=Quiz)
+def invalidate_quiz_answer_key_cache(sender, instance: Quiz, **kwargs):
+    """Drop the compiled answer key of a changed quiz."""
+    from .services.quizzes import invalidate_quiz_answer_key
+
+    quiz_id = instance.pk
+    transaction.on_commit(lambda: invalidate_quiz_answer_key(quiz_id))
+
+
+SELLER_ORDER_LINE_FIELDS = {
+    "quantity",
+    "seller",
+    "total_price_net_amount",
+    "total_price_gross_amount",
+}
+
+
+@receiver(post_save, sender="order.OrderLine")
+@receiver(post_delete, sender="order.OrderLine")
+def refresh_seller_orders_for_line(sender, instance, **kwargs):
+    """Refresh seller order projections when lines are added, edited or removed.
+
+    Lines created or updated in bulk don't send signals; checkout completion,
+    order bulk creation, replace orders and price recalculation project them
+    directly.
+    """
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not SELLER_ORDER_LINE_FIELDS & set(
+        update_fields
+    ):
+        return
+
+    from .services.seller_orders import refresh_seller_orders
+
+    order_id = instance.order_id
+    transaction.on_commit(lambda: refresh_seller_orders([order_id]))
+
+
+@receiver(post_save, sender="order.Order")
+def sync_seller_orders_status(sender, instance, created: bool, **kwargs):
+    """Copy the order status to the order's seller projections."""
+    update_fields = kwargs.get("update_fields")
+    if created or (update_fields is not None and "status" not in update_fields):
+        return
+
+    from .services.seller_orders import update_seller_orders_status
+
+    update_seller_orders_status([instance.pk], instance.status)
@@ -0,0 +1,203 @@
+import datetime
+import logging
+from collections.abc import Iterable
+from uuid import UUID
+
+from django.core.cache import cache
+from django.db import transaction
+
+from ..celeryconf import app
+from ..core.db.connection import allow_writer
+from ..order import OrderStatus
+from ..order.models import Order, OrderLine
+from .analytics import SellerDay, get_bucket_date, refresh_seller_analytics
+from .services.help_views import (
+    HelpArticleViewEvent,
+    delete_old_help_article_views,
+    flush_help_article_views,
+    store_help_article_views,
+)
+from .services.inventory_sync_queue import (
+    INVENTORY_SYNC_FLUSH_SCHEDULED_CACHE_KEY,
+    flush_inventory_sync_queue,
+    schedule_inventory_sync_flush,
+)
+from .services.loyalty_ledger import expire_points
+from .services.pricing_rules import mark_products_with_passed_rule_boundaries_dirty
+from .services.recently_viewed import flush_product_views
+from .utils import create_settlements_for_orders
+from .utils_loyalty import evaluate_badges, refresh_badge_counters
+
+logger = logging.getLogger(__name__)
+
+SETTLEMENTS_ORDER_BATCH_SIZE = 500
+SETTLEMENTS_CHECKPOINT_CACHE_KEY = "marketplace:settlements:last_order_number"
+SETTLEMENTS_CHECKPOINT_TTL = 60 * 60 * 24 * 7  # 7 days
+
+
+def get_settlements_checkpoint() -> int | None:
+    """Return the number of the last order processed by the settlement builder."""
+    return cache.get(SETTLEMENTS_CHECKPOINT_CACHE_KEY)
+
+
+def create_settlements_for_orders_batch(
+    start_number: int = 0,
+    end_number: int | None = None,
+    batch_size: int = SETTLEMENTS_ORDER_BATCH_SIZE,
+) -> tuple[int | None, int]:
+    """Create settlements for the next batch of orders after `start_number`.
+
+    Orders are streamed by their sequential number, so a run can be resumed from
+    the stored checkpoint. Returns the number of the last order in the batch
+    (`None` when there is nothing left to process) and the number of created
+    settlements.
+    """
+    orders = Order.objects.filter(number__gt=start_number).exclude(
+        status=OrderStatus.DRAFT
+    )
+    if end_number is not None:
+        orders = orders.filter(number__lte=end_number)
+    batch = list(orders.order_by("number").values_list("pk", "number")[:batch_size])
+    if not batch:
+        return None, 0
+
+    settlements = create_settlements_for_orders([pk for pk, _ in batch])
+    last_number = batch[-1][1]
+    cache.set(SETTLEMENTS_CHECKPOINT_CACHE_KEY, last_number, SETTLEMENTS_CHECKPOINT_TTL)
+    return last_number, len(settlements)
+
+
+@app.task
+@allow_writer()
+def create_settlements_for_orders_task(
+    start_number: int = 0,
+    end_number: int | None = None,
+    batch_size: int = SETTLEMENTS_ORDER_BATCH_SIZE,
+):
+    """Create missing seller settlements for an order number range, batch by batch."""
+    last_number, created_count = create_settlements_for_orders_batch(
+        start_number, end_number, batch_size
+    )
+    if last_number is None:
+        logger.info("Seller settlements are up to date.")
+        return
+    logger.info(
+        "Created %s seller settlements for orders up to number %s.",
+        created_count,
+        last_number,
+    )
+    create_settlements_for_orders_task.delay(last_number, end_number, batch_size)
+
+
+def schedule_seller_analytics_refresh(buckets: Iterable[SellerDay]):
+    """Refresh the given (seller ID, day) analytics buckets after commit."""
+    payload = sorted({(str(seller_id), day.isoformat()) for seller_id, day in buckets})
+    if payload:
+        transaction.on_commit(lambda: refresh_seller_analytics_task.delay(payload))
+
+
+@app.task
+@allow_writer()
+def refresh_seller_analytics_task(buckets: list[tuple[str, str]]):
+    refresh_seller_analytics(
+        (UUID(seller_id), datetime.date.fromisoformat(day))
+        for seller_id, day in buckets
+    )
+
+
+@app.task
+@allow_writer()
+def refresh_seller_analytics_for_order_task(order_id: str):
+    order = Order.objects.filter(pk=order_id).only("created_at").first()
+    if not order:
+        return
+    seller_ids = (
+        OrderLine.objects.filter(order_id=order_id, seller__isnull=False)
+        .order_by()
+        .values_list("seller_id", flat=True)
+        .distinct()
+    )
+    day = get_bucket_date(order.created_at)
+    refresh_seller_analytics((seller_id, day) for seller_id in seller_ids)
+
+
+@app.task
+@allow_writer()
+def flush_inventory_sync_queue_task():
+    """Sync stocks changed since the last flush to their fulfillment centers."""
+    # Drop the marker first, so changes committed during the flush schedule
+    # a follow-up run.
+    cache.delete(INVENTORY_SYNC_FLUSH_SCHEDULED_CACHE_KEY)
+    _, remaining = flush_inventory_sync_queue()
+    if remaining:
+        schedule_inventory_sync_flush()
+
+
+@app.task
+@allow_writer()
+def update_badge_counters_task(user_id: int, order_id: str | None = None):
+    """Refresh the customer's badge counters and award newly earned badges."""
+    order = Order.objects.filter(pk=order_id).first() if order_id else None
+    evaluate_badges(refresh_badge_counters([user_id]), order=order)
+
+
+@app.task
+@allow_writer()
+def flush_product_views_task():
+    """Store buffered product views in the recently viewed products table."""
+    stored, remaining = flush_product_views()
+    if remaining:
+        logger.info(
+            "Stored %s product views, %s left in the buffer.", stored, remaining
+        )
+
+
+@app.task
+@allow_writer()
+def flush_help_article_views_task():
+    """Store buffered help article views and add them to daily rollups."""
+    stored, remaining = flush_help_article_views()
+    if remaining:
+        logger.info(
+            "Stored %s help article views, %s left in the buffer.", stored, remaining
+        )
+
+
+@app.task
+@allow_writer()
+def store_help_article_views_task(views: list[str]):
+    """Store help article views recorded while the view buffer was unavailable."""
+    store_help_article_views(HelpArticleViewEvent.decode(view) for view in views)
+
+
+@app.task
+@allow_writer()
+def delete_old_help_article_views_task():
+    """Delete raw help article views older than the retention period."""
+    deleted = delete_old_help_article_views()
+    if deleted:
+        logger.info("Deleted %s old help article views.", deleted)
+
+
+@app.task
+@allow_writer()
+def mark_pricing_rule_boundaries_task():
+    """Recalculate prices of products whose pricing rules started or ended.
+
+    Listings are marked as dirty and recalculated by
+    `recalculate_discounted_price_for_products_task`.
+    """
+    marked = mark_products_with_passed_rule_boundaries_dirty()
+    if marked:
+        logger.info("Marked %s product listings for price recalculation.", marked)
+
+
+@app.task
+@allow_writer()
+def expire_loyalty_points_task():
+    """Expire loyalty points whose validity passed, one chunk of credits per run."""
+    expired, has_more = expire_points()
+    if expired:
+        logger.info("Expired loyalty points of %s users.", expired)
+    if has_more:
+        expire_loyalty_points_task.delay()
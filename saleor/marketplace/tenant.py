@@ -0,0 +1,373 @@
+"""Tiered host to seller resolution for marketplace multi-tenancy.
+
+Resolution goes through three tiers:
+
+1. a bounded, per-process LRU of hydrated seller snapshots,
+2. the shared Django cache (Redis in production),
+3. the database.
+
+A warm worker resolves the tenant of a request without any I/O. Entries in the
+local tier expire after `SELLER_TENANT_LOCAL_CACHE_TTL` seconds, which bounds
+staleness in the workers that did not receive the invalidating signal. Entries in
+the shared tier are namespaced by a version counter that is bumped once a
+transaction changing a `Seller` or `SellerDomain` commits. Seller saves that only
+touch `SNAPSHOT_IGNORED_FIELDS` leave the caches alone.
+
+`SellerTenantMiddleware` wraps the resolved seller in a request-scoped
+`TenantScope`. Besides the seller and its channel, the scope exposes the IDs of
+the seller's warehouses and shipping zones, loaded lazily through the same tiers,
+so resolvers scope querysets with plain `IN` filters on indexed IDs instead of
+joining through the seller relations on every request.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from functools import cache as memoize
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.fields.files import FieldFile
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+    from .models import Seller
+
+
+SELLER_LOOKUP_CACHE_TTL_SECONDS = 300  # 5 minutes
+SELLER_LOOKUP_CACHE_KEY = "marketplace:seller_by_host:{version}:{host}"
+SELLER_LOOKUP_CACHE_VERSION_KEY = "marketplace:seller_by_host:version"
+SELLER_SCOPE_CACHE_KEY = "marketplace:seller_tenant_scope:{version}:{seller_id}"
+
+# Sentinel stored in the shared cache for hosts that do not belong to any seller.
+NO_SELLER = ""
+
+# Seller fields that are bumped on every save and never read from a resolution.
+SNAPSHOT_IGNORED_FIELDS = frozenset({"updated_at"})
+
+SellerSnapshot = tuple[Any, ...]
+# (warehouse IDs, shipping zone IDs) of a seller
+SellerScopeIds = tuple[frozenset[UUID], frozenset[int]]
+
+
+def normalize_host(host: str) -> str:
+    """Strip the port and normalize the case of a request host."""
+    return host.split(":")[0].strip().lower()
+
+
+@memoize
+def _snapshot_field_names() -> tuple[str, ...]:
+    from .models import Seller
+
+    return tuple(field.attname for field in Seller._meta.concrete_fields)
+
+
+@memoize
+def _snapshot_id_index() -> int:
+    return _snapshot_field_names().index("id")
+
+
+def take_seller_snapshot(seller: "Seller") -> SellerSnapshot:
+    """Return the concrete field values of a seller as a picklable tuple."""
+    values = []
+    for name in _snapshot_field_names():
+        value = getattr(seller, name)
+        if isinstance(value, FieldFile):
+            # Match the value stored for an empty file field.
+            value = value.name or ""
+        values.append(value)
+    return tuple(values)
+
+
+def get_stored_seller_snapshot(seller_id: UUID) -> SellerSnapshot | None:
+    """Return the snapshot of a seller as currently stored in the database."""
+    from .models import Seller
+
+    return (
+        Seller.objects.filter(pk=seller_id)
+        .values_list(*_snapshot_field_names())
+        .first()
+    )
+
+
+def seller_snapshot_changed(previous: SellerSnapshot | None, seller: "Seller") -> bool:
+    """Tell whether a seller differs from its previous snapshot.
+
+    Fields in `SNAPSHOT_IGNORED_FIELDS` are skipped, so saves that only touch
+    bookkeeping do not drop every cached resolution.
+    """
+    if previous is None:
+        return True
+    current = take_seller_snapshot(seller)
+    return any(
+        old != new
+        for name, old, new in zip(
+            _snapshot_field_names(), previous, current, strict=True
+        )
+        if name not in SNAPSHOT_IGNORED_FIELDS
+    )
+
+
+def hydrate_seller_snapshot(snapshot: SellerSnapshot) -> "Seller":
+    """Build a fresh `Seller` instance from a snapshot without touching the DB.
+
+    Every call returns a new instance, so request handlers can never mutate
+    state shared with other requests.
+    """
+    from .models import Seller
+
+    values = [
+        copy.deepcopy(value) if isinstance(value, dict | list) else value
+        for value in snapshot
+    ]
+    return Seller.from_db(DEFAULT_DB_ALIAS, list(_snapshot_field_names()), values)
+
+
+def _lookup_seller_in_db(host: str) -> Optional["Seller"]:
+    from .models import Seller, SellerDomain, SellerDomainStatus, SellerStatus
+
+    # First, try exact domain match (only primary domains for reliable
+    # multi-tenancy).
+    domain_obj = (
+        SellerDomain.objects.select_related("seller")
+        .filter(
+            domain=host,
+            status=SellerDomainStatus.ACTIVE,
+            is_primary=True,
+            seller__status=SellerStatus.ACTIVE,
+        )
+        .first()
+    )
+    if domain_obj:
+        return domain_obj.seller
+
+    # If no exact match, try subdomain matching
+    # (e.g., "seller1.example.com" -> "seller1").
+    parts = host.split(".")
+    if len(parts) >= 3:
+        return Seller.objects.filter(slug=parts[0], status=SellerStatus.ACTIVE).first()
+    return None
+
+
+def _lookup_scope_ids_in_db(seller_id: UUID) -> SellerScopeIds:
+    from ..shipping.models import ShippingZone
+    from .models import SellerWarehouse
+
+    warehouse_ids = SellerWarehouse.objects.filter(seller_id=seller_id).values_list(
+        "warehouse_id", flat=True
+    )
+    shipping_zone_ids = ShippingZone.objects.filter(
+        seller_logistics_configs__seller_id=seller_id
+    ).values_list("pk", flat=True)
+    return frozenset(warehouse_ids), frozenset(shipping_zone_ids)
+
+
+class SellerTenantResolver:
+    """Resolve the seller owning a host, with a per-process LRU in front."""
+
+    def __init__(self, max_size: int, local_ttl: float):
+        self.max_size = max_size
+        self.local_ttl = local_ttl
+        self._lock = threading.Lock()
+        # host -> (expires_at, seller_id or None, snapshot or None)
+        self._entries: OrderedDict[
+            str, tuple[float, UUID | None, SellerSnapshot | None]
+        ] = OrderedDict()
+        # seller_id -> (expires_at, scope IDs)
+        self._scopes: OrderedDict[UUID, tuple[float, SellerScopeIds]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def resolve(self, host: str) -> Optional["Seller"]:
+        host = normalize_host(host)
+        if not host:
+            return None
+
+        found, snapshot = self._get_local(host)
+        if not found:
+            snapshot = self._get_shared(host)
+            self.remember(host, snapshot)
+        if snapshot is None:
+            return None
+        return hydrate_seller_snapshot(snapshot)
+
+    def remember(self, host: str, snapshot: SellerSnapshot | None) -> None:
+        """Store the resolution result for a host in the local tier."""
+        seller_id = snapshot[_snapshot_id_index()] if snapshot else None
+        expires_at = time.monotonic() + self.local_ttl
+        with self._lock:
+            self._entries[host] = (expires_at, seller_id, snapshot)
+            self._entries.move_to_end(host)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self, seller_id: UUID | None = None, hosts: tuple[str, ...] = ()
+    ) -> None:
+        """Drop local entries for a seller and the given hosts.
+
+        Negative entries are dropped as well, since a changed seller or domain
+        may now match a host that previously resolved to no seller.
+        """
+        hosts_to_drop = {normalize_host(host) for host in hosts}
+        with self._lock:
+            for host, (_, entry_seller_id, _) in list(self._entries.items()):
+                if (
+                    host in hosts_to_drop
+                    or entry_seller_id is None
+                    or entry_seller_id == seller_id
+                ):
+                    del self._entries[host]
+            if seller_id is not None:
+                self._scopes.pop(seller_id, None)
+        bump_shared_cache_version()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._scopes.clear()
+
+    def get_scope_ids(self, seller_id: UUID) -> SellerScopeIds:
+        """Return IDs of the seller's warehouses and shipping zones."""
+        with self._lock:
+            entry = self._scopes.get(seller_id)
+            if entry is not None and entry[0] >= time.monotonic():
+                self._scopes.move_to_end(seller_id)
+                return entry[1]
+
+        cache_key = SELLER_SCOPE_CACHE_KEY.format(
+            version=get_shared_cache_version(), seller_id=seller_id
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            warehouse_ids, shipping_zone_ids = cached
+            scope_ids = frozenset(warehouse_ids), frozenset(shipping_zone_ids)
+        else:
+            scope_ids = _lookup_scope_ids_in_db(seller_id)
+            cache.set(
+                cache_key,
+                (tuple(scope_ids[0]), tuple(scope_ids[1])),
+                SELLER_LOOKUP_CACHE_TTL_SECONDS,
+            )
+
+        expires_at = time.monotonic() + self.local_ttl
+        with self._lock:
+            self._scopes[seller_id] = (expires_at, scope_ids)
+            self._scopes.move_to_end(seller_id)
+            while len(self._scopes) > self.max_size:
+                self._scopes.popitem(last=False)
+        return scope_ids
+
+    def _get_local(self, host: str) -> tuple[bool, SellerSnapshot | None]:
+        with self._lock:
+            entry = self._entries.get(host)
+            if entry is None:
+                return False, None
+            expires_at, _, snapshot = entry
+            if expires_at < time.monotonic():
+                del self._entries[host]
+                return False, None
+            self._entries.move_to_end(host)
+            return True, snapshot
+
+    def _get_shared(self, host: str) -> SellerSnapshot | None:
+        cache_key = SELLER_LOOKUP_CACHE_KEY.format(
+            version=get_shared_cache_version(), host=host
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            # We cache "no seller" as an empty string to allow negative caching.
+            return None if cached == NO_SELLER else tuple(cached)
+
+        seller = _lookup_seller_in_db(host)
+        snapshot = take_seller_snapshot(seller) if seller else None
+        cache.set(
+            cache_key,
+            snapshot if snapshot is not None else NO_SELLER,
+            SELLER_LOOKUP_CACHE_TTL_SECONDS,
+        )
+        return snapshot
+
+
+class TenantScope:
+    """Seller tenant of a request and the IDs its querysets are scoped to.
+
+    The seller and its channel come from the resolved snapshot; warehouse and
+    shipping zone IDs are loaded on first use, so requests that don't touch them
+    do no I/O.
+    """
+
+    def __init__(
+        self, seller: "Seller", resolver: Optional["SellerTenantResolver"] = None
+    ):
+        self.seller = seller
+        self.seller_id: UUID = seller.pk
+        self.channel_id: int | None = seller.channel_id
+        self._resolver = resolver or tenant_resolver
+
+    @cached_property
+    def _scope_ids(self) -> SellerScopeIds:
+        return self._resolver.get_scope_ids(self.seller_id)
+
+    @property
+    def warehouse_ids(self) -> frozenset[UUID]:
+        return self._scope_ids[0]
+
+    @property
+    def shipping_zone_ids(self) -> frozenset[int]:
+        return self._scope_ids[1]
+
+    def filter_sellers(self, qs: "QuerySet") -> "QuerySet":
+        return qs.filter(pk=self.seller_id)
+
+    def filter_products(self, qs: "QuerySet") -> "QuerySet":
+        return qs.filter(seller_id=self.seller_id)
+
+    def filter_variants(self, qs: "QuerySet") -> "QuerySet":
+        return qs.filter(product__seller_id=self.seller_id)
+
+    def filter_checkouts(self, qs: "QuerySet") -> "QuerySet":
+        """Limit checkouts to the seller's dedicated storefront channel."""
+        if self.channel_id is None:
+            return qs
+        return qs.filter(channel_id=self.channel_id)
+
+    def filter_orders(self, qs: "QuerySet") -> "QuerySet":
+        from .models import SellerOrder
+
+        return qs.filter(
+            pk__in=SellerOrder.objects.using(qs.db)
+            .filter(seller_id=self.seller_id)
+            .values("order_id")
+        )
+
+    def filter_warehouses(self, qs: "QuerySet") -> "QuerySet":
+        return qs.filter(pk__in=self.warehouse_ids)
+
+    def filter_shipping_zones(self, qs: "QuerySet") -> "QuerySet":
+        return qs.filter(pk__in=self.shipping_zone_ids)
+
+
+def get_shared_cache_version() -> int:
+    return cache.get_or_set(SELLER_LOOKUP_CACHE_VERSION_KEY, 1, timeout=None)
+
+
+def bump_shared_cache_version() -> None:
+    try:
+        cache.incr(SELLER_LOOKUP_CACHE_VERSION_KEY)
+    except ValueError:
+        # The key expired or was evicted; any new version makes old keys stale.
+        cache.set(SELLER_LOOKUP_CACHE_VERSION_KEY, int(time.time()), timeout=None)
+
+
+tenant_resolver = SellerTenantResolver(
+    max_size=settings.SELLER_TENANT_LOCAL_CACHE_SIZE,
+    local_ttl=settings.SELLER_TENANT_LOCAL_CACHE_TTL,
+)
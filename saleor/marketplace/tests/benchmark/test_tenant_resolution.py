@@ -0,0 +1,51 @@
+"""Throughput benchmark of `SellerTenantMiddleware` on a warm worker.
+
+Run with `pytest -s` to see the requests/sec for each number of seller domains.
+"""
+
+import random
+import time
+
+import pytest
+from django.test import RequestFactory
+
+from ... import middleware
+from ...models import Seller
+from ...tenant import SellerTenantResolver, take_seller_snapshot
+
+REQUESTS_COUNT = 20_000
+
+
+@pytest.mark.parametrize("domains_count", [1_000, 10_000, 100_000])
+def test_tenant_resolution_throughput(
+    domains_count, db, settings, monkeypatch, django_assert_num_queries
+):
+    # given
+    settings.ALLOWED_HOSTS = ["*"]
+    resolver = SellerTenantResolver(max_size=domains_count, local_ttl=3600)
+    hosts = [f"store-{i}.example.com" for i in range(domains_count)]
+    for i, host in enumerate(hosts):
+        seller = Seller(store_name=f"Store {i}", slug=f"store-{i}")
+        resolver.remember(host, take_seller_snapshot(seller))
+    monkeypatch.setattr(middleware, "tenant_resolver", resolver)
+
+    rf = RequestFactory()
+    requests = [
+        rf.get("/graphql/", HTTP_HOST=random.choice(hosts))
+        for _ in range(REQUESTS_COUNT)
+    ]
+    tenant_middleware = middleware.SellerTenantMiddleware(lambda request: None)
+
+    # when
+    with django_assert_num_queries(0):
+        start = time.perf_counter()
+        for request in requests:
+            tenant_middleware.process_request(request)
+        elapsed = time.perf_counter() - start
+
+    # then
+    assert all(request.marketplace_seller is not None for request in requests)
+    print(  # noqa: T201
+        f"\n{domains_count} seller domains: "
+        f"{REQUESTS_COUNT / elapsed:,.0f} requests/sec"
+    )
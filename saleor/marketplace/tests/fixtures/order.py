@@ -0,0 +1,84 @@
+"""Pytest fixtures for marketplace orders."""
+
+from decimal import Decimal
+
+import pytest
+
+from ....order.models import OrderLine
+from ....product.models import Product
+
+
+@pytest.fixture
+def order_lines_with_sellers(db, seller, product):
+    """Create order lines with different sellers."""
+    from ....order.models import Order
+    from ....product.models import ProductVariant
+
+    order = Order.objects.create(
+        currency="USD",
+        total_net_amount=Decimal("100.00"),
+        total_gross_amount=Decimal("120.00"),
+    )
+
+    # Create product variant
+    variant = ProductVariant.objects.create(
+        product=product,
+        sku="TEST-SKU-1",
+    )
+
+    # Create order lines
+    line1 = OrderLine.objects.create(
+        order=order,
+        product=product,
+        variant=variant,
+        product_name="Product 1",
+        variant_name="Variant 1",
+        quantity=1,
+        unit_price_net_amount=Decimal("50.00"),
+        unit_price_gross_amount=Decimal("60.00"),
+        total_price_net_amount=Decimal("50.00"),
+        total_price_gross_amount=Decimal("60.00"),
+        seller=seller,
+        seller_name=seller.store_name,
+    )
+
+    # Create another seller and product
+    from ....account.models import User
+    from ....channel.models import Channel
+    from ...models import Seller, SellerStatus
+
+    seller2 = Seller.objects.create(
+        store_name="Seller 2",
+        slug="seller-2",
+        owner=User.objects.create_user(email="seller2@example.com"),
+        channel=Channel.objects.first(),
+        status=SellerStatus.ACTIVE,
+    )
+    product2 = Product.objects.create(
+        name="Product 2",
+        slug="product-2",
+        product_type=product.product_type,
+    )
+    variant2 = ProductVariant.objects.create(
+        product=product2,
+        sku="TEST-SKU-2",
+    )
+    product2.seller = seller2
+    product2.save()
+
+    line2 = OrderLine.objects.create(
+        order=order,
+        product=product2,
+        variant=variant2,
+        product_name="Product 2",
+        variant_name="Variant 2",
+        quantity=1,
+        unit_price_net_amount=Decimal("50.00"),
+        unit_price_gross_amount=Decimal("60.00"),
+        total_price_net_amount=Decimal("50.00"),
+        total_price_gross_amount=Decimal("60.00"),
+        seller=seller2,
+        seller_name=seller2.store_name,
+    )
+
+    return [line1, line2]
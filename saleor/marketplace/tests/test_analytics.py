@@ -0,0 +1,119 @@
+import datetime
+from decimal import Decimal
+
+from django.utils import timezone
+
+from ..analytics import (
+    backfill_seller_analytics,
+    get_bucket_date,
+    get_seller_analytics_totals,
+    refresh_seller_analytics,
+)
+from ..models import SellerAnalyticsDaily, SellerSettlement, SettlementStatus
+
+
+def _create_settlement(seller, order, order_total, status=SettlementStatus.PENDING):
+    return SellerSettlement.objects.create(
+        seller=seller,
+        order=order,
+        order_total=order_total,
+        platform_fee=order_total / 10,
+        seller_earnings=order_total - order_total / 10,
+        currency=order.currency,
+        status=status,
+    )
+
+
+def test_refresh_seller_analytics(order_lines_with_sellers, seller):
+    # given
+    order = order_lines_with_sellers[0].order
+    settlement = _create_settlement(seller, order, Decimal("60.00"))
+    day = get_bucket_date(settlement.created_at)
+
+    # when
+    refresh_seller_analytics([(seller.pk, day)])
+
+    # then
+    bucket = SellerAnalyticsDaily.objects.get(seller=seller, date=day)
+    assert bucket.revenue == Decimal("60.00")
+    assert bucket.earnings == Decimal("54.00")
+    assert bucket.order_count == 1
+
+
+def test_refresh_seller_analytics_skips_cancelled_settlements(
+    order_lines_with_sellers, seller
+):
+    # given
+    order = order_lines_with_sellers[0].order
+    settlement = _create_settlement(
+        seller, order, Decimal("60.00"), status=SettlementStatus.CANCELLED
+    )
+    day = get_bucket_date(settlement.created_at)
+
+    # when
+    refresh_seller_analytics([(seller.pk, day)])
+
+    # then
+    bucket = SellerAnalyticsDaily.objects.get(seller=seller, date=day)
+    assert bucket.revenue == Decimal("0.00")
+    assert bucket.order_count == 1
+
+
+def test_get_seller_analytics_totals(seller, django_assert_num_queries):
+    # given
+    today = timezone.localdate()
+    SellerAnalyticsDaily.objects.bulk_create(
+        [
+            SellerAnalyticsDaily(
+                seller=seller,
+                date=today - datetime.timedelta(days=days_ago),
+                revenue=Decimal("10.00"),
+                earnings=Decimal("9.00"),
+                order_count=2,
+            )
+            for days_ago in range(40)
+        ]
+    )
+    start_date = timezone.now() - datetime.timedelta(days=9)
+
+    # when
+    with django_assert_num_queries(1):
+        totals = get_seller_analytics_totals(seller, start_date=start_date)
+
+    # then
+    assert totals == {
+        "revenue": Decimal("100.00"),
+        "earnings": Decimal("90.00"),
+        "order_count": 20,
+    }
+
+
+def test_get_seller_analytics_totals_no_buckets(seller):
+    # when
+    totals = get_seller_analytics_totals(seller)
+
+    # then
+    assert totals == {
+        "revenue": Decimal("0.00"),
+        "earnings": Decimal("0.00"),
+        "order_count": 0,
+    }
+
+
+def test_backfill_seller_analytics(order_lines_with_sellers, seller):
+    # given
+    order = order_lines_with_sellers[0].order
+    _create_settlement(seller, order, Decimal("60.00"))
+    stale_day = timezone.localdate() - datetime.timedelta(days=3)
+    SellerAnalyticsDaily.objects.create(
+        seller=seller, date=stale_day, revenue=Decimal("999.00")
+    )
+
+    # when
+    backfill_seller_analytics([seller.pk])
+
+    # then
+    assert not SellerAnalyticsDaily.objects.filter(date=stale_day).exists()
+    totals = get_seller_analytics_totals(seller)
+    assert totals["revenue"] == Decimal("60.00")
+    assert totals["order_count"] == 1
@@ -0,0 +1,130 @@
+import pytest
+
+from ...product.models import ProductChannelListing
+from ..models import FeaturedCollection, FeaturedProduct
+from ..services.featured import (
+    compute_featured_product_ids,
+    get_featured_collection_ids,
+    get_featured_product_ids,
+    invalidate_featured_content,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_featured_content():
+    invalidate_featured_content()
+    yield
+    invalidate_featured_content()
+
+
+@pytest.fixture
+def products(product_list):
+    return sorted(product_list, key=lambda product: product.pk)
+
+
+def test_compute_featured_product_ids_keeps_curated_order(channel_USD, products):
+    # given
+    FeaturedProduct.objects.bulk_create(
+        [
+            FeaturedProduct(channel=channel_USD, product=products[2], sort_order=0),
+            FeaturedProduct(channel=channel_USD, product=products[0], sort_order=1),
+        ]
+    )
+
+    # when
+    product_ids = compute_featured_product_ids(channel_USD.pk)
+
+    # then
+    assert product_ids == [products[2].pk, products[0].pk]
+
+
+def test_compute_featured_product_ids_appends_featured_collection_products(
+    channel_USD, products, published_collection
+):
+    # given
+    FeaturedProduct.objects.create(channel=channel_USD, product=products[1])
+    published_collection.products.add(products[1], products[0])
+    FeaturedCollection.objects.create(
+        channel=channel_USD, collection=published_collection
+    )
+
+    # when
+    product_ids = compute_featured_product_ids(channel_USD.pk)
+
+    # then
+    assert product_ids == [products[1].pk, products[0].pk]
+
+
+def test_compute_featured_product_ids_skips_unpublished_products(
+    channel_USD, channel_PLN, products
+):
+    # given
+    ProductChannelListing.objects.filter(product=products[0]).update(is_published=False)
+    FeaturedProduct.objects.bulk_create(
+        [
+            FeaturedProduct(channel=channel_USD, product=products[0]),
+            FeaturedProduct(channel=channel_USD, product=products[1]),
+            FeaturedProduct(channel=channel_PLN, product=products[2]),
+        ]
+    )
+
+    # when
+    product_ids = compute_featured_product_ids(channel_USD.pk)
+
+    # then
+    assert product_ids == [products[1].pk]
+
+
+def test_get_featured_product_ids_served_from_cache(
+    channel_USD, products, django_assert_num_queries
+):
+    # given
+    FeaturedProduct.objects.create(channel=channel_USD, product=products[0])
+    get_featured_product_ids(channel_USD.pk)
+
+    # when
+    with django_assert_num_queries(0):
+        product_ids = get_featured_product_ids(channel_USD.pk)
+
+    # then
+    assert product_ids == [products[0].pk]
+
+
+def test_featured_content_invalidated_after_featuring_changes(
+    channel_USD, products, published_collection, django_capture_on_commit_callbacks
+):
+    # given
+    assert get_featured_product_ids(channel_USD.pk) == []
+    assert get_featured_collection_ids(channel_USD.pk) == []
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        FeaturedProduct.objects.create(channel=channel_USD, product=products[0])
+        FeaturedCollection.objects.create(
+            channel=channel_USD, collection=published_collection
+        )
+
+    # then
+    assert get_featured_product_ids(channel_USD.pk) == [products[0].pk]
+    assert get_featured_collection_ids(channel_USD.pk) == [published_collection.pk]
+
+
+def test_featured_content_invalidated_after_listing_is_published(
+    channel_USD, products, django_capture_on_commit_callbacks
+):
+    # given
+    listing = ProductChannelListing.objects.get(
+        product=products[0], channel=channel_USD
+    )
+    listing.is_published = False
+    listing.save(update_fields=["is_published"])
+    FeaturedProduct.objects.create(channel=channel_USD, product=products[0])
+    assert get_featured_product_ids(channel_USD.pk) == []
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        listing.is_published = True
+        listing.save(update_fields=["is_published"])
+
+    # then
+    assert get_featured_product_ids(channel_USD.pk) == [products[0].pk]
@@ -0,0 +1,158 @@
+import datetime
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from redis import ConnectionPool
+
+from ..models_help import (
+    HelpArticle,
+    HelpArticleDailyViews,
+    HelpArticleView,
+    HelpCategory,
+)
+from ..services.help_views import (
+    delete_old_help_article_views,
+    flush_help_article_views,
+    get_help_article_view_buffer,
+    get_top_help_article_ids,
+    record_help_article_view,
+)
+
+BROKER_URL = "redis://fake-redis"
+
+
+@pytest.fixture
+def help_article_view_buffer(settings):
+    settings.HELP_ARTICLE_VIEW_BUFFER_BROKER_URL = BROKER_URL
+    server = fakeredis.FakeServer()
+    server.connected = True
+    with patch(
+        "saleor.webhook.observability.buffers.RedisBuffer.get_or_create_connection_pool",
+        return_value=ConnectionPool(
+            connection_class=fakeredis.FakeConnection, server=server
+        ),
+    ):
+        yield get_help_article_view_buffer()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def help_category(db):
+    return HelpCategory.objects.create(name="Shipping", slug="shipping")
+
+
+@pytest.fixture
+def help_articles(help_category):
+    return HelpArticle.objects.bulk_create(
+        [
+            HelpArticle(
+                title=f"Article {i}",
+                slug=f"article-{i}",
+                content="Content",
+                category=help_category,
+            )
+            for i in range(3)
+        ]
+    )
+
+
+def test_record_help_article_view_without_buffer_stores_view(
+    help_articles, customer_user, settings
+):
+    # given
+    settings.HELP_ARTICLE_VIEW_BUFFER_BROKER_URL = None
+    article = help_articles[0]
+
+    # when
+    record_help_article_view(
+        article.pk, customer_user, ip_address="127.0.0.1", user_agent="browser"
+    )
+
+    # then
+    view = HelpArticleView.objects.get()
+    assert view.user == customer_user
+    assert view.ip_address == "127.0.0.1"
+    assert HelpArticleDailyViews.objects.get(article=article).views_count == 1
+    article.refresh_from_db()
+    assert article.views_count == 1
+
+
+def test_record_help_article_view_does_not_write_to_database(
+    help_articles, help_article_view_buffer, django_assert_num_queries
+):
+    # when
+    with django_assert_num_queries(0):
+        record_help_article_view(help_articles[0].pk, user_agent="browser")
+
+    # then
+    assert help_article_view_buffer.size() == 1
+    assert not HelpArticleView.objects.exists()
+
+
+def test_flush_help_article_views_updates_rollups(
+    help_articles, help_article_view_buffer
+):
+    # given
+    first, second, _ = help_articles
+    for article in [first, second, first]:
+        record_help_article_view(article.pk)
+    record_help_article_view(first.pk)
+
+    # when
+    stored, remaining = flush_help_article_views(help_article_view_buffer)
+
+    # then
+    assert (stored, remaining) == (4, 0)
+    assert HelpArticleView.objects.count() == 4
+    assert dict(
+        HelpArticleDailyViews.objects.values_list("article_id", "views_count")
+    ) == {first.pk: 3, second.pk: 1}
+    first.refresh_from_db()
+    assert first.views_count == 3
+
+
+def test_top_help_articles_refreshed_after_flush(
+    help_category, help_articles, help_article_view_buffer
+):
+    # given
+    first, second, _ = help_articles
+    record_help_article_view(first.pk)
+    flush_help_article_views(help_article_view_buffer)
+    assert get_top_help_article_ids(help_category.pk) == [first.pk]
+
+    # when
+    record_help_article_view(second.pk)
+    record_help_article_view(second.pk)
+    flush_help_article_views(help_article_view_buffer)
+
+    # then
+    assert get_top_help_article_ids(help_category.pk) == [second.pk, first.pk]
+    assert get_top_help_article_ids(None) == [second.pk, first.pk]
+
+
+def test_delete_old_help_article_views_keeps_rollups(help_articles, settings):
+    # given
+    settings.HELP_ARTICLE_VIEW_BUFFER_BROKER_URL = None
+    settings.HELP_ARTICLE_VIEW_RETENTION = datetime.timedelta(days=30)
+    now = timezone.now()
+    article = help_articles[0]
+    record_help_article_view(article.pk)
+    HelpArticleView.objects.update(viewed_at=now - datetime.timedelta(days=31))
+    record_help_article_view(article.pk)
+
+    # when
+    deleted = delete_old_help_article_views(now=now, batch_size=1)
+
+    # then
+    assert deleted == 1
+    assert HelpArticleView.objects.count() == 1
+    assert HelpArticleDailyViews.objects.get(article=article).views_count == 2
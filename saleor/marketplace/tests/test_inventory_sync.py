@@ -0,0 +1,135 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+
+from ...product.models import Product, ProductVariant
+from ...warehouse.models import Reservation, Stock
+from ..models import FulfillmentCenter, InventorySync
+from ..services.inventory_sync import sync_all_inventory_for_seller
+
+
+@pytest.fixture
+def fulfillment_center(warehouses):
+    center = FulfillmentCenter.objects.create(
+        name="Liverpool", location="Liverpool, UK", country="GB"
+    )
+    center.warehouses.add(*warehouses)
+    return center
+
+
+def test_sync_all_inventory_for_seller(
+    seller, product, warehouses, fulfillment_center, checkout_line
+):
+    # given
+    product.seller = seller
+    product.save(update_fields=["seller"])
+    variant = product.variants.get()
+    stock = Stock.objects.create(
+        warehouse=warehouses[0], product_variant=variant, quantity=15
+    )
+    Reservation.objects.create(
+        checkout_line=checkout_line,
+        stock=stock,
+        quantity_reserved=3,
+        reserved_until=timezone.now() + datetime.timedelta(minutes=5),
+    )
+    Reservation.objects.create(
+        checkout_line=checkout_line,
+        stock=stock,
+        quantity_reserved=4,
+        reserved_until=timezone.now() - datetime.timedelta(minutes=5),
+    )
+
+    # when
+    result = sync_all_inventory_for_seller(seller, fulfillment_center)
+
+    # then
+    assert result.rows == len(warehouses)
+    syncs = {
+        sync.warehouse_id: sync
+        for sync in InventorySync.objects.filter(product_variant=variant)
+    }
+    assert syncs[warehouses[0].pk].quantity_available == 15
+    assert syncs[warehouses[0].pk].quantity_reserved == 3
+    assert syncs[warehouses[1].pk].quantity_available == 0
+    assert syncs[warehouses[1].pk].quantity_reserved == 0
+
+
+def test_sync_all_inventory_for_seller_updates_existing_rows(
+    seller, product, warehouses, fulfillment_center
+):
+    # given
+    product.seller = seller
+    product.save(update_fields=["seller"])
+    variant = product.variants.get()
+    stock = Stock.objects.create(
+        warehouse=warehouses[0], product_variant=variant, quantity=15
+    )
+    sync_all_inventory_for_seller(seller, fulfillment_center)
+    stock.quantity = 7
+    stock.save(update_fields=["quantity"])
+
+    # when
+    result = sync_all_inventory_for_seller(
+        seller, fulfillment_center, sync_method="manual"
+    )
+
+    # then
+    assert result.rows == len(warehouses)
+    assert InventorySync.objects.count() == len(warehouses)
+    sync = InventorySync.objects.get(product_variant=variant, warehouse=warehouses[0])
+    assert sync.quantity_available == 7
+    assert sync.sync_method == "manual"
+
+
+def test_sync_all_inventory_for_seller_query_count_is_constant(
+    seller,
+    product_type,
+    category,
+    warehouses,
+    fulfillment_center,
+    django_assert_num_queries,
+):
+    # given
+    product = Product.objects.create(
+        name="Seller product",
+        slug="seller-product",
+        product_type=product_type,
+        category=category,
+        seller=seller,
+    )
+    variants = ProductVariant.objects.bulk_create(
+        [ProductVariant(product=product, sku=f"SKU-{i}") for i in range(50)]
+    )
+    Stock.objects.bulk_create(
+        [
+            Stock(warehouse=warehouse, product_variant=variant, quantity=i)
+            for i, variant in enumerate(variants)
+            for warehouse in warehouses
+        ]
+    )
+
+    # when
+    # warehouses + (variant IDs, stock quantities, upsert) per batch + last batch
+    with django_assert_num_queries(1 + 3 * 2 + 1):
+        result = sync_all_inventory_for_seller(
+            seller, fulfillment_center, batch_size=25
+        )
+
+    # then
+    assert result.rows == len(variants) * len(warehouses)
+    assert InventorySync.objects.count() == result.rows
+
+
+def test_sync_all_inventory_for_seller_no_fulfillment_center(seller, product):
+    # given
+    product.seller = seller
+    product.save(update_fields=["seller"])
+
+    # when
+    result = sync_all_inventory_for_seller(seller)
+
+    # then
+    assert result.rows == 0
+    assert not InventorySync.objects.exists()
@@ -0,0 +1,170 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from ...warehouse.models import Stock
+from ..models import FulfillmentCenter, InventorySync, PendingInventorySync
+from ..services import inventory_sync_queue
+from ..services.inventory_sync_queue import (
+    INVENTORY_SYNC_FLUSH_SCHEDULED_CACHE_KEY,
+    enqueue_inventory_sync,
+    flush_inventory_sync_queue,
+)
+from ..tasks import flush_inventory_sync_queue_task
+
+
+@pytest.fixture(autouse=True)
+def clear_inventory_sync_queue_state():
+    inventory_sync_queue._get_pending_stock_keys().clear()
+    cache.delete(INVENTORY_SYNC_FLUSH_SCHEDULED_CACHE_KEY)
+
+
+@pytest.fixture
+def fulfillment_center(warehouse):
+    center = FulfillmentCenter.objects.create(
+        name="Liverpool", location="Liverpool, UK", country="GB"
+    )
+    center.warehouses.add(warehouse)
+    return center
+
+
+@patch("saleor.marketplace.tasks.flush_inventory_sync_queue_task.apply_async")
+def test_stock_changes_are_coalesced_on_commit(
+    mocked_apply_async,
+    product,
+    warehouse,
+    settings,
+    django_capture_on_commit_callbacks,
+    django_assert_num_queries,
+):
+    # given
+    settings.INVENTORY_SYNC_DEBOUNCE = 5
+    stock = Stock.objects.get(product_variant=product.variants.get())
+
+    # when
+    with django_capture_on_commit_callbacks() as callbacks:
+        with transaction.atomic():
+            for quantity in range(10):
+                stock.quantity = quantity
+                stock.save(update_fields=["quantity"])
+
+    # then
+    assert not PendingInventorySync.objects.exists()
+    assert not InventorySync.objects.exists()
+
+    # stock lookup + queue insert
+    with django_assert_num_queries(2):
+        for callback in callbacks:
+            callback()
+
+    pending = PendingInventorySync.objects.get()
+    assert pending.product_variant_id == stock.product_variant_id
+    assert pending.warehouse_id == warehouse.pk
+    mocked_apply_async.assert_called_once_with(countdown=5)
+
+
+@patch("saleor.marketplace.tasks.flush_inventory_sync_queue_task.apply_async")
+def test_enqueue_inventory_sync_skips_missing_stocks(mocked_apply_async, warehouse):
+    # when
+    enqueue_inventory_sync([(-1, warehouse.pk)])
+
+    # then
+    assert not PendingInventorySync.objects.exists()
+    mocked_apply_async.assert_not_called()
+
+
+def test_flush_inventory_sync_queue(product, warehouse, fulfillment_center):
+    # given
+    variant = product.variants.get()
+    Stock.objects.filter(product_variant=variant).update(quantity=42)
+    PendingInventorySync.objects.create(
+        product_variant=variant,
+        warehouse=warehouse,
+        enqueued_at=timezone.now() - datetime.timedelta(seconds=10),
+    )
+
+    # when
+    flushed, remaining = flush_inventory_sync_queue(debounce=5)
+
+    # then
+    assert (flushed, remaining) == (1, 0)
+    assert not PendingInventorySync.objects.exists()
+    sync = InventorySync.objects.get()
+    assert sync.product_variant == variant
+    assert sync.fulfillment_center == fulfillment_center
+    assert sync.warehouse == warehouse
+    assert sync.quantity_available == 42
+    assert sync.sync_method == "webhook"
+
+
+@patch("saleor.marketplace.tasks.flush_inventory_sync_queue_task.apply_async")
+def test_flush_inventory_sync_queue_keeps_stock_changed_during_sync(
+    mocked_apply_async, product, warehouse, fulfillment_center
+):
+    # given
+    variant = product.variants.get()
+    PendingInventorySync.objects.create(
+        product_variant=variant,
+        warehouse=warehouse,
+        enqueued_at=timezone.now() - datetime.timedelta(seconds=10),
+    )
+    sync_inventory_for_stocks = inventory_sync_queue.sync_inventory_for_stocks
+
+    def change_stock_during_sync(stock_keys):
+        stock_keys = list(stock_keys)
+        enqueue_inventory_sync([(variant.pk, warehouse.pk)])
+        sync_inventory_for_stocks(stock_keys)
+
+    # when
+    with patch.object(
+        inventory_sync_queue,
+        "sync_inventory_for_stocks",
+        side_effect=change_stock_during_sync,
+    ):
+        flushed, remaining = flush_inventory_sync_queue(debounce=5)
+
+    # then
+    assert (flushed, remaining) == (1, 1)
+    assert InventorySync.objects.exists()
+    pending = PendingInventorySync.objects.get()
+    assert pending.product_variant == variant
+    assert pending.warehouse == warehouse
+
+
+def test_flush_inventory_sync_queue_waits_for_debounce_window(
+    product, warehouse, fulfillment_center
+):
+    # given
+    PendingInventorySync.objects.create(
+        product_variant=product.variants.get(), warehouse=warehouse
+    )
+
+    # when
+    flushed, remaining = flush_inventory_sync_queue(debounce=5)
+
+    # then
+    assert (flushed, remaining) == (0, 1)
+    assert not InventorySync.objects.exists()
+
+
+@patch("saleor.marketplace.tasks.flush_inventory_sync_queue_task.apply_async")
+def test_flush_inventory_sync_queue_task_reschedules_when_queue_not_empty(
+    mocked_apply_async, product, warehouse, settings
+):
+    # given
+    settings.INVENTORY_SYNC_DEBOUNCE = 5
+    cache.set(INVENTORY_SYNC_FLUSH_SCHEDULED_CACHE_KEY, True)
+    PendingInventorySync.objects.create(
+        product_variant=product.variants.get(), warehouse=warehouse
+    )
+
+    # when
+    flush_inventory_sync_queue_task()
+
+    # then
+    assert PendingInventorySync.objects.exists()
+    mocked_apply_async.assert_called_once_with(countdown=5)
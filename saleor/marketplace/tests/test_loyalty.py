@@ -0,0 +1,208 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from ...order import OrderStatus
+from ...order.models import Order
+from ..models_loyalty import Badge, LoyaltyPointsBalance, UserBadge
+from ..tasks import update_badge_counters_task
+from ..utils_loyalty import (
+    _award_badges,
+    backfill_badges,
+    check_and_award_badges,
+    get_or_create_loyalty_balance,
+    refresh_badge_counters,
+)
+
+
+@pytest.fixture
+def badges(db):
+    return Badge.objects.bulk_create(
+        [
+            Badge(
+                name="First order",
+                slug="first-order",
+                criteria_type="order_count",
+                criteria_value=1,
+                points_reward=50,
+            ),
+            Badge(
+                name="Big spender",
+                slug="big-spender",
+                criteria_type="total_spent",
+                criteria_value=100,
+            ),
+            Badge(
+                name="Collector",
+                slug="collector",
+                criteria_type="loyalty_points",
+                criteria_value=50,
+            ),
+            Badge(
+                name="Staff pick",
+                slug="staff-pick",
+                criteria_type="manual",
+                criteria_value=1,
+            ),
+        ]
+    )
+
+
+def create_orders(user, statuses, total=Decimal("30.00")):
+    return Order.objects.bulk_create(
+        [
+            Order(user=user, status=status, currency="USD", total_gross_amount=total)
+            for status in statuses
+        ]
+    )
+
+
+def test_refresh_badge_counters(customer_user):
+    # given
+    create_orders(
+        customer_user,
+        [
+            OrderStatus.FULFILLED,
+            OrderStatus.PARTIALLY_FULFILLED,
+            OrderStatus.UNFULFILLED,
+        ],
+    )
+
+    # when
+    balances = refresh_badge_counters([customer_user.pk])
+
+    # then
+    balance = LoyaltyPointsBalance.objects.get(user=customer_user)
+    assert balances == {customer_user.pk: balance}
+    assert balance.order_count == 2
+    assert balance.total_spent == Decimal("60.00")
+
+
+def test_check_and_award_badges_uses_counters(customer_user, badges):
+    # given
+    first_order, _, collector, _ = badges
+    balance = get_or_create_loyalty_balance(customer_user)
+    balance.order_count = 1
+    balance.save(update_fields=["order_count"])
+
+    # when
+    check_and_award_badges(customer_user)
+
+    # then
+    # points for the first order badge qualify the user for the collector badge
+    assert set(
+        UserBadge.objects.filter(user=customer_user).values_list("badge", flat=True)
+    ) == {first_order.pk, collector.pk}
+    balance.refresh_from_db()
+    assert balance.lifetime_earned == 50
+
+
+def test_check_and_award_badges_query_count_does_not_depend_on_badges(
+    customer_user, badges, django_assert_num_queries
+):
+    # given
+    Badge.objects.bulk_create(
+        [
+            Badge(
+                name=f"Orders {i}",
+                slug=f"orders-{i}",
+                criteria_type="order_count",
+                criteria_value=10 + i,
+            )
+            for i in range(20)
+        ]
+    )
+    get_or_create_loyalty_balance(customer_user)
+
+    # when
+    with django_assert_num_queries(3):
+        check_and_award_badges(customer_user)
+
+    # then
+    assert not UserBadge.objects.filter(user=customer_user).exists()
+
+
+def test_check_and_award_badges_skips_owned_badges(customer_user, badges):
+    # given
+    first_order = badges[0]
+    UserBadge.objects.create(user=customer_user, badge=first_order)
+    balance = get_or_create_loyalty_balance(customer_user)
+    balance.order_count = 5
+    balance.save(update_fields=["order_count"])
+
+    # when
+    check_and_award_badges(customer_user)
+
+    # then
+    assert UserBadge.objects.filter(user=customer_user, badge=first_order).count() == 1
+    balance.refresh_from_db()
+    assert balance.lifetime_earned == 0
+
+
+def test_award_badges_skips_points_for_badge_awarded_concurrently(
+    customer_user, badges
+):
+    # given
+    first_order = badges[0]
+    balance = get_or_create_loyalty_balance(customer_user)
+    # the badge was awarded by a concurrent evaluation after owned badges were read
+    UserBadge.objects.create(user=customer_user, badge=first_order)
+
+    # when
+    awarded = _award_badges(balance, [first_order], None)
+
+    # then
+    assert awarded == []
+    assert UserBadge.objects.filter(user=customer_user, badge=first_order).count() == 1
+    balance.refresh_from_db()
+    assert balance.lifetime_earned == 0
+
+
+@patch("saleor.marketplace.tasks.update_badge_counters_task.delay")
+def test_order_fulfillment_schedules_badge_counters_update(
+    mocked_delay, customer_user, django_capture_on_commit_callbacks
+):
+    # given
+    [order] = create_orders(customer_user, [OrderStatus.UNFULFILLED])
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        order.status = OrderStatus.FULFILLED
+        order.save(update_fields=["status"])
+
+    # then
+    mocked_delay.assert_called_once_with(customer_user.pk, str(order.pk))
+
+
+def test_update_badge_counters_task(customer_user, badges):
+    # given
+    [order] = create_orders(
+        customer_user, [OrderStatus.FULFILLED], total=Decimal("120.00")
+    )
+
+    # when
+    update_badge_counters_task(customer_user.pk, str(order.pk))
+
+    # then
+    user_badges = UserBadge.objects.filter(user=customer_user)
+    assert {user_badge.badge.slug for user_badge in user_badges} == {
+        "first-order",
+        "big-spender",
+        "collector",
+    }
+    assert {user_badge.order_id for user_badge in user_badges} == {order.pk}
+
+
+def test_backfill_badges(customer_user, staff_user, badges):
+    # given
+    create_orders(customer_user, [OrderStatus.FULFILLED] * 4)
+
+    # when
+    last_user_id, awarded = backfill_badges(batch_size=100)
+
+    # then
+    assert last_user_id == max(customer_user.pk, staff_user.pk)
+    assert awarded == 3
+    assert not LoyaltyPointsBalance.objects.filter(user=staff_user).exists()
+    assert backfill_badges(last_user_id) == (None, 0)
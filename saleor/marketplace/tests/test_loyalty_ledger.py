@@ -0,0 +1,217 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from ...account.models import User
+from ..models_loyalty import LoyaltyPointsBalance, LoyaltyPointsTransaction
+from ..services.loyalty_ledger import (
+    LOYALTY_EXPIRY_CURSOR_CACHE_KEY,
+    credit_points,
+    expire_points,
+    get_expired_points,
+    post_points,
+)
+from ..utils_loyalty import get_or_create_loyalty_balance
+
+EARNED = LoyaltyPointsTransaction.TransactionType.EARNED
+SPENT = LoyaltyPointsTransaction.TransactionType.SPENT
+EXPIRED = LoyaltyPointsTransaction.TransactionType.EXPIRED
+
+
+@pytest.fixture(autouse=True)
+def reset_expiry_cursor():
+    cache.delete(LOYALTY_EXPIRY_CURSOR_CACHE_KEY)
+    yield
+    cache.delete(LOYALTY_EXPIRY_CURSOR_CACHE_KEY)
+
+
+@pytest.fixture
+def users(db):
+    return User.objects.bulk_create(
+        [User(email=f"loyal-{i}@example.com") for i in range(5)]
+    )
+
+
+def test_add_and_spend_points_record_ledger_entries(customer_user):
+    # given
+    balance = get_or_create_loyalty_balance(customer_user)
+
+    # when
+    balance.add_points(100, description="Welcome bonus")
+    balance.spend_points(30, description="Reward")
+
+    # then
+    assert balance.balance == 70
+    assert balance.lifetime_earned == 100
+    assert balance.lifetime_spent == 30
+    entries = LoyaltyPointsTransaction.objects.filter(user=customer_user).order_by(
+        "created_at"
+    )
+    assert [(e.points, e.balance_after, e.transaction_type) for e in entries] == [
+        (100, 100, EARNED),
+        (-30, 70, SPENT),
+    ]
+
+
+def test_spend_points_with_insufficient_balance(customer_user):
+    # given
+    balance = get_or_create_loyalty_balance(customer_user)
+    balance.add_points(10)
+
+    # when
+    with pytest.raises(ValueError, match="Insufficient points balance"):
+        balance.spend_points(20)
+
+    # then
+    balance.refresh_from_db()
+    assert balance.balance == 10
+    assert not LoyaltyPointsTransaction.objects.filter(transaction_type=SPENT).exists()
+
+
+def test_post_points_applies_stale_instance_changes_atomically(customer_user):
+    # given
+    balance = get_or_create_loyalty_balance(customer_user)
+    stale_balance = LoyaltyPointsBalance.objects.get(pk=balance.pk)
+
+    # when
+    balance.add_points(10)
+    stale_balance.add_points(5)
+
+    # then
+    balance.refresh_from_db()
+    assert balance.balance == 15
+    assert balance.lifetime_earned == 15
+
+
+def test_credit_points_query_count_does_not_depend_on_users(
+    users, django_assert_num_queries
+):
+    # given
+    user_ids = [user.pk for user in users]
+
+    # when
+    with django_assert_num_queries(6):
+        credited = credit_points(user_ids, 20, description="Campaign")
+
+    # then
+    assert credited == len(users)
+    assert set(
+        LoyaltyPointsBalance.objects.filter(user_id__in=user_ids).values_list(
+            "balance", "lifetime_earned"
+        )
+    ) == {(20, 20)}
+    assert LoyaltyPointsTransaction.objects.filter(
+        user_id__in=user_ids, points=20, balance_after=20
+    ).count() == len(users)
+
+
+def test_credit_points_in_batches(users):
+    # when
+    credit_points([user.pk for user in users], 5, batch_size=2)
+    credit_points([users[0].pk], 5)
+
+    # then
+    assert LoyaltyPointsBalance.objects.get(user=users[0]).balance == 10
+    assert LoyaltyPointsBalance.objects.get(user=users[4]).balance == 5
+
+
+def test_get_expired_points_spends_soonest_expiring_points_first(customer_user):
+    # given
+    now = timezone.now()
+    post_points({customer_user.pk: 100}, EARNED)
+    post_points(
+        {customer_user.pk: 50}, EARNED, expires_at=now - datetime.timedelta(days=1)
+    )
+    post_points({customer_user.pk: -30}, SPENT)
+
+    # when
+    expired = get_expired_points([customer_user.pk], now)
+
+    # then
+    assert expired == {customer_user.pk: 20}
+
+
+def test_expire_points(customer_user, staff_user):
+    # given
+    now = timezone.now()
+    past = now - datetime.timedelta(hours=1)
+    post_points({customer_user.pk: 40, staff_user.pk: 10}, EARNED, expires_at=past)
+    post_points({staff_user.pk: -10}, SPENT)
+    post_points(
+        {customer_user.pk: 25}, EARNED, expires_at=now + datetime.timedelta(days=1)
+    )
+
+    # when
+    expired, has_more = expire_points(now=now, batch_size=10)
+
+    # then
+    assert (expired, has_more) == (1, False)
+    assert LoyaltyPointsBalance.objects.get(user=customer_user).balance == 25
+    assert LoyaltyPointsBalance.objects.get(user=staff_user).balance == 0
+    entry = LoyaltyPointsTransaction.objects.get(transaction_type=EXPIRED)
+    assert (entry.user_id, entry.points, entry.balance_after) == (
+        customer_user.pk,
+        -40,
+        25,
+    )
+
+
+def test_expire_points_reads_ledger_after_locking_balances(customer_user):
+    # given
+    now = timezone.now()
+    post_points(
+        {customer_user.pk: 40}, EARNED, expires_at=now - datetime.timedelta(hours=1)
+    )
+    locked_before_read = []
+
+    def read_expired_points(user_ids, now):
+        locked_before_read.append(
+            any("FOR UPDATE" in query["sql"] for query in ctx.captured_queries)
+        )
+        return get_expired_points(user_ids, now)
+
+    # when
+    with (
+        CaptureQueriesContext(connection) as ctx,
+        patch(
+            "saleor.marketplace.services.loyalty_ledger.get_expired_points",
+            side_effect=read_expired_points,
+        ),
+    ):
+        expire_points(now=now, batch_size=10)
+
+    # then
+    assert locked_before_read == [True]
+    assert LoyaltyPointsBalance.objects.get(user=customer_user).balance == 0
+
+
+def test_expire_points_in_chunks_is_idempotent(users):
+    # given
+    now = timezone.now()
+    post_points(
+        {user.pk: 10 for user in users},
+        EARNED,
+        expires_at=now - datetime.timedelta(minutes=5),
+    )
+
+    # when
+    results = [expire_points(now=now, batch_size=2) for _ in range(3)]
+    cache.delete(LOYALTY_EXPIRY_CURSOR_CACHE_KEY)
+    rerun = expire_points(now=now, batch_size=10)
+
+    # then
+    assert results == [(2, True), (2, True), (1, False)]
+    assert rerun == (0, False)
+    assert LoyaltyPointsTransaction.objects.filter(
+        transaction_type=EXPIRED
+    ).count() == len(users)
+    assert set(
+        LoyaltyPointsBalance.objects.filter(user__in=users).values_list(
+            "balance", flat=True
+        )
+    ) == {0}
@@ -0,0 +1,181 @@
+import pytest
+
+from ...warehouse.models import Stock
+from ..models import FulfillmentCenter, OrderRoutingRule
+from ..services.order_routing import (
+    get_routing_table,
+    invalidate_routing_table,
+    route_order_lines,
+    route_order_to_fulfillment_center,
+    split_order_by_fulfillment_center,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_routing_table():
+    invalidate_routing_table()
+    yield
+    invalidate_routing_table()
+
+
+@pytest.fixture
+def routed_order(order_lines_with_sellers, address):
+    order = order_lines_with_sellers[0].order
+    order.shipping_address = address
+    order.save(update_fields=["shipping_address"])
+    return order
+
+
+@pytest.fixture
+def fulfillment_centers(warehouses):
+    centers = [
+        FulfillmentCenter.objects.create(
+            name=f"Center {i}", location="Somewhere", country="PL", priority=i
+        )
+        for i in range(len(warehouses))
+    ]
+    for center, warehouse in zip(centers, warehouses, strict=True):
+        center.warehouses.add(warehouse)
+    return centers
+
+
+def test_route_order_to_fulfillment_center_matches_country(
+    routed_order, fulfillment_centers
+):
+    # given
+    us_center, pl_center = fulfillment_centers
+    OrderRoutingRule.objects.create(
+        name="US",
+        fulfillment_center=us_center,
+        priority=1,
+        conditions={"countries": ["US"]},
+    )
+    OrderRoutingRule.objects.create(
+        name="PL",
+        fulfillment_center=pl_center,
+        priority=2,
+        conditions={"countries": ["PL"]},
+    )
+
+    # when
+    center = route_order_to_fulfillment_center(routed_order)
+
+    # then
+    assert center == pl_center
+
+
+def test_route_order_to_fulfillment_center_matches_seller(
+    routed_order, fulfillment_centers, seller
+):
+    # given
+    other_center, seller_center = fulfillment_centers
+    OrderRoutingRule.objects.create(
+        name="Other seller",
+        fulfillment_center=other_center,
+        priority=1,
+        conditions={"seller_ids": ["00000000-0000-0000-0000-000000000000"]},
+    )
+    OrderRoutingRule.objects.create(
+        name="Seller",
+        fulfillment_center=seller_center,
+        priority=2,
+        conditions={"seller_ids": [str(seller.pk)]},
+    )
+
+    # when
+    center = route_order_to_fulfillment_center(routed_order, seller=seller)
+
+    # then
+    assert center == seller_center
+
+
+def test_route_order_lines_require_inventory(
+    routed_order, order_lines_with_sellers, fulfillment_centers, warehouses
+):
+    # given
+    line_1, line_2 = order_lines_with_sellers
+    empty_center, stocked_center = fulfillment_centers
+    Stock.objects.create(
+        warehouse=warehouses[1], product_variant=line_1.variant, quantity=5
+    )
+    OrderRoutingRule.objects.create(
+        name="Empty",
+        fulfillment_center=empty_center,
+        priority=1,
+        conditions={"require_inventory": True},
+    )
+    OrderRoutingRule.objects.create(
+        name="Stocked",
+        fulfillment_center=stocked_center,
+        priority=2,
+        conditions={"require_inventory": True},
+    )
+
+    # when
+    centers = route_order_lines(routed_order)
+
+    # then
+    assert centers[line_1.seller_id] == stocked_center
+    # no rule matches, so the first active fulfillment center is used
+    assert centers[line_2.seller_id] == empty_center
+
+
+def test_route_order_lines_on_warm_table_runs_single_query(
+    routed_order,
+    order_lines_with_sellers,
+    fulfillment_centers,
+    django_assert_num_queries,
+):
+    # given
+    for priority, center in enumerate(fulfillment_centers):
+        OrderRoutingRule.objects.create(
+            name=center.name,
+            fulfillment_center=center,
+            priority=priority,
+            conditions={"countries": ["PL"], "require_inventory": True},
+        )
+    lines = list(routed_order.lines.all())
+    get_routing_table()
+
+    # when
+    with django_assert_num_queries(1):
+        centers = route_order_lines(routed_order, lines)
+
+    # then
+    assert set(centers) == {line.seller_id for line in lines}
+
+
+def test_split_order_by_fulfillment_center(
+    routed_order, order_lines_with_sellers, fulfillment_centers, seller
+):
+    # given
+    other_center, seller_center = fulfillment_centers
+    seller.logistics_config.primary_fulfillment_center = seller_center
+    seller.logistics_config.save(update_fields=["primary_fulfillment_center"])
+    invalidate_routing_table()
+
+    # when
+    lines_by_center = split_order_by_fulfillment_center(routed_order)
+
+    # then
+    line_1, line_2 = order_lines_with_sellers
+    assert lines_by_center == {seller_center: [line_1], other_center: [line_2]}
+
+
+def test_routing_table_is_rebuilt_after_rule_change(
+    routed_order, fulfillment_centers, django_capture_on_commit_callbacks
+):
+    # given
+    first_center, second_center = fulfillment_centers
+    assert route_order_to_fulfillment_center(routed_order) == first_center
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        OrderRoutingRule.objects.create(
+            name="Second",
+            fulfillment_center=second_center,
+            conditions={"countries": ["PL"]},
+        )
+
+    # then
+    assert route_order_to_fulfillment_center(routed_order) == second_center
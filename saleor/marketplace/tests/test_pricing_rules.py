@@ -0,0 +1,193 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+from freezegun import freeze_time
+from prices import Money
+
+from ...checkout.calculations import calculate_checkout_total
+from ...checkout.fetch import fetch_checkout_info, fetch_checkout_lines
+from ...plugins.manager import get_plugins_manager
+from ...product.models import Product, ProductChannelListing
+from ...product.utils.variant_prices import update_discounted_prices_for_promotion
+from ..models import PricingRule, PricingType
+from ..services.pricing_rules import (
+    CompiledPricingRule,
+    PricingRuleSet,
+    mark_products_with_passed_rule_boundaries_dirty,
+)
+
+
+def compiled_rule(pricing_type, discount_percentage=None, fixed_price=None):
+    return CompiledPricingRule(
+        pricing_type=pricing_type,
+        discount_percentage=discount_percentage,
+        fixed_price=fixed_price,
+        country=None,
+        valid_from=None,
+        valid_until=None,
+    )
+
+
+@pytest.mark.parametrize(
+    ("rule", "expected_price"),
+    [
+        (compiled_rule(PricingType.RRP, fixed_price=Decimal(8)), Money(8, "USD")),
+        (compiled_rule(PricingType.RRP, fixed_price=Decimal(12)), Money(10, "USD")),
+        (
+            compiled_rule(PricingType.COST_PLUS, discount_percentage=Decimal(50)),
+            Money(6, "USD"),
+        ),
+        (
+            compiled_rule(PricingType.COST_PLUS, fixed_price=Decimal(2)),
+            Money(6, "USD"),
+        ),
+        (
+            compiled_rule(PricingType.PROMOTIONAL, discount_percentage=Decimal(20)),
+            Money(8, "USD"),
+        ),
+        (compiled_rule(PricingType.SEASONAL, fixed_price=Decimal(7)), Money(7, "USD")),
+        (compiled_rule(PricingType.SEASONAL), None),
+    ],
+)
+def test_compiled_pricing_rule_get_price(rule, expected_price):
+    # when
+    price = rule.get_price(Money(10, "USD"), Money(4, "USD"))
+
+    # then
+    assert price == expected_price
+
+
+def test_pricing_rule_set_prefers_product_rules(product, seller):
+    # given
+    product.seller = seller
+    product.save(update_fields=["seller"])
+    now = timezone.now()
+    PricingRule.objects.bulk_create(
+        [
+            PricingRule(
+                seller=seller,
+                pricing_type=PricingType.PROMOTIONAL,
+                discount_percentage=Decimal(50),
+            ),
+            PricingRule(
+                product=product,
+                pricing_type=PricingType.PROMOTIONAL,
+                discount_percentage=Decimal(10),
+            ),
+            PricingRule(
+                product=product,
+                pricing_type=PricingType.PROMOTIONAL,
+                discount_percentage=Decimal(30),
+                country="PL",
+            ),
+            PricingRule(
+                product=product,
+                pricing_type=PricingType.SEASONAL,
+                fixed_price=Decimal(1),
+                valid_from=now + datetime.timedelta(days=1),
+            ),
+        ]
+    )
+
+    # when
+    rules = PricingRuleSet.load(Product.objects.filter(pk=product.pk), now=now)
+
+    # then
+    assert rules.get_price(product.pk, "US", Money(10, "USD")) == Money(9, "USD")
+    assert rules.get_price(product.pk, "PL", Money(10, "USD")) == Money(7, "USD")
+
+
+def test_update_discounted_prices_applies_pricing_rules(product, channel_USD):
+    # given
+    PricingRule.objects.create(
+        product=product,
+        pricing_type=PricingType.RRP,
+        fixed_price=Decimal("7.50"),
+        country="US",
+    )
+
+    # when
+    update_discounted_prices_for_promotion(Product.objects.filter(pk=product.pk))
+
+    # then
+    variant_listing = product.variants.get().channel_listings.get()
+    assert variant_listing.discounted_price_amount == Decimal("7.50")
+    product_listing = product.channel_listings.get(channel=channel_USD)
+    assert product_listing.discounted_price_amount == Decimal("7.50")
+
+
+def test_checkout_total_uses_pricing_rule_price_beating_promotion(
+    checkout_with_item_on_promotion,
+):
+    # given
+    checkout = checkout_with_item_on_promotion
+    line = checkout.lines.get()
+    product = line.variant.product
+    PricingRule.objects.create(
+        product=product,
+        pricing_type=PricingType.SEASONAL,
+        fixed_price=Decimal(3),
+    )
+    update_discounted_prices_for_promotion(Product.objects.filter(pk=product.pk))
+    variant_listing = line.variant.channel_listings.get()
+    assert variant_listing.pricing_rule_price_amount == Decimal(3)
+    assert not variant_listing.variantlistingpromotionrule.exists()
+
+    manager = get_plugins_manager(allow_replica=False)
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, manager)
+
+    # when
+    total = calculate_checkout_total(
+        manager=manager,
+        checkout_info=checkout_info,
+        lines=lines,
+        address=None,
+        force_update=True,
+    )
+
+    # then
+    assert total.gross == Money(Decimal(3) * line.quantity, checkout.currency)
+    assert not line.discounts.exists()
+
+
+def test_pricing_rule_change_marks_product_listings_dirty(
+    product, django_capture_on_commit_callbacks
+):
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        PricingRule.objects.create(
+            product=product,
+            pricing_type=PricingType.PROMOTIONAL,
+            discount_percentage=Decimal(10),
+        )
+
+    # then
+    assert ProductChannelListing.objects.get(product=product).discounted_price_dirty
+
+
+def test_mark_products_with_passed_rule_boundaries_dirty(product):
+    # given
+    now = timezone.now()
+    PricingRule.objects.bulk_create(
+        [
+            PricingRule(
+                product=product,
+                pricing_type=PricingType.SEASONAL,
+                fixed_price=Decimal(5),
+                valid_from=now + datetime.timedelta(seconds=30),
+            ),
+        ]
+    )
+    mark_products_with_passed_rule_boundaries_dirty(now=now)
+    assert not ProductChannelListing.objects.get(product=product).discounted_price_dirty
+
+    # when
+    with freeze_time(now + datetime.timedelta(minutes=1)):
+        marked = mark_products_with_passed_rule_boundaries_dirty()
+
+    # then
+    assert marked == 1
+    assert ProductChannelListing.objects.get(product=product).discounted_price_dirty
@@ -0,0 +1,196 @@
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ...account.models import User
+from ..models_fandom import Quiz, QuizStats, QuizSubmission
+from ..models_loyalty import LoyaltyPointsBalance, LoyaltyPointsTransaction
+from ..services.quizzes import (
+    QuizAnswerKey,
+    QuizAttempt,
+    get_quiz_answer_keys,
+    get_quiz_leaderboard,
+    score_quiz_submissions,
+)
+from ..utils_fandom import submit_quiz
+
+CORRECT = {"q1": "b", "q2": ["a", "c"]}
+HALF_CORRECT = {"q1": "b", "q2": ["a"]}
+WRONG = {"q1": "a"}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def quiz(db):
+    return Quiz.objects.create(
+        title="Heroes",
+        slug="heroes",
+        questions={
+            "questions": [
+                {"id": "q1", "text": "First?", "correct_answer": "B"},
+                {"id": "q2", "text": "Second?", "correct_answers": ["a", "c"]},
+            ]
+        },
+        points_reward=20,
+    )
+
+
+@pytest.fixture
+def users(db):
+    return User.objects.bulk_create(
+        [User(email=f"fan-{i}@example.com") for i in range(5)]
+    )
+
+
+@pytest.mark.parametrize(
+    ("answers", "expected_score"),
+    [
+        (CORRECT, 100),
+        (HALF_CORRECT, 50),
+        ({"q1": " b ", "q2": ["C", "A"]}, 100),
+        (WRONG, 0),
+        ({}, 0),
+        (None, 0),
+    ],
+)
+def test_quiz_answer_key_score(quiz, answers, expected_score):
+    # given
+    answer_key = QuizAnswerKey.compile(quiz)
+
+    # when
+    score = answer_key.score(answers)
+
+    # then
+    assert score == expected_score
+
+
+def test_answer_key_served_from_cache_until_quiz_changes(
+    quiz, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    # given
+    get_quiz_answer_keys([quiz.pk])
+    with django_assert_num_queries(0):
+        get_quiz_answer_keys([quiz.pk])
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        quiz.questions = [{"id": "q1", "correct_answer": "a"}]
+        quiz.save(update_fields=["questions"])
+
+    # then
+    assert get_quiz_answer_keys([quiz.pk])[quiz.pk].score(WRONG) == 100
+
+
+def test_submit_quiz_awards_points_once(quiz, customer_user):
+    # when
+    submit_quiz(customer_user, quiz, HALF_CORRECT)
+    submission = submit_quiz(customer_user, quiz, CORRECT)
+
+    # then
+    assert submission.score == 100
+    assert submission.points_awarded == 20
+    assert submission.pk == QuizSubmission.objects.get().pk
+    assert QuizSubmission.objects.get().score == 100
+    assert LoyaltyPointsBalance.objects.get(user=customer_user).balance == 20
+    assert LoyaltyPointsTransaction.objects.filter(user=customer_user).count() == 1
+    stats = QuizStats.objects.get(quiz=quiz)
+    assert (stats.submission_count, stats.passed_count, stats.score_sum) == (
+        1,
+        1,
+        100,
+    )
+
+
+def test_score_quiz_submissions_query_count_does_not_depend_on_batch_size(quiz, users):
+    # given
+    with CaptureQueriesContext(connection) as single:
+        score_quiz_submissions([QuizAttempt(users[0].pk, quiz.pk, CORRECT)])
+
+    # when
+    with CaptureQueriesContext(connection) as batch:
+        submissions = score_quiz_submissions(
+            [QuizAttempt(user.pk, quiz.pk, CORRECT) for user in users[1:]]
+        )
+
+    # then
+    assert len(submissions) == 4
+    assert len(batch.captured_queries) <= len(single.captured_queries)
+    stats = QuizStats.objects.get(quiz=quiz)
+    assert (stats.submission_count, stats.passed_count) == (5, 5)
+
+
+def test_score_quiz_submissions_locks_first_submission(quiz, users):
+    # given
+    attempt = QuizAttempt(users[0].pk, quiz.pk, CORRECT)
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        score_quiz_submissions([attempt])
+
+    # then
+    queries = [query["sql"] for query in ctx.captured_queries]
+    submission_table = QuizSubmission._meta.db_table
+    insert_index = next(
+        i
+        for i, sql in enumerate(queries)
+        if sql.startswith(f'INSERT INTO "{submission_table}"')
+        and "ON CONFLICT DO NOTHING" in sql
+    )
+    lock_index = next(
+        i
+        for i, sql in enumerate(queries)
+        if f'FROM "{submission_table}"' in sql and "FOR UPDATE" in sql
+    )
+    assert insert_index < lock_index
+    submission = QuizSubmission.objects.get()
+    assert (submission.score, submission.points_awarded) == (100, 20)
+    stats = QuizStats.objects.get(quiz=quiz)
+    assert (stats.submission_count, stats.passed_count) == (1, 1)
+
+
+def test_get_quiz_leaderboard(quiz, users):
+    # given
+    score_quiz_submissions(
+        [
+            QuizAttempt(users[0].pk, quiz.pk, WRONG),
+            QuizAttempt(users[1].pk, quiz.pk, CORRECT),
+            QuizAttempt(users[2].pk, quiz.pk, HALF_CORRECT),
+        ]
+    )
+
+    # when
+    leaderboard = get_quiz_leaderboard(quiz.pk, limit=2)
+
+    # then
+    assert leaderboard == [(users[1].pk, 100), (users[2].pk, 50)]
+
+
+def test_rebuild_quiz_stats_command_rescores_submissions(quiz, users):
+    # given
+    score_quiz_submissions(
+        [QuizAttempt(user.pk, quiz.pk, HALF_CORRECT) for user in users[:2]]
+    )
+    Quiz.objects.filter(pk=quiz.pk).update(
+        questions=[{"id": "q1", "correct_answer": "b"}]
+    )
+    QuizStats.objects.filter(quiz=quiz).update(submission_count=0, score_sum=0)
+
+    # when
+    call_command("rebuild_quiz_stats", "--rescore")
+
+    # then
+    assert set(QuizSubmission.objects.values_list("score", flat=True)) == {100}
+    stats = QuizStats.objects.get(quiz=quiz)
+    assert (stats.submission_count, stats.passed_count, stats.score_sum) == (
+        2,
+        2,
+        200,
+    )
@@ -0,0 +1,150 @@
+import datetime
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+from django.utils import timezone
+from freezegun import freeze_time
+from redis import ConnectionPool
+
+from ...graphql.context import SaleorContext
+from ...product.models import Product
+from ..dataloaders import RecentlyViewedProductIdsByUserIdLoader
+from ..models import RecentlyViewedProduct
+from ..services.recently_viewed import (
+    ProductView,
+    flush_product_views,
+    get_product_view_buffer,
+    record_product_view,
+    store_product_views,
+)
+
+BROKER_URL = "redis://fake-redis"
+
+
+@pytest.fixture
+def product_view_buffer(settings):
+    settings.PRODUCT_VIEW_BUFFER_BROKER_URL = BROKER_URL
+    server = fakeredis.FakeServer()
+    server.connected = True
+    with patch(
+        "saleor.webhook.observability.buffers.RedisBuffer.get_or_create_connection_pool",
+        return_value=ConnectionPool(
+            connection_class=fakeredis.FakeConnection, server=server
+        ),
+    ):
+        yield get_product_view_buffer()
+
+
+@pytest.fixture
+def products(product_list):
+    return sorted(product_list, key=lambda product: product.pk)
+
+
+def test_record_product_view_without_buffer_stores_view(
+    customer_user, product, settings
+):
+    # given
+    settings.PRODUCT_VIEW_BUFFER_BROKER_URL = None
+
+    # when
+    record_product_view(customer_user, product.pk)
+
+    # then
+    view = RecentlyViewedProduct.objects.get()
+    assert view.user == customer_user
+    assert view.product == product
+
+
+def test_record_product_view_does_not_write_user(
+    customer_user, product, product_view_buffer
+):
+    # given
+    updated_at = customer_user.updated_at
+
+    # when
+    record_product_view(customer_user, product.pk)
+
+    # then
+    customer_user.refresh_from_db()
+    assert customer_user.updated_at == updated_at
+    assert not RecentlyViewedProduct.objects.exists()
+    assert product_view_buffer.size() == 1
+
+
+def test_flush_product_views(customer_user, products, product_view_buffer):
+    # given
+    with freeze_time("2026-10-16 12:00", auto_tick_seconds=1):
+        for product in [*products, products[0]]:
+            record_product_view(customer_user, product.pk)
+
+    # when
+    stored, remaining = flush_product_views(product_view_buffer)
+
+    # then
+    assert (stored, remaining) == (len(products), 0)
+    assert product_view_buffer.size() == 0
+    # the product viewed again moves to the front
+    assert list(
+        RecentlyViewedProduct.objects.filter(user=customer_user).values_list(
+            "product_id", flat=True
+        )
+    ) == [products[0].pk, *[product.pk for product in reversed(products[1:])]]
+
+
+def test_store_product_views_trims_to_user_limit(customer_user, products):
+    # given
+    now = timezone.now()
+    views = [
+        ProductView(
+            customer_user.pk,
+            product.pk,
+            now + datetime.timedelta(seconds=index),
+            limit=2,
+        )
+        for index, product in enumerate(products)
+    ]
+
+    # when
+    store_product_views(views)
+
+    # then
+    assert set(RecentlyViewedProduct.objects.values_list("product_id", flat=True)) == {
+        products[-1].pk,
+        products[-2].pk,
+    }
+
+
+def test_store_product_views_skips_deleted_products(customer_user, product):
+    # given
+    view = ProductView(customer_user.pk, product.pk, timezone.now())
+    Product.objects.filter(pk=product.pk).delete()
+
+    # when
+    stored = store_product_views([view])
+
+    # then
+    assert stored == 0
+    assert not RecentlyViewedProduct.objects.exists()
+
+
+def test_recently_viewed_product_ids_loader(
+    customer_user, staff_user, products, django_assert_num_queries
+):
+    # given
+    now = timezone.now()
+    store_product_views(
+        [
+            ProductView(customer_user.pk, products[0].pk, now),
+            ProductView(customer_user.pk, products[1].pk, now + datetime.timedelta(1)),
+            ProductView(staff_user.pk, products[2].pk, now),
+        ]
+    )
+
+    # when
+    loader = RecentlyViewedProductIdsByUserIdLoader(SaleorContext())
+    with django_assert_num_queries(1):
+        product_ids = loader.batch_load([customer_user.pk, staff_user.pk])
+
+    # then
+    assert product_ids == [[products[1].pk, products[0].pk], [products[2].pk]]
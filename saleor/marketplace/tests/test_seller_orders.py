@@ -0,0 +1,142 @@
+import datetime
+
+from django.utils import timezone
+
+from ...checkout.complete_checkout import create_order_from_checkout
+from ...checkout.fetch import fetch_checkout_info, fetch_checkout_lines
+from ...order import OrderStatus
+from ...order.actions import create_replace_order
+from ...order.fetch import OrderLineInfo
+from ...order.tasks import expire_orders_task
+from ...plugins.manager import get_plugins_manager
+from ..models import SellerOrder
+from ..services.seller_orders import refresh_seller_orders
+
+
+def test_create_order_from_checkout_creates_seller_orders(
+    checkout_with_item, customer_user, seller, app
+):
+    # given
+    checkout = checkout_with_item
+    checkout.user = customer_user
+    checkout.billing_address = customer_user.default_billing_address
+    checkout.shipping_address = customer_user.default_billing_address
+    checkout.save()
+    product = checkout.lines.get().variant.product
+    product.seller = seller
+    product.save(update_fields=["seller"])
+
+    manager = get_plugins_manager(allow_replica=False)
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, manager)
+
+    # when
+    order = create_order_from_checkout(
+        checkout_info=checkout_info, manager=manager, user=None, app=app
+    )
+
+    # then
+    line = order.lines.get()
+    seller_order = SellerOrder.objects.get()
+    assert seller_order.seller == seller
+    assert seller_order.order == order
+    assert seller_order.created_at == order.created_at
+    assert seller_order.status == order.status
+    assert seller_order.subtotal_gross_amount == line.total_price_gross_amount
+    assert seller_order.quantity == line.quantity
+
+
+def test_refresh_seller_orders(order_with_lines, seller):
+    # given
+    first_line, second_line = order_with_lines.lines.all()[:2]
+    first_line.seller = seller
+    first_line.save(update_fields=["seller"])
+    SellerOrder.objects.all().delete()
+
+    # when
+    stored = refresh_seller_orders([order_with_lines.pk])
+
+    # then
+    assert stored == 1
+    seller_order = SellerOrder.objects.get()
+    assert seller_order.subtotal_net_amount == first_line.total_price_net_amount
+    assert seller_order.quantity == first_line.quantity
+
+
+def test_seller_orders_follow_line_changes(
+    order_with_lines, seller, django_capture_on_commit_callbacks
+):
+    # given
+    line = order_with_lines.lines.first()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        line.seller = seller
+        line.save(update_fields=["seller"])
+
+    # then
+    assert SellerOrder.objects.filter(seller=seller).exists()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        line.delete()
+
+    # then
+    assert not SellerOrder.objects.exists()
+
+
+def test_seller_orders_follow_order_status(order_with_lines, seller):
+    # given
+    line = order_with_lines.lines.first()
+    line.seller = seller
+    line.save(update_fields=["seller"])
+    refresh_seller_orders([order_with_lines.pk])
+
+    # when
+    order_with_lines.status = OrderStatus.FULFILLED
+    order_with_lines.save(update_fields=["status"])
+
+    # then
+    assert SellerOrder.objects.get().status == OrderStatus.FULFILLED
+
+
+def test_replace_order_gets_seller_orders(order_with_lines, seller):
+    # given
+    line = order_with_lines.lines.first()
+    line.seller = seller
+    line.save(update_fields=["seller"])
+
+    # when
+    replace_order = create_replace_order(
+        user=None,
+        app=None,
+        original_order=order_with_lines,
+        order_lines_to_replace=[OrderLineInfo(line=line, quantity=1, replace=True)],
+        fulfillment_lines_to_replace=[],
+    )
+
+    # then
+    seller_order = SellerOrder.objects.get(order=replace_order)
+    assert seller_order.seller == seller
+    assert seller_order.quantity == 1
+    assert seller_order.status == replace_order.status
+
+
+def test_expired_orders_update_seller_orders_status(order_with_lines, seller):
+    # given
+    channel = order_with_lines.channel
+    channel.expire_orders_after = 1
+    channel.save(update_fields=["expire_orders_after"])
+    order_with_lines.status = OrderStatus.UNCONFIRMED
+    order_with_lines.created_at = timezone.now() - datetime.timedelta(minutes=10)
+    order_with_lines.save(update_fields=["status", "created_at"])
+    line = order_with_lines.lines.first()
+    line.seller = seller
+    line.save(update_fields=["seller"])
+    refresh_seller_orders([order_with_lines.pk])
+
+    # when
+    expire_orders_task()
+
+    # then
+    assert SellerOrder.objects.get().status == OrderStatus.EXPIRED
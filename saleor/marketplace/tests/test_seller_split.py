@@ -0,0 +1,136 @@
+from decimal import Decimal
+
+import pytest
+
+from ...checkout.fetch import fetch_checkout_info, fetch_checkout_lines
+from ...plugins.manager import get_plugins_manager
+from ..services.seller_split import SellerSplit, distribute, get_order_seller_split
+
+
+@pytest.mark.parametrize(
+    ("amount", "weights", "expected"),
+    [
+        (
+            Decimal("10.00"),
+            {"a": Decimal(1), "b": Decimal(1), "c": Decimal(1)},
+            {"a": Decimal("3.34"), "b": Decimal("3.33"), "c": Decimal("3.33")},
+        ),
+        (
+            Decimal("1.00"),
+            {"a": Decimal(1), "b": Decimal(2)},
+            {"a": Decimal("0.33"), "b": Decimal("0.67")},
+        ),
+        (
+            Decimal("5.00"),
+            {"a": Decimal(0), "b": Decimal(0)},
+            {"a": Decimal("2.50"), "b": Decimal("2.50")},
+        ),
+        (
+            Decimal("-0.01"),
+            {"a": Decimal(1), "b": Decimal(1)},
+            {"a": Decimal("-0.01"), "b": Decimal("0.00")},
+        ),
+        (Decimal("10.00"), {}, {}),
+    ],
+)
+def test_distribute_adds_up_to_amount(amount, weights, expected):
+    # when
+    shares = distribute(amount, weights)
+
+    # then
+    assert shares == expected
+    assert sum(shares.values(), Decimal(0)) == (amount if weights else 0)
+
+
+def test_distribute_uses_currency_precision():
+    # when
+    shares = distribute(Decimal(100), {"a": Decimal(1), "b": Decimal(2)}, 0)
+
+    # then
+    assert shares == {"a": Decimal(33), "b": Decimal(67)}
+
+
+def test_seller_split_allocations(order_lines_with_sellers):
+    # given
+    first, second = order_lines_with_sellers
+    first.total_price_gross_amount = Decimal("20.00")
+
+    # when
+    split = SellerSplit(order_lines_with_sellers, currency="USD")
+
+    # then
+    assert split.sellers == [first.seller, second.seller]
+    assert split.subtotals == {
+        first.seller: Decimal("20.00"),
+        second.seller: Decimal("60.00"),
+    }
+    assert split.allocate_discount(Decimal("10.01")) == {
+        first.seller: Decimal("2.50"),
+        second.seller: Decimal("7.51"),
+    }
+    assert split.allocate_shipping(Decimal("5.00"), "equal") == {
+        first.seller: Decimal("2.50"),
+        second.seller: Decimal("2.50"),
+    }
+    with pytest.raises(ValueError, match="Unknown allocation method"):
+        split.allocate_discount(Decimal(1), "weight")
+
+
+def test_get_order_seller_split_is_memoized(
+    order_lines_with_sellers, django_assert_num_queries
+):
+    # given
+    order = order_lines_with_sellers[0].order
+    with django_assert_num_queries(1):
+        split = get_order_seller_split(order)
+
+    # when
+    with django_assert_num_queries(0):
+        memoized = get_order_seller_split(order)
+
+    # then
+    assert memoized is split
+    assert split.seller_ids == {line.seller_id for line in order_lines_with_sellers}
+
+
+def test_get_order_seller_split_is_memoized_by_lines(
+    order_lines_with_sellers, django_assert_num_queries
+):
+    # given
+    first, second = order_lines_with_sellers[:2]
+    order = first.order
+    all_lines_split = get_order_seller_split(order)
+    first_line_split = get_order_seller_split(order, [first])
+
+    # when
+    with django_assert_num_queries(0):
+        second_line_split = get_order_seller_split(order, [second])
+        memoized = get_order_seller_split(order, [first])
+
+    # then
+    assert memoized is first_line_split
+    assert first_line_split is not all_lines_split
+    assert first_line_split.seller_ids == {first.seller_id}
+    assert second_line_split.seller_ids == {second.seller_id}
+
+
+def test_checkout_info_seller_split(checkout_with_item, seller):
+    # given
+    line = checkout_with_item.lines.get()
+    product = line.variant.product
+    product.seller = seller
+    product.save(update_fields=["seller"])
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(
+        checkout_with_item, lines, get_plugins_manager(allow_replica=False)
+    )
+
+    # when
+    split = checkout_info.seller_split
+
+    # then
+    assert checkout_info.seller_split is split
+    assert split.seller_ids == {seller.pk}
+    assert split.subtotals[seller] == (
+        lines[0].variant_discounted_price.amount * line.quantity
+    )
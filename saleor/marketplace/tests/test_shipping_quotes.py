@@ -0,0 +1,173 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from ..models import SellerShippingMethod
+from ..services.shipping_quotes import (
+    ShippingQuoteService,
+    TierTable,
+    invalidate_shipping_quotes,
+    load_seller_shipping_profiles,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_shipping_quotes():
+    invalidate_shipping_quotes()
+    yield
+    invalidate_shipping_quotes()
+
+
+@pytest.fixture
+def tiered_shipping_method(seller):
+    return SellerShippingMethod.objects.create(
+        seller=seller,
+        name="Standard",
+        price=Decimal("10.00"),
+        estimated_days=3,
+        destination_country="PL",
+        tiered_pricing={
+            "weight_tiers": [
+                {"min_weight": 5, "price": "20.00"},
+                {"min_weight": 1, "price": "15.00"},
+            ],
+            "price_tiers": [{"min_price": 100, "price": "5.00"}],
+        },
+    )
+
+
+def test_tier_table_lookup_returns_highest_matching_tier():
+    # given
+    table = TierTable.compile(
+        [
+            {"min_weight": 5, "price": "20.00"},
+            {"min_weight": 1, "price": "15.00"},
+            {"min_weight": 1, "price": "99.00"},
+        ],
+        "min_weight",
+        Decimal("10.00"),
+    )
+
+    # when & then
+    assert table.thresholds == (Decimal(1), Decimal(5))
+    assert table.lookup(Decimal("0.5")) is None
+    assert table.lookup(Decimal(1)) == Decimal("15.00")
+    assert table.lookup(Decimal("4.99")) == Decimal("15.00")
+    assert table.lookup(Decimal(12)) == Decimal("20.00")
+
+
+def test_load_seller_shipping_profiles_runs_one_query_per_model(
+    seller, tiered_shipping_method, shipping_zone, django_assert_num_queries
+):
+    # given
+    seller.logistics_config.shipping_zones.add(shipping_zone)
+
+    # when
+    with django_assert_num_queries(3):
+        profiles = load_seller_shipping_profiles([seller.pk])
+
+    # then
+    profile = profiles[seller.pk]
+    assert profile.has_logistics_config
+    assert profile.shipping_zone_ids == (shipping_zone.pk,)
+    assert [method.id for method in profile.methods] == [tiered_shipping_method.pk]
+
+
+@pytest.mark.parametrize(
+    ("weight", "subtotal", "expected_price"),
+    [
+        (None, Decimal(50), Decimal("10.00")),
+        (None, Decimal(150), Decimal("5.00")),
+        (Decimal(2), Decimal(50), Decimal("15.00")),
+        (Decimal(7), Decimal(150), Decimal("20.00")),
+    ],
+)
+def test_get_quotes_uses_tier_prices(
+    seller, tiered_shipping_method, weight, subtotal, expected_price
+):
+    # given
+    service = ShippingQuoteService([seller.pk])
+
+    # when
+    quotes = service.get_quotes({seller.pk: (weight, subtotal)}, "PL")
+
+    # then
+    [quote] = quotes[seller.pk]
+    assert quote.method_id == tiered_shipping_method.pk
+    assert quote.price == expected_price
+    assert quote.estimated_days == 3
+
+
+def test_get_quotes_skips_methods_for_other_destinations(
+    seller, tiered_shipping_method
+):
+    # given
+    service = ShippingQuoteService([seller.pk])
+
+    # when
+    quotes = service.get_quotes({seller.pk: (None, Decimal(50))}, "DE")
+
+    # then
+    assert quotes[seller.pk] == []
+
+
+def test_get_quotes_applies_free_shipping_and_b2b_discount(
+    seller, tiered_shipping_method
+):
+    # given
+    seller.seller_type = "b2b_wholesale"
+    seller.save(update_fields=["seller_type"])
+    config = seller.logistics_config
+    config.free_shipping_threshold = Decimal(200)
+    config.custom_shipping_methods = {"b2b_discount_factor": "0.5"}
+    config.save(update_fields=["free_shipping_threshold", "custom_shipping_methods"])
+    service = ShippingQuoteService([seller.pk])
+
+    # when
+    quotes = service.get_quotes(
+        {seller.pk: (Decimal(2), Decimal(50))}, "PL", city="Wroclaw"
+    )
+    free_quotes = service.get_quotes({seller.pk: (None, Decimal(250))}, "PL")
+
+    # then
+    assert quotes[seller.pk][0].price == Decimal("7.50")
+    assert free_quotes[seller.pk][0].price == Decimal("0.00")
+
+
+def test_get_quotes_served_from_cache_within_tier_bucket(
+    seller, tiered_shipping_method, django_assert_num_queries
+):
+    # given
+    ShippingQuoteService([seller.pk]).get_quotes(
+        {seller.pk: (Decimal(2), Decimal(50))}, "PL"
+    )
+
+    # when
+    with patch(
+        "saleor.marketplace.services.shipping_quotes.SellerShippingProfile.get_price"
+    ) as mocked_get_price:
+        with django_assert_num_queries(0):
+            service = ShippingQuoteService([seller.pk])
+            quotes = service.get_quotes({seller.pk: (Decimal(3), Decimal(60))}, "PL")
+
+    # then
+    mocked_get_price.assert_not_called()
+    assert quotes[seller.pk][0].price == Decimal("15.00")
+
+
+def test_shipping_quotes_are_invalidated_after_method_change(
+    seller, tiered_shipping_method, django_capture_on_commit_callbacks
+):
+    # given
+    request = {seller.pk: (None, Decimal(50))}
+    ShippingQuoteService([seller.pk]).get_quotes(request, "PL")
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        tiered_shipping_method.price = Decimal("12.00")
+        tiered_shipping_method.save(update_fields=["price"])
+
+    # then
+    quotes = ShippingQuoteService([seller.pk]).get_quotes(request, "PL")
+    assert quotes[seller.pk][0].price == Decimal("12.00")
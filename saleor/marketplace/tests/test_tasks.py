@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from ..models import SellerSettlement
+from ..tasks import (
+    SETTLEMENTS_CHECKPOINT_CACHE_KEY,
+    create_settlements_for_orders_batch,
+    create_settlements_for_orders_task,
+)
+
+
+def test_create_settlements_for_orders_batch_stores_checkpoint(
+    order_lines_with_sellers,
+):
+    # given
+    cache.delete(SETTLEMENTS_CHECKPOINT_CACHE_KEY)
+    order = order_lines_with_sellers[0].order
+
+    # when
+    last_number, created_count = create_settlements_for_orders_batch(
+        start_number=order.number - 1
+    )
+
+    # then
+    assert last_number == order.number
+    assert created_count == 2
+    assert cache.get(SETTLEMENTS_CHECKPOINT_CACHE_KEY) == order.number
+
+
+def test_create_settlements_for_orders_batch_nothing_to_process(db):
+    # given
+    cache.delete(SETTLEMENTS_CHECKPOINT_CACHE_KEY)
+
+    # when
+    last_number, created_count = create_settlements_for_orders_batch(start_number=0)
+
+    # then
+    assert last_number is None
+    assert created_count == 0
+    assert cache.get(SETTLEMENTS_CHECKPOINT_CACHE_KEY) is None
+
+
+@patch("saleor.marketplace.tasks.create_settlements_for_orders_task.delay")
+def test_create_settlements_for_orders_task_schedules_next_batch(
+    mocked_delay,
+    order_lines_with_sellers,
+):
+    # given
+    order = order_lines_with_sellers[0].order
+
+    # when
+    create_settlements_for_orders_task(order.number - 1, None, 10)
+
+    # then
+    assert SellerSettlement.objects.filter(order=order).count() == 2
+    mocked_delay.assert_called_once_with(order.number, None, 10)
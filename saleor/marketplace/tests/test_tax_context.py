@@ -0,0 +1,82 @@
+from decimal import Decimal
+
+from ...tax.models import TaxClassCountryRate
+from ..models import SellerTaxRegistration
+from ..plugins.tax_context import SellerTaxContext, get_order_tax_context
+
+
+def test_seller_tax_context_prefetches_all_lookups(
+    seller, address, default_tax_class, django_assert_num_queries
+):
+    # given
+    seller.tax_origin_address = address
+    seller.save(update_fields=["tax_origin_address"])
+    SellerTaxRegistration.objects.create(
+        seller=seller,
+        registration_type="vat",
+        registration_number="PL123",
+        country="PL",
+    )
+
+    # when
+    # sellers, tax registrations, tax rates
+    with django_assert_num_queries(3):
+        context = SellerTaxContext([seller.pk], [default_tax_class.pk], ["DE"])
+
+    # then
+    with django_assert_num_queries(0):
+        assert context.get_seller(seller.pk) == seller
+        assert context.get_tax_country(seller.pk, "DE") == "PL"
+        assert context.has_tax_registration(seller.pk, "PL")
+        assert not context.has_tax_registration(seller.pk, "DE")
+        assert context.get_tax_rate(default_tax_class.pk, "PL") == Decimal(23)
+        assert context.get_tax_rate(default_tax_class.pk, "DE") == Decimal(19)
+
+
+def test_seller_tax_context_falls_back_to_default_country_rate(
+    seller, default_tax_class
+):
+    # given
+    TaxClassCountryRate.objects.create(country="FR", rate=20, tax_class=None)
+    context = SellerTaxContext([seller.pk], [default_tax_class.pk])
+
+    # when
+    rate = context.get_tax_rate(default_tax_class.pk, "FR")
+
+    # then
+    assert rate == Decimal(20)
+
+
+def test_seller_tax_context_loads_missing_seller_lazily(
+    seller, django_assert_num_queries
+):
+    # given
+    context = SellerTaxContext([], [])
+
+    # when
+    # sellers, tax registrations
+    with django_assert_num_queries(2):
+        first = context.get_seller(seller.pk)
+    with django_assert_num_queries(0):
+        second = context.get_seller(seller.pk)
+
+    # then
+    assert first == second == seller
+
+
+def test_get_order_tax_context_is_memoized(
+    order_lines_with_sellers, django_assert_num_queries
+):
+    # given
+    order = order_lines_with_sellers[0].order
+    context = get_order_tax_context(order)
+
+    # when
+    with django_assert_num_queries(0):
+        memoized_context = get_order_tax_context(order)
+
+    # then
+    assert memoized_context is context
+    assert {line.seller_id for line in order_lines_with_sellers} <= set(
+        context._sellers
+    )
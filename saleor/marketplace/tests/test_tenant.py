@@ -0,0 +1,360 @@
+"""Tests for the tiered seller tenant resolver."""
+
+import pytest
+from django.core.cache import cache
+
+from ...order.models import Order
+from ...product.models import Product
+from ...shipping.models import ShippingZone
+from ...warehouse.models import Warehouse
+from ..middleware import SellerTenantMiddleware
+from ..models import (
+    Seller,
+    SellerDomain,
+    SellerDomainStatus,
+    SellerOrder,
+    SellerStatus,
+    SellerWarehouse,
+)
+from ..tenant import (
+    SellerTenantResolver,
+    TenantScope,
+    hydrate_seller_snapshot,
+    take_seller_snapshot,
+    tenant_resolver,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_tenant_caches():
+    cache.clear()
+    tenant_resolver.clear()
+    yield
+    tenant_resolver.clear()
+
+
+@pytest.fixture
+def tenant_seller(db, customer_user, channel_USD):
+    seller = Seller.objects.create(
+        store_name="Tenant Seller",
+        slug="tenant-seller",
+        owner=customer_user,
+        channel=channel_USD,
+        status=SellerStatus.ACTIVE,
+    )
+    SellerDomain.objects.create(
+        seller=seller,
+        domain="shop.example.com",
+        is_primary=True,
+        status=SellerDomainStatus.ACTIVE,
+    )
+    return seller
+
+
+def test_resolve_by_primary_domain(tenant_seller):
+    # when
+    seller = tenant_resolver.resolve("Shop.Example.com:8000")
+
+    # then
+    assert seller.pk == tenant_seller.pk
+    assert seller.store_name == tenant_seller.store_name
+    assert seller.channel_id == tenant_seller.channel_id
+
+
+def test_resolve_by_subdomain_slug(tenant_seller):
+    # when
+    seller = tenant_resolver.resolve("tenant-seller.marketplace.example.com")
+
+    # then
+    assert seller.pk == tenant_seller.pk
+
+
+def test_resolve_warm_worker_does_no_io(tenant_seller, django_assert_num_queries):
+    # given
+    tenant_resolver.resolve("shop.example.com")
+    cache.clear()
+
+    # when
+    with django_assert_num_queries(0):
+        seller = tenant_resolver.resolve("shop.example.com")
+
+    # then
+    assert seller.pk == tenant_seller.pk
+
+
+def test_resolve_shared_cache_hit_does_no_query(
+    tenant_seller, django_assert_num_queries
+):
+    # given
+    tenant_resolver.resolve("shop.example.com")
+    tenant_resolver.clear()
+
+    # when
+    with django_assert_num_queries(0):
+        seller = tenant_resolver.resolve("shop.example.com")
+
+    # then
+    assert seller.pk == tenant_seller.pk
+
+
+def test_resolve_returns_fresh_instances(tenant_seller):
+    # when
+    first = tenant_resolver.resolve("shop.example.com")
+    first.metadata["key"] = "value"
+    second = tenant_resolver.resolve("shop.example.com")
+
+    # then
+    assert first is not second
+    assert "key" not in second.metadata
+
+
+def test_resolve_unknown_host_is_negatively_cached(db, django_assert_num_queries):
+    # given
+    assert tenant_resolver.resolve("unknown.example.com") is None
+
+    # when
+    with django_assert_num_queries(0):
+        seller = tenant_resolver.resolve("unknown.example.com")
+
+    # then
+    assert seller is None
+
+
+def test_resolve_skips_inactive_seller(tenant_seller):
+    # given
+    tenant_seller.status = SellerStatus.SUSPENDED
+    tenant_seller.save(update_fields=["status"])
+
+    # when
+    seller = tenant_resolver.resolve("shop.example.com")
+
+    # then
+    assert seller is None
+
+
+def test_seller_save_invalidates_cached_resolution(
+    tenant_seller, django_capture_on_commit_callbacks
+):
+    # given
+    assert tenant_resolver.resolve("shop.example.com").store_name == "Tenant Seller"
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        tenant_seller.store_name = "Renamed Seller"
+        tenant_seller.save(update_fields=["store_name"])
+
+    # then
+    assert tenant_resolver.resolve("shop.example.com").store_name == "Renamed Seller"
+
+
+def test_seller_save_invalidates_cached_resolution_on_commit(
+    tenant_seller, django_capture_on_commit_callbacks
+):
+    # given
+    assert tenant_resolver.resolve("shop.example.com").store_name == "Tenant Seller"
+
+    # when
+    with django_capture_on_commit_callbacks() as callbacks:
+        tenant_seller.store_name = "Renamed Seller"
+        tenant_seller.save(update_fields=["store_name"])
+
+    # then
+    assert tenant_resolver.resolve("shop.example.com").store_name == "Tenant Seller"
+    assert len(callbacks) == 1
+
+
+def test_seller_save_without_changes_keeps_cached_resolution(
+    tenant_seller, django_capture_on_commit_callbacks
+):
+    # given
+    tenant_resolver.resolve("shop.example.com")
+
+    # when
+    with django_capture_on_commit_callbacks() as callbacks:
+        tenant_seller.save()
+        tenant_seller.save(update_fields=["updated_at"])
+
+    # then
+    assert callbacks == []
+
+
+def test_seller_domain_save_invalidates_negative_resolution(
+    tenant_seller, django_capture_on_commit_callbacks
+):
+    # given
+    assert tenant_resolver.resolve("new-shop.com") is None
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        SellerDomain.objects.filter(seller=tenant_seller).update(is_primary=False)
+        SellerDomain.objects.create(
+            seller=tenant_seller,
+            domain="new-shop.com",
+            is_primary=True,
+            status=SellerDomainStatus.ACTIVE,
+        )
+
+    # then
+    assert tenant_resolver.resolve("new-shop.com").pk == tenant_seller.pk
+
+
+def test_local_tier_is_bounded():
+    # given
+    resolver = SellerTenantResolver(max_size=2, local_ttl=60)
+    snapshot = take_seller_snapshot(Seller(store_name="Seller", slug="seller"))
+
+    # when
+    for host in ["a.com", "b.com", "c.com"]:
+        resolver.remember(host, snapshot)
+
+    # then
+    assert len(resolver) == 2
+    assert resolver._get_local("a.com") == (False, None)
+    assert resolver._get_local("c.com") == (True, snapshot)
+
+
+def test_local_tier_entries_expire():
+    # given
+    resolver = SellerTenantResolver(max_size=10, local_ttl=-1)
+
+    # when
+    resolver.remember("a.com", None)
+
+    # then
+    assert resolver._get_local("a.com") == (False, None)
+
+
+def test_hydrate_seller_snapshot_round_trip():
+    # given
+    seller = Seller(store_name="Seller", slug="seller", metadata={"a": 1})
+
+    # when
+    hydrated = hydrate_seller_snapshot(take_seller_snapshot(seller))
+
+    # then
+    assert hydrated.pk == seller.pk
+    assert hydrated.slug == "seller"
+    assert hydrated.metadata == {"a": 1}
+    assert hydrated._state.adding is False
+
+
+def test_middleware_attaches_tenant_scope(tenant_seller, rf, settings):
+    # given
+    settings.ALLOWED_HOSTS = ["*"]
+    request = rf.get("/graphql/", HTTP_HOST="shop.example.com")
+
+    # when
+    SellerTenantMiddleware(lambda request: None).process_request(request)
+
+    # then
+    scope = request.tenant_scope
+    assert scope.seller_id == tenant_seller.pk
+    assert scope.channel_id == tenant_seller.channel_id
+    assert request.marketplace_seller.pk == tenant_seller.pk
+
+
+def test_tenant_scope_ids_are_cached(
+    tenant_seller, warehouse, shipping_zone, django_assert_num_queries
+):
+    # given
+    SellerWarehouse.objects.create(seller=tenant_seller, warehouse=warehouse)
+    tenant_seller.logistics_config.shipping_zones.add(shipping_zone)
+    seller = tenant_resolver.resolve("shop.example.com")
+    with django_assert_num_queries(2):
+        assert TenantScope(seller).warehouse_ids == {warehouse.pk}
+
+    # when
+    with django_assert_num_queries(0):
+        scope = TenantScope(seller)
+        warehouse_ids = scope.warehouse_ids
+        shipping_zone_ids = scope.shipping_zone_ids
+
+    # then
+    assert warehouse_ids == {warehouse.pk}
+    assert shipping_zone_ids == {shipping_zone.pk}
+
+
+def test_seller_warehouse_change_invalidates_tenant_scope(
+    tenant_seller, warehouse, django_capture_on_commit_callbacks
+):
+    # given
+    seller = tenant_resolver.resolve("shop.example.com")
+    assert TenantScope(seller).warehouse_ids == set()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        SellerWarehouse.objects.create(seller=tenant_seller, warehouse=warehouse)
+
+    # then
+    assert TenantScope(seller).warehouse_ids == {warehouse.pk}
+
+
+def test_seller_warehouse_change_invalidates_tenant_scope_on_commit(
+    tenant_seller, warehouse, django_capture_on_commit_callbacks
+):
+    # given
+    seller = tenant_resolver.resolve("shop.example.com")
+    assert TenantScope(seller).warehouse_ids == set()
+
+    # when
+    with django_capture_on_commit_callbacks() as callbacks:
+        SellerWarehouse.objects.create(seller=tenant_seller, warehouse=warehouse)
+
+    # then
+    assert TenantScope(seller).warehouse_ids == set()
+    assert len(callbacks) == 1
+
+
+def test_shipping_zone_clear_invalidates_tenant_scope(
+    tenant_seller, shipping_zone, django_capture_on_commit_callbacks
+):
+    # given
+    tenant_seller.logistics_config.shipping_zones.add(shipping_zone)
+    seller = tenant_resolver.resolve("shop.example.com")
+    assert TenantScope(seller).shipping_zone_ids == {shipping_zone.pk}
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        shipping_zone.seller_logistics_configs.clear()
+
+    # then
+    assert TenantScope(seller).shipping_zone_ids == set()
+
+
+def test_tenant_scope_filters_querysets(tenant_seller, product, warehouse):
+    # given
+    product.seller = tenant_seller
+    product.save(update_fields=["seller"])
+    scope = TenantScope(tenant_seller)
+
+    # when
+    products = scope.filter_products(Product.objects.all())
+    warehouses = scope.filter_warehouses(Warehouse.objects.all())
+
+    # then
+    assert list(products) == [product]
+    assert not warehouses.exists()
+
+
+def test_tenant_scope_filters_orders_and_shipping_zones(
+    tenant_seller, order_list, shipping_zone
+):
+    # given
+    order = order_list[0]
+    SellerOrder.objects.create(
+        seller=tenant_seller,
+        order=order,
+        created_at=order.created_at,
+        status=order.status,
+        currency=order.currency,
+    )
+    tenant_seller.logistics_config.shipping_zones.add(shipping_zone)
+    scope = TenantScope(tenant_resolver.resolve("shop.example.com"))
+
+    # when
+    orders = scope.filter_orders(Order.objects.all())
+    shipping_zones = scope.filter_shipping_zones(ShippingZone.objects.all())
+
+    # then
+    assert list(orders) == [order]
+    assert list(shipping_zones) == [shipping_zone]
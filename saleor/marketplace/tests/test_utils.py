@@ -1,96 +1,20 @@
 """Tests for marketplace utility functions."""
 
 from decimal import Decimal
+from unittest.mock import patch
 
-import pytest
 from prices import Money, TaxedMoney
 
-from ...order.models import OrderLine
-from ...product.models import Product
 from ..utils import (
     allocate_discount_by_seller,
     allocate_shipping_cost_by_seller,
     calculate_seller_subtotal,
+    create_settlements_for_order,
+    create_settlements_for_orders,
     group_lines_by_seller,
 )
 
 
-@pytest.fixture
-def order_lines_with_sellers(db, seller, product):
-    """Create order lines with different sellers."""
-    from ...order.models import Order
-    from ...product.models import ProductVariant
-
-    order = Order.objects.create(
-        currency="USD",
-        total_net_amount=Decimal("100.00"),
-        total_gross_amount=Decimal("120.00"),
-    )
-
-    # Create product variant
-    variant = ProductVariant.objects.create(
-        product=product,
-        sku="TEST-SKU-1",
-    )
-
-    # Create order lines
-    line1 = OrderLine.objects.create(
-        order=order,
-        product=product,
-        variant=variant,
-        product_name="Product 1",
-        variant_name="Variant 1",
-        quantity=1,
-        unit_price_net_amount=Decimal("50.00"),
-        unit_price_gross_amount=Decimal("60.00"),
-        total_price_net_amount=Decimal("50.00"),
-        total_price_gross_amount=Decimal("60.00"),
-        seller=seller,
-        seller_name=seller.store_name,
-    )
-
-    # Create another seller and product
-    from ...account.models import User
-    from ...channel.models import Channel
-    from ..models import Seller, SellerStatus
-
-    seller2 = Seller.objects.create(
-        store_name="Seller 2",
-        slug="seller-2",
-        owner=User.objects.create_user(email="seller2@example.com"),
-        channel=Channel.objects.first(),
-        status=SellerStatus.ACTIVE,
-    )
-    product2 = Product.objects.create(
-        name="Product 2",
-        slug="product-2",
-        product_type=product.product_type,
-    )
-    variant2 = ProductVariant.objects.create(
-        product=product2,
-        sku="TEST-SKU-2",
-    )
-    product2.seller = seller2
-    product2.save()
-
-    line2 = OrderLine.objects.create(
-        order=order,
-        product=product2,
-        variant=variant2,
-        product_name="Product 2",
-        variant_name="Variant 2",
-        quantity=1,
-        unit_price_net_amount=Decimal("50.00"),
-        unit_price_gross_amount=Decimal("60.00"),
-        total_price_net_amount=Decimal("50.00"),
-        total_price_gross_amount=Decimal("60.00"),
-        seller=seller2,
-        seller_name=seller2.store_name,
-    )
-
-    return [line1, line2]
-
-
 def test_group_lines_by_seller(order_lines_with_sellers):
     """Test grouping order lines by seller."""
     grouped = group_lines_by_seller(order_lines_with_sellers)
@@ -150,3 +74,68 @@ def test_calculate_seller_subtotal(order_lines_with_sellers, seller):
     
     assert subtotal > 0
     assert isinstance(subtotal, Decimal)
+
+
+def test_create_settlements_for_orders(
+    order_lines_with_sellers, django_assert_max_num_queries
+):
+    """Test creating settlements for many orders in a constant number of queries."""
+    from ..models import SellerSettlement
+
+    order = order_lines_with_sellers[0].order
+
+    with django_assert_max_num_queries(7):
+        settlements = create_settlements_for_orders([order.pk])
+
+    assert len(settlements) == 2
+    assert SellerSettlement.objects.filter(order=order).count() == 2
+    settlement = SellerSettlement.objects.get(
+        order=order, seller=order_lines_with_sellers[0].seller
+    )
+    assert settlement.order_total == Decimal("60.00")
+    assert settlement.platform_fee == Decimal("6.00")
+    assert settlement.seller_earnings == Decimal("54.00")
+    assert settlement.currency == order.currency
+
+
+def test_create_settlements_for_orders_skips_existing(order_lines_with_sellers):
+    """Test that settlements are created only once per seller and order."""
+    from ..models import SellerSettlement
+
+    order = order_lines_with_sellers[0].order
+    create_settlements_for_order(order)
+
+    settlements = create_settlements_for_orders([order.pk])
+
+    assert settlements == []
+    assert SellerSettlement.objects.filter(order=order).count() == 2
+
+
+def test_create_settlements_for_orders_returns_only_inserted(order_lines_with_sellers):
+    """Test that settlements skipped as conflicts are not reported as created."""
+    from ..models import SellerSettlement
+
+    order = order_lines_with_sellers[0].order
+    seller = order_lines_with_sellers[0].seller
+    bulk_create = SellerSettlement.objects.bulk_create
+
+    def create_concurrently(settlements, **kwargs):
+        # A concurrent run creates the settlement of one seller in the meantime.
+        SellerSettlement.objects.create(
+            seller=seller,
+            order=order,
+            order_total=Decimal("60.00"),
+            platform_fee=Decimal("6.00"),
+            seller_earnings=Decimal("54.00"),
+            currency=order.currency,
+        )
+        return bulk_create(settlements, **kwargs)
+
+    with patch.object(
+        SellerSettlement.objects, "bulk_create", side_effect=create_concurrently
+    ):
+        settlements = create_settlements_for_orders([order.pk])
+
+    assert len(settlements) == 1
+    assert settlements[0].seller != seller
+    assert SellerSettlement.objects.filter(order=order).count() == 2
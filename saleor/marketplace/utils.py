@@ -1,17 +1,24 @@
 """Utility functions for marketplace functionality."""
 
 from collections import defaultdict
+from collections.abc import Iterable
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from django.db import models
 from django.db.models import QuerySet, Sum
 
+from .services.seller_split import SellerSplit, get_line_amount
+
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from ..checkout.models import CheckoutLine
-    from ..marketplace.models import SellerSettlement
+    from ..marketplace.models import Seller, SellerSettlement
     from ..order.models import Order, OrderLine
 
+SETTLEMENTS_BULK_CREATE_BATCH = 1000
+
 
 def group_lines_by_seller(lines: list["OrderLine"] | list["CheckoutLine"]) -> dict:
     """Group order lines or checkout lines by seller.
@@ -19,13 +26,7 @@ def group_lines_by_seller(lines: list["OrderLine"] | list["CheckoutLine"]) -> di
     Returns a dictionary mapping seller to list of lines.
     Lines without a seller are grouped under None.
     """
-    grouped = defaultdict(list)
-    for line in lines:
-        seller = getattr(line, "seller", None)
-        if hasattr(line, "product") and line.product:
-            seller = getattr(line.product, "seller", seller)
-        grouped[seller].append(line)
-    return dict(grouped)
+    return SellerSplit(lines).lines_by_seller
 
 
 def allocate_shipping_cost_by_seller(
@@ -35,6 +36,8 @@ def allocate_shipping_cost_by_seller(
 ) -> dict:
     """Allocate shipping cost across sellers based on allocation method and seller type.
 
+    Prefer `SellerSplit.allocate_shipping` when the lines are split already.
+
     Args:
         lines_by_seller: Dictionary mapping seller to list of lines
         total_shipping_cost: Total shipping cost to allocate
@@ -46,97 +49,9 @@ def allocate_shipping_cost_by_seller(
     Returns:
         Dictionary mapping seller to allocated shipping cost
     """
-    if not lines_by_seller:
-        return {}
-
-    allocation = {}
-
-    # Consider seller type for B2B negotiated rates or bulk discounts
-    seller_type_adjustments = {}
-    for seller in lines_by_seller:
-        if seller and seller.seller_type == "b2b_wholesale":
-            # B2B sellers may have negotiated rates or bulk shipping discounts
-            # Check logistics config for custom shipping rates
-            try:
-                logistics_config = seller.logistics_config
-                # B2B sellers often have negotiated bulk shipping rates
-                # Apply discount factor if configured (e.g., 0.9 for 10% discount)
-                # For now, use standard allocation but structure is ready for discounts
-                discount_factor = Decimal("1.0")
-                if hasattr(logistics_config, "custom_shipping_methods"):
-                    # Check for B2B bulk shipping discount in custom methods
-                    custom_methods = logistics_config.custom_shipping_methods or {}
-                    if isinstance(custom_methods, dict):
-                        b2b_discount = custom_methods.get("b2b_discount_factor", 1.0)
-                        discount_factor = Decimal(str(b2b_discount))
-                seller_type_adjustments[seller] = discount_factor
-            except AttributeError:
-                seller_type_adjustments[seller] = Decimal("1.0")
-        else:
-            # B2C sellers use standard rates
-            seller_type_adjustments[seller] = Decimal("1.0")
-
-    if allocation_method == "equal":
-        cost_per_seller = total_shipping_cost / len(lines_by_seller)
-        for seller in lines_by_seller:
-            # Apply seller type adjustment
-            adjustment = seller_type_adjustments.get(seller, Decimal("1.0"))
-            allocation[seller] = cost_per_seller * adjustment
-    elif allocation_method == "proportional":
-        # Calculate total value per seller
-        seller_totals = {}
-        grand_total = Decimal("0")
-        for seller, lines in lines_by_seller.items():
-            seller_total = sum(
-                line.total_price.gross.amount if hasattr(line, "total_price") else line.get_total().gross.amount
-                for line in lines
-            )
-            seller_totals[seller] = seller_total
-            grand_total += seller_total
-
-        # Allocate proportionally
-        if grand_total > 0:
-            for seller, seller_total in seller_totals.items():
-                proportion = seller_total / grand_total
-                base_allocation = total_shipping_cost * proportion
-                # Apply seller type adjustment
-                adjustment = seller_type_adjustments.get(seller, Decimal("1.0"))
-                allocation[seller] = base_allocation * adjustment
-        else:
-            # If no totals, split equally
-            cost_per_seller = total_shipping_cost / len(lines_by_seller)
-            for seller in lines_by_seller:
-                adjustment = seller_type_adjustments.get(seller, Decimal("1.0"))
-                allocation[seller] = cost_per_seller * adjustment
-    elif allocation_method == "weight":
-        # Calculate total weight per seller
-        seller_weights = {}
-        total_weight = Decimal("0")
-        for seller, lines in lines_by_seller.items():
-            seller_weight = Decimal("0")
-            for line in lines:
-                if hasattr(line, "variant") and line.variant and line.variant.weight:
-                    seller_weight += line.variant.weight.value * line.quantity
-            seller_weights[seller] = seller_weight
-            total_weight += seller_weight
-
-        # Allocate based on weight
-        if total_weight > 0:
-            for seller, weight in seller_weights.items():
-                proportion = weight / total_weight
-                base_allocation = total_shipping_cost * proportion
-                # Apply seller type adjustment
-                adjustment = seller_type_adjustments.get(seller, Decimal("1.0"))
-                allocation[seller] = base_allocation * adjustment
-        else:
-            # If no weights, split equally
-            cost_per_seller = total_shipping_cost / len(lines_by_seller)
-            for seller in lines_by_seller:
-                allocation[seller] = cost_per_seller
-    else:
-        raise ValueError(f"Unknown allocation method: {allocation_method}")
-
-    return allocation
+    return SellerSplit.from_lines_by_seller(lines_by_seller).allocate_shipping(
+        total_shipping_cost, allocation_method
+    )
 
 
 def allocate_discount_by_seller(
@@ -146,6 +61,8 @@ def allocate_discount_by_seller(
 ) -> dict:
     """Allocate discount amount across sellers based on allocation method.
 
+    Prefer `SellerSplit.allocate_discount` when the lines are split already.
+
     Args:
         lines_by_seller: Dictionary mapping seller to list of lines
         total_discount: Total discount amount to allocate
@@ -156,49 +73,14 @@ def allocate_discount_by_seller(
     Returns:
         Dictionary mapping seller to allocated discount amount
     """
-    if not lines_by_seller:
-        return {}
-
-    allocation = {}
-
-    if allocation_method == "equal":
-        discount_per_seller = total_discount / len(lines_by_seller)
-        for seller in lines_by_seller:
-            allocation[seller] = discount_per_seller
-    elif allocation_method == "proportional":
-        # Calculate total value per seller
-        seller_totals = {}
-        grand_total = Decimal("0")
-        for seller, lines in lines_by_seller.items():
-            seller_total = sum(
-                line.total_price.gross.amount if hasattr(line, "total_price") else line.get_total().gross.amount
-                for line in lines
-            )
-            seller_totals[seller] = seller_total
-            grand_total += seller_total
-
-        # Allocate proportionally
-        if grand_total > 0:
-            for seller, seller_total in seller_totals.items():
-                proportion = seller_total / grand_total
-                allocation[seller] = total_discount * proportion
-        else:
-            # If no totals, split equally
-            discount_per_seller = total_discount / len(lines_by_seller)
-            for seller in lines_by_seller:
-                allocation[seller] = discount_per_seller
-    else:
-        raise ValueError(f"Unknown allocation method: {allocation_method}")
-
-    return allocation
+    return SellerSplit.from_lines_by_seller(lines_by_seller).allocate_discount(
+        total_discount, allocation_method
+    )
 
 
 def calculate_seller_subtotal(lines: list["OrderLine"] | list["CheckoutLine"]) -> Decimal:
     """Calculate the subtotal for lines belonging to a specific seller."""
-    return sum(
-        line.total_price.gross.amount if hasattr(line, "total_price") else line.get_total().gross.amount
-        for line in lines
-    )
+    return sum((get_line_amount(line) for line in lines), Decimal(0))
 
 
 def calculate_platform_fee(
@@ -271,7 +153,15 @@ def calculate_seller_order_totals(
         for line in seller_lines
         if hasattr(line, "total_price") and line.total_price
     )
+    return get_seller_totals(order_total, seller, allocated_order_discount)
+
 
+def get_seller_totals(
+    order_total: Decimal,
+    seller: "Seller",
+    allocated_order_discount: Decimal = Decimal("0.00"),
+) -> dict[str, Decimal]:
+    """Calculate a seller's net total, platform fee and earnings from a subtotal."""
     # Marketplace: allocate order-level discounts (e.g. ENTIRE_ORDER vouchers / order
     # promotions) across sellers to get a fair per-seller net total.
     if allocated_order_discount:
@@ -404,75 +294,138 @@ def create_settlements_for_order(order: "Order") -> list["SellerSettlement"]:
     Returns:
         List of created SellerSettlement instances
     """
-    from ..marketplace.models import SellerSettlement, SettlementStatus
-
     if not order or order.is_draft():
         return []
+    return create_settlements_for_orders([order.pk])
+
+
+def create_settlements_for_orders(
+    order_ids: Iterable["UUID"],
+) -> list["SellerSettlement"]:
+    """Create settlement records for all sellers in many orders at once.
+
+    Lines, sellers, order-level discounts and already existing settlements are
+    fetched with one query each. Totals are computed in memory and the new
+    settlements are written with a single bulk insert that skips rows conflicting
+    with the unique (seller, order) constraint.
 
-    # Get all order lines with sellers
-    order_lines = order.lines.select_related("seller").filter(seller__isnull=False)
+    Args:
+        order_ids: IDs of orders to create settlements for
+
+    Returns:
+        List of created SellerSettlement instances
+    """
+    from ..discount import DiscountType
+    from ..discount.models import OrderDiscount
+    from ..marketplace.models import Seller, SellerSettlement, SettlementStatus
+    from ..order import OrderStatus
+    from ..order.models import Order, OrderLine
 
-    if not order_lines.exists():
+    currency_by_order_id = dict(
+        Order.objects.filter(pk__in=order_ids)
+        .exclude(status=OrderStatus.DRAFT)
+        .values_list("pk", "currency")
+    )
+    if not currency_by_order_id:
+        return []
+
+    lines_by_order_id: dict = defaultdict(list)
+    for line in OrderLine.objects.filter(
+        order_id__in=currency_by_order_id.keys(), seller__isnull=False
+    ):
+        lines_by_order_id[line.order_id].append(line)
+    if not lines_by_order_id:
         return []
 
-    # Group lines by seller
-    lines_by_seller = defaultdict(list)
-    for line in order_lines:
-        if line.seller_id:
-            lines_by_seller[line.seller].append(line)
-
-    # Compute order-level discount total (best-effort) and allocate across sellers.
-    # This intentionally does NOT include line-level discounts, as those are already
-    # reflected in `line.total_price`.
-    allocated_discounts_by_seller: dict = {}
-    try:
-        from ..discount import DiscountType
-
-        order_level_discount_total = (
-            order.discounts.filter(
-                type__in=[DiscountType.VOUCHER, DiscountType.PROMOTION]
-            ).aggregate(total=models.Sum("amount_value"))["total"]
-            or Decimal("0.00")
+    sellers = Seller.objects.in_bulk(
+        {line.seller_id for lines in lines_by_order_id.values() for line in lines}
+    )
+
+    # Order-level discount totals. This intentionally does NOT include line-level
+    # discounts, as those are already reflected in `line.total_price`.
+    order_discount_totals = dict(
+        OrderDiscount.objects.filter(
+            order_id__in=lines_by_order_id.keys(),
+            type__in=[DiscountType.VOUCHER, DiscountType.PROMOTION],
         )
-        if order_level_discount_total and lines_by_seller:
-            allocated_discounts_by_seller = allocate_discount_by_seller(
-                lines_by_seller, Decimal(order_level_discount_total), "proportional"
-            )
-    except Exception:
-        allocated_discounts_by_seller = {}
+        .order_by()
+        .values("order_id")
+        .annotate(total=Sum("amount_value"))
+        .values_list("order_id", "total")
+    )
+    existing_settlements = set(
+        SellerSettlement.objects.filter(
+            order_id__in=lines_by_order_id.keys()
+        ).values_list("seller_id", "order_id")
+    )
 
     settlements = []
-    for seller, seller_lines in lines_by_seller.items():
-        # Skip if seller is None or not active
-        if not seller or not seller.is_active:
-            continue
-
-        # Check if settlement already exists for this seller and order
-        existing_settlement = SellerSettlement.objects.filter(
-            seller=seller, order=order
-        ).first()
-        if existing_settlement:
-            continue
-
-        # Calculate totals
-        allocated_discount = allocated_discounts_by_seller.get(seller, Decimal("0.00"))
-        totals = calculate_seller_order_totals(
-            seller_lines, seller, allocated_order_discount=allocated_discount
+    for order_id, order_lines in lines_by_order_id.items():
+        split = SellerSplit(
+            (line for line in order_lines if line.seller_id in sellers),
+            get_seller=lambda line: sellers[line.seller_id],
+            currency=currency_by_order_id[order_id],
         )
 
-        if totals["order_total"] <= 0:
-            continue
-
-        # Create settlement
-        settlement = SellerSettlement.objects.create(
-            seller=seller,
-            order=order,
-            order_total=totals["order_total"],
-            platform_fee=totals["platform_fee"],
-            seller_earnings=totals["seller_earnings"],
-            currency=order.currency,
-            status=SettlementStatus.PENDING,
-        )
-        settlements.append(settlement)
+        # Allocate order-level discounts across sellers to get a fair per-seller
+        # net total.
+        allocated_discounts_by_seller: dict = {}
+        order_discount_total = order_discount_totals.get(order_id)
+        if order_discount_total:
+            allocated_discounts_by_seller = split.allocate_discount(
+                Decimal(order_discount_total), "proportional"
+            )
 
+        for seller in split.sellers:
+            # Skip if seller is not active or settlement already exists
+            if not seller.is_active or (seller.pk, order_id) in existing_settlements:
+                continue
+
+            totals = get_seller_totals(
+                split.get_subtotal(seller),
+                seller,
+                allocated_order_discount=allocated_discounts_by_seller.get(
+                    seller, Decimal("0.00")
+                ),
+            )
+            if totals["order_total"] <= 0:
+                continue
+
+            settlements.append(
+                SellerSettlement(
+                    seller=seller,
+                    order_id=order_id,
+                    order_total=totals["order_total"],
+                    platform_fee=totals["platform_fee"],
+                    seller_earnings=totals["seller_earnings"],
+                    currency=currency_by_order_id[order_id],
+                    status=SettlementStatus.PENDING,
+                )
+            )
+
+    if settlements:
+        # Concurrent runs may have created some of the settlements in the meantime;
+        # the unique (seller, order) constraint makes the insert skip those. The
+        # primary keys are generated in Python, so only the inserted rows are found.
+        SellerSettlement.objects.bulk_create(
+            settlements,
+            ignore_conflicts=True,
+            batch_size=SETTLEMENTS_BULK_CREATE_BATCH,
+        )
+        inserted_ids = set(
+            SellerSettlement.objects.filter(
+                pk__in=[settlement.pk for settlement in settlements]
+            ).values_list("pk", flat=True)
+        )
+        settlements = [
+            settlement for settlement in settlements if settlement.pk in inserted_ids
+        ]
+    if settlements:
+        from .analytics import get_bucket_date
+        from .tasks import schedule_seller_analytics_refresh
+
+        schedule_seller_analytics_refresh(
+            (settlement.seller_id, get_bucket_date(settlement.created_at))
+            for settlement in settlements
+        )
     return settlements
@@ -1,15 +1,28 @@
 """Utility functions for loyalty system."""
 
+from collections.abc import Iterable
 from decimal import Decimal
 from typing import Optional
 from uuid import uuid4
 
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Sum
 from django.utils import timezone
 
 from ..account.models import User
+from ..order import OrderStatus
 from ..order.models import Order
 
+BADGE_ORDER_STATUSES = [OrderStatus.FULFILLED, OrderStatus.PARTIALLY_FULFILLED]
+# Statuses an order can be moved to from, or into, the counted statuses.
+BADGE_COUNTER_STATUSES = [
+    *BADGE_ORDER_STATUSES,
+    OrderStatus.PARTIALLY_RETURNED,
+    OrderStatus.RETURNED,
+]
+BADGE_BACKFILL_BATCH_SIZE = 500
+
 
 def get_or_create_loyalty_balance(user: User):
     """Get or create a loyalty points balance for a user."""
@@ -34,35 +47,29 @@ def create_points_transaction(
     order: Optional[Order] = None,
     expires_at: Optional[timezone.datetime] = None,
 ):
-    """Create a loyalty points transaction record."""
-    from .models_loyalty import LoyaltyPointsTransaction, LoyaltyPointsBalance
-
-    # Get current balance
-    balance = get_or_create_loyalty_balance(user)
-    new_balance = balance.balance + points
+    """Post points to the user's ledger and update their balance atomically."""
+    from .services.loyalty_ledger import post_points
 
-    # Create transaction record
-    transaction = LoyaltyPointsTransaction.objects.create(
-        user=user,
-        points=points,
-        balance_after=new_balance,
-        transaction_type=transaction_type,
+    transactions = post_points(
+        {user.pk: points},
+        transaction_type,
         description=description,
         order=order,
         expires_at=expires_at,
     )
+    return transactions[0] if transactions else None
 
-    return transaction
 
-
-def award_points_for_order(user: User, order: Order, points_per_dollar: Decimal = Decimal("1.0")):
+def award_points_for_order(
+    user: User, order: Order, points_per_dollar: Decimal = Decimal("1.0")
+):
     """Award loyalty points for a completed order."""
     from .models_loyalty import LoyaltyPointsBalance
 
     # Calculate points based on order total (use direct field for simplicity)
     order_total = order.total_gross_amount or Decimal("0")
     points = int(order_total * points_per_dollar)
-    
+
     if points <= 0:
         return None
 
@@ -77,65 +84,179 @@ def award_points_for_order(user: User, order: Order, points_per_dollar: Decimal
     return points
 
 
-def check_and_award_badges(user: User, order: Optional[Order] = None):
-    """Check if user qualifies for any badges and award them."""
-    from .models_loyalty import Badge, UserBadge, LoyaltyPointsBalance
-
-    # Get all active badges
-    badges = Badge.objects.filter(is_active=True)
-
-    for badge in badges:
-        # Skip if user already has this badge
-        if UserBadge.objects.filter(user=user, badge=badge).exists():
-            continue
-
-        # Check if user meets criteria
-        qualifies = False
-
-        if badge.criteria_type == "order_count":
-            from ..order.models import Order, OrderStatus
-            order_count = Order.objects.filter(
-                user=user, status__in=[OrderStatus.FULFILLED, OrderStatus.PARTIALLY_FULFILLED]
-            ).count()
-            if badge.criteria_value and order_count >= badge.criteria_value:
-                qualifies = True
-
-        elif badge.criteria_type == "total_spent":
-            from ..order.models import Order, OrderStatus
-            from django.db.models import Sum
-            total_spent = (
-                Order.objects.filter(
-                    user=user, status__in=[OrderStatus.FULFILLED, OrderStatus.PARTIALLY_FULFILLED]
-                ).aggregate(total=Sum("total_gross_amount"))["total"]
-                or Decimal("0")
-            )
-            if badge.criteria_value and total_spent >= Decimal(str(badge.criteria_value)):
-                qualifies = True
-
-        elif badge.criteria_type == "loyalty_points":
-            balance = get_or_create_loyalty_balance(user)
-            if badge.criteria_value and balance.lifetime_earned >= badge.criteria_value:
-                qualifies = True
-
-        elif badge.criteria_type == "manual":
-            # Manual badges must be assigned by staff
-            continue
-
-        if qualifies:
-            # Award the badge
-            UserBadge.objects.create(
-                user=user,
-                badge=badge,
-                order=order,
-            )
-
-            # Award points if configured
+def get_badge_counters(balance) -> dict[str, Decimal]:
+    """Return the running counters that badge criteria are evaluated against."""
+    return {
+        "order_count": Decimal(balance.order_count),
+        "total_spent": balance.total_spent or Decimal("0"),
+        "loyalty_points": Decimal(balance.lifetime_earned),
+    }
+
+
+def get_threshold_badges() -> list:
+    """Return active badges that are awarded automatically."""
+    from .models_loyalty import Badge
+
+    return list(
+        Badge.objects.filter(is_active=True, criteria_value__gt=0).exclude(
+            criteria_type="manual"
+        )
+    )
+
+
+def refresh_badge_counters(user_ids: Iterable[int]) -> dict:
+    """Recompute order counters of the given users with a single aggregate query.
+
+    Returns loyalty balances of the users that have fulfilled orders or an
+    existing balance, keyed by user ID.
+    """
+    from .models_loyalty import LoyaltyPointsBalance
+
+    user_ids = set(user_ids)
+    if not user_ids:
+        return {}
+    totals = {
+        user_id: (order_count, total_spent or Decimal("0"))
+        for user_id, order_count, total_spent in Order.objects.filter(
+            user_id__in=user_ids, status__in=BADGE_ORDER_STATUSES
+        )
+        .order_by()
+        .values("user_id")
+        .annotate(order_count=Count("pk"), total_spent=Sum("total_gross_amount"))
+        .values_list("user_id", "order_count", "total_spent")
+    }
+    balances = {
+        balance.user_id: balance
+        for balance in LoyaltyPointsBalance.objects.filter(user_id__in=user_ids)
+    }
+    missing = totals.keys() - balances.keys()
+    if missing:
+        LoyaltyPointsBalance.objects.bulk_create(
+            [LoyaltyPointsBalance(user_id=user_id) for user_id in missing],
+            ignore_conflicts=True,
+        )
+        balances.update(
+            {
+                balance.user_id: balance
+                for balance in LoyaltyPointsBalance.objects.filter(user_id__in=missing)
+            }
+        )
+
+    changed = []
+    for user_id, balance in balances.items():
+        order_count, total_spent = totals.get(user_id, (0, Decimal("0")))
+        if (balance.order_count, balance.total_spent) != (order_count, total_spent):
+            balance.order_count = order_count
+            balance.total_spent = total_spent
+            changed.append(balance)
+    LoyaltyPointsBalance.objects.bulk_update(changed, ["order_count", "total_spent"])
+    return balances
+
+
+def evaluate_badges(
+    balances: dict,
+    order: Optional[Order] = None,
+    badges: Optional[list] = None,
+) -> list:
+    """Award badges whose thresholds are met by the users' running counters.
+
+    Badges already owned by the users are fetched with a single query and all
+    thresholds are compared in memory. Points rewarded for a badge count towards
+    the `loyalty_points` criteria, so evaluation repeats until nothing new is
+    earned.
+    """
+    from .models_loyalty import UserBadge
+
+    if not balances:
+        return []
+    if badges is None:
+        badges = get_threshold_badges()
+    owned = set(
+        UserBadge.objects.filter(user_id__in=balances.keys()).values_list(
+            "user_id", "badge_id"
+        )
+    )
+
+    awarded = []
+    for user_id, balance in balances.items():
+        pending = [badge for badge in badges if (user_id, badge.pk) not in owned]
+        while pending:
+            counters = get_badge_counters(balance)
+            earned = [
+                badge
+                for badge in pending
+                if counters.get(badge.criteria_type, Decimal("0"))
+                >= badge.criteria_value
+            ]
+            if not earned:
+                break
+            pending = [badge for badge in pending if badge not in earned]
+            awarded.extend(_award_badges(balance, earned, order))
+    return awarded
+
+
+def _award_badges(balance, badges: list, order: Optional[Order]) -> list:
+    """Create user badges and credit their points.
+
+    Points are credited only for badges inserted here; a badge awarded
+    concurrently for the same user is skipped by the insert and rewarded once.
+    """
+    from .models_loyalty import UserBadge
+
+    user_badges = [
+        UserBadge(user_id=balance.user_id, badge=badge, order=order) for badge in badges
+    ]
+    with transaction.atomic():
+        UserBadge.objects.bulk_create(user_badges, ignore_conflicts=True)
+        # Primary keys are generated in Python, so rows skipped by the insert
+        # aren't found by their keys.
+        inserted_ids = set(
+            UserBadge.objects.filter(
+                pk__in=[user_badge.pk for user_badge in user_badges]
+            ).values_list("pk", flat=True)
+        )
+        inserted = [
+            user_badge for user_badge in user_badges if user_badge.pk in inserted_ids
+        ]
+        for user_badge in inserted:
+            badge = user_badge.badge
             if badge.points_reward > 0:
-                balance = get_or_create_loyalty_balance(user)
                 balance.add_points(
                     badge.points_reward,
                     description=f"Points for earning badge: {badge.name}",
                 )
+    return inserted
+
+
+def check_and_award_badges(user: User, order: Optional[Order] = None):
+    """Check if user qualifies for any badges and award them.
+
+    Order counters are kept up to date by `update_badge_counters_task` when
+    orders are fulfilled, so this runs a constant number of queries regardless
+    of the number of badges.
+    """
+    balance = get_or_create_loyalty_balance(user)
+    return evaluate_badges({user.pk: balance}, order=order)
+
+
+def backfill_badges(
+    start_user_id: int = 0, batch_size: int = BADGE_BACKFILL_BATCH_SIZE
+) -> tuple[int | None, int]:
+    """Recompute counters and award badges for the next batch of users.
+
+    Returns the ID of the last user in the batch (`None` when there is nothing
+    left to process) and the number of awarded badges.
+    """
+    user_ids = list(
+        User.objects.filter(pk__gt=start_user_id)
+        .order_by("pk")
+        .values_list("pk", flat=True)[:batch_size]
+    )
+    if not user_ids:
+        return None, 0
+    balances = refresh_badge_counters(user_ids)
+    awarded = evaluate_badges(balances)
+    return user_ids[-1], len(awarded)
 
 
 def redeem_reward(user: User, reward, generate_code_func=None):
@@ -181,4 +302,3 @@ def redeem_reward(user: User, reward, generate_code_func=None):
     reward.save(update_fields=["quantity_redeemed", "updated_at"])
 
     return redemption
-
@@ -22,6 +22,7 @@ from ..core.utils.events import (
     webhook_async_event_requires_sync_webhooks_to_trigger,
 )
 from ..giftcard import GiftCardLineData
+from ..marketplace.services.seller_orders import refresh_seller_orders
 from ..order.lock_objects import order_lines_qs_select_for_update
 from ..payment import (
     ChargeStatus,
@@ -1833,6 +1834,7 @@ def create_replace_order(
 
         lines_to_create = list(order_line_to_create.values())
         OrderLine.objects.bulk_create(lines_to_create)
+        refresh_seller_orders([replace_order.pk])
 
         draft_order_created_from_replace_event(
             draft_order=replace_order,
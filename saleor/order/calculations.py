@@ -27,6 +27,7 @@ from ..discount.utils.voucher import (
     create_or_update_line_discount_objects_from_voucher,
     get_the_cheapest_line,
 )
+from ..marketplace.services.seller_orders import refresh_seller_orders
 from ..payment.model_helpers import get_subtotal
 from ..plugins import PLUGIN_IDENTIFIER_PREFIX
 from ..plugins.manager import PluginsManager
@@ -157,6 +158,7 @@ def fetch_order_prices_if_expired(
                         "tax_rate",
                     ],
                 )
+                refresh_seller_orders([order.pk])
 
         return order, lines
 
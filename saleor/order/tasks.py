@@ -14,6 +14,7 @@ from ..channel.models import Channel
 from ..core.db.connection import allow_writer
 from ..core.tracing import traced_atomic_transaction
 from ..discount.models import Voucher, VoucherCode, VoucherCustomer
+from ..marketplace.services.seller_orders import update_seller_orders_status
 from ..payment.models import Payment, TransactionItem
 from ..plugins.manager import get_plugins_manager
 from ..warehouse.management import deallocate_stock_for_orders
@@ -164,6 +165,7 @@ def _expire_orders(manager, now):
         Order.objects.filter(id__in=ids_batch).update(
             status=OrderStatus.EXPIRED, expired_at=now
         )
+        update_seller_orders_status(ids_batch, OrderStatus.EXPIRED)
         _bulk_release_voucher_usage(ids_batch)
         _order_expired_events(ids_batch)
         deallocate_stock_for_orders(ids_batch, manager)
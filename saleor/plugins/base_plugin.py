@@ -1322,6 +1322,12 @@ class BasePlugin:
     # Webhook-related functionality will be moved from the plugin to core modules.
     product_metadata_updated: Callable[["Product", Any], Any]
 
+    # Trigger when discounted prices of products are recalculated in bulk.
+    #
+    # Overwrite this method if you need to trigger specific logic after discounted
+    # prices are recalculated, which happens without product events.
+    product_discounted_prices_updated: Callable[[Any], Any]
+
     # Trigger when product variant is created.
     #
     # Overwrite this method if you need to trigger specific logic after a product
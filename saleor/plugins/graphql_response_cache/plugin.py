@@ -0,0 +1,238 @@
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from ...graphql.response_cache import (
+    CATEGORY_TAG,
+    COLLECTION_TAG,
+    MENU_TAG,
+    PAGE_TAG,
+    PRODUCT_TAG,
+    invalidate_response_cache,
+)
+from ..base_plugin import BasePlugin
+
+if TYPE_CHECKING:
+    from ...discount.models import Promotion, PromotionRule
+    from ...menu.models import Menu, MenuItem
+    from ...page.models import Page
+    from ...product.models import (
+        Category,
+        Collection,
+        Product,
+        ProductMedia,
+        ProductVariant,
+    )
+    from ...warehouse.models import Stock
+
+
+class GraphQLResponseCachePlugin(BasePlugin):
+    """Invalidate cached storefront responses on catalogue and content events.
+
+    Handles the same events that trigger webhooks, so responses are invalidated
+    after every mutation or task that changes products, categories, collections,
+    menus or pages. Promotions change product prices, which are also invalidated
+    after discounted prices are recalculated in bulk.
+    """
+
+    PLUGIN_ID = "saleor.graphql.response_cache"
+    PLUGIN_NAME = "GraphQL response cache"
+    PLUGIN_DESCRIPTION = "Invalidates cached responses of storefront queries."
+
+    DEFAULT_ACTIVE = True
+    CONFIGURATION_PER_CHANNEL = False
+
+    def _invalidate(self, previous_value: Any, *tags: str) -> Any:
+        if self.active:
+            invalidate_response_cache(*tags)
+        return previous_value
+
+    def product_created(self, product: "Product", previous_value: Any, webhooks=None):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def product_updated(self, product: "Product", previous_value: Any, webhooks=None):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def product_deleted(
+        self,
+        product: "Product",
+        variants: list[int],
+        previous_value: Any,
+        webhooks=None,
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def product_media_created(self, media: "ProductMedia", previous_value: Any):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def product_media_updated(self, media: "ProductMedia", previous_value: Any):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def product_media_deleted(self, media: "ProductMedia", previous_value: Any):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def product_metadata_updated(self, product: "Product", previous_value: Any):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def product_discounted_prices_updated(self, previous_value: Any):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def product_variant_created(
+        self, product_variant: "ProductVariant", previous_value: Any, webhooks=None
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def product_variant_updated(
+        self,
+        product_variant: "ProductVariant",
+        previous_value: Any,
+        webhooks=None,
+        **kwargs,
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def product_variant_deleted(
+        self, product_variant: "ProductVariant", previous_value: Any, webhooks=None
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def product_variant_metadata_updated(
+        self, product_variant: "ProductVariant", previous_value: Any
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def product_variant_out_of_stock(
+        self, stock: "Stock", previous_value: Any, webhooks=None
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def product_variant_back_in_stock(
+        self, stock: "Stock", previous_value: Any, webhooks=None
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def sale_created(
+        self,
+        sale: "Promotion",
+        current_catalogue: defaultdict[str, set[str]],
+        previous_value: Any,
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def sale_updated(
+        self,
+        sale: "Promotion",
+        previous_catalogue: defaultdict[str, set[str]],
+        current_catalogue: defaultdict[str, set[str]],
+        previous_value: Any,
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def sale_deleted(
+        self,
+        sale: "Promotion",
+        previous_catalogue: defaultdict[str, set[str]],
+        previous_value: Any,
+        webhooks=None,
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def sale_toggle(
+        self,
+        sale: "Promotion",
+        catalogue: defaultdict[str, set[str]],
+        previous_value: Any,
+        webhooks=None,
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def promotion_created(self, promotion: "Promotion", previous_value: Any):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def promotion_updated(self, promotion: "Promotion", previous_value: Any):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def promotion_deleted(
+        self, promotion: "Promotion", previous_value: Any, webhooks=None
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def promotion_started(
+        self, promotion: "Promotion", previous_value: Any, webhooks=None
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def promotion_ended(
+        self, promotion: "Promotion", previous_value: Any, webhooks=None
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def promotion_rule_created(
+        self, promotion_rule: "PromotionRule", previous_value: Any
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def promotion_rule_updated(
+        self, promotion_rule: "PromotionRule", previous_value: Any
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def promotion_rule_deleted(
+        self, promotion_rule: "PromotionRule", previous_value: Any
+    ):
+        return self._invalidate(previous_value, PRODUCT_TAG)
+
+    def category_created(self, category: "Category", previous_value: Any):
+        return self._invalidate(previous_value, CATEGORY_TAG)
+
+    def category_updated(self, category: "Category", previous_value: Any):
+        return self._invalidate(previous_value, CATEGORY_TAG)
+
+    def category_deleted(
+        self, category: "Category", previous_value: Any, webhooks=None
+    ):
+        return self._invalidate(previous_value, CATEGORY_TAG)
+
+    def collection_created(self, collection: "Collection", previous_value: Any):
+        return self._invalidate(previous_value, COLLECTION_TAG)
+
+    def collection_updated(self, collection: "Collection", previous_value: Any):
+        return self._invalidate(previous_value, COLLECTION_TAG)
+
+    def collection_deleted(
+        self, collection: "Collection", previous_value: Any, webhooks=None
+    ):
+        return self._invalidate(previous_value, COLLECTION_TAG)
+
+    def collection_metadata_updated(
+        self, collection: "Collection", previous_value: Any
+    ):
+        return self._invalidate(previous_value, COLLECTION_TAG)
+
+    def menu_created(self, menu: "Menu", previous_value: Any):
+        return self._invalidate(previous_value, MENU_TAG)
+
+    def menu_updated(self, menu: "Menu", previous_value: Any):
+        return self._invalidate(previous_value, MENU_TAG)
+
+    def menu_deleted(self, menu: "Menu", previous_value: Any, webhooks=None):
+        return self._invalidate(previous_value, MENU_TAG)
+
+    def menu_item_created(self, menu_item: "MenuItem", previous_value: Any):
+        return self._invalidate(previous_value, MENU_TAG)
+
+    def menu_item_updated(self, menu_item: "MenuItem", previous_value: Any):
+        return self._invalidate(previous_value, MENU_TAG)
+
+    def menu_item_deleted(
+        self, menu_item: "MenuItem", previous_value: Any, webhooks=None
+    ):
+        return self._invalidate(previous_value, MENU_TAG)
+
+    def page_created(self, page: "Page", previous_value: Any):
+        return self._invalidate(previous_value, PAGE_TAG)
+
+    def page_updated(self, page: "Page", previous_value: Any):
+        return self._invalidate(previous_value, PAGE_TAG)
+
+    def page_deleted(self, page: "Page", previous_value: Any):
+        return self._invalidate(previous_value, PAGE_TAG)
@@ -850,6 +850,12 @@ class PluginsManager(PaymentInterface):
             "product_metadata_updated", default_value, product, channel_slug=None
         )
 
+    def product_discounted_prices_updated(self):
+        default_value = None
+        return self.__run_method_on_plugins(
+            "product_discounted_prices_updated", default_value, channel_slug=None
+        )
+
     # Note: this method is deprecated and will be removed in a future release.
     # Webhook-related functionality will be moved from plugin to core modules.
     def product_variant_created(self, product_variant: "ProductVariant", webhooks=None):
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-17 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0204_product_approval_status_product_compliance_data_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productvariantchannellisting",
+            name="pricing_rule_price_amount",
+            field=models.DecimalField(
+                blank=True, decimal_places=3, max_digits=20, null=True
+            ),
+        ),
+    ]
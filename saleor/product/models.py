@@ -442,12 +442,16 @@ class ProductVariant(SortableModel, ModelWithMetadata, ModelWithExternalReferenc
         channel_listing: "ProductVariantChannelListing",
         price_override: Optional["Decimal"] = None,
     ) -> "Money":
-        """Return the base variant price before applying the promotion discounts."""
-        return (
-            channel_listing.price
-            if price_override is None
-            else Money(price_override, channel_listing.currency)
-        )
+        """Return the base variant price before applying the promotion discounts.
+
+        A price set by a marketplace pricing rule takes precedence over the listing
+        price, as the pricing rule replaces promotions for the listing.
+        """
+        if price_override is not None:
+            return Money(price_override, channel_listing.currency)
+        if channel_listing.pricing_rule_price is not None:
+            return channel_listing.pricing_rule_price
+        return channel_listing.price
 
     def get_price(
         self,
@@ -587,6 +591,17 @@ class ProductVariantChannelListing(models.Model):
     discounted_price = MoneyField(
         amount_field="discounted_price_amount", currency_field="currency"
     )
+    # Set when a marketplace pricing rule gives a lower price than promotions; it
+    # replaces `price` as the base price of checkout and order lines.
+    pricing_rule_price_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        blank=True,
+        null=True,
+    )
+    pricing_rule_price = MoneyField(
+        amount_field="pricing_rule_price_amount", currency_field="currency"
+    )
     promotion_rules = models.ManyToManyField(
         PromotionRule,
         help_text="Promotion rules that were included in the discounted price.",
@@ -1,5 +1,6 @@
 from collections import defaultdict
 from decimal import Decimal
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from django.conf import settings
@@ -15,6 +16,7 @@ from ...discount.utils.promotion import (
     calculate_discounted_price_for_promotions,
     get_variants_to_promotion_rules_map,
 )
+from ...marketplace.services.pricing_rules import PricingRuleSet
 from ..managers import ProductsQueryset, ProductVariantQueryset
 from ..models import (
     ProductChannelListing,
@@ -23,9 +25,14 @@ from ..models import (
     VariantChannelListingPromotionRule,
 )
 
+if TYPE_CHECKING:
+    from ...plugins.manager import PluginsManager
+
 
 def update_discounted_prices_for_promotion(
-    products: ProductsQueryset, only_dirty_products: bool = False
+    products: ProductsQueryset,
+    only_dirty_products: bool = False,
+    manager: Optional["PluginsManager"] = None,
 ):
     """Update Products and ProductVariants discounted prices.
 
@@ -37,7 +44,14 @@ def update_discounted_prices_for_promotion(
 
     When only_dirty_products set to True, the prices will be recalculated only for the
     listings marked as dirty.
+
+    Active marketplace pricing rules of the products are applied as well; the lower
+    of the promotion and the pricing rule price becomes the discounted price.
+
+    Plugins are notified when any price changes; the manager is created when it's
+    not given.
     """
+    pricing_rules = PricingRuleSet.load(products)
     variant_qs = ProductVariant.objects.using(
         settings.DATABASE_CONNECTION_REPLICA_NAME
     ).filter(Exists(products.filter(id=OuterRef("product_id"))))
@@ -81,6 +95,12 @@ def update_discounted_prices_for_promotion(
             rules_info_per_variant,
             product_channel_listing.channel,
             variant_listing_to_listing_rule_per_rule_map,
+            _get_pricing_rule_prices(
+                pricing_rules,
+                product_id,
+                product_channel_listing.channel,
+                variant_listings,
+            ),
         )
 
         product_discounted_price = min(discounted_variants_price)
@@ -105,6 +125,18 @@ def update_discounted_prices_for_promotion(
         changed_variant_listing_promotion_rule_to_create,
         changed_variant_listing_promotion_rule_to_update,
     )
+    if (
+        changed_products_listings_to_update
+        or changed_variants_listings_to_update
+        or changed_variant_listing_promotion_rule_to_create
+        or changed_variant_listing_promotion_rule_to_update
+    ):
+        if manager is None:
+            from ...plugins.manager import get_plugins_manager
+
+            manager = get_plugins_manager(allow_replica=False)
+        # Prices are recalculated in bulk, without product events.
+        manager.product_discounted_prices_updated()
 
 
 def _update_or_create_listings(
@@ -125,7 +157,7 @@ def _update_or_create_listings(
     if changed_variants_listings_to_update:
         ProductVariantChannelListing.objects.bulk_update(
             sorted(changed_variants_listings_to_update, key=lambda listing: listing.id),
-            ["discounted_price_amount"],
+            ["discounted_price_amount", "pricing_rule_price_amount"],
         )
     if changed_variant_listing_promotion_rule_to_create:
         _create_variant_listing_promotion_rule(
@@ -239,11 +271,35 @@ def _get_variant_listings_to_listing_rule_per_rule_id_map(
     return variant_listing_rule_data
 
 
+def _get_pricing_rule_prices(
+    pricing_rules: PricingRuleSet,
+    product_id: int,
+    channel: Channel,
+    variant_listings: list[ProductVariantChannelListing],
+) -> dict[int, Money]:
+    """Return prices set by marketplace pricing rules per variant listing ID."""
+    if not pricing_rules:
+        return {}
+    country_code = channel.default_country.code if channel.default_country else None
+    rule_prices = {}
+    for variant_listing in variant_listings:
+        rule_price = pricing_rules.get_price(
+            product_id,
+            country_code,
+            variant_listing.price,
+            variant_listing.cost_price,
+        )
+        if rule_price is not None:
+            rule_prices[variant_listing.id] = rule_price
+    return rule_prices
+
+
 def _get_discounted_variants_prices_for_promotions(
     variant_listings: list[ProductVariantChannelListing],
     rules_info_per_variant: dict[int, list[PromotionRuleInfo]],
     channel: Channel,
     variant_listing_to_listing_rule_per_rule_map: dict,
+    pricing_rule_prices: dict[int, Money] | None = None,
 ) -> tuple[
     Money,
     list[ProductVariantChannelListing],
@@ -266,6 +322,7 @@ def _get_discounted_variants_prices_for_promotions(
             variant_id=variant_listing.variant_id,
         )
         discounted_variant_price = variant_listing.price
+        pricing_rule_price = (pricing_rule_prices or {}).get(variant_listing.id)
 
         rule_id = None
         if applied_discount:
@@ -275,6 +332,17 @@ def _get_discounted_variants_prices_for_promotions(
                 discounted_variant_price, zero_money(discounted_variant_price.currency)
             )
 
+        pricing_rule_price_amount = None
+        if (
+            pricing_rule_price is not None
+            and pricing_rule_price < discounted_variant_price
+        ):
+            # The pricing rule beats the promotion, so the promotion is not applied;
+            # the rule price becomes the base price of checkout and order lines.
+            rule_id = None
+            discounted_variant_price = pricing_rule_price
+            pricing_rule_price_amount = pricing_rule_price.amount
+        elif applied_discount:
             _handle_discount_rule_id(
                 variant_listing,
                 rule_id,
@@ -285,8 +353,12 @@ def _get_discounted_variants_prices_for_promotions(
                 variant_listing_promotion_rule_to_create,
             )
 
-        if variant_listing.discounted_price != discounted_variant_price:
+        if (
+            variant_listing.discounted_price != discounted_variant_price
+            or variant_listing.pricing_rule_price_amount != pricing_rule_price_amount
+        ):
             variant_listing.discounted_price_amount = discounted_variant_price.amount
+            variant_listing.pricing_rule_price_amount = pricing_rule_price_amount
             variants_listings_to_update.append(variant_listing)
 
             # delete variant listing - promotion rules relations that are not valid
@@ -764,6 +764,11 @@ EVENT_PAYLOAD_DELETE_PERIOD = datetime.timedelta(
 EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT = datetime.timedelta(
     seconds=parse(os.environ.get("EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT", "1 hour"))
 )
+# Compressed event payloads created together are packed into shared segment
+# files of up to this many bytes.
+EVENT_PAYLOAD_SEGMENT_SIZE = int(
+    os.environ.get("EVENT_PAYLOAD_SEGMENT_SIZE", 1024 * 1024)
+)
 EVENT_DELIVERY_ATTEMPT_RESPONSE_SIZE_LIMIT = int(
     os.environ.get("EVENT_DELIVERY_ATTEMPT_RESPONSE_SIZE_LIMIT", 1024)
 )
@@ -825,6 +830,95 @@ DEFAULT_CHANNEL_SLUG = os.environ.get("DEFAULT_CHANNEL_SLUG", "default-channel")
 # product.
 POPULATE_DEFAULTS = get_bool_from_env("POPULATE_DEFAULTS", True)
 
+# Marketplace settings
+# Max number of hosts kept in the per-process seller tenant cache and how long
+# (in seconds) an entry is trusted before it's re-read from the shared cache.
+SELLER_TENANT_LOCAL_CACHE_SIZE = int(
+    os.environ.get("SELLER_TENANT_LOCAL_CACHE_SIZE", 10000)
+)
+SELLER_TENANT_LOCAL_CACHE_TTL = parse(
+    os.environ.get("SELLER_TENANT_LOCAL_CACHE_TTL", "30 seconds")
+)
+# Stock changes are synced to fulfillment centers in batches. The debounce window
+# (in seconds) lets changes of the same stock coalesce before they are flushed.
+INVENTORY_SYNC_DEBOUNCE = parse(os.environ.get("INVENTORY_SYNC_DEBOUNCE", "5 seconds"))
+INVENTORY_SYNC_FLUSH_BATCH_SIZE = int(
+    os.environ.get("INVENTORY_SYNC_FLUSH_BATCH_SIZE", 500)
+)
+# Product views are buffered in a Redis list and flushed to the recently viewed
+# products table periodically. Without a broker URL views are stored directly.
+PRODUCT_VIEW_BUFFER_BROKER_URL = os.environ.get("PRODUCT_VIEW_BUFFER_BROKER_URL")
+PRODUCT_VIEW_BUFFER_SIZE_LIMIT = int(
+    os.environ.get("PRODUCT_VIEW_BUFFER_SIZE_LIMIT", 100000)
+)
+PRODUCT_VIEW_FLUSH_BATCH_SIZE = int(
+    os.environ.get("PRODUCT_VIEW_FLUSH_BATCH_SIZE", 1000)
+)
+PRODUCT_VIEW_FLUSH_PERIOD = datetime.timedelta(
+    seconds=parse(os.environ.get("PRODUCT_VIEW_FLUSH_PERIOD", "5 seconds"))
+)
+PRODUCT_VIEW_BUFFER_TIMEOUT = datetime.timedelta(
+    seconds=parse(os.environ.get("PRODUCT_VIEW_BUFFER_TIMEOUT", "1 hour"))
+)
+if PRODUCT_VIEW_BUFFER_BROKER_URL:
+    CELERY_BEAT_SCHEDULE["flush-product-views"] = {
+        "task": "saleor.marketplace.tasks.flush_product_views_task",
+        "schedule": PRODUCT_VIEW_FLUSH_PERIOD,
+        "options": {"expires": PRODUCT_VIEW_FLUSH_PERIOD.total_seconds()},
+    }
+
+# Period of checking whether validity windows of pricing rules started or ended;
+# prices of affected products are recalculated afterwards.
+PRICING_RULE_BOUNDARY_CHECK_PERIOD = datetime.timedelta(
+    seconds=parse(os.environ.get("PRICING_RULE_BOUNDARY_CHECK_PERIOD", "1 minute"))
+)
+CELERY_BEAT_SCHEDULE["pricing-rule-boundaries"] = {
+    "task": "saleor.marketplace.tasks.mark_pricing_rule_boundaries_task",
+    "schedule": PRICING_RULE_BOUNDARY_CHECK_PERIOD,
+    "options": {"expires": PRICING_RULE_BOUNDARY_CHECK_PERIOD.total_seconds()},
+}
+
+HELP_ARTICLE_VIEW_BUFFER_BROKER_URL = os.environ.get(
+    "HELP_ARTICLE_VIEW_BUFFER_BROKER_URL"
+)
+HELP_ARTICLE_VIEW_BUFFER_SIZE_LIMIT = int(
+    os.environ.get("HELP_ARTICLE_VIEW_BUFFER_SIZE_LIMIT", 100000)
+)
+HELP_ARTICLE_VIEW_FLUSH_BATCH_SIZE = int(
+    os.environ.get("HELP_ARTICLE_VIEW_FLUSH_BATCH_SIZE", 1000)
+)
+HELP_ARTICLE_VIEW_FLUSH_PERIOD = datetime.timedelta(
+    seconds=parse(os.environ.get("HELP_ARTICLE_VIEW_FLUSH_PERIOD", "30 seconds"))
+)
+HELP_ARTICLE_VIEW_BUFFER_TIMEOUT = datetime.timedelta(
+    seconds=parse(os.environ.get("HELP_ARTICLE_VIEW_BUFFER_TIMEOUT", "1 hour"))
+)
+# Raw help article views are deleted after this period; daily rollups are kept.
+HELP_ARTICLE_VIEW_RETENTION = datetime.timedelta(
+    seconds=parse(os.environ.get("HELP_ARTICLE_VIEW_RETENTION", "90 days"))
+)
+if HELP_ARTICLE_VIEW_BUFFER_BROKER_URL:
+    CELERY_BEAT_SCHEDULE["flush-help-article-views"] = {
+        "task": "saleor.marketplace.tasks.flush_help_article_views_task",
+        "schedule": HELP_ARTICLE_VIEW_FLUSH_PERIOD,
+        "options": {"expires": HELP_ARTICLE_VIEW_FLUSH_PERIOD.total_seconds()},
+    }
+CELERY_BEAT_SCHEDULE["delete-old-help-article-views"] = {
+    "task": "saleor.marketplace.tasks.delete_old_help_article_views_task",
+    "schedule": datetime.timedelta(days=1),
+}
+
+# Loyalty points are credited and expired in chunks of this many users.
+LOYALTY_POINTS_BATCH_SIZE = int(os.environ.get("LOYALTY_POINTS_BATCH_SIZE", 1000))
+LOYALTY_POINTS_EXPIRY_PERIOD = datetime.timedelta(
+    seconds=parse(os.environ.get("LOYALTY_POINTS_EXPIRY_PERIOD", "1 hour"))
+)
+CELERY_BEAT_SCHEDULE["expire-loyalty-points"] = {
+    "task": "saleor.marketplace.tasks.expire_loyalty_points_task",
+    "schedule": LOYALTY_POINTS_EXPIRY_PERIOD,
+    "options": {"expires": LOYALTY_POINTS_EXPIRY_PERIOD.total_seconds()},
+}
+
 
 #  Sentry
 sentry_sdk.utils.MAX_STRING_LENGTH = 4096  # type: ignore[attr-defined]
@@ -882,6 +976,7 @@ BUILTIN_PLUGINS = [
     "saleor.plugins.avatax.plugin.DeprecatedAvataxPlugin",
     "saleor.plugins.webhook.plugin.WebhookPlugin",
     "saleor.plugins.marketplace_shipping.plugin.MarketplaceShippingPlugin",
+    "saleor.plugins.graphql_response_cache.plugin.GraphQLResponseCachePlugin",
     "saleor.payment.gateways.dummy.plugin.DeprecatedDummyGatewayPlugin",
     "saleor.payment.gateways.dummy_credit_card.plugin.DeprecatedDummyCreditCardGatewayPlugin",
     "saleor.payment.gateways.stripe.plugin.StripeGatewayPlugin",
@@ -1073,6 +1168,21 @@ WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT = 18
 WEBHOOK_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 WEBHOOK_SYNC_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 
+# Number of async webhook deliveries of a single app sent at the same time by one
+# worker, over keep-alive connections. With the default of 1 deliveries are sent
+# one after another.
+WEBHOOK_ASYNC_APP_CONCURRENCY = int(os.environ.get("WEBHOOK_ASYNC_APP_CONCURRENCY", 1))
+
+# When enabled, new async webhook deliveries are sent by one task per app instead of
+# a task per delivery. A marker in the cache ensures that at most one such task is
+# enqueued or running for an app; it expires after the timeout if a worker dies.
+WEBHOOK_ASYNC_APP_DISPATCH_ENABLED = get_bool_from_env(
+    "WEBHOOK_ASYNC_APP_DISPATCH_ENABLED", False
+)
+WEBHOOK_ASYNC_APP_DISPATCH_MARKER_TIMEOUT = parse(
+    os.environ.get("WEBHOOK_ASYNC_APP_DISPATCH_MARKER_TIMEOUT", "5 minutes")
+)
+
 # The max number of rules with order_predicate defined
 ORDER_RULES_LIMIT = os.environ.get("ORDER_RULES_LIMIT", 100)
 
@@ -1139,6 +1249,22 @@ TELEMETRY_SLOW_GRAPHQL_OPERATION_THRESHOLD = float(
 # For development envs, where schema may change often, it may be convenient to set it to e.g. commit hash value.
 GRAPHQL_CACHE_SUFFIX = os.environ.get("GRAPHQL_CACHE_SUFFIX", "")
 
+# Texts of automatic persisted queries are kept in the cache shared by all workers
+# for this long after they were last registered.
+GRAPHQL_PERSISTED_QUERY_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_PERSISTED_QUERY_TIMEOUT", "7 days")
+)
+
+# Cache responses of anonymous storefront queries for products, categories,
+# collections, menus and pages. Cached responses are invalidated when the objects
+# they contain change and expire after the timeout.
+GRAPHQL_RESPONSE_CACHE_ENABLED = get_bool_from_env(
+    "GRAPHQL_RESPONSE_CACHE_ENABLED", False
+)
+GRAPHQL_RESPONSE_CACHE_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_RESPONSE_CACHE_TIMEOUT", "5 minutes")
+)
+
 # Library `google-i18n-address` use `AddressValidationMetadata` form Google to provide address validation rules.
 # Patch `i18n` module to allows to override the default address rules.
 i18n_rules_override()
@@ -115,6 +115,40 @@ def test_trigger_webhooks_async_for_multiple_objects(
         )
 
 
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+def test_trigger_webhooks_async_for_multiple_objects_writes_payloads_at_once(
+    mocked_send_webhook_request,
+    webhook,
+    order_with_lines,
+    order_unconfirmed,
+):
+    # given
+    webhook_type = WebhookEventAsyncType.ORDER_CREATED
+    orders = [order_with_lines, order_unconfirmed]
+
+    # when
+    trigger_webhooks_async_for_multiple_objects(
+        webhook_type,
+        Webhook.objects.filter(pk=webhook.pk),
+        webhook_payloads_data=[
+            WebhookPayloadData(
+                data=json.dumps({"order": str(order.pk)}),
+                subscribable_object=order,
+            )
+            for order in orders
+        ],
+    )
+
+    # then
+    deliveries = EventDelivery.objects.select_related("payload")
+    assert sorted(
+        json.loads(delivery.payload.get_payload())["order"] for delivery in deliveries
+    ) == sorted(str(order.pk) for order in orders)
+    assert len({delivery.payload.payload_file.name for delivery in deliveries}) == 1
+
+
 @mock.patch(
     "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
 )
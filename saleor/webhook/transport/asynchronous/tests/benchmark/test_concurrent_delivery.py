@@ -0,0 +1,84 @@
+"""Load benchmark of async webhook delivery against a local stub app.
+
+The stub responds after `STUB_LATENCY` seconds, so sequential delivery is capped at
+1 / STUB_LATENCY deliveries per second. Run with `pytest -s` to see the throughput
+for each concurrency.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from ......core.models import EventDelivery, EventDeliveryStatus, EventPayload
+from ......webhook.event_types import WebhookEventAsyncType
+from ...transport import send_webhooks_async_for_app
+
+DELIVERIES_COUNT = 100
+STUB_LATENCY = 0.05
+
+
+class StubAppHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(STUB_LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_app_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubAppHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/webhook"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("concurrency", [1, 4, 16])
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_async_delivery_throughput(
+    mock_send_webhooks_async_for_app_apply_async,
+    concurrency,
+    stub_app_url,
+    webhook,
+    app,
+    settings,
+):
+    # given
+    settings.WEBHOOK_ASYNC_APP_CONCURRENCY = concurrency
+    webhook.target_url = stub_app_url
+    webhook.save(update_fields=["target_url"])
+    payload = EventPayload.objects.create(payload='{"payload_key": "payload_value"}')
+    EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                event_type=WebhookEventAsyncType.ANY,
+                payload=payload,
+                webhook=webhook,
+            )
+            for _ in range(DELIVERIES_COUNT)
+        ]
+    )
+
+    # when
+    start = time.perf_counter()
+    send_webhooks_async_for_app(app_id=app.id)
+    elapsed = time.perf_counter() - start
+
+    # then
+    assert not EventDelivery.objects.filter(status=EventDeliveryStatus.PENDING).exists()
+    print(  # noqa: T201
+        f"\nconcurrency {concurrency}: {DELIVERIES_COUNT / elapsed:,.1f} deliveries/sec"
+    )
@@ -0,0 +1,161 @@
+from unittest.mock import ANY, patch
+
+import pytest
+from django.core.cache import cache
+
+from .....core.models import EventDelivery, EventDeliveryStatus
+from .....core.telemetry import saleor_attributes
+from .....tests.utils import get_metric_data
+from ....event_types import WebhookEventAsyncType
+from ....models import Webhook
+from ...metrics import METRIC_ASYNC_APP_DISPATCH_COUNT, METRIC_ASYNC_PENDING_DELIVERIES
+from ...utils import WebhookResponse, get_sqs_message_group_id
+from ..transport import (
+    APP_DISPATCH_MARKER_KEY,
+    WebhookPayloadData,
+    send_webhooks_async_for_app,
+    trigger_webhooks_async_for_multiple_objects,
+)
+
+
+@pytest.fixture
+def app_dispatch_enabled(settings, app):
+    settings.WEBHOOK_ASYNC_APP_DISPATCH_ENABLED = True
+    marker_key = APP_DISPATCH_MARKER_KEY.format(app_id=app.id)
+    cache.delete(marker_key)
+    yield marker_key
+    cache.delete(marker_key)
+
+
+def _trigger_order_created(orders):
+    trigger_webhooks_async_for_multiple_objects(
+        WebhookEventAsyncType.ORDER_CREATED,
+        Webhook.objects.all(),
+        webhook_payloads_data=[
+            WebhookPayloadData(data='{"example": "payload"}', subscribable_object=o)
+            for o in orders
+        ],
+    )
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_trigger_webhooks_async_dispatches_one_task_per_app(
+    mocked_send_webhooks_async_for_app,
+    mocked_send_webhook_request,
+    app_dispatch_enabled,
+    webhook,
+    app,
+    order_with_lines,
+    order_unconfirmed,
+):
+    # when
+    _trigger_order_created([order_with_lines, order_unconfirmed])
+
+    # then
+    assert EventDelivery.objects.filter(webhook__app=app).count() == 2
+    mocked_send_webhook_request.assert_not_called()
+    mocked_send_webhooks_async_for_app.assert_called_once_with(
+        kwargs={"app_id": app.id, "telemetry_context": ANY, "queue": None},
+        queue=None,
+        MessageGroupId=get_sqs_message_group_id("example.com", app),
+    )
+    assert cache.get(app_dispatch_enabled)
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_trigger_webhooks_async_coalesces_wake_ups_of_app(
+    mocked_send_webhooks_async_for_app,
+    app_dispatch_enabled,
+    webhook,
+    app,
+    order_with_lines,
+    order_unconfirmed,
+    get_test_metrics_data,
+):
+    # when
+    _trigger_order_created([order_with_lines])
+    _trigger_order_created([order_unconfirmed])
+
+    # then
+    mocked_send_webhooks_async_for_app.assert_called_once()
+    metrics_data = get_test_metrics_data()
+    dispatch_count = {
+        data_point.attributes[
+            saleor_attributes.SALEOR_WEBHOOK_DISPATCH_COALESCED
+        ]: data_point.value
+        for data_point in get_metric_data(
+            metrics_data, METRIC_ASYNC_APP_DISPATCH_COUNT
+        ).data.data_points
+    }
+    assert dispatch_count == {False: 1, True: 1}
+    pending_deliveries = get_metric_data(
+        metrics_data, METRIC_ASYNC_PENDING_DELIVERIES
+    ).data.data_points[0]
+    assert pending_deliveries.value == 2
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_webhooks_async_for_app_releases_marker_when_done(
+    mocked_send_webhooks_async_for_app,
+    mock_send_webhook_using_scheme_method,
+    app_dispatch_enabled,
+    app,
+    event_delivery,
+):
+    # given
+    cache.set(app_dispatch_enabled, 1)
+    mock_send_webhook_using_scheme_method.return_value = WebhookResponse(
+        content="", status=EventDeliveryStatus.SUCCESS
+    )
+    send_webhooks_async_for_app(app_id=app.id)
+    assert cache.get(app_dispatch_enabled)
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    assert cache.get(app_dispatch_enabled) is None
+    mocked_send_webhooks_async_for_app.assert_called_once()
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.claim_deliveries_for_app",
+    return_value=({}, {}),
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_webhooks_async_for_app_wakes_up_for_deliveries_created_meanwhile(
+    mocked_send_webhooks_async_for_app,
+    mocked_claim_deliveries_for_app,
+    app_dispatch_enabled,
+    app,
+    event_delivery,
+):
+    # given
+    # the delivery was created after the task fetched an empty batch, so it wasn't
+    # dispatched as the marker was still set
+    cache.set(app_dispatch_enabled, 1)
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    mocked_send_webhooks_async_for_app.assert_called_once_with(
+        kwargs={"app_id": app.id, "telemetry_context": ANY, "queue": None},
+        queue=None,
+        MessageGroupId=get_sqs_message_group_id("example.com", app),
+    )
+    assert cache.get(app_dispatch_enabled)
@@ -1,7 +1,15 @@
+from datetime import timedelta
 from unittest.mock import ANY, patch
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
 from .....core.models import EventDelivery, EventDeliveryAttempt, EventDeliveryStatus
+from .....graphql.app.enums import CircuitBreakerState
 from ..transport import (
+    WEBHOOK_ASYNC_APP_LEASE,
+    WEBHOOK_RETRY_BACKOFF,
     WebhookResponse,
     send_webhooks_async_for_app,
 )
@@ -31,7 +39,8 @@ def test_send_webhooks_async_for_app(
     # then
     mock_send_webhook_using_scheme_method.assert_called_once()
     mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
-        kwargs={"app_id": app.id, "telemetry_context": ANY},
+        kwargs={"app_id": app.id, "telemetry_context": ANY, "queue": None},
+        queue=None,
     )
 
     # deliveries should be cleared
@@ -78,13 +87,14 @@ def test_send_webhooks_async_for_app_doesnt_pick_failed(
 @patch(
     "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
 )
-def test_send_webhooks_async_for_app_no_payload(
+def test_send_webhooks_async_for_app_skips_deliveries_without_payload(
     mock_send_webhooks_async_for_app_apply_async,
     mock_send_webhook_using_scheme_method,
     app,
     event_delivery,
 ):
     # given
+    # deferred payloads are generated after the delivery is created
     event_delivery.payload = None
     event_delivery.save()
 
@@ -98,13 +108,8 @@ def test_send_webhooks_async_for_app_no_payload(
     deliveries = EventDelivery.objects.all()
     assert len(deliveries) == 1
     assert deliveries[0].status == EventDeliveryStatus.PENDING
-    assert EventDeliveryAttempt.objects.filter(
-        status=EventDeliveryStatus.FAILED
-    ).exists()
-
-    mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
-        kwargs={"app_id": app.id, "telemetry_context": ANY},
-    )
+    assert not EventDeliveryAttempt.objects.exists()
+    mock_send_webhooks_async_for_app_apply_async.assert_not_called()
 
 
 @patch(
@@ -138,7 +143,8 @@ def test_send_webhooks_async_for_app_failed_status(
     ).exists()
 
     mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
-        kwargs={"app_id": app.id, "telemetry_context": ANY},
+        kwargs={"app_id": app.id, "telemetry_context": ANY, "queue": None},
+        queue=None,
     )
 
 
@@ -166,7 +172,8 @@ def test_send_multiple_webhooks_async_for_app(
     # then
     assert mock_send_webhook_using_scheme_method.call_count == 3
     mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
-        kwargs={"app_id": app.id, "telemetry_context": ANY},
+        kwargs={"app_id": app.id, "telemetry_context": ANY, "queue": None},
+        queue=None,
     )
 
     # deliveries should be cleared
@@ -195,6 +202,8 @@ def test_send_webhooks_async_for_app_last_retry_failed(
             for _ in range(5)
         ]
     )
+    # the backoff after the last attempt has passed
+    EventDeliveryAttempt.objects.update(created_at=timezone.now() - timedelta(hours=1))
     mock_send_webhook_using_scheme_method.return_value = WebhookResponse(
         content="", status=EventDeliveryStatus.FAILED
     )
@@ -212,5 +221,255 @@ def test_send_webhooks_async_for_app_last_retry_failed(
     )
 
     mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
-        kwargs={"app_id": app.id, "telemetry_context": ANY},
+        kwargs={"app_id": app.id, "telemetry_context": ANY, "queue": None},
+        queue=None,
+    )
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_multiple_webhooks_async_for_app_concurrently(
+    mock_send_webhooks_async_for_app_apply_async,
+    mock_send_webhook_using_scheme_method,
+    app,
+    event_deliveries,
+    settings,
+):
+    # given
+    settings.WEBHOOK_ASYNC_APP_CONCURRENCY = 2
+    mock_send_webhook_using_scheme_method.side_effect = [
+        WebhookResponse(content="", status=EventDeliveryStatus.SUCCESS),
+        WebhookResponse(content="", status=EventDeliveryStatus.FAILED),
+        WebhookResponse(content="", status=EventDeliveryStatus.SUCCESS),
+    ]
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    assert mock_send_webhook_using_scheme_method.call_count == 3
+    sessions = {
+        call.kwargs["session"]
+        for call in mock_send_webhook_using_scheme_method.call_args_list
+    }
+    assert len(sessions) == 1
+    delivery = EventDelivery.objects.get()
+    assert delivery.status == EventDeliveryStatus.PENDING
+    assert EventDeliveryAttempt.objects.filter(
+        delivery=delivery, status=EventDeliveryStatus.FAILED
+    ).exists()
+    mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
+        kwargs={"app_id": app.id, "telemetry_context": ANY, "queue": None},
+        queue=None,
+    )
+
+
+@patch("saleor.webhook.transport.asynchronous.transport.breaker_board")
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_webhooks_async_for_app_concurrently_with_open_circuit_breaker(
+    mock_send_webhooks_async_for_app_apply_async,
+    mock_send_webhook_using_scheme_method,
+    mock_breaker_board,
+    app,
+    event_delivery,
+    settings,
+):
+    # given
+    settings.WEBHOOK_ASYNC_APP_CONCURRENCY = 2
+    mock_breaker_board.update_breaker_state.return_value = CircuitBreakerState.OPEN
+    mock_breaker_board.cooldown_seconds = 120
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    mock_send_webhook_using_scheme_method.assert_not_called()
+    assert EventDelivery.objects.get().status == EventDeliveryStatus.PENDING
+    assert not EventDeliveryAttempt.objects.exists()
+    mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
+        kwargs={"app_id": app.id, "telemetry_context": ANY, "queue": None},
+        queue=None,
+        countdown=120,
+    )
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_webhooks_async_for_app_waits_for_retry_backoff(
+    mock_send_webhooks_async_for_app_apply_async,
+    mock_send_webhook_using_scheme_method,
+    app,
+    event_delivery,
+):
+    # given
+    EventDeliveryAttempt.objects.create(
+        delivery=event_delivery, status=EventDeliveryStatus.FAILED
+    )
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    mock_send_webhook_using_scheme_method.assert_not_called()
+    assert EventDelivery.objects.get().status == EventDeliveryStatus.PENDING
+    assert EventDeliveryAttempt.objects.count() == 1
+    mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
+        kwargs={"app_id": app.id, "telemetry_context": ANY, "queue": ANY},
+        queue=ANY,
+        MessageGroupId=ANY,
+        countdown=WEBHOOK_RETRY_BACKOFF,
+    )
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhooks_async_for_app_retries_after_backoff(
+    mock_send_webhook_using_scheme_method,
+    app,
+    event_delivery,
+):
+    # given
+    attempt = EventDeliveryAttempt.objects.create(
+        delivery=event_delivery, status=EventDeliveryStatus.FAILED
+    )
+    EventDeliveryAttempt.objects.filter(pk=attempt.pk).update(
+        created_at=timezone.now() - timedelta(seconds=WEBHOOK_RETRY_BACKOFF + 1)
+    )
+    mock_send_webhook_using_scheme_method.return_value = WebhookResponse(
+        content="", status=EventDeliveryStatus.SUCCESS
+    )
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    mock_send_webhook_using_scheme_method.assert_called_once()
+    assert not EventDelivery.objects.exists()
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhooks_async_for_app_skips_deliveries_claimed_by_other_task(
+    mock_send_webhook_using_scheme_method,
+    app,
+    event_delivery,
+):
+    # given
+    # the pending attempt of the task that is sending the delivery
+    EventDeliveryAttempt.objects.create(
+        delivery=event_delivery, status=EventDeliveryStatus.PENDING
+    )
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    mock_send_webhook_using_scheme_method.assert_not_called()
+    assert EventDeliveryAttempt.objects.count() == 1
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhooks_async_for_app_resends_deliveries_with_expired_claim(
+    mock_send_webhook_using_scheme_method,
+    app,
+    event_delivery,
+):
+    # given
+    # the task that claimed the delivery didn't store the result of the attempt
+    attempt = EventDeliveryAttempt.objects.create(
+        delivery=event_delivery, status=EventDeliveryStatus.PENDING
+    )
+    EventDeliveryAttempt.objects.filter(pk=attempt.pk).update(
+        created_at=timezone.now() - timedelta(seconds=WEBHOOK_ASYNC_APP_LEASE + 1)
+    )
+    mock_send_webhook_using_scheme_method.return_value = WebhookResponse(
+        content="", status=EventDeliveryStatus.SUCCESS
+    )
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    mock_send_webhook_using_scheme_method.assert_called_once()
+    assert not EventDelivery.objects.exists()
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhooks_async_for_app_skips_inactive_webhook(
+    mock_send_webhook_using_scheme_method, app, event_delivery
+):
+    # given
+    event_delivery.webhook.is_active = False
+    event_delivery.webhook.save(update_fields=["is_active"])
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    mock_send_webhook_using_scheme_method.assert_not_called()
+    assert not EventDeliveryAttempt.objects.exists()
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhooks_async_for_app_skips_inactive_app(
+    mock_send_webhook_using_scheme_method, app, event_delivery
+):
+    # given
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    mock_send_webhook_using_scheme_method.assert_not_called()
+    assert not EventDeliveryAttempt.objects.exists()
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_webhooks_async_for_app_skips_deliveries_locked_by_other_task(
+    mock_send_webhooks_async_for_app_apply_async,
+    mock_send_webhook_using_scheme_method,
+    app,
+    event_delivery,
+):
+    # given
+    mock_send_webhook_using_scheme_method.return_value = WebhookResponse(
+        content="", status=EventDeliveryStatus.SUCCESS
+    )
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    assert any(
+        "FOR UPDATE OF" in query["sql"] and "SKIP LOCKED" in query["sql"]
+        for query in ctx.captured_queries
     )
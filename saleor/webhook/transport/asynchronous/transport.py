@@ -1,8 +1,10 @@
 import datetime
 import json
 import logging
+import math
 from collections import defaultdict
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
@@ -12,13 +14,16 @@ from celery.exceptions import MaxRetriesExceededError
 from celery.utils.log import get_task_logger
 from django.apps import apps
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
+from django.utils import timezone
 from opentelemetry.trace import StatusCode
+from requests import Session
 
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
 from ....core.db.connection import allow_writer
-from ....core.models import EventDelivery, EventPayload
+from ....core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ....core.telemetry import (
     TelemetryTaskContext,
     get_task_context,
@@ -27,6 +32,7 @@ from ....core.telemetry import (
 from ....core.tracing import webhooks_otel_trace
 from ....core.utils import get_domain
 from ....core.utils.url import sanitize_url_for_logging
+from ....graphql.app.enums import CircuitBreakerState
 from ....graphql.webhook.subscription_payload import (
     generate_payload_from_subscription,
     generate_payload_promise_from_subscription,
@@ -35,24 +41,32 @@ from ....graphql.webhook.subscription_payload import (
 )
 from ....graphql.webhook.subscription_types import WEBHOOK_TYPES_MAP
 from ... import observability
+from ...circuit_breaker.breaker_board import initialize_breaker_board
 from ...event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ...observability import WebhookData
-from ..metrics import record_external_request, record_first_delivery_attempt_delay
+from ..metrics import (
+    record_async_app_dispatch,
+    record_async_pending_deliveries,
+    record_external_request,
+    record_first_delivery_attempt_delay,
+)
 from ..utils import (
     DeferredPayloadData,
+    EventDeliveryWithAttemptCount,
     RequestorModelName,
     WebhookResponse,
     WebhookSchemes,
     attempt_update,
+    claim_deliveries_for_app,
     clear_successful_deliveries,
     clear_successful_delivery,
     create_attempt,
-    create_attempts_for_deliveries,
     delivery_update,
-    get_deliveries_for_app,
     get_delivery_for_webhook,
     get_multiple_deliveries_for_webhooks,
+    get_pending_deliveries_for_app,
     get_sqs_message_group_id,
+    get_webhook_http_session,
     handle_webhook_retry,
     prepare_deferred_payload_data,
     process_failed_deliveries,
@@ -60,6 +74,7 @@ from ..utils import (
 )
 
 if TYPE_CHECKING:
+    from ....app.models import App
     from ....graphql.core.context import SaleorContext
     from ....graphql.core.dataloaders import DataLoader
     from ....webhook.models import Webhook
@@ -72,7 +87,19 @@ OBSERVABILITY_QUEUE_NAME = "observability"
 MAX_WEBHOOK_EVENTS_IN_DB_BULK = 100
 
 MAX_WEBHOOK_RETRIES = 5
+WEBHOOK_RETRY_BACKOFF = 10
 WEBHOOK_ASYNC_BATCH_SIZE = 100
+# Deliveries claimed by the per-app task aren't picked by another task until the
+# whole batch could have been sent with every request timing out.
+WEBHOOK_ASYNC_APP_LEASE = WEBHOOK_ASYNC_BATCH_SIZE * math.ceil(
+    sum(settings.WEBHOOK_TIMEOUT)
+)
+
+APP_DISPATCH_MARKER_KEY = "webhook:async:app-dispatch:{app_id}"
+
+# Consulted before sending deliveries concurrently, so an app with an open circuit
+# breaker isn't flooded with requests.
+breaker_board = initialize_breaker_board()
 
 
 @dataclass
@@ -360,8 +387,10 @@ def trigger_webhooks_async_for_multiple_objects(
         int, list[tuple[EventDelivery, DeferredPayloadData]]
     ] = defaultdict(list)
 
-    for webhook_payload_detail in webhook_payloads_data:
-        if legacy_webhooks:
+    if legacy_webhooks:
+        event_payloads = []
+        event_payloads_data = []
+        for webhook_payload_detail in webhook_payloads_data:
             data = webhook_payload_detail.data
             if webhook_payload_detail.legacy_data_generator:
                 data = webhook_payload_detail.legacy_data_generator()
@@ -369,19 +398,31 @@ def trigger_webhooks_async_for_multiple_objects(
                 raise NotImplementedError(
                     "No payload was provided for regular webhooks."
                 )
+            event_payloads.append(EventPayload())
+            event_payloads_data.append(data)
 
-            with allow_writer():
-                # Use transaction to ensure EventPayload and EventDelivery are created
-                # together, preventing inconsistent DB state.
-                with transaction.atomic():
-                    payload = EventPayload.objects.create_with_payload_file(data)
-                    deliveries.extend(
-                        create_event_delivery_list_for_webhooks(
-                            webhooks=legacy_webhooks,
-                            event_payload=payload,
-                            event_type=event_type,
-                        )
+        with allow_writer():
+            # Use transaction to ensure EventPayload and EventDelivery are created
+            # together, preventing inconsistent DB state. Payloads of all objects
+            # are written at once, so they share a single segment file.
+            with transaction.atomic():
+                EventPayload.objects.bulk_create_with_payload_files(
+                    event_payloads, event_payloads_data
+                )
+                deliveries.extend(
+                    EventDelivery.objects.bulk_create(
+                        [
+                            EventDelivery(
+                                status=EventDeliveryStatus.PENDING,
+                                event_type=event_type,
+                                payload=event_payload,
+                                webhook=webhook,
+                            )
+                            for event_payload in event_payloads
+                            for webhook in legacy_webhooks
+                        ]
                     )
+                )
 
     if subscription_webhooks:
         subscribable_objects = [
@@ -439,11 +480,12 @@ def trigger_webhooks_async_for_multiple_objects(
             MessageGroupId=message_group_id,
         )
 
+    if settings.WEBHOOK_ASYNC_APP_DISPATCH_ENABLED:
+        dispatch_deliveries_for_apps(deliveries, get_task_context(), queue=queue)
+        return
+
     for delivery in deliveries:
         message_group_id = get_sqs_message_group_id(domain, delivery.webhook.app)
-        # TODO: switch to new `send_webhooks_async_for_app` task when we have
-        # deduplication mechanism in place.
-
         send_webhook_request_async.apply_async(
             kwargs={
                 "event_delivery_id": delivery.pk,
@@ -679,12 +721,18 @@ def _generate_deferred_payloads(
                 EventDelivery.objects.bulk_update(
                     event_deliveries_for_bulk_update, ["payload"]
                 )
+    if settings.WEBHOOK_ASYNC_APP_DISPATCH_ENABLED:
+        dispatch_deliveries_for_apps(
+            event_deliveries_for_bulk_update,
+            telemetry_context,
+            queue=send_webhook_queue,
+        )
+        return
+
     domain = get_domain()
     for delivery in event_deliveries_for_bulk_update:
         # Trigger webhook delivery task when the payload is ready.
         message_group_id = get_sqs_message_group_id(domain, delivery.webhook.app)
-        # TODO: switch to new `send_webhooks_async_for_app` task when we have
-        # deduplication mechanism in place.
         send_webhook_request_async.apply_async(
             kwargs={
                 "event_delivery_id": delivery.pk,
@@ -701,7 +749,7 @@ def _generate_deferred_payloads(
 @app.task(
     queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
     bind=True,
-    retry_backoff=10,
+    retry_backoff=WEBHOOK_RETRY_BACKOFF,
     retry_kwargs={"max_retries": 5},
 )
 @allow_writer()
@@ -783,6 +831,103 @@ def send_webhook_request_async(
     clear_successful_delivery(delivery)
 
 
+def send_delivery_request(
+    delivery: EventDelivery,
+    attempt_count: int,
+    domain: str,
+    telemetry_context: TelemetryTaskContext,
+    session: Session | None = None,
+) -> WebhookResponse:
+    """Send the payload of a delivery without touching the database.
+
+    Safe to call from worker threads, as the payload and webhook app are fetched
+    along with the delivery.
+    """
+    webhook = delivery.webhook
+    try:
+        if not delivery.payload:
+            raise ValueError(f"Event delivery id: {delivery.pk} has no payload.")
+        data = delivery.payload.get_payload()
+        # Convert payload to bytes if it's not already.
+        data = data if isinstance(data, bytes) else data.encode("utf-8")
+        # Count payload size in bytes.
+        payload_size = len(data)
+
+        if attempt_count == 0:
+            record_first_delivery_attempt_delay(
+                delivery.created_at, delivery.event_type, webhook.app
+            )
+        send_kwargs = {"session": session} if session else {}
+        with webhooks_otel_trace(
+            delivery.event_type,
+            payload_size,
+            webhook.app,
+            span_links=telemetry_context.links,
+        ):
+            response = send_webhook_using_scheme_method(
+                webhook.target_url,
+                domain,
+                webhook.secret_key,
+                delivery.event_type,
+                data,
+                webhook.custom_headers,
+                **send_kwargs,
+            )
+
+        record_external_request(
+            delivery.event_type,
+            webhook.target_url,
+            response,
+            payload_size,
+            webhook.app,
+            sync=False,
+        )
+    except ValueError as e:
+        response = WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
+    return response
+
+
+def send_delivery_requests_concurrently(
+    deliveries: dict[int, EventDeliveryWithAttemptCount],
+    domain: str,
+    telemetry_context: TelemetryTaskContext,
+    concurrency: int,
+) -> dict[int, WebhookResponse]:
+    """Send deliveries with at most `concurrency` requests in flight.
+
+    Requests share one session, so connections to the app are kept alive between
+    deliveries.
+    """
+    with (
+        get_webhook_http_session(concurrency) as session,
+        ThreadPoolExecutor(max_workers=concurrency) as executor,
+    ):
+        futures = {
+            delivery_id: executor.submit(
+                send_delivery_request,
+                delivery_with_count.delivery,
+                delivery_with_count.count,
+                domain,
+                telemetry_context,
+                session,
+            )
+            for delivery_id, delivery_with_count in deliveries.items()
+        }
+        return {delivery_id: future.result() for delivery_id, future in futures.items()}
+
+
+def is_app_circuit_breaker_open(app_id: int) -> bool:
+    if not breaker_board:
+        return False
+    from ....app.models import App
+
+    app = App.objects.filter(pk=app_id).first()
+    if app is None:
+        return False
+    state = breaker_board.update_breaker_state(app)
+    return state == CircuitBreakerState.OPEN
+
+
 @app.task(
     queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
     bind=True,
@@ -793,95 +938,212 @@ def send_webhooks_async_for_app(
     self,
     app_id,
     telemetry_context: TelemetryTaskContext,
+    queue: str | None = None,
 ) -> None:
     domain = get_domain()
-    deliveries = get_deliveries_for_app(app_id, WEBHOOK_ASYNC_BATCH_SIZE)
+    concurrency = settings.WEBHOOK_ASYNC_APP_CONCURRENCY
+    if concurrency > 1 and is_app_circuit_breaker_open(app_id):
+        # Leave deliveries pending until the breaker lets requests through.
+        countdown = breaker_board.cooldown_seconds  # type: ignore[union-attr]
+        set_app_dispatch_marker(
+            app_id,
+            settings.WEBHOOK_ASYNC_APP_DISPATCH_MARKER_TIMEOUT + countdown,
+        )
+        send_webhooks_async_for_app.apply_async(
+            kwargs={
+                "app_id": app_id,
+                "telemetry_context": telemetry_context.to_dict(),
+                "queue": queue,
+            },
+            queue=queue,
+            countdown=countdown,
+        )
+        return
 
+    # The batch is claimed in a short transaction, so no transaction is open and
+    # no rows are locked while the webhooks are sent.
+    deliveries, attempts = claim_deliveries_for_app(
+        app_id,
+        WEBHOOK_ASYNC_BATCH_SIZE,
+        WEBHOOK_RETRY_BACKOFF,
+        WEBHOOK_ASYNC_APP_LEASE,
+        self.request.id,
+    )
     if not deliveries:
+        release_app_dispatch_marker(app_id, telemetry_context, queue)
         return
 
-    attempts_for_deliveries = create_attempts_for_deliveries(
-        deliveries, self.request.id
+    processed_deliveries = send_deliveries_for_app(
+        deliveries, attempts, domain, telemetry_context
     )
+    clear_successful_deliveries(processed_deliveries)
+
+    set_app_dispatch_marker(app_id)
+    send_webhooks_async_for_app.apply_async(
+        kwargs={
+            "app_id": app_id,
+            "telemetry_context": telemetry_context.to_dict(),
+            "queue": queue,
+        },
+        queue=queue,
+    )
+
+
+def send_deliveries_for_app(
+    deliveries: dict[int, EventDeliveryWithAttemptCount],
+    attempts_for_deliveries: dict[int, EventDeliveryAttempt],
+    domain: str,
+    telemetry_context: TelemetryTaskContext,
+) -> list[EventDelivery]:
+    """Send the claimed batch of deliveries of a single app and store the attempts.
+
+    Must be called outside of a transaction. Failed attempts are stored in a short
+    transaction once all requests are done; the returned successful deliveries are
+    to be cleared.
+    """
     failed_deliveries_attempts = []
     successful_deliveries = []
+    finished_deliveries_count = 0
+
+    responses: dict[int, WebhookResponse] = {}
+    concurrency = settings.WEBHOOK_ASYNC_APP_CONCURRENCY
+    if concurrency > 1:
+        responses = send_delivery_requests_concurrently(
+            deliveries, domain, telemetry_context, concurrency
+        )
 
     for delivery_id, delivery_with_count in deliveries.items():
         delivery = delivery_with_count.delivery
         attempt_count = delivery_with_count.count
         attempt = attempts_for_deliveries[delivery_id]
-
         webhook = delivery.webhook
 
-        try:
-            if not delivery.payload:
-                raise ValueError(f"Event delivery id: {delivery_id} has no payload.")
-            data = delivery.payload.get_payload()
-            # Convert payload to bytes if it's not already.
-            data = data if isinstance(data, bytes) else data.encode("utf-8")
-            # Count payload size in bytes.
-            payload_size = len(data)
-
-            if attempt_count == 0:
-                record_first_delivery_attempt_delay(
-                    delivery.created_at, delivery.event_type, webhook.app
-                )
-            with webhooks_otel_trace(
-                delivery.event_type,
-                payload_size,
-                webhook.app,
-                span_links=telemetry_context.links,
-            ):
-                response = send_webhook_using_scheme_method(
-                    webhook.target_url,
-                    domain,
-                    webhook.secret_key,
-                    delivery.event_type,
-                    data,
-                    webhook.custom_headers,
-                )
-
-            record_external_request(
-                delivery.event_type,
-                webhook.target_url,
-                response,
-                payload_size,
-                webhook.app,
-                sync=False,
-            )
-            if response.status == EventDeliveryStatus.FAILED:
-                attempt_update(attempt, response, with_save=False)
-                failed_deliveries_attempts.append((delivery, attempt, attempt_count))
-            elif response.status == EventDeliveryStatus.SUCCESS:
-                task_logger.info(
-                    "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
-                    webhook.id,
-                    sanitize_url_for_logging(webhook.target_url),
-                    delivery.event_type,
-                    delivery.id,
-                )
-                delivery.status = EventDeliveryStatus.SUCCESS
-                # update attempt without save to provide proper data in observability
-                attempt_update(attempt, response, with_save=False)
-        except ValueError as e:
-            response = WebhookResponse(
-                content=str(e), status=EventDeliveryStatus.FAILED
+        response = responses.get(delivery_id)
+        if response is None:
+            response = send_delivery_request(
+                delivery, attempt_count, domain, telemetry_context
             )
+        if response.status == EventDeliveryStatus.FAILED:
             attempt_update(attempt, response, with_save=False)
             failed_deliveries_attempts.append((delivery, attempt, attempt_count))
+            if attempt_count >= MAX_WEBHOOK_RETRIES:
+                finished_deliveries_count += 1
+        elif response.status == EventDeliveryStatus.SUCCESS:
+            task_logger.info(
+                "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
+                webhook.id,
+                sanitize_url_for_logging(webhook.target_url),
+                delivery.event_type,
+                delivery.id,
+            )
+            delivery.status = EventDeliveryStatus.SUCCESS
+            # update attempt without save to provide proper data in observability
+            attempt_update(attempt, response, with_save=False)
+            finished_deliveries_count += 1
 
         observability.report_event_delivery_attempt(attempt)
         successful_deliveries.append(delivery)
 
-    process_failed_deliveries(failed_deliveries_attempts, MAX_WEBHOOK_RETRIES)
-    clear_successful_deliveries(successful_deliveries)
+    with transaction.atomic():
+        process_failed_deliveries(failed_deliveries_attempts, MAX_WEBHOOK_RETRIES)
+    first_delivery = next(iter(deliveries.values())).delivery
+    record_async_pending_deliveries(
+        first_delivery.webhook.app, -finished_deliveries_count
+    )
+    return successful_deliveries
 
-    send_webhooks_async_for_app.apply_async(
-        kwargs={
-            "app_id": app_id,
-            "telemetry_context": telemetry_context.to_dict(),
-        },
+
+def set_app_dispatch_marker(app_id: int, timeout: int | None = None) -> None:
+    """Mark that the per-app task is enqueued or running for the app."""
+    cache.set(
+        APP_DISPATCH_MARKER_KEY.format(app_id=app_id),
+        1,
+        timeout or settings.WEBHOOK_ASYNC_APP_DISPATCH_MARKER_TIMEOUT,
+    )
+
+
+def wake_up_app_task(
+    app: "App",
+    telemetry_context: TelemetryTaskContext,
+    queue: str | None,
+    countdown: int = 0,
+) -> bool:
+    """Enqueue the per-app task unless it's already enqueued or running.
+
+    Return True if the task was enqueued.
+    """
+    enqueued = cache.add(
+        APP_DISPATCH_MARKER_KEY.format(app_id=app.id),
+        1,
+        settings.WEBHOOK_ASYNC_APP_DISPATCH_MARKER_TIMEOUT + countdown,
     )
+    record_async_app_dispatch(app, coalesced=not enqueued)
+    if enqueued:
+        options = {"countdown": countdown} if countdown else {}
+        send_webhooks_async_for_app.apply_async(
+            kwargs={
+                "app_id": app.id,
+                "telemetry_context": telemetry_context.to_dict(),
+                "queue": queue,
+            },
+            queue=queue,
+            MessageGroupId=get_sqs_message_group_id(get_domain(), app),
+            **options,
+        )
+    return enqueued
+
+
+def release_app_dispatch_marker(
+    app_id: int, telemetry_context: TelemetryTaskContext, queue: str | None
+) -> None:
+    cache.delete(APP_DISPATCH_MARKER_KEY.format(app_id=app_id))
+    # Deliveries created after the last batch was fetched weren't dispatched, as
+    # the marker was still set, and failed deliveries wait for their next attempt;
+    # wake the task up again for them.
+    delivery = (
+        get_pending_deliveries_for_app(
+            app_id, WEBHOOK_RETRY_BACKOFF, WEBHOOK_ASYNC_APP_LEASE
+        )
+        .select_related("webhook__app")
+        .order_by("next_attempt_at")
+        .first()
+    )
+    if delivery:
+        countdown = (delivery.next_attempt_at - timezone.now()).total_seconds()
+        wake_up_app_task(
+            delivery.webhook.app,
+            telemetry_context,
+            queue or settings.WEBHOOK_CELERY_QUEUE_NAME,
+            countdown=max(math.ceil(countdown), 0),
+        )
+
+
+def dispatch_deliveries_for_apps(
+    deliveries: Iterable[EventDelivery],
+    telemetry_context: TelemetryTaskContext,
+    queue: str | None = None,
+) -> None:
+    """Group new deliveries by app and wake up the per-app task of each app.
+
+    Deliveries aren't sent by separate tasks. For each app at most one
+    `send_webhooks_async_for_app` task is enqueued at a time, which sends pending
+    deliveries of the app in batches until there are none left, so a flood of
+    events results in a bounded number of broker messages.
+    """
+    deliveries_per_app: dict[int, list[EventDelivery]] = defaultdict(list)
+    for delivery in deliveries:
+        deliveries_per_app[delivery.webhook.app_id].append(delivery)
+
+    for app_deliveries in deliveries_per_app.values():
+        webhook = app_deliveries[0].webhook
+        record_async_pending_deliveries(webhook.app, len(app_deliveries))
+        wake_up_app_task(
+            webhook.app,
+            telemetry_context,
+            get_queue_name_for_webhook(
+                webhook, default_queue=queue or settings.WEBHOOK_CELERY_QUEUE_NAME
+            ),
+        )
 
 
 def send_observability_events(webhooks: list[WebhookData], events: list[bytes]):
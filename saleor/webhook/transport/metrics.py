@@ -67,6 +67,24 @@ METRIC_EXTERNAL_REQUEST_FIRST_ATTEMPT_DELAY = meter.create_metric(
     description="Delay of the first delivery attempt for async webhook.",
 )
 
+METRIC_ASYNC_APP_DISPATCH_COUNT = meter.create_metric(
+    "saleor.webhook.async.app_dispatch.count",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.EVENT,
+    description=(
+        "Number of wake-ups of the per-app async webhook task, including the ones "
+        "coalesced with an already enqueued task."
+    ),
+)
+METRIC_ASYNC_PENDING_DELIVERIES = meter.create_metric(
+    "saleor.webhook.async.pending_deliveries",
+    scope=Scope.CORE,
+    type=MetricType.UP_DOWN_COUNTER,
+    unit=Unit.EVENT,
+    description="Number of async webhook deliveries waiting for the per-app task.",
+)
+
 
 def record_external_request(
     event_type: str,
@@ -113,3 +131,19 @@ def record_first_delivery_attempt_delay(
         unit=Unit.SECOND,
         attributes=attributes,
     )
+
+
+def record_async_app_dispatch(app: App, *, coalesced: bool) -> None:
+    attributes = {
+        saleor_attributes.SALEOR_APP_IDENTIFIER: app.identifier,
+        saleor_attributes.SALEOR_WEBHOOK_DISPATCH_COALESCED: coalesced,
+    }
+    meter.record(METRIC_ASYNC_APP_DISPATCH_COUNT, 1, Unit.EVENT, attributes=attributes)
+
+
+def record_async_pending_deliveries(app: App, amount: int) -> None:
+    """Record a change of the number of pending deliveries of the app."""
+    attributes = {saleor_attributes.SALEOR_APP_IDENTIFIER: app.identifier}
+    meter.record(
+        METRIC_ASYNC_PENDING_DELIVERIES, amount, Unit.EVENT, attributes=attributes
+    )
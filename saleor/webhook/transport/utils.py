@@ -17,11 +17,25 @@ from celery import Task
 from celery.exceptions import MaxRetriesExceededError, Retry
 from celery.utils.log import get_task_logger
 from django.conf import settings
-from django.db.models import Count
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Power
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.text import slugify
 from google.cloud import pubsub_v1
-from requests import RequestException
+from requests import RequestException, Session
+from requests.adapters import DEFAULT_POOLSIZE
 from requests_hardened.ip_filter import InvalidIPAddress
 
 from ...app.headers import AppHeaders, DeprecatedAppHeaders
@@ -138,6 +152,7 @@ def send_webhook_using_http(
     event_type,
     timeout=settings.WEBHOOK_TIMEOUT,
     custom_headers: dict[str, str] | None = None,
+    session: Session | None = None,
 ) -> WebhookResponse:
     """Send a webhook request using http / https protocol.
 
@@ -148,6 +163,8 @@ def send_webhook_using_http(
     :param event_type: Webhook event type.
     :param timeout: Request timeout.
     :param custom_headers: Custom headers which will be added to request headers.
+    :param session: Session to send the request with, reusing its connections.
+        A new session is used for every request when not provided.
 
     :return: WebhookResponse object.
     """
@@ -167,8 +184,9 @@ def send_webhook_using_http(
     if custom_headers:
         headers.update(custom_headers)
 
+    send_request = session.request if session else HTTPClient.send_request
     try:
-        response = HTTPClient.send_request(
+        response = send_request(
             "POST",
             target_url,
             data=message,
@@ -307,6 +325,7 @@ def send_webhook_using_scheme_method(
     event_type,
     data,
     custom_headers=None,
+    session: Session | None = None,
 ) -> WebhookResponse:
     parts = urlparse(target_url)
     message = data if isinstance(data, bytes) else data.encode("utf-8")
@@ -327,10 +346,19 @@ def send_webhook_using_scheme_method(
             signature,
             event_type,
             custom_headers=custom_headers,
+            session=session,
         )
     raise ValueError(f"Unknown webhook scheme: {parts.scheme!r}")
 
 
+def get_webhook_http_session(pool_maxsize: int) -> Session:
+    """Return a session keeping up to `pool_maxsize` connections alive per host."""
+    session = HTTPClient.get_session()
+    for adapter in session.adapters.values():
+        adapter.init_poolmanager(DEFAULT_POOLSIZE, max(pool_maxsize, DEFAULT_POOLSIZE))
+    return session
+
+
 def handle_webhook_retry(
     celery_task: Task,
     webhook: Webhook,
@@ -407,25 +435,86 @@ def get_delivery_for_webhook(
     return delivery, not_found
 
 
-def get_deliveries_for_app(
-    app_id, batch_size
-) -> dict[int, "EventDeliveryWithAttemptCount"]:
-    deliveries = (
-        EventDelivery.objects.select_related("payload", "webhook__app")
-        .filter(webhook__app_id=app_id, status=EventDeliveryStatus.PENDING)
-        .order_by("created_at")
+def get_pending_deliveries_for_app(app_id, retry_backoff: int, lease: int):
+    """Return pending deliveries of the app annotated with their next attempt time.
+
+    Failed deliveries are retried with an exponential backoff, the same as
+    deliveries sent by `send_webhook_request_async`. A delivery whose last attempt
+    is still pending was claimed by a task and is not due again until the lease of
+    `lease` seconds expires, e.g. after the task crashed.
+    """
+    attempts = EventDeliveryAttempt.objects.filter(delivery=OuterRef("pk"))
+    last_attempt = attempts.order_by("-created_at", "-pk")[:1]
+    return (
+        EventDelivery.objects.filter(
+            webhook__app_id=app_id,
+            webhook__is_active=True,
+            webhook__app__is_active=True,
+            status=EventDeliveryStatus.PENDING,
+            payload__isnull=False,
+        )
+        .annotate(
+            attempts_count=Coalesce(
+                Subquery(
+                    attempts.order_by()
+                    .values("delivery")
+                    .annotate(count=Count("pk"))
+                    .values("count")
+                ),
+                0,
+            ),
+            last_attempt_at=Subquery(last_attempt.values("created_at")),
+            last_attempt_status=Subquery(last_attempt.values("status")),
+        )
         .annotate(
-            attempts_count=Count("attempts", distinct=True),
-        )[:batch_size]
+            next_attempt_at=Case(
+                When(
+                    last_attempt_status=EventDeliveryStatus.PENDING,
+                    then=F("last_attempt_at")
+                    + Value(datetime.timedelta(seconds=lease)),
+                ),
+                default=Coalesce(
+                    F("last_attempt_at")
+                    + ExpressionWrapper(
+                        Value(datetime.timedelta(seconds=retry_backoff))
+                        * Power(2, F("attempts_count") - 1),
+                        output_field=DurationField(),
+                    ),
+                    F("created_at"),
+                ),
+            )
+        )
     )
 
-    return {
-        delivery.pk: EventDeliveryWithAttemptCount(
-            delivery=delivery,
-            count=delivery.attempts_count,
+
+def claim_deliveries_for_app(
+    app_id, batch_size, retry_backoff: int, lease: int, task_id: str | None
+) -> tuple[dict[int, "EventDeliveryWithAttemptCount"], dict[int, EventDeliveryAttempt]]:
+    """Claim the batch of deliveries of the app that are due to be sent.
+
+    The deliveries are locked only while the batch is selected and a pending
+    attempt is created for each of them. The pending attempts act as a lease: once
+    the transaction commits, other tasks skip the deliveries until the attempts
+    are stored or the lease expires, so the webhooks can be sent outside of any
+    transaction.
+    """
+    with transaction.atomic():
+        deliveries = (
+            get_pending_deliveries_for_app(app_id, retry_backoff, lease)
+            .select_related("payload", "webhook__app")
+            .select_for_update(skip_locked=True, of=("self",))
+            .filter(next_attempt_at__lte=timezone.now())
+            .order_by("created_at")[:batch_size]
         )
-        for delivery in deliveries
-    }
+        deliveries_with_count = {
+            delivery.pk: EventDeliveryWithAttemptCount(
+                delivery=delivery,
+                count=delivery.attempts_count,
+            )
+            for delivery in deliveries
+        }
+        attempts = create_attempts_for_deliveries(deliveries_with_count, task_id)
+    return deliveries_with_count, attempts
 
 
 def get_multiple_deliveries_for_webhooks(
@@ -558,7 +647,9 @@ def clear_successful_deliveries(deliveries: list["EventDelivery"]):
             if event_payload.payload_file
         ]
         payloads_to_delete.delete()
-        delete_files_from_private_storage_task(files_to_delete)
+        delete_files_from_private_storage_task(
+            EventPayload.objects.get_unreferenced_payload_files(files_to_delete)
+        )
 
 
 @allow_writer()